@@ -0,0 +1,53 @@
+"""BacktestEngine replay and PerformanceAnalyzer metrics at several history sizes."""
+import pytest
+
+from synthetic import generate_backtest_results, generate_ohlcv
+
+from app.backtesting.backtest_engine import BacktestEngine
+from app.backtesting.performance_metrics import PerformanceAnalyzer
+
+BACKTEST_CONFIG = {
+    "enabled_strategies": ["technical", "volume"],
+    "min_confidence": 0.3,
+    "strategy_config": {"min_confidence": 0.3},
+}
+
+
+def _engine(candles, signal_logger):
+    engine = BacktestEngine(BACKTEST_CONFIG)
+    engine.strategy_manager.signal_logger = signal_logger
+    # Replay in-memory candles instead of loading historical_ohlcv
+    engine.fetch_historical_data = lambda symbol, interval_minutes, days_back: candles
+    return engine
+
+
+@pytest.mark.parametrize("candles", [
+    1_000,
+    10_000,
+    pytest.param(100_000, marks=pytest.mark.large),
+])
+def bench_run_backtest(benchmark, null_signal_logger, candles):
+    data = generate_ohlcv(candles)
+    rounds = 5 if candles <= 1_000 else 1
+
+    results = benchmark.pedantic(
+        lambda engine: engine.run_backtest(["BTCUSD"]),
+        setup=lambda: ((_engine(data, null_signal_logger),), {}),
+        rounds=rounds, iterations=1,
+    )
+
+    assert results["total_trades"] > 0
+    assert len(results["portfolio_values"]) == candles
+
+
+@pytest.mark.parametrize("values, trades", [
+    (1_000, 100),
+    (10_000, 1_000),
+    (100_000, 10_000),
+])
+def bench_calculate_metrics(benchmark, values, trades):
+    results = generate_backtest_results(values, trades)
+
+    metrics = benchmark(PerformanceAnalyzer.calculate_metrics, results)
+
+    assert metrics["completed_trades"] == trades // 2
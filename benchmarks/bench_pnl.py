@@ -0,0 +1,54 @@
+"""Dashboard P&L (load_pnl_data) against a seeded trades table."""
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import delete, insert
+
+from synthetic import generate_trades
+
+from app.database.connection import get_db
+from app.database.models import PnLCheckpoint, Trade
+from app.dashboard import load_pnl_data
+from app.logic.pnl_ledger import pnl_ledger
+
+
+def _seed(n):
+    rows = []
+    for t in generate_trades(n):
+        price, amount, fee = Decimal(str(t["price"])), Decimal(str(t["amount"])), Decimal(str(t["fee"]))
+        rows.append({
+            "timestamp": t["timestamp"], "action": t["action"], "symbol": t["symbol"],
+            "price": price, "amount": amount, "gross_value": price * amount,
+            "fee": fee, "net_value": price * amount - fee, "test_mode": False,
+        })
+    with get_db() as db:
+        db.execute(delete(PnLCheckpoint))
+        db.execute(delete(Trade))
+        db.execute(insert(Trade), rows)
+
+
+def _cold_ledger():
+    """Restart state: no in-memory ledger and no checkpoints, so every trade is replayed."""
+    pnl_ledger.reset()
+    with get_db() as db:
+        db.execute(delete(PnLCheckpoint))
+    return (), {}
+
+
+@pytest.fixture(scope="module", params=[1_000, 100_000], ids=["1k_trades", "100k_trades"])
+def seeded_trades(request):
+    _seed(request.param)
+    pnl_ledger.reset()
+    yield request.param
+    pnl_ledger.reset()
+
+
+def bench_load_pnl_data_cold(benchmark, seeded_trades):
+    labels, data = benchmark.pedantic(load_pnl_data, setup=_cold_ledger, rounds=3, iterations=1)
+    assert len(labels) == 5
+
+
+def bench_load_pnl_data_warm(benchmark, seeded_trades):
+    load_pnl_data()  # catch up once; later calls only check for new trades
+    labels, data = benchmark(load_pnl_data)
+    assert len(labels) == 5
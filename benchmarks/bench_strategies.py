@@ -0,0 +1,45 @@
+"""Per-call cost of the strategies and of StrategyManager aggregation."""
+import pytest
+
+from synthetic import context_from_candles, generate_ohlcv
+
+from app.strategies.technical_strategy import TechnicalStrategy
+from app.strategies.volume_strategy import VolumeStrategy
+
+
+@pytest.fixture(scope="module")
+def context():
+    return context_from_candles(generate_ohlcv(500), window=100)
+
+
+@pytest.fixture(scope="module")
+def batch_contexts():
+    return {
+        f"SYM{i}USD": context_from_candles(generate_ohlcv(150, seed=i), window=100)
+        for i in range(50)
+    }
+
+
+def bench_technical_get_signal(benchmark, context):
+    strategy = TechnicalStrategy()
+    signal, confidence, _ = benchmark(strategy.get_signal, "BTCUSD", context)
+    assert signal in ("BUY", "SELL", "HOLD")
+
+
+def bench_volume_get_signal(benchmark, context):
+    strategy = VolumeStrategy()
+    signal, confidence, _ = benchmark(strategy.get_signal, "BTCUSD", context)
+    assert signal in ("BUY", "SELL", "HOLD")
+
+
+def bench_strategy_manager_get_signal(benchmark, make_strategy_manager, context):
+    manager = make_strategy_manager()
+    signal, confidence, reason, signal_id = benchmark(manager.get_signal, "BTCUSD", context)
+    assert signal_id is None  # logging stubbed
+
+
+def bench_strategy_manager_get_signals_batch50(benchmark, make_strategy_manager, batch_contexts):
+    manager = make_strategy_manager()
+    symbols = list(batch_contexts)
+    results = benchmark(manager.get_signals, symbols, batch_contexts)
+    assert len(results) == 50
@@ -0,0 +1,68 @@
+"""
+Benchmark configuration.
+
+The app is pointed at a scratch SQLite file before any app module is
+imported, so DB-backed benchmarks never touch data/trading_bot.db, and
+INFO logging is switched off so timings measure the code rather than log
+formatting and I/O.
+"""
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRATCH_DIR = tempfile.mkdtemp(prefix="trading_bot_bench_")
+os.environ["DATABASE_URL"] = f"sqlite:///{SCRATCH_DIR}/bench.db"
+
+sys.path.insert(0, str(BENCH_DIR))
+logging.disable(logging.INFO)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-large", action="store_true", default=False,
+        help="Also run the large (slow) benchmark sizes",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--bench-large"):
+        return
+    skip_large = pytest.mark.skip(reason="large size: run with --bench-large")
+    for item in items:
+        if "large" in item.keywords:
+            item.add_marker(skip_large)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(SCRATCH_DIR, ignore_errors=True)
+
+
+class NullSignalLogger:
+    """Stands in for StrategySignalLogger: decisions are not persisted."""
+
+    def log_decision(self, *args, **kwargs):
+        return None
+
+
+@pytest.fixture
+def null_signal_logger():
+    return NullSignalLogger()
+
+
+@pytest.fixture
+def make_strategy_manager(null_signal_logger):
+    """Build a StrategyManager whose decision logging is stubbed out."""
+    from app.strategies.strategy_manager import StrategyManager
+
+    def make(config=None):
+        manager = StrategyManager(config=config or {})
+        manager.signal_logger = null_signal_logger
+        return manager
+
+    return make
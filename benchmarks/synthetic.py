@@ -0,0 +1,130 @@
+"""
+Deterministic synthetic data for the benchmarks.
+
+Every generator takes a seed and uses its own random.Random, so a given
+(size, seed) produces the same series on every machine and commit and
+timings stay comparable between runs.
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Sequence
+
+START = datetime(2024, 1, 1)
+REGIME_LENGTH = 250  # candles per trend regime
+REGIME_DRIFTS = (0.002, 0.0, -0.002, 0.001, -0.001)
+
+
+def generate_ohlcv(
+    n: int, seed: int = 42, start_price: float = 100.0, interval_minutes: int = 60,
+) -> List[Dict[str, Any]]:
+    """
+    Random-walk candles with trending regimes and volume spikes.
+
+    Drift switches every REGIME_LENGTH candles so moving-average, RSI and
+    volume strategies all produce BUY and SELL signals, not just HOLD.
+
+    Returns:
+        Candle dicts (timestamp, open, high, low, close, volume), the shape
+        BacktestEngine.fetch_historical_data returns
+    """
+    rng = random.Random(seed)
+    step = timedelta(minutes=interval_minutes)
+    price = start_price
+    candles = []
+    for i in range(n):
+        drift = REGIME_DRIFTS[(i // REGIME_LENGTH) % len(REGIME_DRIFTS)]
+        ret = rng.gauss(drift, 0.01)
+        open_price = price
+        price = max(open_price * (1 + ret), 0.01)
+        wick = abs(rng.gauss(0, 0.003))
+        volume = rng.lognormvariate(3, 0.4) * (1 + 40 * abs(ret))
+        candles.append({
+            "timestamp": START + i * step,
+            "open": open_price,
+            "high": max(open_price, price) * (1 + wick),
+            "low": min(open_price, price) * (1 - wick),
+            "close": price,
+            "volume": volume,
+        })
+    return candles
+
+
+def context_from_candles(candles: Sequence[Dict[str, Any]], window: int = 100) -> Dict[str, Any]:
+    """Strategy context for the last candle (what the trading loop builds)."""
+    recent = candles[-window:]
+    return {
+        "headlines": [],
+        "price": recent[-1]["close"],
+        "volume": recent[-1]["volume"],
+        "price_history": [c["close"] for c in recent],
+        "volume_history": [c["volume"] for c in recent],
+    }
+
+
+def generate_trades(
+    n: int, symbols: Sequence[str] = ("BTCUSD", "ETHUSD", "SOLUSD", "XRPUSD", "DOGEUSD"), seed: int = 7,
+) -> List[Dict[str, Any]]:
+    """
+    Buy/sell fills spread over symbols; sells never exceed the open position.
+
+    Returns:
+        Dicts with timestamp, symbol, action, price, amount, fee
+    """
+    rng = random.Random(seed)
+    prices = {symbol: 10.0 * (i + 1) for i, symbol in enumerate(symbols)}
+    positions = {symbol: 0.0 for symbol in symbols}
+    trades = []
+    for i in range(n):
+        symbol = symbols[rng.randrange(len(symbols))]
+        prices[symbol] *= 1 + rng.gauss(0, 0.01)
+        price = prices[symbol]
+        if positions[symbol] > 0 and rng.random() < 0.45:
+            action = "sell"
+            amount = positions[symbol] * rng.uniform(0.2, 1.0)
+            positions[symbol] -= amount
+        else:
+            action = "buy"
+            amount = rng.uniform(0.1, 2.0)
+            positions[symbol] += amount
+        trades.append({
+            "timestamp": START + timedelta(minutes=i),
+            "symbol": symbol,
+            "action": action,
+            "price": round(price, 8),
+            "amount": round(amount, 8),
+            "fee": round(price * amount * 0.0026, 8),
+        })
+    return trades
+
+
+def generate_backtest_results(n_values: int, n_trades: int, seed: int = 11) -> Dict[str, Any]:
+    """
+    Results dict shaped like BacktestEngine.run_backtest output, for
+    PerformanceAnalyzer.calculate_metrics.
+    """
+    candles = generate_ohlcv(n_values, seed=seed)
+    initial_capital = 10000.0
+    scale = initial_capital / candles[0]["close"]
+    portfolio_values = [
+        {"timestamp": c["timestamp"], "total_value": c["close"] * scale} for c in candles
+    ]
+
+    trades = []
+    every = max(n_values // max(n_trades, 1), 1)
+    for i, candle in enumerate(candles[::every][:n_trades]):
+        trades.append({
+            "timestamp": candle["timestamp"],
+            "symbol": "BTCUSD",
+            "action": "BUY" if i % 2 == 0 else "SELL",
+            "price": candle["close"],
+            "amount": 1.0,
+            "fee": candle["close"] * 0.0026,
+        })
+
+    return {
+        "initial_capital": initial_capital,
+        "portfolio_values": portfolio_values,
+        "trades": trades,
+        "symbols": ["BTCUSD"],
+    }
@@ -14,7 +14,7 @@ import shutil
 from datetime import datetime
 from pathlib import Path
 from app.database.connection import get_db
-from app.database.models import Trade, Holding
+from app.database.models import Trade, Holding, CurrentPosition, PnLCheckpoint
 
 def main():
     print("=" * 60)
@@ -66,8 +66,10 @@ def main():
         # Delete production trades only
         deleted_trades = db.query(Trade).filter(Trade.test_mode == False).delete()
 
-        # Delete all holdings
+        # Delete all holdings (history and compacted current positions)
         deleted_holdings = db.query(Holding).delete()
+        db.query(CurrentPosition).delete()
+        db.query(PnLCheckpoint).filter(PnLCheckpoint.test_mode == False).delete()
 
         db.commit()
 
@@ -0,0 +1,172 @@
+"""
+Compare dashboard read throughput of the sync and async repository layers.
+
+Seeds a temporary database (never the bot's), then runs N concurrent
+clients on one event loop, each issuing the same request mix the dashboard
+serves (signal feed page, recent trades, current holdings):
+
+- sync:  sync repositories on the read pool via run_in_threadpool, the way
+         FastAPI runs `def` routes
+- async: async repositories (AsyncSession over aiosqlite) awaited directly
+- blocking: sync repositories called inline from the event loop, the
+         baseline an `async def` handler gets without either
+
+Reports requests/s, p50/p95 latency and the worst event-loop stall seen by
+a 10ms ticker (how long other requests and SSE streams were starved).
+
+Usage:
+    python scripts/benchmark_async_db.py [--clients 1 8 32] [--requests 50]
+                                         [--signals 20000] [--trades 2000]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from app.database.async_repositories import AsyncSignalRepository, AsyncTradeRepository, AsyncHoldingRepository
+from app.database.connection import READ_POOL_SIZE, create_async_read_engine, set_read_only
+from app.database.models import Base, Signal, Trade, Holding
+from app.database.repositories import SignalRepository, TradeRepository, HoldingRepository
+
+SYMBOLS = ["BTC/USD", "ETH/USD", "SOL/USD", "ADA/USD", "DOT/USD"]
+
+
+def seed(url: str, signals: int, trades: int):
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    start = datetime.utcnow() - timedelta(minutes=5 * signals)
+    with engine.begin() as conn:
+        conn.execute(insert(Signal), [
+            dict(timestamp=start + timedelta(minutes=5 * i), symbol=SYMBOLS[i % len(SYMBOLS)],
+                 price=Decimal("100"), final_signal=("BUY", "SELL", "HOLD", "HOLD")[i % 4],
+                 final_confidence=Decimal("0.6"), aggregation_method="weighted_vote",
+                 strategies={"technical": {"signal": "BUY", "confidence": 0.6}}, test_mode=False)
+            for i in range(signals)
+        ])
+        step = max(signals // max(trades, 1), 1)
+        conn.execute(insert(Trade), [
+            dict(timestamp=start + timedelta(minutes=5 * i * step), action=("buy", "sell")[i % 2],
+                 symbol=SYMBOLS[i % len(SYMBOLS)], price=Decimal("100"), amount=Decimal("0.1"),
+                 gross_value=Decimal("10"), fee=Decimal("0.026"), net_value=Decimal("10.026"),
+                 signal_id=i * step + 1, test_mode=False)
+            for i in range(trades)
+        ])
+        conn.execute(insert(Holding), [
+            dict(timestamp=datetime.utcnow(), symbol=symbol, amount=Decimal("1"),
+                 avg_buy_price=Decimal("100"), test_mode=False)
+            for symbol in SYMBOLS
+        ])
+    engine.dispose()
+
+
+def sync_request(session_factory):
+    with session_factory() as db:
+        SignalRepository(db).get_feed(limit=50)
+        TradeRepository(db).get_recent(limit=200)
+        HoldingRepository(db).get_current_holdings()
+
+
+async def async_request(session_factory):
+    async with session_factory() as db:
+        await AsyncSignalRepository(db).get_feed(limit=50)
+        await AsyncTradeRepository(db).get_recent(limit=200)
+        await AsyncHoldingRepository(db).get_current_holdings()
+
+
+async def run_scenario(request, clients: int, requests: int) -> dict:
+    latencies = []
+    stall = 0.0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal stall
+        while not done.is_set():
+            expected = time.perf_counter() + 0.01
+            await asyncio.sleep(0.01)
+            stall = max(stall, time.perf_counter() - expected)
+
+    async def client():
+        for _ in range(requests):
+            started = time.perf_counter()
+            await request()
+            latencies.append(time.perf_counter() - started)
+
+    ticking = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await ticking
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "max_stall_ms": stall * 1000,
+    }
+
+
+async def benchmark(url: str, client_counts, requests: int):
+    sync_engine = create_engine(
+        url, connect_args={"check_same_thread": False}, poolclass=QueuePool,
+        pool_size=READ_POOL_SIZE, max_overflow=READ_POOL_SIZE,
+    )
+    event.listen(sync_engine, "connect", set_read_only)
+    sync_sessions = sessionmaker(bind=sync_engine)
+    async_engine = create_async_read_engine(url)
+    async_sessions = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    scenarios = {
+        "sync": lambda: run_in_threadpool(sync_request, sync_sessions),
+        "async": lambda: async_request(async_sessions),
+        "blocking": lambda: _inline(sync_request, sync_sessions),
+    }
+
+    print(f"{'layer':<10}{'clients':>8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'stall ms':>10}")
+    for clients in client_counts:
+        for name, request in scenarios.items():
+            await run_scenario(request, 1, 3)  # warm pools and caches
+            r = await run_scenario(request, clients, requests)
+            print(f"{name:<10}{clients:>8}{r['rps']:>10.1f}{r['p50_ms']:>10.2f}"
+                  f"{r['p95_ms']:>10.2f}{r['max_stall_ms']:>10.2f}")
+
+    await async_engine.dispose()
+    sync_engine.dispose()
+
+
+async def _inline(fn, *args):
+    return fn(*args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=50, help="Requests per client")
+    parser.add_argument("--signals", type=int, default=20000)
+    parser.add_argument("--trades", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'benchmark.db'}"
+        print(f"Seeding {args.signals} signals and {args.trades} trades...")
+        seed(url, args.signals, args.trades)
+        asyncio.run(benchmark(url, args.clients, args.requests))
+
+
+if __name__ == "__main__":
+    main()
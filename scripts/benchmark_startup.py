@@ -0,0 +1,107 @@
+"""
+Measure import-time startup cost with `python -X importtime`.
+
+Each module is imported in a fresh interpreter --runs times; the report
+shows the median cumulative import time, the heavy SDKs that were loaded as
+a side effect, and whether the import created the bot's database file.
+
+Save a baseline on one commit and compare another against it:
+
+    git stash / git checkout <before>
+    python scripts/benchmark_startup.py --save /tmp/startup-before.json
+    git checkout <after>
+    python scripts/benchmark_startup.py --compare /tmp/startup-before.json
+
+Usage:
+    python scripts/benchmark_startup.py [--runs 5] [--modules app.main ...]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+DB_FILE = ROOT / "data" / "trading_bot.db"
+
+DEFAULT_MODULES = [
+    "app.database.connection",
+    "app.database.repositories",
+    "app.strategies.strategy_manager",
+    "app.dashboard",
+    "app.main",
+]
+HEAVY_PACKAGES = ["openai", "krakenex", "feedparser", "requests", "numpy", "fastapi", "sqlalchemy"]
+
+
+def import_once(module: str) -> dict:
+    """Import `module` in a fresh interpreter; returns timings and side effects."""
+    probe = (
+        f"import sys, json; import {module}; "
+        f"print(json.dumps({{p: p in sys.modules for p in {HEAVY_PACKAGES!r}}}))"
+    )
+    db_existed = DB_FILE.exists()
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    env.pop("PYTEST_CURRENT_TEST", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=SRC, env=env, capture_output=True, text=True, check=True,
+    )
+
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if line.startswith("import time:") and line.rsplit("|", 1)[-1].strip() == module:
+            cumulative_us = int(line.split("|")[1])
+    loaded = json.loads(result.stdout.strip().splitlines()[-1])
+    return {
+        "ms": cumulative_us / 1000 if cumulative_us is not None else None,
+        "loaded": sorted(p for p, present in loaded.items() if present),
+        "created_db": not db_existed and DB_FILE.exists(),
+    }
+
+
+def measure(modules, runs: int) -> dict:
+    results = {}
+    for module in modules:
+        samples = [import_once(module) for _ in range(runs)]
+        results[module] = {
+            "median_ms": round(statistics.median(s["ms"] for s in samples), 1),
+            "min_ms": round(min(s["ms"] for s in samples), 1),
+            "loaded": samples[-1]["loaded"],
+            "created_db": any(s["created_db"] for s in samples),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    parser.add_argument("--save", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file from --save")
+    args = parser.parse_args()
+
+    results = measure(args.modules, args.runs)
+    baseline = json.loads(Path(args.compare).read_text()) if args.compare else {}
+
+    print(f"{'module':<36}{'median ms':>10}{'min ms':>9}{'before':>9}  heavy imports / side effects")
+    for module, r in results.items():
+        before = baseline.get(module, {}).get("median_ms")
+        heavy = [p for p in r["loaded"] if p in ("openai", "krakenex", "feedparser", "requests")]
+        notes = ", ".join(heavy) or "-"
+        if r["created_db"]:
+            notes += " (created data/trading_bot.db)"
+        print(f"{module:<36}{r['median_ms']:>10.1f}{r['min_ms']:>9.1f}"
+              f"{before if before is not None else '-':>9}  {notes}")
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(results, indent=2))
+        print(f"Saved to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
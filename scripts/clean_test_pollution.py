@@ -12,7 +12,7 @@ from datetime import datetime, timezone
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from app.database.connection import get_db
-from app.database.models import Signal, Trade, Holding, SeenNews, ErrorLog
+from app.database.models import Signal, StrategyVote, Trade, Holding, CurrentPosition, PnLCheckpoint, StrategyRollup, SeenNews, ErrorLog
 from sqlalchemy import text
 
 def clean_all_test_data():
@@ -28,14 +28,26 @@ def clean_all_test_data():
         holdings_count = db.query(Holding).delete()
         print(f"  Deleted {holdings_count} holdings")
 
+        positions_count = db.query(CurrentPosition).delete()
+        print(f"  Deleted {positions_count} current positions")
+
+        checkpoints_count = db.query(PnLCheckpoint).delete()
+        print(f"  Deleted {checkpoints_count} P&L checkpoints")
+
         # Delete all trades
         trades_count = db.query(Trade).delete()
         print(f"  Deleted {trades_count} trades")
 
+        votes_count = db.query(StrategyVote).delete()
+        print(f"  Deleted {votes_count} strategy votes")
+
         # Delete all signals (from testing)
         signals_count = db.query(Signal).delete()
         print(f"  Deleted {signals_count} signals")
 
+        rollups_count = db.query(StrategyRollup).delete()
+        print(f"  Deleted {rollups_count} strategy rollups")
+
         # Delete seen news
         news_count = db.query(SeenNews).delete()
         print(f"  Deleted {news_count} seen news items")
@@ -0,0 +1,570 @@
+"""
+Load-test the dashboard API and the SSE event stream.
+
+Runs the real FastAPI app (uvicorn, in a child process) against a seeded
+SQLite database (never the bot's), with Kraken and OpenAI replaced by local
+stubs and no scheduler or data collector. Then:
+
+- N HTTP clients loop over the dashboard endpoints (/partial, /api/holdings,
+  /api/strategy/*) as fast as the server answers, or every --think-ms
+- M SSE clients hold /api/events open while the server emits events at
+  --event-rate per second, each stamped with its send time
+
+Reports per-endpoint p50/p95/p99 latency, errors and throughput, SSE event
+delivery lag and missed events, and the server's event-loop lag.
+
+Subcommands:
+    seed   Create and fill a database file (1M signals and 50k trades by default)
+    serve  Run the app with stubbed exchange/LLM clients against a database
+    run    Seed a database if needed, start `serve`, drive the load, report
+
+Usage:
+    python scripts/load_test.py run [--db /tmp/load.db] [--clients 20] [--sse 50]
+                                    [--duration 30] [--event-rate 5]
+                                    [--signals 1000000] [--trades 50000]
+    python scripts/load_test.py run --signals 20000 --trades 2000 --duration 5   # quick check
+    python scripts/load_test.py run --url http://127.0.0.1:8000                 # an already running server
+
+The database file is kept (seeding 1M signals takes a few minutes), so
+later runs with the same --db start immediately. Needs httpx, which the
+test suite already uses.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import types
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+DEFAULT_DB = Path(tempfile.gettempdir()) / "trading_bot_load.db"
+
+SYMBOLS = [
+    "BTC/USD", "ETH/USD", "SOL/USD", "ADA/USD", "DOT/USD", "XRP/USD", "LTC/USD",
+    "LINK/USD", "AVAX/USD", "ATOM/USD", "UNI/USD", "DOGE/USD", "XLM/USD", "ALGO/USD",
+    "FIL/USD", "AAVE/USD", "NEAR/USD", "ETC/USD", "BCH/USD", "TRX/USD",
+]
+STRATEGIES = ("technical", "volume", "sentiment")
+BASE_PRICES = {symbol: round(60_000 / 1.7 ** i, 4) for i, symbol in enumerate(SYMBOLS)}
+
+DEFAULT_ENDPOINTS = [
+    "/partial",
+    "/api/holdings",
+    "/api/strategy/current",
+    "/api/strategy/history?limit=100",
+    "/api/strategy/performance",
+    "/api/strategy/performance/technical",
+    "/api/strategy/correlation",
+    "/api/strategy/summary",
+    "/api/strategy/signals/latest",
+]
+
+
+def _use_database(db: Path):
+    """Point the app at db; must run before any app module is imported."""
+    os.environ["DATABASE_URL"] = f"sqlite:///{db}"
+
+
+def percentile(samples, p):
+    """Nearest-rank percentile of a sorted list."""
+    if not samples:
+        return 0.0
+    return samples[min(int(len(samples) * p), len(samples) - 1)]
+
+
+# ---------- Seeding ----------
+def seed(db: Path, signals: int, trades: int, holdings: int = 8, chunk: int = 10_000):
+    """
+    Fill a fresh database with signals (one every 5 minutes per symbol, the
+    newest now), their strategy votes and rollups, trades executed from a
+    sample of those signals, and holdings snapshots.
+    """
+    _use_database(db)
+    from sqlalchemy import insert
+
+    from app.database.connection import get_db, ensure_db
+    from app.database.migrations import migration_runner
+    from app.database.models import Holding, Signal, Trade
+    from app.database.repositories import StrategyVoteRepository
+    from app.metrics.query_profiler import query_profiler
+    from app.strategy_rollups import rebuild_rollups
+
+    # Bulk inserts would fill the slow-query log
+    query_profiler.update_config({"enabled": False})
+    ensure_db()
+    migration_runner.apply_pending()
+
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    spacing = timedelta(minutes=5) / len(SYMBOLS)
+    prices = dict(BASE_PRICES)
+    started = time.perf_counter()
+
+    for first in range(0, signals, chunk):
+        rows = []
+        for i in range(first, min(first + chunk, signals)):
+            symbol = SYMBOLS[i % len(SYMBOLS)]
+            prices[symbol] *= 1 + rng.gauss(0, 0.002)
+            votes = {
+                name: {
+                    "signal": rng.choices(("BUY", "SELL", "HOLD"), (1, 1, 3))[0],
+                    "confidence": round(rng.random(), 4),
+                    "reason": f"{name} load-test vote",
+                }
+                for name in STRATEGIES
+            }
+            final = rng.choices(("BUY", "SELL", "HOLD"), (1, 1, 4))[0]
+            rows.append(dict(
+                id=i + 1, timestamp=now - spacing * (signals - 1 - i), symbol=symbol,
+                price=Decimal(f"{prices[symbol]:.8f}"), final_signal=final,
+                final_confidence=Decimal(f"{rng.uniform(0.3, 0.9):.4f}"),
+                aggregation_method="weighted_vote", strategies=votes, test_mode=False,
+                signal_metadata={"source": "load_test"},
+            ))
+        with get_db() as session:
+            session.execute(insert(Signal), rows)
+            StrategyVoteRepository(session).add_for_signals(rows)
+        print(f"\r  signals {first + len(rows):>10,}/{signals:,}", end="", flush=True)
+    print()
+
+    # Trades alternate buy/sell per symbol, executed from evenly spaced signals
+    step = max(signals // max(trades, 1), 1)
+    rows = []
+    for t in range(min(trades, signals)):
+        signal_index = t * step
+        symbol = SYMBOLS[signal_index % len(SYMBOLS)]
+        action = ("buy", "sell")[(t // len(SYMBOLS)) % 2]
+        price = Decimal(f"{BASE_PRICES[symbol] * rng.uniform(0.9, 1.1):.8f}")
+        amount = Decimal(f"{20 / float(price):.8f}")
+        gross = price * amount
+        fee = gross * Decimal("0.0026")
+        rows.append(dict(
+            timestamp=now - spacing * (signals - 1 - signal_index), action=action, symbol=symbol,
+            price=price, amount=amount, gross_value=gross, fee=fee,
+            net_value=gross + fee if action == "buy" else gross - fee,
+            signal_id=signal_index + 1, strategies_used=list(STRATEGIES), test_mode=False,
+            reason="load test",
+        ))
+    with get_db() as session:
+        for first in range(0, len(rows), chunk):
+            session.execute(insert(Trade), rows[first:first + chunk])
+        session.execute(insert(Holding), [
+            dict(timestamp=now, symbol=symbol, amount=Decimal("0.5"),
+                 avg_buy_price=Decimal(f"{BASE_PRICES[symbol]:.8f}"), test_mode=False)
+            for symbol in SYMBOLS[:holdings]
+        ])
+    print(f"  trades  {len(rows):>10,}")
+
+    rolled = rebuild_rollups()
+    print(f"  rollups from {rolled:,} signals")
+    print(f"Seeded {db} in {time.perf_counter() - started:.1f}s")
+
+
+# ---------- Stubbed external services ----------
+def install_stubs(latency_ms: float = 0.0):
+    """
+    Register fake `krakenex` and `openai` modules, so every exchange and
+    LLM call the app makes is answered locally (after latency_ms).
+    """
+    delay = latency_ms / 1000
+
+    class KrakenAPI:
+        def __init__(self, key=None, secret=None):
+            self.rng = random.Random()
+
+        def _ticker(self, pair):
+            price = BASE_PRICES.get(pair, 1.0) * self.rng.uniform(0.98, 1.02)
+            return {"c": [f"{price:.8f}", "1.0"], "v": ["1000.0", "25000.0"]}
+
+        def query_public(self, method, data=None):
+            time.sleep(delay)
+            data = data or {}
+            if method == "Ticker":
+                pairs = data["pair"].split(",") if data.get("pair") else SYMBOLS
+                return {"error": [], "result": {pair: self._ticker(pair) for pair in pairs}}
+            if method == "OHLC":
+                price, start = BASE_PRICES.get(data.get("pair"), 1.0), int(time.time()) - 720 * 60
+                candles = [
+                    [start + i * 60, f"{price}", f"{price * 1.001}", f"{price * 0.999}", f"{price}",
+                     f"{price}", "10.0", 5]
+                    for i in range(720)
+                ]
+                return {"error": [], "result": {data.get("pair", "XXBTZUSD"): candles, "last": start}}
+            return {"error": [], "result": {}}
+
+        def query_private(self, method, data=None):
+            time.sleep(delay)
+            if method == "Balance":
+                return {"error": [], "result": {"ZUSD": "1000.0000", "XXBT": "0.0100000000"}}
+            return {"error": [], "result": {}}
+
+    krakenex = types.ModuleType("krakenex")
+    krakenex.API = KrakenAPI
+
+    class Completions:
+        def create(self, **kwargs):
+            time.sleep(delay)
+            content = json.dumps({"signal": "HOLD", "confidence": 0.5, "reason": "load-test stub"})
+            message = types.SimpleNamespace(content=content, role="assistant")
+            return types.SimpleNamespace(
+                choices=[types.SimpleNamespace(message=message, finish_reason="stop")],
+                usage=types.SimpleNamespace(prompt_tokens=0, completion_tokens=0, total_tokens=0),
+            )
+
+    class OpenAI:
+        def __init__(self, api_key=None, **kwargs):
+            self.chat = types.SimpleNamespace(completions=Completions())
+
+    openai = types.ModuleType("openai")
+    openai.OpenAI = OpenAI
+    openai.chat = types.SimpleNamespace(completions=Completions())
+    for name in ("OpenAIError", "AuthenticationError", "RateLimitError", "APIConnectionError"):
+        setattr(openai, name, type(name, (Exception,), {}))
+
+    sys.modules["krakenex"] = krakenex
+    sys.modules["openai"] = openai
+
+
+# ---------- Server ----------
+async def emit_events(rate: float, event_type: str):
+    """Emit an event every 1/rate seconds carrying its sequence number and send time."""
+    from app.events import event_bus, EventType
+
+    kind = EventType(event_type)
+    interval = 1 / rate
+    next_at = time.perf_counter()
+    seq = 0
+    while True:
+        seq += 1
+        await event_bus.emit(kind, {
+            "seq": seq, "sent_at": time.time(), "symbol": SYMBOLS[seq % len(SYMBOLS)], "load_test": True,
+        })
+        next_at += interval
+        await asyncio.sleep(max(next_at - time.perf_counter(), 0))
+
+
+def serve(args):
+    """Run the dashboard app with stubbed clients and no background trading."""
+    if not Path(args.db).exists():
+        sys.exit(f"[LoadTest] Database {args.db} does not exist; run `seed` first")
+    _use_database(Path(args.db))
+    install_stubs(args.stub_latency_ms)
+
+    import uvicorn
+
+    from app.main import app, start_loop_monitor
+    from app.database.connection import ensure_db
+    from app.logic.pnl_ledger import pnl_ledger
+    from app.logic.position_book import position_book
+    from app.response_cache import response_cache
+
+    logging.getLogger().setLevel(args.log_level.upper())
+    if args.no_cache:
+        response_cache.default_ttl = 0.0
+
+    emitter = []
+
+    async def load_test_startup():
+        ensure_db()
+        position_book.rebuild()
+        pnl_ledger.sync()
+        if args.event_rate > 0:
+            emitter.append(asyncio.create_task(emit_events(args.event_rate, args.event_type)))
+        logging.warning(f"[LoadTest] Serving {args.db} on port {args.port}")
+
+    # Replace the production startup (scheduler, data collector, backfills)
+    app.router.on_startup[:] = [load_test_startup, start_loop_monitor]
+
+    uvicorn.Server(uvicorn.Config(
+        app, host="127.0.0.1", port=args.port, log_level=args.log_level, access_log=False,
+    )).run()
+
+
+# ---------- Load ----------
+class EndpointStats:
+    def __init__(self):
+        self.latencies = []
+        self.errors = 0
+
+    def row(self, name, elapsed):
+        latencies = sorted(self.latencies)
+        return (
+            f"{name:<40}{len(latencies):>9}{self.errors:>8}{len(latencies) / elapsed:>9.1f}"
+            f"{percentile(latencies, 0.50) * 1000:>9.1f}{percentile(latencies, 0.95) * 1000:>9.1f}"
+            f"{percentile(latencies, 0.99) * 1000:>9.1f}{(latencies[-1] if latencies else 0) * 1000:>9.1f}"
+        )
+
+
+class SSEStats:
+    def __init__(self):
+        self.connected = False
+        self.lags = []
+        self.first_seq = None
+        self.last_seq = None
+
+    @property
+    def missed(self):
+        if self.first_seq is None:
+            return 0
+        return self.last_seq - self.first_seq + 1 - len(self.lags)
+
+
+async def http_client(client, paths, stats, deadline, think, offset):
+    import httpx
+
+    i = offset
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        started = time.perf_counter()
+        try:
+            response = await client.get(path)
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            ok = False
+        if ok:
+            stats[path].latencies.append(time.perf_counter() - started)
+        else:
+            stats[path].errors += 1
+        if think:
+            await asyncio.sleep(think)
+
+
+async def sse_client(client, stats, measuring):
+    async with client.stream("GET", "/api/events") as response:
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            received = time.time()
+            event = json.loads(line[6:])
+            if event.get("type") == "connected":
+                stats.connected = True
+                continue
+            data = event.get("data") or {}
+            if "sent_at" not in data or not measuring.is_set():
+                continue
+            stats.lags.append(received - data["sent_at"])
+            if stats.first_seq is None:
+                stats.first_seq = data["seq"]
+            stats.last_seq = data["seq"]
+
+
+async def drive(url, args) -> dict:
+    """Run the HTTP and SSE clients for args.duration seconds and collect results."""
+    import httpx
+
+    paths = args.endpoints or DEFAULT_ENDPOINTS
+    limits = httpx.Limits(max_connections=args.clients + 10, max_keepalive_connections=args.clients + 10)
+    timeout = httpx.Timeout(60.0)
+
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=timeout) as client, \
+            httpx.AsyncClient(base_url=url, limits=httpx.Limits(max_connections=args.sse + 1),
+                              timeout=httpx.Timeout(None)) as sse:
+        # Warm the caches and pools once per endpoint
+        for path in paths:
+            response = await client.get(path)
+            if response.status_code >= 400:
+                print(f"  warning: {path} answered {response.status_code}")
+
+        measuring = asyncio.Event()
+        sse_stats = [SSEStats() for _ in range(args.sse)]
+        sse_tasks = [asyncio.create_task(sse_client(sse, s, measuring)) for s in sse_stats]
+        connect_deadline = time.perf_counter() + 30
+        while not all(s.connected for s in sse_stats) and time.perf_counter() < connect_deadline:
+            await asyncio.sleep(0.05)
+
+        stats = {path: EndpointStats() for path in paths}
+        measuring.set()
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            http_client(client, paths, stats, deadline, args.think_ms / 1000, offset)
+            for offset in range(args.clients)
+        ))
+        elapsed = time.perf_counter() - started
+
+        for task in sse_tasks:
+            task.cancel()
+        await asyncio.gather(*sse_tasks, return_exceptions=True)
+
+        try:
+            server = (await client.get("/api/metrics/event-loop")).json()
+        except (httpx.HTTPError, ValueError):
+            server = {}
+
+    return {"paths": paths, "stats": stats, "sse": sse_stats, "elapsed": elapsed, "server": server}
+
+
+def report(results, args):
+    stats, elapsed = results["stats"], results["elapsed"]
+    print(f"\nHTTP: {args.clients} clients for {elapsed:.1f}s"
+          f"{f' (think {args.think_ms:.0f}ms)' if args.think_ms else ''}")
+    print(f"{'endpoint':<40}{'requests':>9}{'errors':>8}{'req/s':>9}"
+          f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    total = EndpointStats()
+    for path in results["paths"]:
+        print(stats[path].row(path, elapsed))
+        total.latencies.extend(stats[path].latencies)
+        total.errors += stats[path].errors
+    print(total.row("all", elapsed))
+
+    summary = {
+        "clients": args.clients, "duration_s": round(elapsed, 2),
+        "requests": len(total.latencies), "errors": total.errors,
+        "rps": round(len(total.latencies) / elapsed, 1),
+        "endpoints": {
+            path: {
+                "requests": len(s.latencies), "errors": s.errors,
+                **{f"p{int(p * 100)}_ms": round(percentile(sorted(s.latencies), p) * 1000, 2)
+                   for p in (0.50, 0.95, 0.99)},
+            }
+            for path, s in stats.items()
+        },
+    }
+
+    sse = results["sse"]
+    if sse:
+        lags = sorted(lag for s in sse for lag in s.lags)
+        missed = sum(s.missed for s in sse)
+        connected = sum(s.connected for s in sse)
+        print(f"\nSSE: {connected}/{len(sse)} clients connected, {len(lags)} events received "
+              f"({len(lags) / max(len(sse), 1):.0f} per client), {missed} missed")
+        if lags:
+            print(f"  delivery lag ms: p50 {percentile(lags, 0.50) * 1000:.1f}  "
+                  f"p95 {percentile(lags, 0.95) * 1000:.1f}  p99 {percentile(lags, 0.99) * 1000:.1f}  "
+                  f"max {lags[-1] * 1000:.1f}")
+        summary["sse"] = {
+            "clients": len(sse), "connected": connected, "received": len(lags), "missed": missed,
+            **{f"lag_p{int(p * 100)}_ms": round(percentile(lags, p) * 1000, 2) for p in (0.50, 0.95, 0.99)},
+        }
+
+    loop = results["server"].get("event_loop")
+    if loop:
+        print(f"\nServer event loop lag ms: p95 {loop['p95_ms']}  max {loop['max_ms']}  "
+              f"stalls {loop['stalls']}")
+        summary["event_loop"] = loop
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(summary, indent=2))
+        print(f"\nSaved {args.json}")
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_ready(url: str, process, timeout: float = 120.0):
+    import httpx
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            sys.exit(f"[LoadTest] Server exited with code {process.returncode}")
+        try:
+            if httpx.get(f"{url}/api/metrics/event-loop", timeout=2).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.25)
+    sys.exit(f"[LoadTest] Server at {url} not ready after {timeout:.0f}s")
+
+
+def run(args):
+    process = None
+    url = args.url
+    if url is None:
+        db = Path(args.db)
+        if not db.exists():
+            print(f"Seeding {args.signals:,} signals and {args.trades:,} trades into {db}...")
+            seed(db, args.signals, args.trades)
+        port = _free_port()
+        command = [
+            sys.executable, str(Path(__file__).resolve()), "serve", "--db", str(db), "--port", str(port),
+            "--event-rate", str(args.event_rate), "--event-type", args.event_type,
+            "--stub-latency-ms", str(args.stub_latency_ms), "--log-level", args.server_log_level,
+        ] + (["--no-cache"] if args.no_cache else [])
+        process = subprocess.Popen(command)
+        url = f"http://127.0.0.1:{port}"
+
+    try:
+        _wait_ready(url, process)
+        results = asyncio.run(drive(url, args))
+        report(results, args)
+    finally:
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_seed_args(p):
+        p.add_argument("--db", default=str(DEFAULT_DB), help="SQLite file to seed/serve")
+        p.add_argument("--signals", type=int, default=1_000_000)
+        p.add_argument("--trades", type=int, default=50_000)
+
+    def add_server_args(p):
+        p.add_argument("--event-rate", type=float, default=5.0, help="Events emitted per second (0 = none)")
+        p.add_argument("--event-type", default="signal_generated",
+                       help="EventType value to emit (signal_generated also invalidates cached signal views)")
+        p.add_argument("--stub-latency-ms", type=float, default=0.0, help="Added to every stubbed Kraken/OpenAI call")
+        p.add_argument("--no-cache", action="store_true", help="Expire response-cache entries immediately")
+
+    p = commands.add_parser("seed", help="Create and fill a database file")
+    add_seed_args(p)
+    p.add_argument("--force", action="store_true", help="Replace an existing file")
+
+    p = commands.add_parser("serve", help="Run the app against a seeded database")
+    p.add_argument("--db", default=str(DEFAULT_DB))
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--log-level", default="warning")
+    add_server_args(p)
+
+    p = commands.add_parser("run", help="Start a server, drive load, report")
+    add_seed_args(p)
+    add_server_args(p)
+    p.add_argument("--url", help="Target an already running server instead of starting one")
+    p.add_argument("--clients", type=int, default=20, help="Concurrent HTTP clients")
+    p.add_argument("--sse", type=int, default=50, help="Concurrent SSE clients")
+    p.add_argument("--duration", type=float, default=30.0, help="Seconds of load")
+    p.add_argument("--think-ms", type=float, default=0.0, help="Pause between a client's requests")
+    p.add_argument("--endpoints", nargs="+", help=f"Paths to request (default: {' '.join(DEFAULT_ENDPOINTS)})")
+    p.add_argument("--json", help="Also write the results to this file")
+    p.add_argument("--server-log-level", default="error",
+                   help="Log level of the started server (warning shows the slow-query log)")
+
+    args = parser.parse_args()
+    if args.command == "seed":
+        db = Path(args.db)
+        if db.exists():
+            if not args.force:
+                sys.exit(f"[LoadTest] {db} exists; pass --force to replace it")
+            for path in (db, Path(f"{db}-wal"), Path(f"{db}-shm")):
+                path.unlink(missing_ok=True)
+        seed(db, args.signals, args.trades)
+    elif args.command == "serve":
+        serve(args)
+    else:
+        run(args)
+
+
+if __name__ == "__main__":
+    main()
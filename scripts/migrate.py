@@ -0,0 +1,42 @@
+"""
+Apply pending schema migrations (see app.database.migrations).
+
+The app applies them in the background at startup; this runs them in the
+foreground, e.g. before starting the bot after an upgrade.
+
+Usage:
+    python scripts/migrate.py [--status]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from app.database.connection import init_db
+from app.database.migrations import migration_runner
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--status", action="store_true", help="List recorded and pending migrations only")
+    args = parser.parse_args()
+
+    init_db()
+    if not args.status:
+        for result in migration_runner.apply_pending():
+            print(f"✅ {result['version']} {result['name']} ({result['duration_seconds']}s)")
+
+    stats = migration_runner.get_stats()
+    for row in stats["recorded"]:
+        print(f"   {row['version']:>3} {row['name']:<48} {row['duration_seconds']:>8}s  {row['applied_at']}")
+    if stats["pending"]:
+        print(f"Pending: {stats['pending']}")
+    if stats["last_error"]:
+        print(f"❌ {stats['last_error']}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
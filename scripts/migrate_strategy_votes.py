@@ -0,0 +1,24 @@
+"""
+Migration script: Signal.strategies JSON → strategy_votes rows.
+
+Creates the strategy_votes table if needed and fills it for every signal
+that has no votes yet. Safe to re-run.
+"""
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from app.database.connection import init_db
+from app.strategy_signal_logger import backfill_strategy_votes
+
+
+def main():
+    init_db()
+    migrated = backfill_strategy_votes()
+    print(f"✅ Migrated votes for {migrated} signals")
+
+
+if __name__ == "__main__":
+    main()
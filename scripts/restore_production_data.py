@@ -12,7 +12,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from app.database.connection import get_db
 from app.database.repositories import RSSFeedRepository, BotConfigRepository
-from app.database.models import Signal
+from app.database.models import Signal, StrategyRollup
 from decimal import Decimal
 
 def restore_rss_feeds():
@@ -65,6 +65,7 @@ def clean_test_signals():
     """Remove any test signals that got created."""
     with get_db() as db:
         test_signals = db.query(Signal).filter(Signal.test_mode == True).delete()
+        db.query(StrategyRollup).filter(StrategyRollup.test_mode == True).delete()
         db.commit()
         print(f"Cleaned {test_signals} test signals")
 
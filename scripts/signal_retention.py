@@ -0,0 +1,60 @@
+"""
+Run signal retention once (downsample HOLD-only hours, archive and delete
+old signals, incremental vacuum).
+
+Usage:
+    python scripts/signal_retention.py [--raw-days N] [--no-archive]
+    python scripts/signal_retention.py --enable-incremental-vacuum
+
+--enable-incremental-vacuum switches an existing database to
+auto_vacuum=INCREMENTAL with a one-off full VACUUM (stop the bot first;
+databases created after retention was added already use it).
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from app.database.connection import engine, init_db
+from app.signal_retention import signal_retention
+
+
+def enable_incremental_vacuum():
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.exec_driver_sql("VACUUM")
+        mode = conn.exec_driver_sql("PRAGMA auto_vacuum").scalar()
+    print(f"✅ auto_vacuum is now {mode} (2 = INCREMENTAL)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--raw-days", type=int, help="Keep raw signals this many days")
+    parser.add_argument("--downsample-after-days", type=int, help="Downsample HOLD-only hours older than this")
+    parser.add_argument("--no-archive", action="store_true", help="Delete without writing archive files")
+    parser.add_argument("--enable-incremental-vacuum", action="store_true")
+    args = parser.parse_args()
+
+    init_db()
+    if args.enable_incremental_vacuum:
+        enable_incremental_vacuum()
+        return
+
+    overrides = {}
+    if args.raw_days is not None:
+        overrides["raw_days"] = args.raw_days
+    if args.downsample_after_days is not None:
+        overrides["downsample_hold_after_days"] = args.downsample_after_days
+    if args.no_archive:
+        overrides["archive"] = False
+    if overrides:
+        signal_retention.update_config(overrides)
+
+    result = signal_retention.run()
+    print(f"✅ Retention complete: {result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -275,14 +275,13 @@ class BacktestEngine:
             # Record portfolio value
             portfolio.record_value(timestamp, current_prices)
 
-            # For each symbol, check if we should trade
+            # Build strategy context for every symbol with enough history
+            batch_symbols = []
+            batch_contexts = []
             for symbol in symbols:
                 if symbol not in current_prices:
                     continue
 
-                price = current_prices[symbol]
-                normalized_symbol = normalize_symbol(symbol)
-
                 # Build historical price/volume arrays for strategies
                 # (strategies need recent history to make decisions)
                 symbol_candles = historical_data[symbol]
@@ -296,31 +295,42 @@ class BacktestEngine:
 
                 # Get recent prices and volumes
                 recent_candles = symbol_candles[max(0, current_idx-100):current_idx+1]
-                price_history = [c["close"] for c in recent_candles]
-                volume_history = [c["volume"] for c in recent_candles]
 
-                # Generate signal from strategies
+                batch_symbols.append(symbol)
+                batch_contexts.append({
+                    "headlines": [],  # No news in backtest for now
+                    "price": current_prices[symbol],
+                    "volume": current_volumes.get(symbol, 0),
+                    "price_history": [c["close"] for c in recent_candles],
+                    "volume_history": [c["volume"] for c in recent_candles]
+                })
+
+            if not batch_symbols:
+                continue
+
+            # Generate signals for all symbols at this step in one batch
+            try:
+                decisions = self.strategy_manager.get_signals(
+                    [normalize_symbol(symbol) for symbol in batch_symbols],
+                    batch_contexts
+                )
+            except Exception as e:
+                logging.error(f"[Backtest] Error generating signals at {timestamp}: {e}")
+                continue
+
+            # Use min_confidence from config, default to 0.5
+            min_confidence = self.config.get("min_confidence", 0.5)
+
+            # Execute trades based on signal
+            for symbol, decision in zip(batch_symbols, decisions):
                 try:
-                    context = {
-                        "headlines": [],  # No news in backtest for now
-                        "price": price,
-                        "volume": current_volumes.get(symbol, 0),
-                        "price_history": price_history,
-                        "volume_history": volume_history
-                    }
-
-                    signal, confidence, reason, signal_id = self.strategy_manager.get_signal(
-                        symbol=normalized_symbol,
-                        context=context
-                    )
-
-                    # Execute trades based on signal
+                    signal = decision["signal"]
+                    confidence = decision["confidence"]
+                    price = current_prices[symbol]
+
                     portfolio_value = portfolio.get_portfolio_value(current_prices)
                     position_size_usd = portfolio_value * position_size_pct
 
-                    # Use min_confidence from config, default to 0.5
-                    min_confidence = self.config.get("min_confidence", 0.5)
-
                     if signal == "BUY" and confidence > min_confidence:
                         amount = position_size_usd / price
                         portfolio.buy(symbol, price, amount, timestamp)
@@ -331,7 +341,7 @@ class BacktestEngine:
                         portfolio.sell(symbol, price, amount, timestamp)
 
                 except Exception as e:
-                    logging.error(f"[Backtest] Error generating signal for {symbol}: {e}")
+                    logging.error(f"[Backtest] Error executing signal for {symbol}: {e}")
 
         # Calculate final metrics
         final_value = portfolio.get_portfolio_value(current_prices)
@@ -0,0 +1,118 @@
+"""
+Lazy construction of the bot's components.
+
+Importing app.main (or any module a script, test or worker needs) must not
+connect to Kraken, load the OpenAI SDK or touch the database. Components are
+registered here as factories and built on first use:
+
+    from app.bootstrap import components
+
+    price = components.kraken.get_price("BTC/USD")
+
+Each component is built once per process (thread-safe) and cached. The
+database itself is initialized the same way by
+app.database.connection.ensure_db() on the first session.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+def _kraken():
+    from app.client.kraken import KrakenClient
+    return KrakenClient()
+
+
+def _sentiment():
+    from app.logic.sentiment import SentimentSignal
+    return SentimentSignal()
+
+
+def _trader():
+    from app.logic.paper_trader import PaperTrader
+    from app.logic.position_book import position_book
+    return PaperTrader(book=position_book)
+
+
+def _notifier():
+    from app.logic.notifier import Notifier
+    return Notifier()
+
+
+DEFAULT_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "kraken": _kraken,        # KrakenClient for prices, balances and trades
+    "sentiment": _sentiment,  # SentimentSignal (OpenAI)
+    "trader": _trader,        # PaperTrader on the shared position book
+    "notifier": _notifier,
+}
+
+
+class Components:
+    """Registry of lazily built, process-wide components."""
+
+    def __init__(self, factories: Dict[str, Callable[[], Any]] = None):
+        """
+        Args:
+            factories: name -> zero-argument factory (defaults to DEFAULT_FACTORIES)
+        """
+        self._factories = dict(factories or DEFAULT_FACTORIES)
+        self._instances: Dict[str, Any] = {}
+        self._build_seconds: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    def register(self, name: str, factory: Callable[[], Any]):
+        """Register (or replace) a factory; drops any instance already built."""
+        with self._lock:
+            self._factories[name] = factory
+            self._instances.pop(name, None)
+
+    def get(self, name: str) -> Any:
+        """Get a component, building it on first use."""
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        with self._lock:
+            if name not in self._instances:
+                if name not in self._factories:
+                    raise KeyError(f"Unknown component: {name}")
+                started = time.perf_counter()
+                self._instances[name] = self._factories[name]()
+                self._build_seconds[name] = round(time.perf_counter() - started, 4)
+                logger.info(f"[Bootstrap] Built {name} in {self._build_seconds[name]}s")
+            return self._instances[name]
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self.get(name)
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def set(self, name: str, instance: Any):
+        """Use an existing instance for `name` (e.g. a stub in tests)."""
+        with self._lock:
+            self._instances[name] = instance
+
+    def reset(self, *names: str):
+        """Forget built instances (all when no names are given)."""
+        with self._lock:
+            for name in names or list(self._instances):
+                self._instances.pop(name, None)
+                self._build_seconds.pop(name, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Which components are built and how long each took."""
+        with self._lock:
+            return {
+                "registered": sorted(self._factories),
+                "built": dict(self._build_seconds),
+            }
+
+
+# Global singleton
+components = Components()
@@ -1,25 +1,129 @@
 import os
-import krakenex
+import time
+import logging
 from dotenv import load_dotenv
+from app.utils.symbol_normalizer import normalize_symbol
+from app.metrics.tracing import external_call
 
 load_dotenv()
 
+# How long a pair Kraken rejected stays skipped before it is tried again
+UNKNOWN_PAIR_RETRY_SECONDS = 30 * 60
+
 
 class KrakenClient:
     def __init__(self):
-        self.api = krakenex.API(
-            key=os.getenv("KRAKEN_API_KEY"), secret=os.getenv("KRAKEN_API_SECRET")
-        )
+        # krakenex (and requests) load on first API call
+        self._api = None
+        # Pairs Kraken rejected with EQuery -> when they were rejected;
+        # left out of batched calls until UNKNOWN_PAIR_RETRY_SECONDS pass
+        self.unknown_pairs = {}
+
+    @property
+    def api(self):
+        """Lazy load the krakenex API client."""
+        if self._api is None:
+            import krakenex
+
+            self._api = krakenex.API(
+                key=os.getenv("KRAKEN_API_KEY"), secret=os.getenv("KRAKEN_API_SECRET")
+            )
+        return self._api
+
+    @api.setter
+    def api(self, api):
+        self._api = api
+
+    def _query(self, method, params=None, private=False):
+        """Call the Kraken API, recording latency and errors for /metrics."""
+        with external_call("kraken", method) as call:
+            if private:
+                result = self.api.query_private(method) if params is None else self.api.query_private(method, params)
+            else:
+                result = self.api.query_public(method) if params is None else self.api.query_public(method, params)
+            if isinstance(result, dict) and result.get("error"):
+                call.failed()
+            return result
 
     def get_price(self, symbol):
         try:
-            result = self.api.query_public("Ticker", {"pair": symbol})
+            result = self._query("Ticker", {"pair": symbol})
             pair_data = result["result"]
             key = next(iter(pair_data))
             return float(pair_data[key]["c"][0])
         except Exception:
             return 0.0
 
+    def get_prices(self, symbols):
+        """
+        Last trade prices for several pairs in one Ticker call.
+
+        Kraken rejects the whole batch if any pair is unknown (EQuery), so
+        on that error each pair is retried alone; pairs that fail on their
+        own are skipped in later calls for UNKNOWN_PAIR_RETRY_SECONDS, so a
+        pair Kraken lists later is picked up again.
+
+        Args:
+            symbols: Pairs in any recognised format (BTCUSD, BTC/USD, XXBTZUSD)
+
+        Returns:
+            {symbol: price} keyed as passed in; pairs missing from the
+            response (or the whole batch on error) are omitted
+        """
+        symbols = [s for s in symbols if not self._is_unknown_pair(s)]
+        if not symbols:
+            return {}
+        try:
+            result = self._query("Ticker", {"pair": ",".join(symbols)})
+        except Exception as e:
+            logging.error(f"[KrakenClient] Ticker request for {symbols} failed: {e}")
+            return {}
+
+        errors = result.get("error") or []
+        if any(str(error).startswith("EQuery") for error in errors):
+            if len(symbols) == 1:
+                logging.warning(f"[KrakenClient] Skipping unknown pair {symbols[0]}: {errors}")
+                self.unknown_pairs[symbols[0]] = time.monotonic()
+                return {}
+            logging.warning(f"[KrakenClient] Ticker rejected {symbols} ({errors}); retrying pairs individually")
+            prices = {}
+            for symbol in symbols:
+                prices.update(self.get_prices([symbol]))
+            return prices
+
+        pair_data = result.get("result")
+        if errors or not isinstance(pair_data, dict):
+            logging.error(f"[KrakenClient] Ticker error for {symbols}: {errors or 'no result'}")
+            return {}
+
+        # Kraken answers with its own pair names (XXBTZUSD); match on canonical form
+        by_canonical = {}
+        for key, ticker in pair_data.items():
+            try:
+                by_canonical[normalize_symbol(key)] = float(ticker["c"][0])
+            except (ValueError, KeyError, IndexError, TypeError):
+                continue
+
+        prices = {}
+        for symbol in symbols:
+            try:
+                canonical = normalize_symbol(symbol)
+            except ValueError:
+                continue
+            if by_canonical.get(canonical, 0) > 0:
+                prices[symbol] = by_canonical[canonical]
+        return prices
+
+    def _is_unknown_pair(self, symbol):
+        """True while symbol is inside its skip window; expired entries are dropped."""
+        rejected_at = self.unknown_pairs.get(symbol)
+        if rejected_at is None:
+            return False
+        if time.monotonic() - rejected_at >= UNKNOWN_PAIR_RETRY_SECONDS:
+            del self.unknown_pairs[symbol]
+            return False
+        return True
+
     def get_balance(self, asset=None):
         """
         Get balance from Kraken.
@@ -31,7 +135,7 @@ class KrakenClient:
             dict or float depending on asset parameter
         """
         try:
-            result = self.api.query_private("Balance")
+            result = self._query("Balance", private=True)
             balances = result.get("result", {})
 
             import logging
@@ -57,7 +161,7 @@ class KrakenClient:
 
     def get_tickers(self):
         try:
-            result = self.api.query_public("Ticker")
+            result = self._query("Ticker")
             data = result["result"]
             formatted = {}
             for k, v in data.items():
@@ -83,7 +187,7 @@ class KrakenClient:
             if since:
                 params["since"] = since
 
-            result = self.api.query_public("OHLC", params)
+            result = self._query("OHLC", params)
 
             if result.get("error"):
                 import logging
@@ -1,21 +1,33 @@
 from pathlib import Path
 from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
-from collections import defaultdict
 from typing import Dict, Any, List, Tuple
 from decimal import Decimal
 import json
+import base64
 import logging
 import asyncio
 from app.strategy_signal_logger import StrategySignalLogger
+from app.strategy_rollups import get_strategy_totals
+from app.strategy_correlation import strategy_correlation
 from datetime import datetime, timezone, timedelta
 from app.error_tracker import error_tracker
+from app.logic.position_book import position_book
+from app.logic.pnl_ledger import pnl_ledger
 from app.events import event_bus, EventType
+from app.response_cache import response_cache
+from app.metrics.loop_monitor import loop_monitor
+from app.metrics.query_profiler import query_profiler
+from app.metrics.prometheus import metrics, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from app.metrics.tracing import tracer, trace_to_flame, traces_to_otlp
+from app.data_collector import data_collector
 import time
 
 # Database imports
-from app.database.connection import get_db
+from app.database.connection import get_db, get_read_db, get_async_read_db, get_pool_stats
+from app.database.async_repositories import AsyncTradeRepository
 from app.database.repositories import SignalRepository, TradeRepository, HoldingRepository, RSSFeedRepository, BotConfigRepository
 from sqlalchemy import func, desc
 
@@ -29,6 +41,9 @@ LOGS_DIR = PROJECT_ROOT / "logs"
 # Initialize
 signal_logger = StrategySignalLogger(data_dir=str(LOGS_DIR))
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+
+# SSE clients only need the latest event per type and symbol when they fall behind
+SSE_OVERFLOW = "coalesce"
 # REMOVED: RSS_FEEDS_FILE - feeds now in database
 
 
@@ -39,7 +54,7 @@ templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 def _load_trades() -> List[Dict[str, Any]]:
     """Load trades from database."""
     try:
-        with get_db() as db:
+        with get_read_db() as db:
             repo = TradeRepository(db)
             trade_models = repo.get_all(test_mode=False)
 
@@ -73,7 +88,7 @@ def _load_status() -> Dict[str, Any]:
     from datetime import timezone
 
     try:
-        with get_db() as db:
+        with get_read_db() as db:
             from app.database.repositories import BotConfigRepository, SignalRepository
             config_repo = BotConfigRepository(db)
             signal_repo = SignalRepository(db)
@@ -122,7 +137,7 @@ def _load_status() -> Dict[str, Any]:
 def _load_rss_feeds() -> List[Dict[str, Any]]:
     """Load RSS feeds from database with headline counts."""
     try:
-        with get_db() as db:
+        with get_read_db() as db:
             from app.database.models import SeenNews
             repo = RSSFeedRepository(db)
             feed_models = repo.get_all()
@@ -171,73 +186,9 @@ def _load_rss_feeds() -> List[Dict[str, Any]]:
 
 # ---------- PnL ----------
 def load_pnl_data() -> Tuple[List[str], List[float]]:
-    trades = _load_trades()
-    if not trades:
-        return [], []
-
-    pnl_by_symbol = defaultdict(float)
-    positions: Dict[str, Dict[str, Any]] = {}
-    last_price: Dict[str, float] = {}
-
-    for trade in trades:
-        symbol = trade.get("symbol")
-        action = (trade.get("action") or "").lower()
-        price = trade.get("price")
-        amount = trade.get("amount", 0)
-
-        if not symbol or price is None or amount is None:
-            continue
-
-        last_price[symbol] = price
-        pos = positions.get(symbol)
-
-        if action == "buy":
-            if pos is None:
-                positions[symbol] = {"price": price, "amount": amount, "side": "long"}
-            elif pos["side"] == "long":
-                total_cost = pos["price"] * pos["amount"] + price * amount
-                total_amount = pos["amount"] + amount
-                pos["price"] = (
-                    total_cost / total_amount if total_amount else pos["price"]
-                )
-                pos["amount"] = total_amount
-            elif pos["side"] == "short":
-                cover_amount = min(amount, pos["amount"])
-                pnl = (pos["price"] - price) * cover_amount
-                pnl_by_symbol[symbol] += pnl
-                pos["amount"] -= cover_amount
-                if pos["amount"] <= 0:
-                    positions.pop(symbol, None)
-
-        elif action == "sell":
-            if pos is None:
-                positions[symbol] = {"price": price, "amount": amount, "side": "short"}
-            elif pos["side"] == "short":
-                total_cost = pos["price"] * pos["amount"] + price * amount
-                total_amount = pos["amount"] + amount
-                pos["price"] = (
-                    total_cost / total_amount if total_amount else pos["price"]
-                )
-                pos["amount"] = total_amount
-            elif pos["side"] == "long":
-                sell_amount = min(amount, pos["amount"])
-                pnl = (price - pos["price"]) * sell_amount
-                pnl_by_symbol[symbol] += pnl
-                pos["amount"] -= sell_amount
-                if pos["amount"] <= 0:
-                    positions.pop(symbol, None)
-
-    for symbol, pos in positions.items():
-        if symbol in last_price:
-            current_price = last_price[symbol]
-            if pos["side"] == "long":
-                unrealized = (current_price - pos["price"]) * pos["amount"]
-            else:
-                unrealized = (pos["price"] - current_price) * pos["amount"]
-            pnl_by_symbol[symbol] += unrealized
-
-    labels = list(pnl_by_symbol.keys())
-    pnl_data = [round(pnl_by_symbol[s], 2) for s in labels]
+    """Per-symbol P&L (realized + unrealized at last trade price) from the ledger."""
+    pnl_ledger.sync()
+    labels, pnl_data = pnl_ledger.get_pnl_data()
 
     logging.info(f"[PnL] Labels: {labels}")
     logging.info(f"[PnL] Data: {pnl_data}")
@@ -299,7 +250,7 @@ def build_summary(trades: List[Dict[str, Any]]) -> Dict[str, Any]:
 def load_sentiment() -> Dict[str, Dict[str, Any]]:
     """Load sentiment data from recent signals in database."""
     try:
-        with get_db() as db:
+        with get_read_db() as db:
             signal_repo = SignalRepository(db)
             recent_signals = signal_repo.get_recent(hours=24, test_mode=False, limit=100)
 
@@ -324,9 +275,48 @@ def load_sentiment() -> Dict[str, Dict[str, Any]]:
         return {}
 
 
+# ---------- Signal feed ----------
+def _signal_feed_item(s, t=None) -> Dict[str, Any]:
+    """Signal row (and the trade it triggered, if any) in dashboard format."""
+    item = {
+        "id": s.id,
+        "symbol": s.symbol,
+        "signal": s.final_signal or "HOLD",
+        "confidence": float(s.final_confidence) if s.final_confidence else 0.0,
+        "price": float(s.price) if s.price else 0.0,
+        "timestamp": s.timestamp.isoformat() + 'Z' if s.timestamp else None,
+        "executed": t is not None,
+        "strategies": s.strategies or {},
+    }
+    if t is not None:
+        item["trade"] = {
+            "trade_id": t.id,
+            "action": t.action,
+            "amount": float(t.amount),
+            "net_value": float(t.net_value),
+            "trade_timestamp": t.timestamp.isoformat() + 'Z' if t.timestamp else None
+        }
+    return item
+
+
+def _encode_cursor(timestamp: datetime, signal_id: int) -> str:
+    raw = f"{timestamp.isoformat()}|{signal_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Inverse of _encode_cursor; raises ValueError on malformed input."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, signal_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(timestamp), int(signal_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
 # ---------- Routes ----------
 @router.get("/", response_class=HTMLResponse)
-async def dashboard(request: Request):
+def dashboard(request: Request):
     labels, pnl_data = load_pnl_data()
     return templates.TemplateResponse(
         "dashboard.html",
@@ -335,7 +325,14 @@ async def dashboard(request: Request):
 
 
 @router.get("/partial")
-async def partial(signal_limit: int = 50):
+async def partial(request: Request, signal_limit: int = 50):
+    return await response_cache.respond(
+        request, "partial", lambda: run_in_threadpool(_build_partial, signal_limit),
+        tags=("trades", "pnl", "signals"),
+    )
+
+
+def _build_partial(signal_limit: int = 50):
     trades = _load_trades()
     summary = build_summary(trades)
     labels, pnl_data = load_pnl_data()
@@ -353,73 +350,21 @@ async def partial(signal_limit: int = 50):
         t for t in trades if (t.get("action") or "").lower() in ("buy", "sell")
     ][-20:]
 
-    # Load signals from database - include ALL signals (HOLDs and non-HOLDs)
+    # Signal feed: executed signals first (newest first), then fill with recent
+    # non-executed ones - two set-based queries, each bounded by signal_limit
     signals = []
     try:
-        with get_db() as db:
+        with get_read_db() as db:
             signal_repo = SignalRepository(db)
-            trade_repo = TradeRepository(db)
+            executed = signal_repo.get_feed(limit=signal_limit, executed=True)
+            remaining = signal_limit - len(executed)
+            regular = signal_repo.get_feed(
+                limit=remaining,
+                executed=False,
+                since=datetime.utcnow() - timedelta(hours=24),
+            ) if remaining > 0 else []
 
-            # Get all trades and create mapping: signal_id -> trade
-            executed_signal_ids = set()
-            signal_to_trade = {}
-            all_trades = trade_repo.get_all(test_mode=False)
-            for t in all_trades:
-                if t.signal_id:
-                    executed_signal_ids.add(t.signal_id)
-                    signal_to_trade[t.signal_id] = {
-                        "trade_id": t.id,
-                        "action": t.action,
-                        "amount": float(t.amount),
-                        "net_value": float(t.net_value),
-                        "trade_timestamp": t.timestamp.isoformat() + 'Z' if t.timestamp else None
-                    }
-
-            # ALWAYS fetch executed signals by ID (so they're never missed)
-            executed_signals = []
-            for signal_id in executed_signal_ids:
-                s = signal_repo.get_by_id(signal_id)
-                if s:
-                    signal_dict = {
-                        "id": s.id,
-                        "symbol": s.symbol,
-                        "signal": s.final_signal or "HOLD",
-                        "confidence": float(s.final_confidence) if s.final_confidence else 0.0,
-                        "price": float(s.price) if s.price else 0.0,
-                        "timestamp": s.timestamp.isoformat() + 'Z' if s.timestamp else None,
-                        "executed": True,
-                        "strategies": s.strategies if hasattr(s, 'strategies') else {},
-                        "trade": signal_to_trade[s.id]
-                    }
-                    executed_signals.append(signal_dict)
-
-            # Get recent non-executed signals
-            fetch_limit = min(signal_limit * 3, 500)
-            recent_signals = signal_repo.get_recent(hours=24, test_mode=False, limit=fetch_limit)
-
-            regular_signals = []
-            for s in recent_signals:
-                # Skip if already in executed list
-                if s.id in executed_signal_ids:
-                    continue
-
-                signal_dict = {
-                    "id": s.id,
-                    "symbol": s.symbol,
-                    "signal": s.final_signal or "HOLD",
-                    "confidence": float(s.final_confidence) if s.final_confidence else 0.0,
-                    "price": float(s.price) if s.price else 0.0,
-                    "timestamp": s.timestamp.isoformat() + 'Z' if s.timestamp else None,
-                    "executed": False,
-                    "strategies": s.strategies if hasattr(s, 'strategies') else {}
-                }
-                regular_signals.append(signal_dict)
-
-            # PRIORITIZE: Executed signals first, then fill with regular signals
-            # Sort executed signals by timestamp (newest first)
-            executed_signals.sort(key=lambda x: x['timestamp'], reverse=True)
-
-            signals = executed_signals + regular_signals[-(signal_limit - len(executed_signals)):]
+            signals = [_signal_feed_item(s, t) for s, t in executed + regular]
 
     except Exception as e:
         logging.error(f"[Partial] Error loading signals from database: {e}")
@@ -435,7 +380,7 @@ async def partial(signal_limit: int = 50):
 
 
 @router.get("/status")
-async def status():
+def status():
     status_data = _load_status()
     return JSONResponse(
         {
@@ -491,7 +436,13 @@ async def update_balance(request: Request):
 
 
 @router.get("/api/balance")
-async def get_balance():
+async def get_balance(request: Request):
+    return await response_cache.respond(
+        request, "balance", lambda: run_in_threadpool(_build_balance), tags=("trades", "pnl")
+    )
+
+
+def _build_balance():
     balance_data = {
         "paper_trading": {
             "initial": 200.0,
@@ -508,7 +459,11 @@ async def get_balance():
         labels, pnl_data = load_pnl_data()
         total_pnl = sum(pnl_data) if pnl_data else 0.0
 
+        totals = pnl_ledger.get_totals()
+
         balance_data["paper_trading"]["pnl"] = round(total_pnl, 2)
+        balance_data["paper_trading"]["realized_pnl"] = round(totals["realized_pnl"], 2)
+        balance_data["paper_trading"]["unrealized_pnl"] = round(totals["unrealized_pnl"], 2)
         balance_data["paper_trading"]["current"] = round(200.0 + total_pnl, 2)
 
         logging.info(
@@ -558,44 +513,117 @@ async def get_balance():
     }
 
 
+# Collector quotes younger than this are used as-is for holdings valuation
+HOLDINGS_PRICE_MAX_AGE = 90
+
+# Shared so pairs Kraken rejects are remembered between requests
+_price_client = None
+
+
+def _get_price_client():
+    global _price_client
+    if _price_client is None:
+        from app.client.kraken import KrakenClient
+        _price_client = KrakenClient()
+    return _price_client
+
+
+def _get_holding_prices(symbols: List[str]) -> Dict[str, Tuple[float, float, str]]:
+    """
+    Current prices for held symbols with at most one exchange call.
+
+    Returns:
+        symbol -> (price, observed_at, source) where observed_at is a Unix
+        timestamp and source is "collector" or "exchange"; symbols with no
+        price available are omitted
+    """
+    now = time.time()
+    quotes = {
+        symbol: (price, now - age, "collector")
+        for symbol, (price, age) in data_collector.get_fresh_prices(symbols, HOLDINGS_PRICE_MAX_AGE).items()
+    }
+
+    missing = [s for s in symbols if s not in quotes]
+    if missing:
+        try:
+            for symbol, price in _get_price_client().get_prices(missing).items():
+                quotes[symbol] = (price, time.time(), "exchange")
+        except Exception as e:
+            logging.warning(f"[Holdings] Failed to fetch prices for {missing}: {e}")
+
+    return quotes
+
+
+def _refresh_price_ages(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Recompute price ages from price_observed_at, so cached holdings report the age at serve time."""
+    now = time.time()
+    ages = []
+    for holding in result.get("holdings", {}).values():
+        observed_at = holding.get("price_observed_at")
+        if observed_at is not None:
+            holding["price_age_seconds"] = round(max(now - observed_at, 0.0), 1)
+            ages.append(holding["price_age_seconds"])
+    if "summary" in result and "oldest_price_age_seconds" in result["summary"]:
+        result["summary"]["oldest_price_age_seconds"] = max(ages, default=None)
+    return result
+
+
 @router.get("/api/holdings")
-async def get_holdings():
+async def get_holdings(request: Request):
+    """Get current holdings/positions (cached; marked to live Kraken prices)."""
+    return await response_cache.respond(
+        request, "holdings", lambda: run_in_threadpool(_build_holdings), tags=("positions",),
+        finalize=_refresh_price_ages,
+    )
+
+
+def _build_holdings():
     """Get current holdings/positions from database."""
     try:
-        # Load holdings directly from database and convert to dict INSIDE session
-        with get_db() as db:
-            from app.database.repositories import HoldingRepository
-            holding_repo = HoldingRepository(db)
-            holdings_models = holding_repo.get_current_holdings(test_mode=False)
-
-            # Convert to dict while session is still open
-            holdings_list = []
-            for h in holdings_models:
-                holdings_list.append({
-                    "symbol": h.symbol,
-                    "amount": float(h.amount),
-                    "avg_buy_price": float(h.avg_buy_price),
-                    "current_price": float(h.current_price) if h.current_price else float(h.avg_buy_price),
-                    "entry_trade_id": h.entry_trade_id,
-                    "entry_signal_id": h.entry_signal_id,
-                })
+        if position_book.loaded:
+            # In-memory position book (kept current by the trader)
+            holdings_list = [
+                {
+                    "symbol": symbol,
+                    "amount": p["amount"],
+                    "avg_buy_price": p["avg_price"],
+                    "current_price": p["current_price"],
+                    "entry_trade_id": p["entry_trade_id"],
+                    "entry_signal_id": p["entry_signal_id"],
+                }
+                for symbol, p in position_book.snapshot().items()
+            ]
+        else:
+            # Load holdings directly from database and convert to dict INSIDE session
+            with get_read_db() as db:
+                from app.database.repositories import HoldingRepository
+                holding_repo = HoldingRepository(db)
+                holdings_models = holding_repo.get_current_holdings(test_mode=False)
+
+                # Convert to dict while session is still open
+                holdings_list = []
+                for h in holdings_models:
+                    holdings_list.append({
+                        "symbol": h.symbol,
+                        "amount": float(h.amount),
+                        "avg_buy_price": float(h.avg_buy_price),
+                        "current_price": float(h.current_price) if h.current_price else float(h.avg_buy_price),
+                        "entry_trade_id": h.entry_trade_id,
+                        "entry_signal_id": h.entry_signal_id,
+                    })
 
-        # Get current prices from Kraken
-        from app.client.kraken import KrakenClient
-        kraken_client = KrakenClient()
+        # Value at the collector's latest prices when fresh, otherwise one
+        # batched Ticker call for whatever is missing (book price as last resort)
+        quotes = _get_holding_prices([h["symbol"] for h in holdings_list])
 
         formatted_holdings = {}
         for holding in holdings_list:
             symbol = holding["symbol"]
             amount = holding["amount"]
             avg_price = holding["avg_buy_price"]
-
-            # Get current market price
-            try:
-                current_price = kraken_client.get_price(symbol)
-            except Exception as e:
-                logging.warning(f"Failed to get price for {symbol}: {e}")
-                current_price = holding["current_price"]
+            current_price, observed_at, price_source = quotes.get(
+                symbol, (holding["current_price"], None, "book")
+            )
 
             market_value = amount * current_price
             cost_basis = amount * avg_price
@@ -605,6 +633,9 @@ async def get_holdings():
                 "amount": round(amount, 8),
                 "avg_price": round(avg_price, 2),
                 "current_price": round(current_price, 2),
+                "price_age_seconds": None,
+                "price_observed_at": round(observed_at, 3) if observed_at is not None else None,
+                "price_source": price_source,
                 "market_value": round(market_value, 2),
                 "cost_basis": round(cost_basis, 2),
                 "unrealized_pnl": round(unrealized_pnl, 2),
@@ -618,7 +649,7 @@ async def get_holdings():
         total_cost = sum(h["cost_basis"] for h in formatted_holdings.values())
         total_pnl = total_value - total_cost
 
-        return {
+        return _refresh_price_ages({
             "holdings": formatted_holdings,
             "summary": {
                 "total_positions": len(formatted_holdings),
@@ -628,8 +659,9 @@ async def get_holdings():
                 "total_unrealized_pnl_percent": round(
                     (total_pnl / total_cost * 100) if total_cost > 0 else 0, 2
                 ),
+                "oldest_price_age_seconds": None,
             },
-        }
+        })
 
     except Exception as e:
         logging.error(f"[Holdings] Error calculating from trades: {e}")
@@ -647,10 +679,17 @@ async def get_holdings():
 
 # Strategy API endpoints
 @router.get("/api/strategy/current")
-async def get_current_signals():
+async def get_current_signals(request: Request):
+    """Get current signals (cached until the next signal)."""
+    return await response_cache.respond(
+        request, "strategy_current", lambda: run_in_threadpool(_build_current_signals), tags=("signals",)
+    )
+
+
+def _build_current_signals():
     """Get current signals from database."""
     try:
-        with get_db() as db:
+        with get_read_db() as db:
             repo = SignalRepository(db)
             # Get recent signals (last 24 hours)
             signal_models = repo.get_recent(hours=24, test_mode=False, limit=100)
@@ -696,7 +735,7 @@ async def get_current_signals():
 
 
 @router.get("/api/strategy/history")
-async def get_signal_history(request: Request):
+def get_signal_history(request: Request):
     try:
         symbol = request.query_params.get("symbol")
         limit_str = request.query_params.get("limit", "100")
@@ -722,9 +761,59 @@ async def get_signal_history(request: Request):
         return JSONResponse({"error": str(e), "status": "error"}, status_code=500)
 
 
+@router.get("/api/signals/feed")
+def get_signal_feed(
+    cursor: str = None,
+    limit: int = 50,
+    symbol: str = None,
+    executed: bool = None,
+):
+    """
+    Cursor-paginated signal feed, newest first.
+
+    Pass next_cursor from the previous page as ?cursor= to continue; each page
+    is a single keyset query, so deep pages cost the same as the first.
+    """
+    limit = max(1, min(limit, 200))
+    try:
+        before = _decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        return JSONResponse({"error": str(e), "status": "error"}, status_code=400)
+
+    try:
+        with get_read_db() as db:
+            rows = SignalRepository(db).get_feed(
+                limit=limit + 1, before=before, executed=executed, symbol=symbol
+            )
+            page = rows[:limit]
+            signals = [_signal_feed_item(s, t) for s, t in page]
+            next_cursor = (
+                _encode_cursor(page[-1][0].timestamp, page[-1][0].id)
+                if len(rows) > limit else None
+            )
+
+        return JSONResponse({
+            "signals": signals,
+            "count": len(signals),
+            "next_cursor": next_cursor,
+            "status": "success",
+        })
+    except Exception as e:
+        logging.error(f"[API] Error in get_signal_feed: {e}")
+        return JSONResponse({"error": str(e), "status": "error"}, status_code=500)
+
+
 @router.get("/api/strategy/performance")
 async def get_strategy_performance(request: Request):
-    """Get strategy performance from database."""
+    """Get strategy performance (cached until the next signal)."""
+    return await response_cache.respond(
+        request, "strategy_performance", lambda: run_in_threadpool(_build_strategy_performance, request),
+        tags=("signals",),
+    )
+
+
+def _build_strategy_performance(request: Request):
+    """Get strategy performance from the hourly/daily signal rollups."""
     try:
         lookback_str = request.query_params.get("lookback_days", "7")
 
@@ -736,74 +825,32 @@ async def get_strategy_performance(request: Request):
                 status_code=400,
             )
 
-        with get_db() as db:
-            repo = SignalRepository(db)
-            # Get signals from lookback period
-            hours = lookback_days * 24
-            signals = repo.get_recent(hours=hours, test_mode=False, limit=10000)
-
-            # Calculate performance per strategy
-            strategy_stats = defaultdict(lambda: {
-                "total_signals": 0,
-                "buy_signals": 0,
-                "sell_signals": 0,
-                "hold_signals": 0,
-                "avg_confidence": 0.0,
-                "total_confidence": 0.0
-            })
-
-            for sig in signals:
-                strategies_dict = sig.strategies or {}
-                for strategy_name, strategy_data in strategies_dict.items():
-                    stats = strategy_stats[strategy_name]
-                    stats["total_signals"] += 1
-
-                    signal_type = strategy_data.get("signal", "HOLD") if isinstance(strategy_data, dict) else "HOLD"
-                    if signal_type == "BUY":
-                        stats["buy_signals"] += 1
-                    elif signal_type == "SELL":
-                        stats["sell_signals"] += 1
-                    else:
-                        stats["hold_signals"] += 1
-
-                    confidence = strategy_data.get("confidence", 0) if isinstance(strategy_data, dict) else 0
-                    stats["total_confidence"] += confidence
-
-            # Calculate averages
-            performance = {}
-            for strategy_name, stats in strategy_stats.items():
-                if stats["total_signals"] > 0:
-                    stats["avg_confidence"] = round(stats["total_confidence"] / stats["total_signals"], 4)
-                del stats["total_confidence"]  # Remove intermediate calculation
-                performance[strategy_name] = stats
+        performance = {
+            strategy_name: {
+                "total_signals": totals["total_signals"],
+                "buy_signals": totals["buy_count"],
+                "sell_signals": totals["sell_count"],
+                "hold_signals": totals["hold_count"],
+                "avg_confidence": round(totals["confidence_sum"] / totals["total_signals"], 4),
+            }
+            for strategy_name, totals in get_strategy_totals(lookback_days, test_mode=False).items()
+        }
 
-            logging.info(f"[Dashboard] Calculated performance for {len(performance)} strategies from database")
-            return JSONResponse(
-                {
-                    "strategies": performance,
-                    "lookback_days": lookback_days,
-                    "status": "success",
-                }
-            )
+        logging.info(f"[Dashboard] Read performance for {len(performance)} strategies from rollups")
+        return JSONResponse(
+            {
+                "strategies": performance,
+                "lookback_days": lookback_days,
+                "status": "success",
+            }
+        )
     except Exception as e:
         logging.error(f"[API] Error in get_strategy_performance: {e}")
-        # Fallback to file-based logger
-        try:
-            performance = signal_logger.get_all_strategies_performance(lookback_days)
-            return JSONResponse(
-                {
-                    "strategies": performance,
-                    "lookback_days": lookback_days,
-                    "status": "success",
-                }
-            )
-        except Exception as fallback_error:
-            logging.error(f"[API] Fallback also failed: {fallback_error}")
-            return JSONResponse({"error": str(e), "status": "error"}, status_code=500)
+        return JSONResponse({"error": str(e), "status": "error"}, status_code=500)
 
 
 @router.get("/api/strategy/performance/{strategy_name}")
-async def get_single_strategy_performance(strategy_name: str, request: Request):
+def get_single_strategy_performance(strategy_name: str, request: Request):
     try:
         lookback_str = request.query_params.get("lookback_days", "7")
 
@@ -835,11 +882,21 @@ async def get_single_strategy_performance(strategy_name: str, request: Request):
 
 
 @router.get("/api/strategy/correlation")
-async def get_strategy_correlation():
+def get_strategy_correlation(lookback_days: str = "7", symbol: str = None, limit: str = "1000"):
+    """Pairwise agreement and Cohen's kappa between strategies (cached until the next signal)."""
     try:
-        correlations = signal_logger.get_signal_correlation()
+        lookback = min(float(lookback_days), 90)
+        sample = max(1, min(int(limit), 10000))
+    except ValueError:
+        return JSONResponse(
+            {"error": "Invalid lookback_days or limit parameter", "status": "error"},
+            status_code=400,
+        )
 
-        if not correlations:
+    try:
+        result = strategy_correlation.get(lookback, symbol=symbol, limit=sample)
+
+        if not result["strategies"]:
             return JSONResponse(
                 {
                     "correlations": {},
@@ -850,8 +907,13 @@ async def get_strategy_correlation():
 
         return JSONResponse(
             {
-                "correlations": correlations,
-                "description": "1.0 = always agree, 0.0 = never agree",
+                "correlations": result["agreement"],
+                "kappa": result["kappa"],
+                "overlap": result["overlap"],
+                "signals": result["signals"],
+                "lookback_days": lookback,
+                "symbol": symbol,
+                "description": "1.0 = always agree, 0.0 = never agree; kappa corrects agreement for chance",
                 "status": "success",
             }
         )
@@ -861,7 +923,7 @@ async def get_strategy_correlation():
 
 
 @router.get("/api/strategy/summary")
-async def get_strategy_summary():
+def get_strategy_summary():
     try:
         all_signals = signal_logger.get_recent_signals(limit=10000)
 
@@ -903,7 +965,7 @@ async def get_strategy_summary():
 
 
 @router.get("/api/strategy/signals/latest")
-async def get_latest_signal():
+def get_latest_signal():
     try:
         signals = signal_logger.get_recent_signals(limit=1)
 
@@ -929,7 +991,7 @@ async def get_latest_signal():
 
 # Signal Performance Analysis
 @router.get("/api/analysis/signal-performance")
-async def get_signal_performance():
+def get_signal_performance():
     """Get comprehensive signal-to-trade correlation and strategy performance analysis."""
     try:
         from app.signal_performance import get_signal_performance_analysis
@@ -949,7 +1011,7 @@ async def get_system_health():
         health_data = {}
 
         openai_start = time.time()
-        openai_status = await check_openai_health()
+        openai_status = await run_in_threadpool(check_openai_health)
         openai_latency = int((time.time() - openai_start) * 1000)
 
         health_data["openai"] = {
@@ -960,7 +1022,7 @@ async def get_system_health():
         }
 
         exchange_start = time.time()
-        exchange_status = await check_exchange_health()
+        exchange_status = await run_in_threadpool(check_exchange_health)
         exchange_latency = int((time.time() - exchange_start) * 1000)
 
         health_data["exchange"] = {
@@ -971,7 +1033,7 @@ async def get_system_health():
         }
 
         rss_start = time.time()
-        rss_status = await check_rss_feeds_health()
+        rss_status = await run_in_threadpool(check_rss_feeds_health)
         rss_latency = int((time.time() - rss_start) * 1000)
 
         health_data["rssFeeds"] = {
@@ -982,7 +1044,7 @@ async def get_system_health():
         }
 
         db_start = time.time()
-        db_status = check_database_health()
+        db_status = await run_in_threadpool(check_database_health)
         db_latency = int((time.time() - db_start) * 1000)
 
         health_data["database"] = {
@@ -999,6 +1061,75 @@ async def get_system_health():
         return JSONResponse({"error": str(e), "status": "error"}, status_code=500)
 
 
+@router.get("/metrics")
+async def prometheus_metrics():
+    """Trading-loop, external-call and database metrics in Prometheus text format."""
+    return PlainTextResponse(metrics.render(), media_type=METRICS_CONTENT_TYPE)
+
+
+@router.get("/api/traces/latest")
+async def get_latest_traces(limit: int = 5, name: str = None, min_ms: float = 0.0, format: str = "flame"):
+    """
+    Most recent trade-cycle traces with a per-span timing breakdown.
+
+    Query params:
+        limit: Traces to return, newest first (default 5)
+        name: Only traces whose root span has this name (trade_cycle, event_evaluation)
+        min_ms: Only traces at least this long (find the slow cycles)
+        format: flame (tree, breakdown, folded stacks) or otlp (OTLP/JSON export)
+    """
+    traces = tracer.get_traces(limit=max(1, min(limit, 100)), name=name, min_ms=min_ms)
+    if format == "otlp":
+        return JSONResponse(traces_to_otlp(traces))
+    return JSONResponse({
+        "traces": [trace_to_flame(trace) for trace in traces],
+        "tracing": tracer.get_stats(),
+        "status": "success",
+    })
+
+
+@router.get("/api/metrics/event-loop")
+async def get_event_loop_metrics():
+    """Event-loop lag and blocking thread pool usage."""
+    from anyio import to_thread
+
+    limiter = to_thread.current_default_thread_limiter()
+    return JSONResponse({
+        "event_loop": loop_monitor.get_stats(),
+        "threadpool": {
+            "size": limiter.total_tokens,
+            "busy": limiter.borrowed_tokens,
+        },
+        "status": "success",
+    })
+
+
+@router.get("/api/metrics/event-bus")
+async def get_event_bus_metrics():
+    """Event bus subscriber queues: depth, lag and dropped events."""
+    return JSONResponse({**event_bus.get_stats(), "status": "success"})
+
+
+@router.get("/api/metrics/db-pool")
+async def get_db_pool_metrics():
+    """Writer gate contention and read pool usage."""
+    return JSONResponse({**get_pool_stats(), "status": "success"})
+
+
+@router.get("/api/metrics/db")
+async def get_db_query_metrics(top: int = 25, sort: str = "total_ms", caller: str = None):
+    """
+    Per-statement latency histograms and recent slow queries.
+
+    Query params:
+        top: Statements to return (default 25)
+        sort: total_ms, avg_ms, max_ms, p95_ms or count
+        caller: Only statements issued by this caller (e.g. SignalRepository)
+    """
+    top = max(1, min(top, 500))
+    return JSONResponse({**query_profiler.get_stats(top=top, sort=sort, caller=caller), "status": "success"})
+
+
 @router.get("/api/health/details")
 async def get_health_details(component: str = None):
     """
@@ -1012,16 +1143,16 @@ async def get_health_details(component: str = None):
         components = {}
 
         if component is None or component == "openai":
-            components["openai"] = await check_openai_health()
+            components["openai"] = await run_in_threadpool(check_openai_health)
 
         if component is None or component == "exchange":
-            components["exchange"] = await check_exchange_health()
+            components["exchange"] = await run_in_threadpool(check_exchange_health)
 
         if component is None or component == "rss":
-            components["rss"] = await check_rss_feeds_health()
+            components["rss"] = await run_in_threadpool(check_rss_feeds_health)
 
         if component is None or component == "database":
-            components["database"] = check_database_health()
+            components["database"] = await run_in_threadpool(check_database_health)
 
         # If specific component requested, return just that one
         if component and component in components:
@@ -1041,7 +1172,7 @@ async def get_health_details(component: str = None):
 
 
 @router.get("/api/errors")
-async def get_errors(component: str = None, limit: int = 50):
+def get_errors(component: str = None, limit: int = 50):
     """
     Get recent errors, optionally filtered by component.
 
@@ -1061,7 +1192,7 @@ async def get_errors(component: str = None, limit: int = 50):
 
 
 @router.post("/api/errors/clear")
-async def clear_errors(component: str = None):
+def clear_errors(component: str = None):
     """
     Clear errors, optionally for a specific component.
 
@@ -1083,7 +1214,7 @@ async def clear_errors(component: str = None):
 async def test_openai():
     """Test OpenAI API connection."""
     try:
-        result = await check_openai_health()
+        result = await run_in_threadpool(check_openai_health)
 
         if result["status"] != "operational":
             error_tracker.log_error(
@@ -1122,7 +1253,7 @@ async def test_openai():
 async def test_kraken():
     """Test Kraken API connection."""
     try:
-        result = await check_exchange_health()
+        result = await run_in_threadpool(check_exchange_health)
 
         if result["status"] != "operational":
             error_tracker.log_error(
@@ -1161,7 +1292,7 @@ async def test_kraken():
 async def test_rss():
     """Test RSS feeds connection."""
     try:
-        result = await check_rss_feeds_health()
+        result = await run_in_threadpool(check_rss_feeds_health)
 
         if result["status"] != "operational":
             error_tracker.log_error(
@@ -1208,7 +1339,7 @@ async def get_detailed_health():
         health_data = {}
 
         # OpenAI
-        openai_status = await check_openai_health()
+        openai_status = await run_in_threadpool(check_openai_health)
         openai_errors = error_tracker.get_component_errors("openai")
         health_data["openai"] = {
             "status": openai_status["status"],
@@ -1220,7 +1351,7 @@ async def get_detailed_health():
         }
 
         # Kraken/Exchange
-        exchange_status = await check_exchange_health()
+        exchange_status = await run_in_threadpool(check_exchange_health)
         exchange_errors = error_tracker.get_component_errors("exchange")
         health_data["exchange"] = {
             "status": exchange_status["status"],
@@ -1232,7 +1363,7 @@ async def get_detailed_health():
         }
 
         # RSS Feeds
-        rss_status = await check_rss_feeds_health()
+        rss_status = await run_in_threadpool(check_rss_feeds_health)
         rss_errors = error_tracker.get_component_errors("rss")
         health_data["rssFeeds"] = {
             "status": rss_status["status"],
@@ -1244,7 +1375,7 @@ async def get_detailed_health():
         }
 
         # Database
-        db_status = check_database_health()
+        db_status = await run_in_threadpool(check_database_health)
         db_errors = error_tracker.get_component_errors("database")
         health_data["database"] = {
             "status": db_status["status"],
@@ -1269,11 +1400,10 @@ async def get_detailed_health():
 
 @router.get("/api/trades/all")
 async def get_all_trades():
-    """Get all trades from database."""
+    """Get all trades from database (awaited on the async read pool)."""
     try:
-        with get_db() as db:
-            repo = TradeRepository(db)
-            trade_models = repo.get_all(test_mode=False)
+        async with get_async_read_db() as db:
+            trade_models = await AsyncTradeRepository(db).get_all(test_mode=False)
 
             # Convert to dict format, filter out HOLD actions
             real_trades = []
@@ -1308,7 +1438,7 @@ Replace your existing check_*_health functions with these enhanced versions.
 They return detailed error messages and actionable guidance.
 """
 
-async def check_openai_health() -> Dict[str, Any]:
+def check_openai_health() -> Dict[str, Any]:
     """Check OpenAI API health with detailed error reporting."""
     try:
         sentiment = load_sentiment()
@@ -1403,7 +1533,7 @@ async def check_openai_health() -> Dict[str, Any]:
         }
 
 
-async def check_exchange_health() -> Dict[str, Any]:
+def check_exchange_health() -> Dict[str, Any]:
     """Check Kraken exchange health by testing actual API functionality."""
     try:
         from app.client.kraken import KrakenClient
@@ -1455,7 +1585,7 @@ async def check_exchange_health() -> Dict[str, Any]:
         }
 
 
-async def check_rss_feeds_health() -> Dict[str, Any]:
+def check_rss_feeds_health() -> Dict[str, Any]:
     """Check RSS feeds health with detailed feed status."""
     try:
         feeds = _load_rss_feeds()
@@ -1476,62 +1606,68 @@ async def check_rss_feeds_health() -> Dict[str, Any]:
         import feedparser
         from app.database.repositories import RSSFeedRepository
 
-        # Update errors in database
-        with get_db() as db:
-            feed_repo = RSSFeedRepository(db)
+        # Parse every feed first (no session held over network I/O), then
+        # record fetch stats in one write; feeds were read over the read pool
+        fetch_stats = []
+        for feed in feeds:
+            feed_url = feed.get("url", "")
+            feed_name = feed.get("name", "Unknown")
+            feed_id = feed.get("id")
+            is_active = feed.get("active", True)
 
-            for feed in feeds:
-                feed_url = feed.get("url", "")
-                feed_name = feed.get("name", "Unknown")
-                feed_id = feed.get("id")
-                is_active = feed.get("active", True)
-
-                if not is_active:
-                    continue  # Skip disabled feeds
-
-                error_msg = None
-
-                try:
-                    start_time = time.time()
-                    parsed = feedparser.parse(feed_url)
-                    latency = int((time.time() - start_time) * 1000)
-
-                    if parsed.bozo:  # Feed has errors
-                        error_msg = str(parsed.bozo_exception) if hasattr(parsed, 'bozo_exception') else "Parse error"
-                        broken_feeds.append({
-                            "name": feed_name,
-                            "url": feed_url,
-                            "error": error_msg
-                        })
-                    elif len(parsed.entries) == 0:
-                        error_msg = "No entries found"
-                        broken_feeds.append({
-                            "name": feed_name,
-                            "url": feed_url,
-                            "error": error_msg
-                        })
-                    else:
-                        operational_feeds.append({
-                            "name": feed_name,
-                            "entries": len(parsed.entries),
-                            "latency": latency
-                        })
-                except Exception as e:
-                    error_msg = str(e)
+            if not is_active:
+                continue  # Skip disabled feeds
+
+            error_msg = None
+            items_fetched = 0
+
+            try:
+                start_time = time.time()
+                parsed = feedparser.parse(feed_url)
+                latency = int((time.time() - start_time) * 1000)
+
+                if parsed.bozo:  # Feed has errors
+                    error_msg = str(parsed.bozo_exception) if hasattr(parsed, 'bozo_exception') else "Parse error"
+                    broken_feeds.append({
+                        "name": feed_name,
+                        "url": feed_url,
+                        "error": error_msg
+                    })
+                elif len(parsed.entries) == 0:
+                    error_msg = "No entries found"
                     broken_feeds.append({
                         "name": feed_name,
                         "url": feed_url,
                         "error": error_msg
                     })
+                else:
+                    items_fetched = len(parsed.entries)
+                    operational_feeds.append({
+                        "name": feed_name,
+                        "entries": items_fetched,
+                        "latency": latency
+                    })
+            except Exception as e:
+                error_msg = str(e)
+                broken_feeds.append({
+                    "name": feed_name,
+                    "url": feed_url,
+                    "error": error_msg
+                })
+
+            if feed_id:
+                fetch_stats.append((feed_id, items_fetched, error_msg))
+
+        # Update feed error status in database
+        if fetch_stats:
+            try:
+                with get_db() as db:
+                    feed_repo = RSSFeedRepository(db)
+                    for feed_id, items_fetched, error_msg in fetch_stats:
+                        feed_repo.update_fetch_stats(feed_id=feed_id, items_fetched=items_fetched, error=error_msg)
+            except Exception as e:
+                logging.error(f"[Health] Failed to save RSS fetch stats: {e}")
 
-                # Update feed error status in database
-                if feed_id:
-                    feed_repo.update_fetch_stats(
-                        feed_id=feed_id,
-                        items_fetched=0 if error_msg else len(parsed.entries) if 'parsed' in locals() else 0,
-                        error=error_msg
-                    )
-        
         total_active = len(operational_feeds) + len(broken_feeds)
         operational_count = len(operational_feeds)
         
@@ -1588,7 +1724,7 @@ def check_database_health() -> Dict[str, Any]:
     try:
         start_time = time.time()
 
-        with get_db() as db:
+        with get_read_db() as db:
             from app.database.repositories import SignalRepository, TradeRepository, HoldingRepository, RSSFeedRepository
 
             # Test each critical table
@@ -1600,7 +1736,10 @@ def check_database_health() -> Dict[str, Any]:
             # Count records in each table
             signal_count = len(signal_repo.get_recent(hours=24 * 7, test_mode=False, limit=1000))
             trade_count = len(trade_repo.get_all(test_mode=False))
-            holding_count = len(holding_repo.get_current_holdings(test_mode=False))
+            if position_book.loaded:
+                holding_count = len(position_book.snapshot())
+            else:
+                holding_count = len(holding_repo.get_current_holdings(test_mode=False))
             feed_count = len(feed_repo.get_all())
 
             latency = int((time.time() - start_time) * 1000)
@@ -1627,7 +1766,7 @@ def check_database_health() -> Dict[str, Any]:
 
 
 @router.get("/api/errors")
-async def get_errors(component: str = None, limit: int = 50):
+def get_errors(component: str = None, limit: int = 50):
     """Get recent errors, optionally filtered by component."""
     try:
         errors = error_tracker.get_errors(component=component, limit=limit)
@@ -1642,7 +1781,7 @@ async def get_errors(component: str = None, limit: int = 50):
 
 
 @router.post("/api/errors/clear")
-async def clear_errors(component: str = None):
+def clear_errors(component: str = None):
     """Clear errors, optionally for a specific component."""
     try:
         cleared = error_tracker.clear_errors(component=component)
@@ -1660,7 +1799,7 @@ async def clear_errors(component: str = None):
 async def test_openai():
     """Test OpenAI API connection."""
     try:
-        result = await check_openai_health()
+        result = await run_in_threadpool(check_openai_health)
         if result["status"] != "operational":
             error_tracker.log_error(
                 component="openai",
@@ -1695,7 +1834,7 @@ async def test_openai():
 async def test_kraken():
     """Test Kraken API connection."""
     try:
-        result = await check_exchange_health()
+        result = await run_in_threadpool(check_exchange_health)
         if result["status"] != "operational":
             error_tracker.log_error(
                 component="exchange",
@@ -1730,7 +1869,7 @@ async def test_kraken():
 async def test_rss():
     """Test RSS feeds connection."""
     try:
-        result = await check_rss_feeds_health()
+        result = await run_in_threadpool(check_rss_feeds_health)
         if result["status"] != "operational":
             error_tracker.log_error(
                 component="rss",
@@ -1762,7 +1901,7 @@ async def test_rss():
 
 
 @router.post("/api/test/database")
-async def test_database():
+def test_database():
     """Test database connection."""
     try:
         result = check_database_health()
@@ -1809,7 +1948,7 @@ async def get_detailed_health():
         health_data = {}
         
         # OpenAI - merge all fields from health check
-        openai_status = await check_openai_health()
+        openai_status = await run_in_threadpool(check_openai_health)
         openai_errors = error_tracker.get_component_errors("openai")
         health_data["openai"] = {
             **openai_status,  # This spreads all fields: status, message, details, action, latency
@@ -1820,7 +1959,7 @@ async def get_detailed_health():
         }
         
         # Kraken/Exchange - merge all fields
-        exchange_status = await check_exchange_health()
+        exchange_status = await run_in_threadpool(check_exchange_health)
         exchange_errors = error_tracker.get_component_errors("exchange")
         health_data["exchange"] = {
             **exchange_status,  # Spreads: status, message, details, action, latency
@@ -1831,7 +1970,7 @@ async def get_detailed_health():
         }
         
         # RSS Feeds - merge all fields including details dict
-        rss_status = await check_rss_feeds_health()
+        rss_status = await run_in_threadpool(check_rss_feeds_health)
         rss_errors = error_tracker.get_component_errors("rss")
         health_data["rssFeeds"] = {
             **rss_status,  # Spreads: status, message, details (with operational/broken), action, latency
@@ -1842,7 +1981,7 @@ async def get_detailed_health():
         }
         
         # Database - merge all fields
-        db_status = check_database_health()
+        db_status = await run_in_threadpool(check_database_health)
         db_errors = error_tracker.get_component_errors("database")
         health_data["database"] = {
             **db_status,  # Spreads: status, message, details, action, latency
@@ -1863,7 +2002,7 @@ async def get_detailed_health():
         return JSONResponse(status_code=500, content={"error": str(e)})
 
 @router.get("/api/feeds")
-async def get_rss_feeds():
+def get_rss_feeds():
     try:
         feeds = _load_rss_feeds()
         # Ensure all feeds have active field (default True)
@@ -1942,7 +2081,7 @@ async def add_rss_feed(request: Request):
 
 
 @router.delete("/api/feeds/{feed_id}")
-async def delete_rss_feed(feed_id: int):
+def delete_rss_feed(feed_id: int):
     """Delete an RSS feed from the database."""
     try:
         with get_db() as db:
@@ -1978,10 +2117,10 @@ async def delete_rss_feed(feed_id: int):
 
 # Configuration Management
 @router.get("/api/config")
-async def get_config():
+def get_config():
     """Get current trading configuration from database."""
     try:
-        with get_db() as db:
+        with get_read_db() as db:
             config_repo = BotConfigRepository(db)
             bot_config = config_repo.get_current()
 
@@ -2065,33 +2204,34 @@ async def update_config(request: Request):
         min_confidence = new_config.get("aggregation", {}).get("min_confidence", 0.5)
         position_size = new_config.get("risk_management", {}).get("position_size_percent", 5.0)
 
-        # Save to database
-        with get_db() as db:
-            config_repo = BotConfigRepository(db)
-            config_repo.create_or_update(
-                mode=mode,
-                min_confidence=Decimal(str(min_confidence)),
-                position_size=Decimal(str(position_size))
-            )
-            db.commit()
+        # Save to database (off the event loop)
+        def save_config():
+            with get_db() as db:
+                config_repo = BotConfigRepository(db)
+                config_repo.create_or_update(
+                    mode=mode,
+                    min_confidence=Decimal(str(min_confidence)),
+                    position_size=Decimal(str(position_size))
+                )
+                db.commit()
 
-            logging.info(f"[Config] Saved to database: mode={mode}, min_confidence={min_confidence}, position_size={position_size}")
+        await run_in_threadpool(save_config)
+        logging.info(f"[Config] Saved to database: mode={mode}, min_confidence={min_confidence}, position_size={position_size}")
 
-            # Emit CONFIG_CHANGED event
-            try:
-                import asyncio
-                from app.events.event_bus import event_bus, EventType
+        # Emit CONFIG_CHANGED event
+        try:
+            from app.events.event_bus import event_bus, EventType
 
-                await event_bus.emit(EventType.CONFIG_CHANGED, {
-                    "config": {
-                        "mode": mode,
-                        "min_confidence": float(min_confidence),
-                        "position_size": float(position_size)
-                    },
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                })
-            except Exception as emit_error:
-                logging.error(f"[Config] Failed to emit CONFIG_CHANGED event: {emit_error}")
+            await event_bus.emit(EventType.CONFIG_CHANGED, {
+                "config": {
+                    "mode": mode,
+                    "min_confidence": float(min_confidence),
+                    "position_size": float(position_size)
+                },
+                "timestamp": datetime.now(timezone.utc).isoformat()
+            })
+        except Exception as emit_error:
+            logging.error(f"[Config] Failed to emit CONFIG_CHANGED event: {emit_error}")
 
         return JSONResponse(
             {
@@ -2165,7 +2305,7 @@ async def update_rss_feed(feed_id: int, request: Request):
 
 
 @router.put("/api/feeds/{feed_id}/toggle")
-async def toggle_rss_feed(feed_id: int):
+def toggle_rss_feed(feed_id: int):
     """Toggle active/inactive status of an RSS feed."""
     try:
         with get_db() as db:
@@ -2193,7 +2333,7 @@ async def toggle_rss_feed(feed_id: int):
 
 
 @router.post("/api/feeds/{feed_id}/test")
-async def test_rss_feed(feed_id: int):
+def test_rss_feed(feed_id: int):
     """Test an RSS feed by ID."""
     try:
         import feedparser
@@ -2253,15 +2393,9 @@ async def event_stream(request: Request):
         # Send initial connection message
         yield f"data: {json.dumps({'type': 'connected', 'message': 'Event stream connected'})}\n\n"
 
-        # Queue to receive events
-        event_queue = asyncio.Queue()
-
-        # Subscribe to all event types
-        async def on_event(event):
-            await event_queue.put(event)
-
-        for event_type in EventType:
-            event_bus.subscribe(event_type, on_event)
+        # Bounded per-client queue: a slow client loses (coalesced) events
+        # instead of growing memory or delaying other subscribers
+        subscription = event_bus.subscribe_queue(name="sse", overflow=SSE_OVERFLOW)
 
         try:
             while True:
@@ -2270,23 +2404,17 @@ async def event_stream(request: Request):
                     logging.info("[SSE] Client disconnected")
                     break
 
-                try:
-                    # Wait for event with timeout
-                    event = await asyncio.wait_for(event_queue.get(), timeout=30.0)
-
-                    # Send event to client
-                    yield f"data: {json.dumps(event)}\n\n"
-
-                except asyncio.TimeoutError:
+                event = await subscription.get(timeout=30.0)
+                if event is None:
                     # Send heartbeat to keep connection alive
                     yield f": heartbeat\n\n"
+                else:
+                    yield f"data: {json.dumps(event)}\n\n"
 
         except asyncio.CancelledError:
             logging.info("[SSE] Event stream cancelled")
         finally:
-            # Unsubscribe from events
-            for event_type in EventType:
-                event_bus.unsubscribe(event_type, on_event)
+            subscription.close()
 
     return StreamingResponse(
         event_generator(),
@@ -2304,7 +2432,7 @@ async def event_stream(request: Request):
 # ===================================
 
 @router.get("/api/theme")
-async def get_theme():
+def get_theme():
     """Get current theme settings."""
     # For now, return default theme
     # In future, could store user preference in database
@@ -11,6 +11,7 @@ from datetime import datetime
 from app.client.kraken import KrakenClient
 from app.logic.symbol_scanner import DEFAULT_PRIORITY_SYMBOLS
 from app.utils.symbol_normalizer import normalize_symbol
+from app.metrics.prometheus import DATA_COLLECTOR_STALENESS, DATA_COLLECTOR_SYMBOLS
 
 
 class DataCollector:
@@ -22,10 +23,27 @@ class DataCollector:
         # Thread-safe storage: symbol -> deque of (timestamp, price, volume)
         self.price_history = defaultdict(lambda: deque(maxlen=max_history))
         self.volume_history = defaultdict(lambda: deque(maxlen=max_history))
+        # Latest quote per canonical symbol: symbol -> (price, epoch seconds)
+        self.latest_quotes = {}
+        # Epoch seconds of the last snapshot that returned tickers
+        self.last_snapshot_at = None
         self.lock = Lock()
         
         self.running = False
         self.thread = None
+
+        # Callbacks notified after each snapshot: callback(updates)
+        self.listeners = []
+
+    def add_listener(self, callback):
+        """Register a callback receiving {symbol: {"price", "volume"}} per snapshot."""
+        if callback not in self.listeners:
+            self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """Unregister a snapshot callback."""
+        if callback in self.listeners:
+            self.listeners.remove(callback)
     
     def start(self):
         """Start background collection thread."""
@@ -62,7 +80,9 @@ class DataCollector:
         """Fetch current prices/volumes for all symbols."""
         tickers = self.client.get_tickers()
         timestamp = datetime.now()
-        
+        received_at = time.time()
+        updates = {}
+
         with self.lock:
             for symbol, data in tickers.items():
                 # Only track USD pairs
@@ -75,8 +95,23 @@ class DataCollector:
                 if price > 0:
                     self.price_history[symbol].append(price)
                     self.volume_history[symbol].append(volume)
-        
+                    updates[symbol] = {"price": price, "volume": volume}
+                    try:
+                        self.latest_quotes[normalize_symbol(symbol)] = (price, received_at)
+                    except ValueError:
+                        pass
+
+            if tickers:
+                self.last_snapshot_at = received_at
+
         logging.info(f"[DataCollector] Updated {len(tickers)} symbols")
+
+        # Notify listeners outside the lock so they can read history freely
+        for callback in list(self.listeners):
+            try:
+                callback(updates)
+            except Exception as e:
+                logging.error(f"[DataCollector] Listener error: {e}")
     
     def get_price_history(self, symbol, limit=None):
         """Get price history for symbol (most recent first)."""
@@ -104,12 +139,39 @@ class DataCollector:
         # Fallback to live API call
         return self.client.get_price(symbol)
     
+    def get_fresh_prices(self, symbols, max_age):
+        """
+        Latest collected prices that are at most max_age seconds old.
+
+        Args:
+            symbols: Canonical symbols
+            max_age: Maximum quote age in seconds
+
+        Returns:
+            {symbol: (price, age_seconds)} for symbols with a fresh quote
+        """
+        now = time.time()
+        fresh = {}
+        with self.lock:
+            for symbol in symbols:
+                quote = self.latest_quotes.get(symbol)
+                if quote and now - quote[1] <= max_age:
+                    fresh[symbol] = (quote[0], now - quote[1])
+        return fresh
+
+    def staleness(self):
+        """Seconds since the last successful snapshot (None before the first)."""
+        if self.last_snapshot_at is None:
+            return None
+        return time.time() - self.last_snapshot_at
+
     def get_stats(self):
         """Get collection statistics."""
         with self.lock:
             return {
                 "symbols_tracked": len(self.price_history),
-                "avg_data_points": sum(len(h) for h in self.price_history.values()) / max(len(self.price_history), 1)
+                "avg_data_points": sum(len(h) for h in self.price_history.values()) / max(len(self.price_history), 1),
+                "staleness_seconds": self.staleness(),
             }
 
     def _backfill_history(self):
@@ -159,3 +221,6 @@ class DataCollector:
 
 # Global singleton
 data_collector = DataCollector()
+
+DATA_COLLECTOR_STALENESS.set_function(data_collector.staleness)
+DATA_COLLECTOR_SYMBOLS.set_function(lambda: len(data_collector.price_history))
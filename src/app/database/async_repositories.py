@@ -0,0 +1,134 @@
+"""
+Async data repositories for event-loop callers (dashboard and SSE handlers).
+
+Each async repository wraps an AsyncSession (see
+connection.get_async_read_db) and exposes the read methods of its sync
+counterpart in app.database.repositories as coroutines. The query code is
+shared: every call runs the sync repository method through
+AsyncSession.run_sync, so results are identical to the sync layer while
+the I/O happens on the aiosqlite connection thread instead of blocking the
+event loop.
+
+Writes stay on the sync writer (get_db and its write gate); the async pool
+is read-only.
+
+Usage:
+    async with get_async_read_db() as db:
+        trades = await AsyncTradeRepository(db).get_all(test_mode=False)
+"""
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.repositories import (
+    SignalRepository, TradeRepository, HoldingRepository, RSSFeedRepository,
+    BotConfigRepository, HistoricalOHLCVRepository
+)
+
+
+def _delegated(name: str) -> Callable:
+    """Async method running the sync repository's `name` on the session."""
+    async def method(self, *args, **kwargs):
+        return await self.session.run_sync(
+            lambda session: getattr(self.sync_repository(session), name)(*args, **kwargs)
+        )
+
+    method.__name__ = name
+    method.__doc__ = f"Async {name}; see the sync repository for arguments."
+    return method
+
+
+class AsyncRepository:
+    """Base for async repositories; subclasses set sync_repository."""
+
+    sync_repository = None
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+
+class AsyncSignalRepository(AsyncRepository):
+    """Async read access to trading signals."""
+
+    sync_repository = SignalRepository
+
+    get_by_id = _delegated("get_by_id")
+    get_recent = _delegated("get_recent")
+    get_feed = _delegated("get_feed")
+    get_by_symbol = _delegated("get_by_symbol")
+    get_non_hold_signals = _delegated("get_non_hold_signals")
+    count_by_signal_type = _delegated("count_by_signal_type")
+
+
+class AsyncTradeRepository(AsyncRepository):
+    """Async read access to trades."""
+
+    sync_repository = TradeRepository
+
+    get_by_id = _delegated("get_by_id")
+    get_recent = _delegated("get_recent")
+    get_by_symbol = _delegated("get_by_symbol")
+    get_all = _delegated("get_all")
+    get_fills_after = _delegated("get_fills_after")
+    get_max_id = _delegated("get_max_id")
+    count_total = _delegated("count_total")
+    get_win_loss_stats = _delegated("get_win_loss_stats")
+
+
+class AsyncHoldingRepository(AsyncRepository):
+    """Async read access to holdings snapshots."""
+
+    sync_repository = HoldingRepository
+
+    get_current_holdings = _delegated("get_current_holdings")
+    get_history = _delegated("get_history")
+
+
+class AsyncRSSFeedRepository(AsyncRepository):
+    """Async read access to RSS feeds."""
+
+    sync_repository = RSSFeedRepository
+
+    get_all = _delegated("get_all")
+    get_by_id = _delegated("get_by_id")
+    get_by_url = _delegated("get_by_url")
+
+
+class AsyncBotConfigRepository(AsyncRepository):
+    """Async read access to bot configuration."""
+
+    sync_repository = BotConfigRepository
+
+    get_current = _delegated("get_current")
+    get_config_dict = _delegated("get_config_dict")
+
+
+class AsyncHistoricalOHLCVRepository(AsyncRepository):
+    """Async read access to historical OHLCV candles."""
+
+    sync_repository = HistoricalOHLCVRepository
+
+    get_by_symbol_and_time = _delegated("get_by_symbol_and_time")
+    get_by_symbol = _delegated("get_by_symbol")
+    get_range = _delegated("get_range")
+    get_latest_timestamp = _delegated("get_latest_timestamp")
+    count_candles = _delegated("count_candles")
+
+
+def get_async_repositories(session: AsyncSession) -> dict:
+    """
+    Get all async repositories for a session (same keys as get_repositories).
+
+    Usage:
+        async with get_async_read_db() as db:
+            repos = get_async_repositories(db)
+            feeds = await repos['feeds'].get_all(enabled_only=True)
+    """
+    return {
+        "signals": AsyncSignalRepository(session),
+        "trades": AsyncTradeRepository(session),
+        "holdings": AsyncHoldingRepository(session),
+        "feeds": AsyncRSSFeedRepository(session),
+        "config": AsyncBotConfigRepository(session),
+        "historical": AsyncHistoricalOHLCVRepository(session),
+    }
@@ -1,19 +1,46 @@
 """
 Database connection management.
 
-Simple, resilient SQLite connection with session management.
+SQLite connections with a read/write split:
+- Writes go through one writer connection. get_db() holds a write gate
+  (re-entrant per thread) for the whole session,
+  so transactions from different threads never interleave on it
+- Reads that don't need the writer (dashboard, SSE, reports) use
+  get_read_db(), a pool of read-only WAL connections that run concurrently
+  with the writer
+
+Async handlers can use get_async_read_db(), an AsyncSession over a
+read-only aiosqlite pool (created on first use), with the repositories in
+app.database.async_repositories.
+
+DB_POOL_MODE=shared routes reads through the writer too (the previous
+single-connection behaviour). DB_READ_POOL_SIZE, DB_BUSY_TIMEOUT_MS and
+DB_MMAP_SIZE tune the pool and per-connection pragmas. DATABASE_URL points
+the process at another SQLite file (pytest always uses its own test file).
+
+Importing this module opens nothing: the data directory, database file and
+tables are created by init_db(), which the session helpers run on first use
+(scripts that use `engine` directly call init_db() themselves).
 """
+import time
 import logging
+import threading
 from pathlib import Path
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, Generator
 
 from sqlalchemy import create_engine, event, text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
 
 from app.database.models import Base
+from app.metrics.query_profiler import query_profiler  # noqa: F401 - hooks every Engine
+from app.metrics.prometheus import DB_COMMIT_SECONDS, DB_WRITE_SECONDS, DB_WRITE_WAIT_SECONDS
+from app.metrics.tracing import tracer
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
@@ -26,13 +53,22 @@ if os.getenv('PYTEST_CURRENT_TEST'):
     import tempfile
     TEST_DB_PATH = Path(tempfile.gettempdir()) / "test_trading_bot.db"
     DATABASE_URL = f"sqlite:///{TEST_DB_PATH}"
+elif os.getenv("DATABASE_URL"):
+    # Explicit database (benchmarks, load tests, scratch copies)
+    DATABASE_URL = os.environ["DATABASE_URL"]
 else:
     # Production database
     DB_DIR = Path(__file__).parent.parent.parent.parent / "data"
-    DB_DIR.mkdir(parents=True, exist_ok=True)
     DB_PATH = DB_DIR / "trading_bot.db"
     DATABASE_URL = f"sqlite:///{DB_PATH}"
 
+# Pool configuration
+POOL_MODE = os.getenv("DB_POOL_MODE", "split")  # split | shared
+READ_POOL_SIZE = int(os.getenv("DB_READ_POOL_SIZE", "4"))
+BUSY_TIMEOUT_MS = int(os.getenv("DB_BUSY_TIMEOUT_MS", "30000"))
+MMAP_SIZE = int(os.getenv("DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+WRITE_GATE_TIMEOUT = 30.0  # seconds a thread waits for the writer before giving up
+
 
 # Enable WAL mode and foreign keys for SQLite
 @event.listens_for(Engine, "connect")
@@ -40,6 +76,10 @@ def set_sqlite_pragma(dbapi_conn, connection_record):
     """Configure SQLite for optimal performance and safety."""
     cursor = dbapi_conn.cursor()
 
+    # Let signal retention hand freed pages back with incremental_vacuum
+    # (only takes effect on a new database, before any table exists)
+    cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+
     # Write-Ahead Logging for better concurrency
     cursor.execute("PRAGMA journal_mode=WAL")
 
@@ -55,35 +95,193 @@ def set_sqlite_pragma(dbapi_conn, connection_record):
     # Temp store in memory
     cursor.execute("PRAGMA temp_store=MEMORY")
 
+    # Wait for locks held by other processes (scripts) instead of failing
+    cursor.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+
+    # Memory-map the file so reads skip the read() syscall path
+    cursor.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+
     cursor.close()
 
 
-# Create engine
+class WriteGate:
+    """
+    Serializes use of the single writer connection across threads.
+
+    Re-entrant per thread, so nested get_db() calls on one thread share the
+    connection as before. Keeps wait/hold statistics for pool metrics.
+    """
+
+    def __init__(self, timeout: float = WRITE_GATE_TIMEOUT):
+        self.timeout = timeout
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self.waiting = 0
+        self.stats = {
+            "acquired": 0, "timeouts": 0,
+            "wait_seconds_total": 0.0, "wait_seconds_max": 0.0,
+            "hold_seconds_total": 0.0, "hold_seconds_max": 0.0,
+        }
+
+    @contextmanager
+    def hold(self):
+        depth = getattr(self._local, "depth", 0)
+        if depth:
+            # Already held by this thread
+            self._local.depth = depth + 1
+            try:
+                yield
+            finally:
+                self._local.depth = depth
+            return
+
+        started = time.perf_counter()
+        with self._stats_lock:
+            self.waiting += 1
+        acquired = self._lock.acquire(timeout=self.timeout)
+        waited = time.perf_counter() - started
+        with self._stats_lock:
+            self.waiting -= 1
+            if not acquired:
+                self.stats["timeouts"] += 1
+            else:
+                self.stats["acquired"] += 1
+                self.stats["wait_seconds_total"] += waited
+                self.stats["wait_seconds_max"] = max(self.stats["wait_seconds_max"], waited)
+        if not acquired:
+            raise TimeoutError(f"Timed out after {self.timeout}s waiting for the database writer")
+        DB_WRITE_WAIT_SECONDS.observe(waited)
+
+        self._local.depth = 1
+        held_from = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._local.depth = 0
+            held = time.perf_counter() - held_from
+            self._lock.release()
+            DB_WRITE_SECONDS.observe(held)
+            with self._stats_lock:
+                self.stats["hold_seconds_total"] += held
+                self.stats["hold_seconds_max"] = max(self.stats["hold_seconds_max"], held)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            acquired = self.stats["acquired"]
+            return {
+                **{k: round(v, 6) if isinstance(v, float) else v for k, v in self.stats.items()},
+                "waiting": self.waiting,
+                "wait_seconds_avg": round(self.stats["wait_seconds_total"] / acquired, 6) if acquired else 0.0,
+            }
+
+
+# Writer engine: one connection shared by every writing thread, behind write_gate
 engine = create_engine(
     DATABASE_URL,
     echo=False,  # Set to True for SQL logging during development
     connect_args={
-        "check_same_thread": False,  # Allow multiple threads (safe with proper session management)
-        "timeout": 30  # 30 second timeout for locks
+        "check_same_thread": False,  # Used from several threads, one at a time (write_gate)
+        "timeout": BUSY_TIMEOUT_MS / 1000,
+    },
+    poolclass=StaticPool,
+)
+write_gate = WriteGate()
+
+# Reader engine: pooled read-only connections (WAL readers don't block the writer)
+read_engine = create_engine(
+    DATABASE_URL,
+    echo=False,
+    connect_args={
+        "check_same_thread": False,  # Pooled connections move between request threads
+        "timeout": BUSY_TIMEOUT_MS / 1000,
     },
-    poolclass=StaticPool,  # Single connection pool for SQLite
+    poolclass=QueuePool,
+    pool_size=READ_POOL_SIZE,
+    max_overflow=READ_POOL_SIZE,
+    pool_timeout=WRITE_GATE_TIMEOUT,
 )
 
-# Create session factory
+
+@event.listens_for(read_engine, "connect")
+def set_read_only(dbapi_conn, connection_record):
+    """Reader connections refuse writes."""
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
+
+
+def create_async_read_engine(url, pool_size: int = READ_POOL_SIZE):
+    """
+    Create a read-only aiosqlite engine for `url` (a sqlite URL or URL object).
+
+    Each aiosqlite connection runs its queries on its own thread, so awaiting
+    them never blocks the event loop. Pragmas are the same as the sync
+    engines (the Engine "connect" listener above also fires for it).
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    async_engine = create_async_engine(
+        make_url(url).set(drivername="sqlite+aiosqlite"),
+        echo=False,
+        connect_args={"timeout": BUSY_TIMEOUT_MS / 1000},
+        pool_size=pool_size,
+        max_overflow=pool_size,
+        pool_timeout=WRITE_GATE_TIMEOUT,
+    )
+    event.listen(async_engine.sync_engine, "connect", set_read_only)
+    return async_engine
+
+
+# Create session factories
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
     bind=engine
 )
+ReadSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=read_engine
+)
+
+
+# Async reader engine: built on first use so sync-only processes never import aiosqlite
+async_read_engine = None
+AsyncReadSessionLocal = None
+_async_engine_lock = threading.Lock()
+
+
+def get_async_read_engine():
+    """The shared async read-only engine (created on first call)."""
+    global async_read_engine, AsyncReadSessionLocal
+    if async_read_engine is None:
+        with _async_engine_lock:
+            if async_read_engine is None:
+                from sqlalchemy.ext.asyncio import async_sessionmaker
+
+                # Same file as the sync engines
+                async_read_engine = create_async_read_engine(read_engine.url)
+                AsyncReadSessionLocal = async_sessionmaker(
+                    bind=async_read_engine, autoflush=False, expire_on_commit=False
+                )
+    return async_read_engine
+
+
+_db_initialized = False
+_init_lock = threading.Lock()
 
 
 def init_db():
-    """Initialize database - create all tables."""
+    """Initialize database - create the data directory and all tables."""
+    global _db_initialized
     try:
-        # Use TEST_DB_PATH if in test mode, otherwise DB_PATH
-        db_path = TEST_DB_PATH if os.getenv('PYTEST_CURRENT_TEST') else DB_PATH
+        # The file the engine was created for (init may run after PYTEST_CURRENT_TEST is set)
+        db_path = Path(engine.url.database)
         logger.info(f"Initializing database at: {db_path}")
+        db_path.parent.mkdir(parents=True, exist_ok=True)
         Base.metadata.create_all(bind=engine)
+        _db_initialized = True
         logger.info("Database initialized successfully")
 
         # Log database info
@@ -95,6 +293,15 @@ def init_db():
         raise
 
 
+def ensure_db():
+    """Run init_db() once per process, on first use of a session helper."""
+    if _db_initialized:
+        return
+    with _init_lock:
+        if not _db_initialized:
+            init_db()
+
+
 def drop_all_tables():
     """Drop all tables - USE WITH CAUTION!"""
     logger.warning("Dropping all database tables!")
@@ -111,17 +318,93 @@ def get_db() -> Generator[Session, None, None]:
         with get_db() as db:
             signal = db.query(Signal).first()
     """
-    session = SessionLocal()
+    ensure_db()
+    with tracer.span("db.write"), write_gate.hold():
+        session = SessionLocal()
+        try:
+            yield session
+            with DB_COMMIT_SECONDS.time():
+                session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+
+@contextmanager
+def get_read_db() -> Generator[Session, None, None]:
+    """
+    Get a read-only session from the reader pool.
+
+    Sees everything committed before the session's first query and never
+    waits for the writer. Writes raise (PRAGMA query_only). Falls back to
+    get_db() when DB_POOL_MODE=shared.
+
+    Usage:
+        with get_read_db() as db:
+            signals = SignalRepository(db).get_recent()
+    """
+    if POOL_MODE == "shared":
+        with get_db() as session:
+            yield session
+        return
+
+    ensure_db()
+    session = ReadSessionLocal()
     try:
         yield session
-        session.commit()
-    except Exception:
-        session.rollback()
-        raise
     finally:
+        session.rollback()
         session.close()
 
 
+@asynccontextmanager
+async def get_async_read_db() -> AsyncGenerator["AsyncSession", None]:
+    """
+    Get a read-only AsyncSession from the async reader pool.
+
+    Same visibility and read-only rules as get_read_db(). Objects loaded
+    through it stay readable after the block exits (they are detached, not
+    expired), but lazy relationships must be loaded inside it.
+
+    Usage:
+        async with get_async_read_db() as db:
+            trades = await AsyncTradeRepository(db).get_all()
+    """
+    ensure_db()
+    get_async_read_engine()
+    session = AsyncReadSessionLocal()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """Writer gate and reader pool metrics."""
+    pool = read_engine.pool
+    async_pool = async_read_engine.pool if async_read_engine is not None else None
+    return {
+        "mode": POOL_MODE,
+        "writer": write_gate.get_stats(),
+        "reader": {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+            "max_overflow": READ_POOL_SIZE,
+        },
+        "async_reader": {
+            "size": async_pool.size(),
+            "checked_out": async_pool.checkedout(),
+            "checked_in": async_pool.checkedin(),
+            "overflow": async_pool.overflow(),
+        } if async_pool is not None else None,
+        "pragmas": {"busy_timeout_ms": BUSY_TIMEOUT_MS, "mmap_size": MMAP_SIZE},
+    }
+
+
 def get_db_session() -> Session:
     """
     Get database session (for dependency injection in FastAPI).
@@ -131,6 +414,7 @@ def get_db_session() -> Session:
         def route(db: Session = Depends(get_db_session)):
             ...
     """
+    ensure_db()
     session = SessionLocal()
     try:
         return session
@@ -205,10 +489,3 @@ def get_table_counts() -> dict:
         counts["prod_trades"] = db.query(Trade).filter(Trade.test_mode == False).count()
 
     return counts
-
-
-# Initialize database on module import
-try:
-    init_db()
-except Exception as e:
-    logger.error(f"Failed to initialize database on import: {e}")
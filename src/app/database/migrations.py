@@ -0,0 +1,193 @@
+"""
+Schema migrations.
+
+Base.metadata.create_all only creates missing tables, so new indexes (and
+other schema changes) never reach an existing database. Migrations are
+numbered SQL steps recorded in the schema_migrations table; each is applied
+once, in order, in its own transaction, and its duration is stored with it.
+
+Index builds run in the background at startup (migration_runner.start())
+so the app serves requests while they run. SQLite builds an index in one
+statement holding the write lock: readers (WAL) carry on, and trading-loop
+writes wait on the write gate until the build commits (a few seconds on
+millions of rows) instead of the loop being stopped for a migration.
+
+New databases already have every index from the models, so the
+IF NOT EXISTS statements are no-ops there and the migrations only get
+recorded.
+
+Usage:
+    python scripts/migrate.py            # apply pending, foreground
+    python scripts/migrate.py --status
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from app.database.connection import get_db, get_read_db
+from app.database.models import SchemaMigration
+
+logger = logging.getLogger(__name__)
+
+
+class Migration:
+    """One numbered schema change: SQL statements applied in one transaction."""
+
+    def __init__(self, version: int, name: str, statements: List[str]):
+        """
+        Args:
+            version: Ordering key, unique and never reused
+            name: Short description (stored with the version)
+            statements: SQL to run, idempotent where possible (IF [NOT] EXISTS)
+        """
+        self.version = version
+        self.name = name
+        self.statements = statements
+
+    def apply(self, connection):
+        for statement in self.statements:
+            connection.exec_driver_sql(statement)
+
+    def __repr__(self):
+        return f"<Migration({self.version}, {self.name})>"
+
+
+MIGRATIONS = [
+    Migration(1, "signals (test_mode, timestamp DESC) index", [
+        "CREATE INDEX IF NOT EXISTS idx_signal_test_timestamp_desc "
+        "ON signals (test_mode, timestamp DESC, id DESC)",
+    ]),
+    Migration(2, "trades (test_mode, timestamp DESC) index", [
+        "CREATE INDEX IF NOT EXISTS idx_trade_test_timestamp_desc "
+        "ON trades (test_mode, timestamp DESC, id DESC)",
+        "DROP INDEX IF EXISTS idx_trade_test_timestamp",
+    ]),
+    Migration(3, "holdings (symbol, test_mode, timestamp) index", [
+        "CREATE INDEX IF NOT EXISTS idx_holding_symbol_test_timestamp "
+        "ON holdings (symbol, test_mode, timestamp)",
+        "DROP INDEX IF EXISTS idx_symbol_test",
+    ]),
+]
+
+
+class MigrationRunner:
+    """Applies pending migrations, in the foreground or on a background thread."""
+
+    def __init__(self, migrations: Optional[List[Migration]] = None):
+        """
+        Args:
+            migrations: Migrations to manage (defaults to MIGRATIONS)
+        """
+        self.migrations = sorted(migrations or MIGRATIONS, key=lambda m: m.version)
+        self.lock = threading.Lock()
+        self.thread: Optional[threading.Thread] = None
+        self.stats = {
+            "applied": [],  # migrations applied by this process, with timings
+            "last_error": None,
+            "last_run": None,
+        }
+
+    def applied_versions(self) -> Dict[int, SchemaMigration]:
+        """Recorded migrations by version."""
+        with get_read_db() as db:
+            rows = db.query(SchemaMigration).all()
+            db.expunge_all()
+        return {row.version: row for row in rows}
+
+    def pending(self) -> List[Migration]:
+        """Migrations not yet recorded, in version order."""
+        applied = self.applied_versions()
+        return [m for m in self.migrations if m.version not in applied]
+
+    def apply_pending(self) -> List[Dict[str, Any]]:
+        """
+        Apply every pending migration in order; stops at the first failure.
+
+        Returns:
+            {"version", "name", "duration_seconds"} per migration applied
+        """
+        with self.lock:
+            results = []
+            self.stats["last_run"] = datetime.now(timezone.utc).isoformat()
+            for migration in self.pending():
+                try:
+                    results.append(self._apply(migration))
+                except Exception as e:
+                    self.stats["last_error"] = f"{migration.version} {migration.name}: {e}"
+                    logger.error(f"[Migrations] {migration.version} ({migration.name}) failed: {e}")
+                    break
+
+            if results:
+                # Let the planner pick up the new indexes
+                with get_db() as db:
+                    db.connection().exec_driver_sql("PRAGMA optimize")
+            return results
+
+    def _apply(self, migration: Migration) -> Dict[str, Any]:
+        logger.info(f"[Migrations] Applying {migration.version} ({migration.name})")
+        with get_db() as db:
+            started = time.perf_counter()
+            migration.apply(db.connection())
+            duration = round(time.perf_counter() - started, 4)
+            db.add(SchemaMigration(
+                version=migration.version, name=migration.name, duration_seconds=duration,
+            ))
+
+        result = {"version": migration.version, "name": migration.name, "duration_seconds": duration}
+        self.stats["applied"].append(result)
+        logger.info(f"[Migrations] Applied {migration.version} ({migration.name}) in {duration}s")
+        return result
+
+    def start(self) -> bool:
+        """
+        Apply pending migrations on a background thread.
+
+        Returns:
+            False if a background run is already in progress
+        """
+        if self.thread and self.thread.is_alive():
+            return False
+        self.thread = threading.Thread(target=self._run_background, name="migrations", daemon=True)
+        self.thread.start()
+        return True
+
+    def _run_background(self):
+        try:
+            applied = self.apply_pending()
+            if applied:
+                total = sum(r["duration_seconds"] for r in applied)
+                logger.info(f"[Migrations] {len(applied)} migration(s) applied in {total:.2f}s")
+        except Exception as e:
+            self.stats["last_error"] = str(e)
+            logger.error(f"[Migrations] Background run failed: {e}")
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a background run; True once no run is in progress."""
+        if self.thread:
+            self.thread.join(timeout)
+            return not self.thread.is_alive()
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Recorded and pending migrations plus this process's run history."""
+        applied = self.applied_versions()
+        return {
+            **self.stats,
+            "running": bool(self.thread and self.thread.is_alive()),
+            "recorded": [
+                {
+                    "version": row.version, "name": row.name,
+                    "applied_at": row.applied_at.isoformat() if row.applied_at else None,
+                    "duration_seconds": row.duration_seconds,
+                }
+                for row in sorted(applied.values(), key=lambda r: r.version)
+            ],
+            "pending": [m.version for m in self.migrations if m.version not in applied],
+        }
+
+
+# Global singleton
+migration_runner = MigrationRunner()
@@ -7,7 +7,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 from sqlalchemy import (
-    Column, Integer, String, Numeric, Boolean,
+    Column, Integer, String, Numeric, Boolean, Float,
     DateTime, ForeignKey, Index, JSON, Text, create_engine
 )
 from sqlalchemy.ext.declarative import declarative_base
@@ -47,6 +47,7 @@ class Signal(Base):
 
     # Relationships
     trades = relationship("Trade", back_populates="signal")
+    votes = relationship("StrategyVote", cascade="all, delete-orphan", passive_deletes=True)
 
     # Composite indexes
     __table_args__ = (
@@ -58,6 +59,54 @@ class Signal(Base):
         return f"<Signal(id={self.id}, symbol={self.symbol}, signal={self.final_signal}, conf={self.final_confidence})>"
 
 
+# Feed and recent-signal scans (newest first within a partition); existing
+# databases get it from migration 1
+Index('idx_signal_test_timestamp_desc', Signal.test_mode, Signal.timestamp.desc(), Signal.id.desc())
+
+
+class IdSequence(Base):
+    """Database-side ID reservations for rows whose IDs are handed out before insert."""
+    __tablename__ = "id_sequences"
+
+    name = Column(String(50), primary_key=True)  # table name
+    next_id = Column(Integer, nullable=False)
+
+    def __repr__(self):
+        return f"<IdSequence(name={self.name}, next_id={self.next_id})>"
+
+
+class SchemaMigration(Base):
+    """Applied schema migrations (see app.database.migrations)."""
+    __tablename__ = "schema_migrations"
+
+    version = Column(Integer, primary_key=True)
+    name = Column(String(100), nullable=False)
+    applied_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    duration_seconds = Column(Float, nullable=False, default=0.0)
+
+    def __repr__(self):
+        return f"<SchemaMigration(version={self.version}, name={self.name})>"
+
+
+class StrategyVote(Base):
+    """One strategy's vote on a signal (normalized copy of Signal.strategies)."""
+    __tablename__ = "strategy_votes"
+
+    signal_id = Column(Integer, ForeignKey('signals.id', ondelete='CASCADE'), primary_key=True)
+    strategy = Column(String(50), primary_key=True)
+    signal = Column(String(10), nullable=False)  # BUY, SELL, HOLD
+    confidence = Column(Float, nullable=False, default=0.0)
+    weight = Column(Float)
+
+    __table_args__ = (
+        Index('idx_vote_strategy_signal_id', 'strategy', 'signal_id'),
+        Index('idx_vote_strategy_signal', 'strategy', 'signal'),
+    )
+
+    def __repr__(self):
+        return f"<StrategyVote(signal_id={self.signal_id}, strategy={self.strategy}, signal={self.signal})>"
+
+
 class Trade(Base):
     """Executed trades."""
     __tablename__ = "trades"
@@ -95,13 +144,16 @@ class Trade(Base):
     # Composite indexes
     __table_args__ = (
         Index('idx_trade_symbol_timestamp', 'symbol', 'timestamp'),
-        Index('idx_trade_test_timestamp', 'test_mode', 'timestamp'),
     )
 
     def __repr__(self):
         return f"<Trade(id={self.id}, {self.action} {self.amount} {self.symbol} @ {self.price})>"
 
 
+# Replaces idx_trade_test_timestamp (migration 2)
+Index('idx_trade_test_timestamp_desc', Trade.test_mode, Trade.timestamp.desc(), Trade.id.desc())
+
+
 class Holding(Base):
     """Current positions (point-in-time snapshots)."""
     __tablename__ = "holdings"
@@ -122,13 +174,58 @@ class Holding(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
     __table_args__ = (
-        Index('idx_symbol_test', 'symbol', 'test_mode'),
+        # Covers the latest-snapshot-per-symbol lookup; replaces
+        # idx_symbol_test (migration 3)
+        Index('idx_holding_symbol_test_timestamp', 'symbol', 'test_mode', 'timestamp'),
     )
 
     def __repr__(self):
         return f"<Holding(symbol={self.symbol}, amount={self.amount}, pnl={self.unrealized_pnl})>"
 
 
+class CurrentPosition(Base):
+    """Compacted current position per symbol (one row, updated in place)."""
+    __tablename__ = "current_positions"
+
+    symbol = Column(String(20), primary_key=True)
+    test_mode = Column(Boolean, primary_key=True, default=False)
+    amount = Column(SQLDecimal(20, 8), nullable=False)
+    avg_buy_price = Column(SQLDecimal(20, 8), nullable=False)
+    current_price = Column(SQLDecimal(20, 8))
+    unrealized_pnl = Column(SQLDecimal(20, 8))
+    realized_pnl = Column(SQLDecimal(20, 8), nullable=False, default=0)
+
+    # Attribution (last trade/signal that changed the position)
+    entry_signal_id = Column(Integer, ForeignKey('signals.id'))
+    entry_trade_id = Column(Integer, ForeignKey('trades.id'))
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<CurrentPosition(symbol={self.symbol}, amount={self.amount}, realized={self.realized_pnl})>"
+
+
+class PnLCheckpoint(Base):
+    """Incremental P&L ledger state per symbol, as of last_trade_id."""
+    __tablename__ = "pnl_checkpoints"
+
+    symbol = Column(String(20), primary_key=True)
+    test_mode = Column(Boolean, primary_key=True, default=False)
+    side = Column(String(5))  # long, short, or NULL when flat
+    amount = Column(SQLDecimal(20, 8), nullable=False, default=0)
+    avg_price = Column(SQLDecimal(20, 8), nullable=False, default=0)
+    last_price = Column(SQLDecimal(20, 8))
+    realized_pnl = Column(SQLDecimal(20, 8), nullable=False, default=0)
+
+    # Highest trade id folded into this row
+    last_trade_id = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<PnLCheckpoint(symbol={self.symbol}, realized={self.realized_pnl}, last_trade_id={self.last_trade_id})>"
+
+
 class StrategyPerformance(Base):
     """Aggregated performance metrics by strategy."""
     __tablename__ = "strategy_performance"
@@ -168,6 +265,48 @@ class StrategyPerformance(Base):
         return f"<StrategyPerformance(strategy={self.strategy_name}, win_rate={self.win_rate})>"
 
 
+class StrategyRollup(Base):
+    """Per-strategy, per-symbol signal aggregates in hourly and daily buckets."""
+    __tablename__ = "strategy_rollups"
+
+    strategy_name = Column(String(50), primary_key=True)
+    symbol = Column(String(20), primary_key=True)
+    granularity = Column(String(5), primary_key=True)  # hour, day
+    bucket_start = Column(DateTime, primary_key=True)
+    test_mode = Column(Boolean, primary_key=True, default=False)
+
+    buy_count = Column(Integer, nullable=False, default=0)
+    sell_count = Column(Integer, nullable=False, default=0)
+    hold_count = Column(Integer, nullable=False, default=0)
+    confidence_sum = Column(Float, nullable=False, default=0.0)
+    agreement_count = Column(Integer, nullable=False, default=0)  # strategy signal == final signal
+
+    __table_args__ = (
+        Index('idx_rollup_bucket', 'granularity', 'bucket_start'),
+    )
+
+    def __repr__(self):
+        return f"<StrategyRollup(strategy={self.strategy_name}, symbol={self.symbol}, {self.granularity}={self.bucket_start})>"
+
+
+class SignalAggregate(Base):
+    """Hourly summary of HOLD-only signal periods downsampled out of the signals table."""
+    __tablename__ = "signal_aggregates"
+
+    symbol = Column(String(20), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)  # hour
+    test_mode = Column(Boolean, primary_key=True, default=False)
+
+    signal_count = Column(Integer, nullable=False, default=0)
+    confidence_sum = Column(Float, nullable=False, default=0.0)
+    price_sum = Column(Float, nullable=False, default=0.0)
+    price_min = Column(Float)
+    price_max = Column(Float)
+
+    def __repr__(self):
+        return f"<SignalAggregate(symbol={self.symbol}, hour={self.bucket_start}, count={self.signal_count})>"
+
+
 class StrategyDefinition(Base):
     """Dynamic strategy configurations."""
     __tablename__ = "strategy_definitions"
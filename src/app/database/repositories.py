@@ -3,17 +3,19 @@ Data repositories for clean database access.
 
 Repository pattern separates data access logic from business logic.
 """
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, or_, bindparam, case, delete, func, select, text, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from app.database.models import (
-    Signal, Trade, Holding, StrategyPerformance,
-    StrategyDefinition, ErrorLog, RSSFeed, SeenNews, BotStatus,
+    Signal, StrategyVote, IdSequence, Trade, Holding, CurrentPosition, PnLCheckpoint, StrategyPerformance,
+    StrategyRollup, SignalAggregate, StrategyDefinition, ErrorLog, RSSFeed, SeenNews, BotStatus,
     HistoricalOHLCV
 )
+from app.utils.signal_matching import match_by_time
 
 
 class SignalRepository:
@@ -36,8 +38,9 @@ class SignalRepository:
         strategy_version: Optional[str] = None,
         signal_metadata: Optional[Dict] = None
     ) -> Signal:
-        """Create a new signal."""
+        """Create a new signal (ID reserved from id_sequences, like queued signals)."""
         signal = Signal(
+            id=IdSequenceRepository(self.session).reserve(Signal),
             timestamp=timestamp,
             symbol=symbol,
             price=price,
@@ -52,6 +55,7 @@ class SignalRepository:
         )
         self.session.add(signal)
         self.session.flush()  # Get the ID without committing
+        StrategyVoteRepository(self.session).add_for_signals([{"id": signal.id, "strategies": strategies}])
         return signal
 
     def get_by_id(self, signal_id: int) -> Optional[Signal]:
@@ -73,6 +77,84 @@ class SignalRepository:
 
         return query.order_by(Signal.timestamp.desc()).limit(limit).all()
 
+    def get_feed(
+        self,
+        limit: int = 50,
+        before: Optional[Tuple[datetime, int]] = None,
+        executed: Optional[bool] = None,
+        since: Optional[datetime] = None,
+        symbol: Optional[str] = None,
+        test_mode: bool = False
+    ) -> List[Tuple[Signal, Optional[Trade]]]:
+        """
+        Page of signals, newest first, each with the trade it triggered (if any).
+
+        One query: signals LEFT JOIN their first trade, keyset-paginated on
+        (timestamp, id) so every page costs the same regardless of depth.
+        The executed-only feed is driven from trades (indexed on signal_id)
+        instead, so it scales with trades rather than signals.
+
+        Args:
+            limit: Page size
+            before: (timestamp, id) of the last row of the previous page
+            executed: True/False to keep only signals with/without a trade
+            since: Oldest timestamp to include
+            symbol: Restrict to one symbol
+            test_mode: Signal/trade partition
+        """
+        if executed is True:
+            query = self.with_executing_trade(test_mode)
+        else:
+            query = self.with_linked_trade(test_mode)
+
+        if before is not None:
+            before_ts, before_id = before
+            query = query.filter(or_(
+                Signal.timestamp < before_ts,
+                and_(Signal.timestamp == before_ts, Signal.id < before_id)
+            ))
+        if executed is False:
+            query = query.filter(Trade.id.is_(None))
+        if since is not None:
+            query = query.filter(Signal.timestamp >= since)
+        if symbol:
+            query = query.filter(Signal.symbol == symbol)
+
+        return query.order_by(Signal.timestamp.desc(), Signal.id.desc()).limit(limit).all()
+
+    def with_linked_trade(self, test_mode: bool = False):
+        """Query of (Signal, Trade|None): signals LEFT JOIN the first trade carrying their signal_id."""
+        linked = aliased(Trade)
+        first_trade_id = (
+            select(func.min(linked.id))
+            .where(linked.signal_id == Signal.id)
+            .where(linked.test_mode == test_mode)
+            .correlate(Signal)
+            .scalar_subquery()
+        )
+        return (
+            self.session.query(Signal, Trade)
+            .outerjoin(Trade, Trade.id == first_trade_id)
+            .filter(Signal.test_mode == test_mode)
+        )
+
+    def with_executing_trade(self, test_mode: bool = False):
+        """Query of (Signal, Trade) for executed signals only, starting from trades grouped by signal_id."""
+        first_trades = (
+            select(Trade.signal_id, func.min(Trade.id).label("trade_id"))
+            .where(Trade.signal_id.isnot(None))
+            .where(Trade.test_mode == test_mode)
+            .group_by(Trade.signal_id)
+            .subquery()
+        )
+        return (
+            self.session.query(Signal, Trade)
+            .select_from(first_trades)
+            .join(Signal, Signal.id == first_trades.c.signal_id)
+            .join(Trade, Trade.id == first_trades.c.trade_id)
+            .filter(Signal.test_mode == test_mode)
+        )
+
     def get_by_symbol(
         self,
         symbol: str,
@@ -123,6 +205,133 @@ class SignalRepository:
         return {signal_type: count for signal_type, count in results}
 
 
+class IdSequenceRepository:
+    """Hands out primary keys from the id_sequences table."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def reserve(self, model, count: int = 1) -> int:
+        """
+        Reserve `count` consecutive IDs for a table.
+
+        One atomic UPDATE ... RETURNING, so concurrent writers (threads or
+        processes) never get overlapping ranges. The sequence never falls
+        below MAX(id) + 1, so rows inserted without a reservation are skipped.
+        The reservation commits with the caller's transaction.
+
+        Returns:
+            First reserved ID
+        """
+        name = model.__tablename__
+        self.session.execute(
+            sqlite_insert(IdSequence).values(name=name, next_id=1).on_conflict_do_nothing()
+        )
+        floor = select(func.coalesce(func.max(model.id), 0) + 1).scalar_subquery()
+        next_id = self.session.execute(
+            update(IdSequence)
+            .where(IdSequence.name == name)
+            .values(next_id=func.max(IdSequence.next_id, floor) + count)
+            .returning(IdSequence.next_id)
+        ).scalar_one()
+        return next_id - count
+
+
+class StrategyVoteRepository:
+    """Repository for per-strategy votes (strategy_votes child table of signals)."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    @staticmethod
+    def vote_rows(signal_id: int, strategies: Optional[Dict]) -> List[Dict]:
+        """Flatten a Signal.strategies dict into strategy_votes rows."""
+        rows = []
+        for strategy, data in (strategies or {}).items():
+            if not isinstance(data, dict):
+                data = {}
+            weight = data.get("weight")
+            rows.append({
+                "signal_id": signal_id,
+                "strategy": strategy,
+                "signal": data.get("signal", "HOLD"),
+                "confidence": float(data.get("confidence") or 0),
+                "weight": float(weight) if weight is not None else None,
+            })
+        return rows
+
+    def add_for_signals(self, signals: List[Dict]) -> int:
+        """
+        Insert votes for signal rows in one statement.
+
+        Args:
+            signals: Dicts with the signal's id and strategies
+        """
+        rows = [vote for s in signals for vote in self.vote_rows(s["id"], s.get("strategies"))]
+        if rows:
+            self.session.execute(sqlite_insert(StrategyVote).on_conflict_do_nothing(), rows)
+        return len(rows)
+
+    def backfill(self, batch_size: int = 1000) -> int:
+        """
+        Create votes for signals that have none (migration for rows written
+        before strategy_votes existed).
+
+        Signals whose strategies column is NULL or an empty object produce
+        no votes, so they are excluded in SQL rather than rescanned (and
+        counted) on every run.
+
+        Returns:
+            Number of signals that got votes
+        """
+        has_votes = select(StrategyVote.signal_id).where(StrategyVote.signal_id == Signal.id).exists()
+        has_strategies = and_(
+            func.json_type(Signal.strategies) == "object",
+            text("EXISTS (SELECT 1 FROM json_each(signals.strategies))"),
+        )
+        migrated = 0
+        last_id = 0
+        while True:
+            batch = (
+                self.session.query(Signal.id, Signal.strategies)
+                .filter(Signal.id > last_id, has_strategies, ~has_votes)
+                .order_by(Signal.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not batch:
+                return migrated
+            signals = [{"id": row.id, "strategies": row.strategies} for row in batch]
+            self.add_for_signals(signals)
+            migrated += sum(1 for signal in signals if self.vote_rows(signal["id"], signal["strategies"]))
+            last_id = batch[-1].id
+
+    def get_votes(
+        self,
+        since: datetime,
+        test_mode: bool = False,
+        symbol: Optional[str] = None,
+        limit: int = 1000
+    ) -> List[Tuple[int, str, str]]:
+        """
+        Votes on the latest `limit` signals at or after `since`.
+
+        Returns:
+            (signal_id, strategy, signal) rows
+        """
+        signal_ids = select(Signal.id).where(Signal.timestamp >= since, Signal.test_mode == test_mode)
+        if symbol:
+            signal_ids = signal_ids.where(Signal.symbol == symbol)
+        signal_ids = signal_ids.order_by(Signal.timestamp.desc()).limit(limit)
+
+        return [
+            tuple(row) for row in
+            self.session.query(StrategyVote.signal_id, StrategyVote.strategy, StrategyVote.signal)
+            .filter(StrategyVote.signal_id.in_(signal_ids))
+            .all()
+        ]
+
+
 class TradeRepository:
     """Repository for Trade operations."""
 
@@ -215,6 +424,27 @@ class TradeRepository:
             .all()
         )
 
+    def get_fills_after(self, trade_id: int, test_mode: bool = False) -> List:
+        """
+        Get (id, symbol, action, price, amount) rows with id > trade_id,
+        oldest first. Used for incremental replays; reads only the columns needed.
+        """
+        return (
+            self.session.query(Trade.id, Trade.symbol, Trade.action, Trade.price, Trade.amount)
+            .filter(Trade.id > trade_id)
+            .filter(Trade.test_mode == test_mode)
+            .order_by(Trade.id.asc())
+            .all()
+        )
+
+    def get_max_id(self, test_mode: bool = False) -> int:
+        """Highest trade id (0 if there are no trades)."""
+        return (
+            self.session.query(func.max(Trade.id))
+            .filter(Trade.test_mode == test_mode)
+            .scalar()
+        ) or 0
+
     def count_total(self, test_mode: bool = False) -> int:
         """Count total trades."""
         return self.session.query(Trade).filter(Trade.test_mode == test_mode).count()
@@ -324,6 +554,295 @@ class HoldingRepository:
         )
 
 
+class CurrentPositionRepository:
+    """Repository for the compacted current_positions table."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_all(self, test_mode: bool = False) -> List[CurrentPosition]:
+        """Get every position row, including closed (amount 0) ones."""
+        return (
+            self.session.query(CurrentPosition)
+            .filter(CurrentPosition.test_mode == test_mode)
+            .all()
+        )
+
+    def upsert(
+        self,
+        symbol: str,
+        amount: Decimal,
+        avg_buy_price: Decimal,
+        current_price: Optional[Decimal] = None,
+        unrealized_pnl: Optional[Decimal] = None,
+        realized_pnl: Decimal = Decimal("0"),
+        entry_signal_id: Optional[int] = None,
+        entry_trade_id: Optional[int] = None,
+        test_mode: bool = False
+    ) -> CurrentPosition:
+        """Insert or update the position row for a symbol."""
+        position = self.session.get(CurrentPosition, (symbol, test_mode))
+        if position is None:
+            position = CurrentPosition(symbol=symbol, test_mode=test_mode)
+            self.session.add(position)
+
+        position.amount = amount
+        position.avg_buy_price = avg_buy_price
+        position.current_price = current_price
+        position.unrealized_pnl = unrealized_pnl
+        position.realized_pnl = realized_pnl
+        position.entry_signal_id = entry_signal_id
+        position.entry_trade_id = entry_trade_id
+        position.updated_at = datetime.utcnow()
+        self.session.flush()
+        return position
+
+
+class PnLCheckpointRepository:
+    """Repository for the incremental P&L ledger checkpoints."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_all(self, test_mode: bool = False) -> List[PnLCheckpoint]:
+        """Get every checkpoint row."""
+        return (
+            self.session.query(PnLCheckpoint)
+            .filter(PnLCheckpoint.test_mode == test_mode)
+            .all()
+        )
+
+    def upsert(
+        self,
+        symbol: str,
+        side: Optional[str],
+        amount: Decimal,
+        avg_price: Decimal,
+        last_price: Optional[Decimal],
+        realized_pnl: Decimal,
+        last_trade_id: int,
+        test_mode: bool = False
+    ) -> PnLCheckpoint:
+        """Insert or update the checkpoint row for a symbol."""
+        checkpoint = self.session.get(PnLCheckpoint, (symbol, test_mode))
+        if checkpoint is None:
+            checkpoint = PnLCheckpoint(symbol=symbol, test_mode=test_mode)
+            self.session.add(checkpoint)
+
+        checkpoint.side = side
+        checkpoint.amount = amount
+        checkpoint.avg_price = avg_price
+        checkpoint.last_price = last_price
+        checkpoint.realized_pnl = realized_pnl
+        checkpoint.last_trade_id = last_trade_id
+        checkpoint.updated_at = datetime.utcnow()
+        self.session.flush()
+        return checkpoint
+
+    def delete_all(self, test_mode: bool = False) -> int:
+        """Drop all checkpoints (forces a full replay)."""
+        return (
+            self.session.query(PnLCheckpoint)
+            .filter(PnLCheckpoint.test_mode == test_mode)
+            .delete()
+        )
+
+
+class StrategyRollupRepository:
+    """Repository for hourly/daily strategy signal rollups."""
+
+    COUNTERS = ("buy_count", "sell_count", "hold_count", "confidence_sum", "agreement_count")
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def apply(self, deltas: List[Dict]) -> int:
+        """
+        Add delta rows to their buckets (insert or increment in one statement).
+
+        Args:
+            deltas: Dicts with the key columns (strategy_name, symbol,
+                granularity, bucket_start, test_mode) and COUNTERS
+        """
+        if not deltas:
+            return 0
+        stmt = sqlite_insert(StrategyRollup)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["strategy_name", "symbol", "granularity", "bucket_start", "test_mode"],
+            set_={col: getattr(StrategyRollup, col) + getattr(stmt.excluded, col) for col in self.COUNTERS}
+        )
+        self.session.execute(stmt, deltas)
+        return len(deltas)
+
+    def get_totals(
+        self,
+        since: datetime,
+        test_mode: bool = False,
+        strategy_name: Optional[str] = None,
+        symbol: Optional[str] = None
+    ) -> List:
+        """
+        Per-strategy totals for signals at or after `since` (hour resolution).
+
+        Whole days come from daily buckets; the partial first day from
+        hourly buckets. Returns rows of (strategy_name, *COUNTERS).
+        """
+        hour_start = since.replace(minute=0, second=0, microsecond=0)
+        day_start = since.replace(hour=0, minute=0, second=0, microsecond=0)
+        if day_start < hour_start:
+            day_start += timedelta(days=1)
+
+        query = (
+            self.session.query(
+                StrategyRollup.strategy_name,
+                *[func.sum(getattr(StrategyRollup, col)) for col in self.COUNTERS]
+            )
+            .filter(StrategyRollup.test_mode == test_mode)
+            .filter(or_(
+                and_(StrategyRollup.granularity == "day", StrategyRollup.bucket_start >= day_start),
+                and_(
+                    StrategyRollup.granularity == "hour",
+                    StrategyRollup.bucket_start >= hour_start,
+                    StrategyRollup.bucket_start < day_start
+                )
+            ))
+        )
+        if strategy_name:
+            query = query.filter(StrategyRollup.strategy_name == strategy_name)
+        if symbol:
+            query = query.filter(StrategyRollup.symbol == symbol)
+
+        return query.group_by(StrategyRollup.strategy_name).all()
+
+    def count(self) -> int:
+        return self.session.query(func.count()).select_from(StrategyRollup).scalar() or 0
+
+    def delete_all(self) -> int:
+        return self.session.query(StrategyRollup).delete()
+
+
+class SignalRetentionRepository:
+    """
+    Repository for signal retention: HOLD-only downsampling into
+    signal_aggregates and batched range deletes.
+
+    Signals referenced by a trade are never removed.
+    """
+
+    AGGREGATE_SUMS = ("signal_count", "confidence_sum", "price_sum")
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    @staticmethod
+    def _untraded():
+        return ~select(Trade.id).where(Trade.signal_id == Signal.id).exists()
+
+    def downsample_hold_hours(self, before: datetime, limit: int = 500) -> Tuple[int, int]:
+        """
+        Collapse up to `limit` HOLD-only (symbol, hour) periods older than
+        `before` into signal_aggregates rows and delete their signals.
+
+        Returns:
+            (periods downsampled, signals deleted)
+        """
+        before = before.replace(minute=0, second=0, microsecond=0)
+        bucket = func.strftime("%Y-%m-%d %H:00:00", Signal.timestamp)
+        periods = (
+            self.session.query(
+                Signal.symbol, Signal.test_mode, bucket,
+                func.count(Signal.id), func.sum(Signal.final_confidence),
+                func.sum(Signal.price), func.min(Signal.price), func.max(Signal.price)
+            )
+            .filter(Signal.timestamp < before)
+            .group_by(Signal.symbol, Signal.test_mode, bucket)
+            .having(func.sum(case((Signal.final_signal != "HOLD", 1), else_=0)) == 0)
+            .having(func.sum(case((self._untraded(), 0), else_=1)) == 0)
+            .limit(limit)
+            .all()
+        )
+        if not periods:
+            return 0, 0
+
+        aggregates = [
+            dict(
+                symbol=symbol, test_mode=bool(test_mode),
+                bucket_start=datetime.strptime(hour, "%Y-%m-%d %H:%M:%S"),
+                signal_count=count, confidence_sum=float(confidence_sum or 0),
+                price_sum=float(price_sum or 0), price_min=float(price_min), price_max=float(price_max),
+            )
+            for symbol, test_mode, hour, count, confidence_sum, price_sum, price_min, price_max in periods
+        ]
+
+        stmt = sqlite_insert(SignalAggregate)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["symbol", "bucket_start", "test_mode"],
+            set_={
+                **{col: getattr(SignalAggregate, col) + getattr(stmt.excluded, col) for col in self.AGGREGATE_SUMS},
+                "price_min": func.min(SignalAggregate.price_min, stmt.excluded.price_min),
+                "price_max": func.max(SignalAggregate.price_max, stmt.excluded.price_max),
+            }
+        )
+        self.session.execute(stmt, aggregates)
+
+        signals = Signal.__table__
+        deleted = self.session.connection().execute(
+            delete(signals).where(
+                signals.c.symbol == bindparam("b_symbol"),
+                signals.c.test_mode == bindparam("b_test_mode"),
+                signals.c.timestamp >= bindparam("b_start"),
+                signals.c.timestamp < bindparam("b_end"),
+            ),
+            [
+                dict(b_symbol=a["symbol"], b_test_mode=a["test_mode"],
+                     b_start=a["bucket_start"], b_end=a["bucket_start"] + timedelta(hours=1))
+                for a in aggregates
+            ]
+        ).rowcount
+        return len(aggregates), deleted
+
+    def oldest(self, before: datetime, limit: int = 1000, test_mode: Optional[bool] = None) -> List[Signal]:
+        """Up to `limit` removable signals older than `before`, in id order."""
+        query = self.session.query(Signal).filter(Signal.timestamp < before, self._untraded())
+        if test_mode is not None:
+            query = query.filter(Signal.test_mode == test_mode)
+        return query.order_by(Signal.id).limit(limit).all()
+
+    def delete_before(
+        self,
+        before: datetime,
+        max_id: Optional[int] = None,
+        test_mode: Optional[bool] = None,
+        limit: Optional[int] = None
+    ) -> int:
+        """
+        DELETE signals WHERE timestamp < before (votes cascade).
+
+        Args:
+            before: Delete signals older than this
+            max_id: Only ids up to this one (the batch just archived)
+            test_mode: Restrict to one partition
+            limit: Delete at most this many (oldest ids first)
+
+        Returns:
+            Number of signals deleted
+        """
+        conditions = [Signal.timestamp < before, self._untraded()]
+        if max_id is not None:
+            conditions.append(Signal.id <= max_id)
+        if test_mode is not None:
+            conditions.append(Signal.test_mode == test_mode)
+
+        stmt = delete(Signal)
+        if limit is not None:
+            stmt = stmt.where(Signal.id.in_(
+                select(Signal.id).where(*conditions).order_by(Signal.id).limit(limit)
+            ))
+        else:
+            stmt = stmt.where(*conditions)
+        return self.session.execute(stmt.execution_options(synchronize_session=False)).rowcount
+
+
 class PerformanceRepository:
     """Repository for performance analysis."""
 
@@ -337,84 +856,87 @@ class PerformanceRepository:
         time_window_minutes: int = 10
     ) -> List[Dict]:
         """
-        Correlate signals to trades within a time window.
-        Returns list of {signal, trade, executed} dicts.
+        Correlate non-HOLD signals to trades.
+
+        Trades linked by signal_id are joined in SQL; the rest are matched
+        to the earliest same-symbol, same-side trade up to
+        time_window_minutes after the signal (app.utils.signal_matching).
+        Returns list of {signal, trade, executed} dicts, newest first.
         """
         cutoff = datetime.utcnow() - timedelta(hours=hours)
 
-        # Get non-HOLD signals
-        signals = (
-            self.session.query(Signal)
+        rows = (
+            SignalRepository(self.session).with_linked_trade(test_mode)
             .filter(Signal.final_signal != 'HOLD')
             .filter(Signal.timestamp >= cutoff)
-            .filter(Signal.test_mode == test_mode)
             .order_by(Signal.timestamp.desc())
             .all()
         )
 
-        # Get trades in same period
-        trades = (
-            self.session.query(Trade)
-            .filter(Trade.timestamp >= cutoff)
-            .filter(Trade.test_mode == test_mode)
-            .all()
-        )
-
-        # Correlate
-        correlations = []
-        for signal in signals:
-            matched_trade = None
-
-            # Find trade within time window
-            for trade in trades:
-                time_diff = abs((trade.timestamp - signal.timestamp).total_seconds() / 60)
-                if (
-                    trade.symbol == signal.symbol and
-                    trade.action.upper() == signal.final_signal and
-                    time_diff <= time_window_minutes
-                ):
-                    matched_trade = trade
-                    break
-
-            correlations.append({
-                "signal": signal,
-                "trade": matched_trade,
-                "executed": matched_trade is not None
-            })
+        matched = [trade for _, trade in rows]
+        unmatched = [i for i, trade in enumerate(matched) if trade is None]
+        if unmatched:
+            # Trades in same period, for the time-window fallback
+            trades = (
+                self.session.query(Trade)
+                .filter(Trade.timestamp >= cutoff)
+                .filter(Trade.test_mode == test_mode)
+                .all()
+            )
+            matches = match_by_time(
+                [(rows[i][0].symbol, rows[i][0].final_signal, rows[i][0].timestamp) for i in unmatched],
+                [(t.symbol, t.action, t.timestamp) for t in trades],
+                time_window_minutes
+            )
+            for i, trade_index in zip(unmatched, matches):
+                if trade_index is not None:
+                    matched[i] = trades[trade_index]
 
-        return correlations
+        return [
+            {"signal": signal, "trade": trade, "executed": trade is not None}
+            for (signal, _), trade in zip(rows, matched)
+        ]
 
     def get_strategy_performance(
         self,
         hours: int = 24,
-        test_mode: bool = False
+        test_mode: bool = False,
+        time_window_minutes: int = 10
     ) -> Dict[str, Dict]:
-        """Calculate performance metrics by strategy."""
-        correlations = self.correlate_signals_to_trades(hours, test_mode)
+        """
+        Calculate execution metrics by strategy.
+
+        Execution comes from correlate_signals_to_trades (signal_id join,
+        then the shared time-window matcher), so both methods agree on what
+        "executed" means; strategy membership comes from strategy_votes.
+        """
+        cutoff = datetime.utcnow() - timedelta(hours=hours)
+
+        correlations = self.correlate_signals_to_trades(hours, test_mode, time_window_minutes)
+        executed_ids = {c["signal"].id for c in correlations if c["executed"]}
+
+        votes = (
+            self.session.query(StrategyVote.strategy, StrategyVote.signal_id)
+            .join(Signal, Signal.id == StrategyVote.signal_id)
+            .filter(Signal.final_signal != 'HOLD')
+            .filter(Signal.timestamp >= cutoff)
+            .filter(Signal.test_mode == test_mode)
+            .all()
+        )
 
         strategy_stats = {}
-        for corr in correlations:
-            signal = corr["signal"]
-            strategies = signal.strategies or {}
-
-            for strategy_name in strategies:
-                if strategy_name not in strategy_stats:
-                    strategy_stats[strategy_name] = {
-                        "signals_generated": 0,
-                        "signals_executed": 0,
-                        "execution_rate": 0.0
-                    }
-
-                strategy_stats[strategy_name]["signals_generated"] += 1
-                if corr["executed"]:
-                    strategy_stats[strategy_name]["signals_executed"] += 1
-
-        # Calculate rates
+        for strategy, signal_id in votes:
+            stats = strategy_stats.setdefault(strategy, {
+                "signals_generated": 0,
+                "signals_executed": 0,
+                "execution_rate": 0.0
+            })
+            stats["signals_generated"] += 1
+            if signal_id in executed_ids:
+                stats["signals_executed"] += 1
+
         for stats in strategy_stats.values():
-            if stats["signals_generated"] > 0:
-                stats["execution_rate"] = (
-                    stats["signals_executed"] / stats["signals_generated"]
-                )
+            stats["execution_rate"] = stats["signals_executed"] / stats["signals_generated"]
 
         return strategy_stats
 
@@ -804,6 +1326,11 @@ def get_repositories(session: Session) -> Dict:
         "signals": SignalRepository(session),
         "trades": TradeRepository(session),
         "holdings": HoldingRepository(session),
+        "positions": CurrentPositionRepository(session),
+        "pnl": PnLCheckpointRepository(session),
+        "rollups": StrategyRollupRepository(session),
+        "retention": SignalRetentionRepository(session),
+        "votes": StrategyVoteRepository(session),
         "performance": PerformanceRepository(session),
         "feeds": RSSFeedRepository(session),
         "config": BotConfigRepository(session),
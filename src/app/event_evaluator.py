@@ -0,0 +1,249 @@
+"""
+Event-driven trade evaluation.
+Re-evaluates a single symbol between scheduled cycles when the market moves.
+
+Triggers (any one fires an evaluation):
+- Price moved more than price_change_pct since the symbol was last evaluated
+- Volume reading is volume_spike_ratio times its trailing average
+- New, previously unseen headlines mention the symbol
+
+Triggers are debounced (bursts within debounce_seconds collapse into one
+evaluation) and rate limited per symbol by cooldown_seconds. The periodic
+trade cycle still runs as a safety net and resets the per-symbol reference.
+"""
+
+import time
+import logging
+from collections import OrderedDict, defaultdict, deque
+from threading import Lock, Timer
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from app.utils.symbol_normalizer import normalize_symbol
+
+
+DEFAULT_TRIGGER_CONFIG = {
+    "enabled": True,
+    "price_change_pct": 1.5,      # % move since last evaluation
+    "volume_spike_ratio": 2.0,    # latest volume vs trailing average
+    "volume_lookback": 20,        # readings in the trailing average
+    "trigger_on_headlines": True,
+    "headline_poll_minutes": 2,   # 0 disables the headline watcher job
+    "debounce_seconds": 10,
+    "cooldown_seconds": 120,
+    "max_seen_headlines": 5000,   # headline URLs remembered for dedup (LRU)
+}
+
+
+class EventDrivenEvaluator:
+    """Decides when a single symbol deserves an out-of-cycle evaluation."""
+
+    def __init__(
+        self,
+        evaluate_fn: Optional[Callable[[str, List[str], List[Dict[str, Any]]], None]] = None,
+        config: Optional[Dict[str, Any]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            evaluate_fn: Called as evaluate_fn(symbol, reasons, headlines)
+                when a trigger fires and survives debounce/cooldown
+            config: Overrides for DEFAULT_TRIGGER_CONFIG
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.evaluate_fn = evaluate_fn
+        self.config = {**DEFAULT_TRIGGER_CONFIG, **(config or {})}
+        self.clock = clock
+        self.lock = Lock()
+
+        self.watched = set()
+        self.reference_price: Dict[str, float] = {}
+        self.volume_history = defaultdict(
+            lambda: deque(maxlen=self.config["volume_lookback"])
+        )
+        self.last_evaluated: Dict[str, float] = {}
+        # Insertion-ordered so the oldest URLs are evicted first
+        self.seen_headline_urls: "OrderedDict[str, None]" = OrderedDict()
+
+        # Pending (debounced) evaluations: symbol -> {"reasons", "headlines", "timer"}
+        self.pending: Dict[str, Dict[str, Any]] = {}
+
+        self.stats = {"triggers": 0, "evaluations": 0, "suppressed": 0}
+
+    # ---------- Configuration ----------
+    def update_config(self, new_config: Dict[str, Any]):
+        """Update trigger thresholds at runtime."""
+        with self.lock:
+            self.config.update(new_config)
+        logging.info(f"[EventEval] Configuration updated: {new_config}")
+
+    def watch(self, symbols: Iterable[str]):
+        """Add symbols to the set that can trigger evaluations."""
+        with self.lock:
+            for symbol in symbols:
+                canonical = self._canonical(symbol)
+                if canonical:
+                    self.watched.add(canonical)
+
+    def mark_evaluated(self, symbol: str, price: Optional[float] = None):
+        """
+        Record that a symbol was just evaluated (by either path).
+
+        Resets the price reference and starts the cooldown window so the
+        periodic cycle and event path don't evaluate the same move twice.
+        """
+        canonical = self._canonical(symbol)
+        if not canonical:
+            return
+        with self.lock:
+            self.watched.add(canonical)
+            self.last_evaluated[canonical] = self.clock()
+            if price and price > 0:
+                self.reference_price[canonical] = price
+
+    # ---------- Inputs ----------
+    def on_market_update(self, updates: Dict[str, Dict[str, float]]):
+        """
+        DataCollector listener.
+
+        Args:
+            updates: symbol -> {"price": float, "volume": float}
+        """
+        if not self.config["enabled"]:
+            return
+
+        for raw_symbol, data in updates.items():
+            symbol = self._canonical(raw_symbol)
+            if not symbol:
+                continue
+
+            price = data.get("price", 0)
+            volume = data.get("volume", 0)
+            reasons = []
+
+            with self.lock:
+                if symbol not in self.watched or price <= 0:
+                    continue
+
+                reference = self.reference_price.get(symbol)
+                if reference is None:
+                    self.reference_price[symbol] = price
+                else:
+                    change_pct = (price - reference) / reference * 100
+                    if abs(change_pct) >= self.config["price_change_pct"]:
+                        reasons.append(f"price moved {change_pct:+.2f}%")
+
+                history = self.volume_history[symbol]
+                if len(history) >= max(self.config["volume_lookback"] // 2, 1):
+                    avg_volume = sum(history) / len(history)
+                    if avg_volume > 0 and volume >= avg_volume * self.config["volume_spike_ratio"]:
+                        reasons.append(f"volume spike {volume / avg_volume:.1f}x")
+                history.append(volume)
+
+            if reasons:
+                self._trigger(symbol, reasons)
+
+    def on_headlines(self, headlines_by_symbol: Dict[str, List[Dict[str, Any]]]):
+        """Trigger evaluations for symbols with headlines not seen before."""
+        if not (self.config["enabled"] and self.config["trigger_on_headlines"]):
+            return
+
+        for raw_symbol, headlines in headlines_by_symbol.items():
+            symbol = self._canonical(raw_symbol)
+            if not symbol:
+                continue
+
+            with self.lock:
+                new_headlines = [
+                    h for h in headlines
+                    if h.get("url") and h["url"] not in self.seen_headline_urls
+                ]
+                for h in new_headlines:
+                    self.seen_headline_urls[h["url"]] = None
+                while len(self.seen_headline_urls) > self.config["max_seen_headlines"]:
+                    self.seen_headline_urls.popitem(last=False)
+
+            if new_headlines:
+                self._trigger(
+                    symbol,
+                    [f"{len(new_headlines)} new headline(s)"],
+                    headlines=new_headlines,
+                )
+
+    # ---------- Dispatch ----------
+    def _trigger(self, symbol: str, reasons: List[str], headlines: Optional[List[Dict]] = None):
+        """Queue an evaluation, honouring cooldown and debounce."""
+        with self.lock:
+            self.stats["triggers"] += 1
+
+            last = self.last_evaluated.get(symbol)
+            if last is not None and self.clock() - last < self.config["cooldown_seconds"]:
+                self.stats["suppressed"] += 1
+                logging.debug(f"[EventEval] {symbol} in cooldown, ignoring: {reasons}")
+                return
+
+            pending = self.pending.get(symbol)
+            if pending:
+                # Coalesce into the evaluation already waiting to run
+                pending["reasons"].extend(r for r in reasons if r not in pending["reasons"])
+                pending["headlines"].extend(headlines or [])
+                return
+
+            pending = {"reasons": list(reasons), "headlines": list(headlines or []), "timer": None}
+            self.pending[symbol] = pending
+
+            debounce = self.config["debounce_seconds"]
+            if debounce > 0:
+                timer = Timer(debounce, self._dispatch, args=(symbol,))
+                timer.daemon = True
+                pending["timer"] = timer
+                timer.start()
+
+        logging.info(f"[EventEval] {symbol} triggered: {'; '.join(reasons)}")
+        if self.config["debounce_seconds"] <= 0:
+            self._dispatch(symbol)
+
+    def _dispatch(self, symbol: str):
+        """Run the evaluation callback for a pending symbol."""
+        with self.lock:
+            pending = self.pending.pop(symbol, None)
+            if not pending:
+                return
+            self.last_evaluated[symbol] = self.clock()
+            self.stats["evaluations"] += 1
+
+        if not self.evaluate_fn:
+            return
+
+        try:
+            self.evaluate_fn(symbol, pending["reasons"], pending["headlines"])
+        except Exception as e:
+            logging.error(f"[EventEval] Evaluation failed for {symbol}: {e}")
+
+    def stop(self):
+        """Cancel any pending debounced evaluations."""
+        with self.lock:
+            for pending in self.pending.values():
+                if pending["timer"]:
+                    pending["timer"].cancel()
+            self.pending.clear()
+        logging.info("[EventEval] Stopped")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get trigger statistics."""
+        with self.lock:
+            return {
+                **self.stats,
+                "watched_symbols": sorted(self.watched),
+                "pending": sorted(self.pending),
+            }
+
+    @staticmethod
+    def _canonical(symbol: str) -> Optional[str]:
+        try:
+            return normalize_symbol(symbol)
+        except ValueError:
+            return None
+
+
+# Global singleton
+event_evaluator = EventDrivenEvaluator()
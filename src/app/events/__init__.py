@@ -1,5 +1,5 @@
 """Event system for real-time updates."""
 
-from app.events.event_bus import EventBus, event_bus, EventType
+from app.events.event_bus import EventBus, event_bus, EventType, Subscription
 
-__all__ = ["EventBus", "event_bus", "EventType"]
+__all__ = ["EventBus", "event_bus", "EventType", "Subscription"]
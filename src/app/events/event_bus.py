@@ -1,13 +1,46 @@
 """
 Event bus for broadcasting state changes to the UI.
+
+Two kinds of subscriber:
+
+- Callbacks (subscribe): run inline by emit, for fast in-process hooks such
+  as response-cache invalidation
+- Queues (subscribe_queue): each subscriber gets its own bounded queue that
+  emit fills without waiting, so a slow consumer (an SSE client on a slow
+  connection) can only fall behind itself. When a queue is full the
+  overflow policy decides what is lost:
+    drop_oldest  discard the oldest queued event
+    coalesce     replace the queued event with the same type and symbol
+                 (the UI only needs the latest), else discard the oldest
+
+Queues are thread-safe: events emitted from scheduler threads (their own
+event loop via asyncio.run) wake consumers on the server's loop.
 """
 import asyncio
-import json
 import logging
+import threading
+import time
+from collections import defaultdict, deque
 from enum import Enum
-from typing import Any, Dict, List, Callable
+from typing import Any, Callable, Dict, Iterable, List, Optional
 from datetime import datetime
-from collections import defaultdict
+
+from app.metrics.prometheus import (
+    EVENTS_EMITTED,
+    EVENT_BUS_SUBSCRIBERS,
+    EVENT_BUS_QUEUE_DEPTH,
+    EVENT_BUS_SUBSCRIBER_LAG,
+    EVENT_BUS_DELIVERY_SECONDS,
+    EVENT_BUS_DROPPED,
+)
+
+OVERFLOW_POLICIES = ("drop_oldest", "coalesce")
+
+DEFAULT_EVENT_BUS_CONFIG = {
+    "queue_size": 100,  # events buffered per queue subscriber
+    "overflow": "drop_oldest",  # default policy for subscribe_queue
+    "history_size": 100,  # events kept for get_recent_events
+}
 
 
 class EventType(str, Enum):
@@ -23,20 +56,187 @@ class EventType(str, Enum):
     BOT_STATUS_CHANGED = "bot_status_changed"
 
 
+def _type_name(event_type) -> str:
+    return event_type.value if isinstance(event_type, Enum) else event_type
+
+
+def coalesce_key(event: Dict[str, Any]):
+    """Events with the same key supersede each other under the coalesce policy."""
+    data = event.get("data")
+    return event.get("type"), data.get("symbol") if isinstance(data, dict) else None
+
+
+class Subscription:
+    """
+    A bounded event queue owned by one consumer.
+
+    Created by EventBus.subscribe_queue; read with `await get()` and
+    released with close().
+    """
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        event_types: Iterable[EventType],
+        maxsize: int,
+        overflow: str,
+        name: str = "queue",
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow!r} (expected one of {OVERFLOW_POLICIES})")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.bus = bus
+        self.event_types = frozenset(event_types)
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.name = name
+        self.closed = False
+
+        # (enqueued_at, event), oldest first
+        self._queue: deque = deque()
+        self._lock = threading.Lock()
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None  # Sync consumer: get_nowait() only
+        self._ready = asyncio.Event() if self._loop else None
+
+        self.stats = {"delivered": 0, "dropped": 0, "coalesced": 0}
+
+    # ---------- Producer side (EventBus.emit) ----------
+    def put(self, event: Dict[str, Any]):
+        """Queue an event without blocking, applying the overflow policy when full."""
+        entry = (time.monotonic(), event)
+        with self._lock:
+            if self.closed:
+                return
+            if len(self._queue) >= self.maxsize:
+                if not (self.overflow == "coalesce" and self._coalesce(entry)):
+                    self._queue.popleft()
+                    self.stats["dropped"] += 1
+                    EVENT_BUS_DROPPED.inc(reason="dropped")
+                    self._queue.append(entry)
+            else:
+                self._queue.append(entry)
+        self._wake()
+
+    def _coalesce(self, entry) -> bool:
+        """Replace the newest queued event sharing the entry's key (caller holds the lock)."""
+        key = coalesce_key(entry[1])
+        for index in range(len(self._queue) - 1, -1, -1):
+            if coalesce_key(self._queue[index][1]) == key:
+                # Keep the superseded event's enqueue time, so lag still
+                # reflects how long the consumer has been behind
+                self._queue[index] = (self._queue[index][0], entry[1])
+                self.stats["coalesced"] += 1
+                EVENT_BUS_DROPPED.inc(reason="coalesced")
+                return True
+        return False
+
+    def _wake(self):
+        if self._ready is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._ready.set)
+        except RuntimeError:
+            pass  # Consumer's loop already closed
+
+    # ---------- Consumer side ----------
+    def get_nowait(self) -> Optional[Dict[str, Any]]:
+        """Next queued event, or None when the queue is empty."""
+        with self._lock:
+            if not self._queue:
+                return None
+            enqueued_at, event = self._queue.popleft()
+            self.stats["delivered"] += 1
+        EVENT_BUS_DELIVERY_SECONDS.observe(time.monotonic() - enqueued_at)
+        return event
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Wait for the next event.
+
+        Returns:
+            The event, or None on timeout or after close()
+        """
+        if self._ready is None:
+            raise RuntimeError("Subscription was created outside an event loop; use get_nowait()")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.closed:
+            self._ready.clear()
+            event = self.get_nowait()
+            if event is not None:
+                return event
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return None
+        return None
+
+    def close(self):
+        """Stop receiving events and drop anything still queued."""
+        self.bus._remove_subscription(self)
+        with self._lock:
+            self.closed = True
+            self._queue.clear()
+        self._wake()
+
+    # ---------- Introspection ----------
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def lag_seconds(self) -> float:
+        """Age of the oldest undelivered event."""
+        with self._lock:
+            return time.monotonic() - self._queue[0][0] if self._queue else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "overflow": self.overflow,
+            "maxsize": self.maxsize,
+            "depth": self.depth,
+            "lag_seconds": round(self.lag_seconds(), 3),
+            **self.stats,
+        }
+
+
 class EventBus:
     """
-    Simple event bus for broadcasting events to subscribers.
-    Supports both sync and async subscribers.
+    Event bus for broadcasting events to callback and queue subscribers.
+    Callbacks can be sync or async.
     """
 
-    def __init__(self):
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            config: Overrides for DEFAULT_EVENT_BUS_CONFIG
+        """
+        self.config = {**DEFAULT_EVENT_BUS_CONFIG, **(config or {})}
         self._subscribers: Dict[EventType, List[Callable]] = defaultdict(list)
-        self._event_history: List[Dict[str, Any]] = []
-        self._max_history = 100
+        self._subscriptions: List[Subscription] = []
+        self._subscriptions_lock = threading.Lock()
+        self._event_history: deque = deque(maxlen=self.config["history_size"])
+
+    def update_config(self, new_config: Dict[str, Any]):
+        """Update configuration (queue settings apply to new subscriptions)."""
+        self.config.update(new_config)
+        if self._event_history.maxlen != self.config["history_size"]:
+            self._event_history = deque(self._event_history, maxlen=self.config["history_size"])
+        logging.info(f"[EventBus] Config updated: {new_config}")
 
     def subscribe(self, event_type: EventType, callback: Callable):
         """
-        Subscribe to an event type.
+        Subscribe a callback to an event type.
+
+        Callbacks run inline during emit and must be quick; consumers that
+        may fall behind should use subscribe_queue instead.
 
         Args:
             event_type: Type of event to listen for
@@ -50,10 +250,48 @@ class EventBus:
         if callback in self._subscribers[event_type]:
             self._subscribers[event_type].remove(callback)
 
+    def subscribe_queue(
+        self,
+        event_types: Optional[Iterable[EventType]] = None,
+        maxsize: Optional[int] = None,
+        overflow: Optional[str] = None,
+        name: str = "queue",
+    ) -> Subscription:
+        """
+        Open a bounded queue receiving events of the given types.
+
+        Args:
+            event_types: Types to receive (default: all)
+            maxsize: Queue bound (default: config queue_size)
+            overflow: "drop_oldest" or "coalesce" (default: config overflow)
+            name: Label for get_stats
+
+        Returns:
+            Subscription; call close() when done
+        """
+        subscription = Subscription(
+            self,
+            EventType if event_types is None else event_types,
+            maxsize or self.config["queue_size"],
+            overflow or self.config["overflow"],
+            name=name,
+        )
+        with self._subscriptions_lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def _remove_subscription(self, subscription: Subscription):
+        with self._subscriptions_lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
     async def emit(self, event_type: EventType, data: Dict[str, Any]):
         """
         Emit an event to all subscribers.
 
+        Queue subscribers are filled without waiting; callbacks run in
+        subscription order.
+
         Args:
             event_type: Type of event
             data: Event data payload
@@ -64,14 +302,18 @@ class EventBus:
             "timestamp": datetime.utcnow().isoformat()
         }
 
-        # Add to history
+        EVENTS_EMITTED.inc(type=_type_name(event_type))
         self._event_history.append(event)
-        if len(self._event_history) > self._max_history:
-            self._event_history.pop(0)
 
-        # Notify subscribers
-        subscribers = self._subscribers.get(event_type, [])
-        logging.debug(f"[EventBus] Emitting {event_type} to {len(subscribers)} subscribers")
+        with self._subscriptions_lock:
+            subscriptions = [s for s in self._subscriptions if event_type in s.event_types]
+        for subscription in subscriptions:
+            subscription.put(event)
+
+        subscribers = list(self._subscribers.get(event_type, []))
+        logging.debug(
+            f"[EventBus] Emitting {event_type} to {len(subscribers)} callbacks, {len(subscriptions)} queues"
+        )
 
         for callback in subscribers:
             try:
@@ -83,15 +325,56 @@ class EventBus:
             except Exception as e:
                 logging.error(f"[EventBus] Error in subscriber callback: {e}")
 
+    def subscriber_counts(self) -> Dict[str, int]:
+        """Subscribers (callbacks and queues) per event type."""
+        counts = defaultdict(int)
+        for event_type, callbacks in list(self._subscribers.items()):
+            counts[_type_name(event_type)] += len(callbacks)
+        for subscription in self.subscriptions():
+            for event_type in subscription.event_types:
+                counts[_type_name(event_type)] += 1
+        return dict(counts)
+
+    def subscriptions(self) -> List[Subscription]:
+        with self._subscriptions_lock:
+            return list(self._subscriptions)
+
+    def queue_depth(self) -> int:
+        """Events waiting across all queue subscribers."""
+        return sum(s.depth for s in self.subscriptions())
+
+    def max_lag_seconds(self) -> float:
+        """Age of the oldest undelivered event across queue subscribers."""
+        return max((s.lag_seconds() for s in self.subscriptions()), default=0.0)
+
     def get_recent_events(self, event_type: EventType = None, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent events, optionally filtered by type."""
         if event_type:
             events = [e for e in self._event_history if e["type"] == event_type]
         else:
-            events = self._event_history
+            events = list(self._event_history)
 
         return events[-limit:]
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue subscriber depth, lag and drop counts."""
+        subscriptions = [s.get_stats() for s in self.subscriptions()]
+        return {
+            "config": dict(self.config),
+            "callbacks": sum(len(c) for c in list(self._subscribers.values())),
+            "queues": len(subscriptions),
+            "queue_depth": sum(s["depth"] for s in subscriptions),
+            "max_lag_seconds": max((s["lag_seconds"] for s in subscriptions), default=0.0),
+            "dropped": sum(s["dropped"] for s in subscriptions),
+            "coalesced": sum(s["coalesced"] for s in subscriptions),
+            "history": len(self._event_history),
+            "subscriptions": subscriptions,
+        }
+
 
 # Global event bus instance
 event_bus = EventBus()
+
+EVENT_BUS_SUBSCRIBERS.set_function(event_bus.subscriber_counts)
+EVENT_BUS_QUEUE_DEPTH.set_function(event_bus.queue_depth)
+EVENT_BUS_SUBSCRIBER_LAG.set_function(event_bus.max_lag_seconds)
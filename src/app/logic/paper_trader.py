@@ -7,7 +7,11 @@ from typing import Optional
 from app.utils.symbol_normalizer import normalize_symbol
 from app.notifications.telegram import get_telegram_notifier
 from app.database.connection import get_db
-from app.database.repositories import TradeRepository, HoldingRepository
+from app.database.models import Trade
+from app.database.repositories import TradeRepository
+from app.logic.position_book import PositionBook
+from app.logic.pnl_ledger import pnl_ledger
+from app.strategy_signal_logger import signal_writer
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 LOGS_DIR = PROJECT_ROOT / "logs"
@@ -16,36 +20,72 @@ LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
 
 class PaperTrader:
-    def __init__(self):
+    def __init__(self, book: Optional[PositionBook] = None):
+        """
+        Args:
+            book: Position book to trade against (the app passes the shared
+                position_book; defaults to a private book loaded on first use)
+        """
         # REMOVED: JSON file initialization - all data now in database
-        pass
+        # Positions and trade stats are loaded from the database once, then
+        # kept current in memory by execute_trade
+        self.book = book or PositionBook()
+        self.trade_stats = None
+
+    def _ensure_loaded(self) -> bool:
+        """Load positions and running trade stats from the database (once)."""
+        if self.book.loaded and self.trade_stats is not None:
+            return True
 
-    def get_holdings(self):
-        """Get current holdings/positions from database."""
         try:
             with get_db() as db:
-                holding_repo = HoldingRepository(db)
-                holdings_list = holding_repo.get_current_holdings(test_mode=False)
-
-                # Convert to dict format for compatibility
-                holdings_dict = {}
-                for holding in holdings_list:
-                    amount = float(holding.amount)
-                    avg_price = float(holding.avg_buy_price)
-                    current_price = float(holding.current_price) if holding.current_price else avg_price
-
-                    holdings_dict[holding.symbol] = {
-                        "amount": amount,
-                        "avg_price": avg_price,
-                        "current_price": current_price,
-                        "market_value": amount * current_price,
-                        "cost_basis": amount * avg_price,
-                        "unrealized_pnl": float(holding.unrealized_pnl) if holding.unrealized_pnl else 0.0,
-                    }
-                return holdings_dict
+                if not self.book.loaded:
+                    self.book.load_from_session(db)
+
+                trades = (
+                    db.query(Trade.symbol, Trade.action, Trade.price)
+                    .filter(Trade.test_mode == False)
+                    .order_by(Trade.timestamp.asc(), Trade.id.asc())
+                    .all()
+                )
+                self.trade_stats = {"trade_count": 0, "wins": 0, "sells": 0, "open_buys": {}}
+                for symbol, action, price in trades:
+                    self._record_trade_stats(symbol, action, float(price) if price else 0)
+            return True
         except Exception as e:
             logging.error(f"[PaperTrader] Failed to load holdings from database: {e}")
+            return False
+
+    def _record_trade_stats(self, symbol, action, price):
+        """Update running trade count and win stats for one trade (O(1))."""
+        stats = self.trade_stats
+        action = (action or "").upper()
+        if action not in ("BUY", "SELL"):
+            return
+
+        stats["trade_count"] += 1
+
+        # Track [sum, count] of buy prices since the last sell per symbol
+        open_buys = stats["open_buys"]
+        if action == "BUY":
+            total, count = open_buys.get(symbol, (0.0, 0))
+            open_buys[symbol] = (total + price, count + 1)
+        elif symbol in open_buys:
+            # Use average buy price
+            total, count = open_buys.pop(symbol)
+            if price > total / count:
+                stats["wins"] += 1
+            stats["sells"] += 1
+
+    def get_holdings(self):
+        """Get current holdings/positions (in-memory book, loaded from database)."""
+        if not self._ensure_loaded():
             return {}
+        return self.book.snapshot()
+
+    def _write_holding_snapshot(self, db, symbol, position, trade_id=None, signal_id=None):
+        """Persist a projected position (current_positions + holdings history)."""
+        self.book.persist(db, symbol, position, trade_id=trade_id, signal_id=signal_id)
 
     def update_holdings(self, symbol, action, amount, price, trade_id=None, signal_id=None):
         """Update holdings in database based on trade action.
@@ -61,78 +101,23 @@ class PaperTrader:
         # Normalize symbol to canonical format
         canonical_symbol = normalize_symbol(symbol)
 
-        try:
-            with get_db() as db:
-                holding_repo = HoldingRepository(db)
-                holdings = self.get_holdings()
-
-                if action.upper() == "BUY":
-                    if canonical_symbol in holdings:
-                        # Average up position
-                        old_amount = holdings[canonical_symbol]["amount"]
-                        old_avg_price = holdings[canonical_symbol]["avg_price"]
-                        new_amount = old_amount + amount
-                        new_avg_price = (
-                            (old_amount * old_avg_price) + (amount * price)
-                        ) / new_amount
-
-                        # Update holding in database - preserving original entry IDs for averaging up
-                        holding_repo.create(
-                            timestamp=datetime.now(timezone.utc),
-                            symbol=canonical_symbol,
-                            amount=Decimal(str(new_amount)),
-                            avg_buy_price=Decimal(str(new_avg_price)),
-                            current_price=Decimal(str(price)),
-                            unrealized_pnl=Decimal(str((new_amount * price) - (new_amount * new_avg_price))),
-                            entry_trade_id=trade_id,  # Link to current trade for averaging up
-                            entry_signal_id=signal_id,  # Link to current signal
-                            test_mode=False
-                        )
-                    else:
-                        # New position - link to originating trade and signal
-                        holding_repo.create(
-                            timestamp=datetime.now(timezone.utc),
-                            symbol=canonical_symbol,
-                            amount=Decimal(str(amount)),
-                            avg_buy_price=Decimal(str(price)),
-                            current_price=Decimal(str(price)),
-                            unrealized_pnl=Decimal("0.0"),
-                            entry_trade_id=trade_id,  # Link to originating trade
-                            entry_signal_id=signal_id,  # Link to originating signal
-                            test_mode=False
-                        )
+        with self.book.lock:
+            if not self._ensure_loaded():
+                return
 
-                elif action.upper() == "SELL":
-                    if canonical_symbol in holdings:
-                        new_amount = holdings[canonical_symbol]["amount"] - amount
-
-                        # Always create a holding record to update the position
-                        # If position closed, amount will be 0 (filtered by get_current_holdings)
-                        if new_amount < 0:
-                            new_amount = 0  # Can't go negative
-
-                        avg_price = holdings[canonical_symbol]["avg_price"]
-                        market_value = new_amount * price
-                        cost_basis = new_amount * avg_price
-                        unrealized_pnl = market_value - cost_basis
-
-                        holding_repo.create(
-                            timestamp=datetime.now(timezone.utc),
-                            symbol=canonical_symbol,
-                            amount=Decimal(str(new_amount)),
-                            avg_buy_price=Decimal(str(avg_price)),
-                            current_price=Decimal(str(price)),
-                            unrealized_pnl=Decimal(str(unrealized_pnl)),
-                            entry_trade_id=trade_id,  # Link to trade that reduced position
-                            entry_signal_id=signal_id,  # Link to signal
-                            test_mode=False
-                        )
+            position = self.book.project(canonical_symbol, action, amount, price)
+            if position is None:
+                return
+
+            try:
+                with get_db() as db:
+                    self._write_holding_snapshot(db, canonical_symbol, position, trade_id, signal_id)
 
-                db.commit()
+                self.book.apply(canonical_symbol, position, trade_id=trade_id, signal_id=signal_id)
                 logging.info(f"[PaperTrader] Updated holdings in database: {action} {canonical_symbol}")
 
-        except Exception as e:
-            logging.error(f"[PaperTrader] Failed to update holdings in database: {e}")
+            except Exception as e:
+                logging.error(f"[PaperTrader] Failed to update holdings in database: {e}")
 
     def execute_trade(self, symbol, action, price, balance, reason, amount=0.01, signal_id=None):
         """
@@ -144,6 +129,10 @@ class PaperTrader:
         For SELL: You receive price - fee
         For HOLD: No trade executed
 
+        The trade row and its holdings snapshot are written in one
+        transaction; the in-memory position book and trade stats are only
+        updated once that transaction commits.
+
         Args:
             signal_id: The database ID of the signal that triggered this trade (for correlation)
         """
@@ -170,112 +159,100 @@ class PaperTrader:
                 "reason": reason
             }
 
-        # Validate SELL - check if position exists
-        if action.upper() == "SELL":
-            holdings = self.get_holdings()
-            if canonical_symbol not in holdings or holdings[canonical_symbol]["amount"] <= 0:
-                return {
-                    "success": False,
-                    "action": "SELL",
-                    "symbol": canonical_symbol,
-                    "message": "Cannot sell - no position exists",
-                    "reason": reason
-                }
-
-        # Calculate gross value
-        gross_value = amount * price
-        
-        # Apply 0.26% taker fee (always reduces net proceeds)
-        fee_rate = 0.0026
-        fee = gross_value * fee_rate
-        
-        # Net value calculation (fee always reduces what you get/pay)
-        # BUY: Total cost = gross_value + fee (you pay MORE)
-        # SELL: Total proceeds = gross_value - fee (you receive LESS)
-        if action.lower() == "buy":
-            net_value = gross_value + fee  # Cost includes fee
-        elif action.lower() == "sell":
-            net_value = gross_value - fee  # Proceeds minus fee
-        else:
-            # Should never reach here due to validation above
+        # Never write a trade pointing at a signal the write-behind queue didn't persist
+        if signal_id is not None and not signal_writer.confirm(signal_id):
+            logging.error(f"[PaperTrader] Signal {signal_id} was not persisted, skipping {action} {canonical_symbol}")
             return {
                 "success": False,
-                "action": action,
+                "action": action.upper(),
                 "symbol": canonical_symbol,
-                "message": f"Unexpected action: {action}"
+                "message": f"Signal {signal_id} was not persisted - trade skipped",
+                "reason": reason
             }
-        
-        # Write trade to database with signal_id
-        trade_id = None
-        try:
-            with get_db() as db:
-                repo = TradeRepository(db)
-                trade_model = repo.create(
-                    timestamp=datetime.now(timezone.utc),
-                    action=action.lower(),
-                    symbol=canonical_symbol,
-                    price=price,
-                    amount=amount,
-                    gross_value=gross_value,
-                    fee=fee,
-                    net_value=net_value,
-                    reason=reason,
-                    test_mode=False,
-                    signal_id=signal_id  # Link trade to triggering signal
-                )
-                db.flush()  # Ensure trade ID is available
-                trade_id = trade_model.id
-                db.commit()
+
+        with self.book.lock:
+            loaded = self._ensure_loaded()
+            position_before = self.book.get(canonical_symbol)
+
+            # Validate SELL - check if position exists
+            if action.upper() == "SELL":
+                if not position_before or position_before["amount"] <= 0:
+                    return {
+                        "success": False,
+                        "action": "SELL",
+                        "symbol": canonical_symbol,
+                        "message": "Cannot sell - no position exists",
+                        "reason": reason
+                    }
+
+            # Calculate gross value
+            gross_value = amount * price
+
+            # Apply 0.26% taker fee (always reduces net proceeds)
+            fee_rate = 0.0026
+            fee = gross_value * fee_rate
+
+            # Net value calculation (fee always reduces what you get/pay)
+            # BUY: Total cost = gross_value + fee (you pay MORE)
+            # SELL: Total proceeds = gross_value - fee (you receive LESS)
+            if action.lower() == "buy":
+                net_value = gross_value + fee  # Cost includes fee
+            else:
+                net_value = gross_value - fee  # Proceeds minus fee
+
+            position = self.book.project(canonical_symbol, action, amount, price)
+
+            # Write trade + holdings snapshot to database in one transaction
+            trade_id = None
+            try:
+                with get_db() as db:
+                    repo = TradeRepository(db)
+                    trade_model = repo.create(
+                        timestamp=datetime.now(timezone.utc),
+                        action=action.lower(),
+                        symbol=canonical_symbol,
+                        price=price,
+                        amount=amount,
+                        gross_value=gross_value,
+                        fee=fee,
+                        net_value=net_value,
+                        reason=reason,
+                        test_mode=False,
+                        signal_id=signal_id  # Link trade to triggering signal
+                    )
+                    trade_id = trade_model.id
+
+                    if position is not None:
+                        self._write_holding_snapshot(
+                            db, canonical_symbol, position,
+                            trade_id=trade_id, signal_id=signal_id
+                        )
+
                 logging.info(f"[PaperTrader] Saved trade to database: ID={trade_id}, {action} {canonical_symbol} | signal_id={signal_id}")
 
-                # Emit TRADE_EXECUTED event to event bus for SSE
-                try:
-                    import asyncio
-                    from app.events.event_bus import event_bus, EventType
-
-                    # Run emit in background if there's an event loop, otherwise skip
-                    try:
-                        loop = asyncio.get_event_loop()
-                        if loop.is_running():
-                            asyncio.ensure_future(event_bus.emit(EventType.TRADE_EXECUTED, {
-                                "trade_id": trade_id,
-                                "symbol": canonical_symbol,
-                                "action": action.lower(),
-                                "price": price,
-                                "amount": amount,
-                                "net_value": net_value,
-                                "signal_id": signal_id,
-                                "timestamp": datetime.now(timezone.utc).isoformat()
-                            }))
-                        else:
-                            # No running loop, run it synchronously
-                            loop.run_until_complete(event_bus.emit(EventType.TRADE_EXECUTED, {
-                                "trade_id": trade_id,
-                                "symbol": canonical_symbol,
-                                "action": action.lower(),
-                                "price": price,
-                                "amount": amount,
-                                "net_value": net_value,
-                                "signal_id": signal_id,
-                                "timestamp": datetime.now(timezone.utc).isoformat()
-                            }))
-                    except RuntimeError:
-                        # No event loop exists, create one
-                        asyncio.run(event_bus.emit(EventType.TRADE_EXECUTED, {
-                            "trade_id": trade_id,
-                            "symbol": canonical_symbol,
-                            "action": action.lower(),
-                            "price": price,
-                            "amount": amount,
-                            "net_value": net_value,
-                            "signal_id": signal_id,
-                            "timestamp": datetime.now(timezone.utc).isoformat()
-                        }))
-                except Exception as e:
-                    logging.error(f"[PaperTrader] Failed to emit TRADE_EXECUTED event: {e}")
+                # Committed - bring the in-memory state forward
+                if loaded:
+                    self.book.apply(canonical_symbol, position, trade_id=trade_id, signal_id=signal_id)
+                    self._record_trade_stats(canonical_symbol, action, price)
 
-        except Exception as e:
-            logging.error(f"[PaperTrader] Failed to save trade to database: {e}")
+            except Exception as e:
+                trade_id = None
+                logging.error(f"[PaperTrader] Failed to save trade to database: {e}")
+
+        if trade_id is not None:
+            # Fold the committed trade into the P&L ledger (no-op until first loaded)
+            if pnl_ledger.loaded:
+                pnl_ledger.sync()
+
+            self._emit_trade_executed({
+                "trade_id": trade_id,
+                "symbol": canonical_symbol,
+                "action": action.lower(),
+                "price": price,
+                "amount": amount,
+                "net_value": net_value,
+                "signal_id": signal_id,
+            })
 
         # Create trade dict for return and notifications
         trade = {
@@ -291,15 +268,13 @@ class PaperTrader:
             "value": round(net_value, 2),
         }
 
-        # Update holdings after trade executes - pass trade_id and signal_id for data integrity
-        self.update_holdings(canonical_symbol, action, amount, price, trade_id=trade_id, signal_id=signal_id)
-
         # Send Telegram notification
         try:
             self._send_trade_notification(
                 trade=trade,
                 balance_before=balance,
-                canonical_symbol=canonical_symbol
+                canonical_symbol=canonical_symbol,
+                avg_buy_price=position_before["avg_price"] if position_before else None
             )
         except Exception as e:
             logging.error(f"[PaperTrader] Failed to send Telegram notification: {e}")
@@ -307,7 +282,30 @@ class PaperTrader:
         # Return trade dict for backward compatibility
         return trade
 
-    def _send_trade_notification(self, trade: dict, balance_before: float, canonical_symbol: str):
+    def _emit_trade_executed(self, payload: dict):
+        """Emit TRADE_EXECUTED to the event bus for SSE."""
+        try:
+            import asyncio
+            from app.events.event_bus import event_bus, EventType
+
+            payload = {**payload, "timestamp": datetime.now(timezone.utc).isoformat()}
+
+            # Run emit in background if there's an event loop, otherwise skip
+            try:
+                loop = asyncio.get_event_loop()
+                if loop.is_running():
+                    asyncio.ensure_future(event_bus.emit(EventType.TRADE_EXECUTED, payload))
+                else:
+                    # No running loop, run it synchronously
+                    loop.run_until_complete(event_bus.emit(EventType.TRADE_EXECUTED, payload))
+            except RuntimeError:
+                # No event loop exists, create one
+                asyncio.run(event_bus.emit(EventType.TRADE_EXECUTED, payload))
+        except Exception as e:
+            logging.error(f"[PaperTrader] Failed to emit TRADE_EXECUTED event: {e}")
+
+    def _send_trade_notification(self, trade: dict, balance_before: float, canonical_symbol: str,
+                                 avg_buy_price: Optional[float] = None):
         """Send Telegram notification for executed trade."""
         notifier = get_telegram_notifier()
         if not notifier.enabled:
@@ -322,13 +320,14 @@ class PaperTrader:
         else:  # SELL
             balance_after = balance_before + net_value
 
-        # Calculate PnL for SELL trades
+        # Calculate PnL for SELL trades (against the entry price before the sell)
         pnl = None
         pnl_percentage = None
         if action == "SELL":
-            holdings = self.get_holdings()
-            if canonical_symbol in holdings:
-                avg_buy_price = holdings[canonical_symbol]["avg_price"]
+            if avg_buy_price is None:
+                position = self.book.get(canonical_symbol)
+                avg_buy_price = position["avg_price"] if position else None
+            if avg_buy_price:
                 sell_price = trade["price"]
                 pnl = (sell_price - avg_buy_price) * trade["amount"]
                 pnl_percentage = ((sell_price - avg_buy_price) / avg_buy_price) * 100
@@ -357,51 +356,17 @@ class PaperTrader:
         )
 
     def _get_trade_count(self) -> int:
-        """Get total number of trades executed from database."""
-        try:
-            with get_db() as db:
-                repo = TradeRepository(db)
-                trades = repo.get_all(test_mode=False)
-                return len([t for t in trades if t.action and t.action.lower() != "hold"])
-        except Exception as e:
-            logging.error(f"[PaperTrader] Failed to get trade count from database: {e}")
+        """Get total number of trades executed (running count)."""
+        if not self._ensure_loaded():
             return 0
+        return self.trade_stats["trade_count"]
 
     def _calculate_win_rate(self) -> Optional[float]:
-        """Calculate win rate from sell trades in database."""
-        try:
-            with get_db() as db:
-                repo = TradeRepository(db)
-                trades = repo.get_all(test_mode=False)
+        """Win rate of sells vs. the average buy price since the previous sell."""
+        if not self._ensure_loaded():
+            return None
 
-            # Track buy and sell prices for each symbol
-            positions = {}
-            wins = 0
-            total_sells = 0
+        if self.trade_stats["sells"] == 0:
+            return None
 
-            for trade in trades:
-                symbol = trade.symbol
-                action = (trade.action or "").upper()
-                price = float(trade.price) if trade.price else 0
-
-                if action == "BUY":
-                    if symbol not in positions:
-                        positions[symbol] = []
-                    positions[symbol].append(price)
-
-                elif action == "SELL" and symbol in positions and positions[symbol]:
-                    # Use average buy price
-                    avg_buy = sum(positions[symbol]) / len(positions[symbol])
-                    if price > avg_buy:
-                        wins += 1
-                    total_sells += 1
-                    positions[symbol] = []  # Clear position
-
-            if total_sells == 0:
-                return None
-
-            return (wins / total_sells) * 100
-
-        except Exception as e:
-            logging.error(f"[PaperTrader] Failed to calculate win rate from database: {e}")
-            return None 
\ No newline at end of file
+        return (self.trade_stats["wins"] / self.trade_stats["sells"]) * 100
@@ -0,0 +1,277 @@
+"""
+Incremental P&L ledger.
+Folds each committed trade into per-symbol realized and unrealized P&L so
+dashboard reads are O(symbols) instead of replaying the trade history.
+
+Persistence:
+- pnl_checkpoints: one row per symbol, stamped with the last trade id folded in
+
+sync() catches up on trades with an id above the checkpoint (normally none,
+or the one just committed), so trades written by any path are picked up.
+PaperTrader syncs after each trade it commits; dashboard reads only check
+the newest trade id over the read pool and take the writer when there is
+something to checkpoint.
+Long and short positions are tracked; unrealized P&L is marked at the
+symbol's last trade price.
+"""
+
+import logging
+from decimal import Decimal
+from threading import RLock
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.database.connection import get_db, get_read_db
+from app.database.repositories import PnLCheckpointRepository, TradeRepository
+
+# Checkpoint columns are Numeric(20, 8); keep in-memory values identical
+# to what a reload from the database would produce.
+PRECISION = 8
+
+
+def _q(value: float) -> float:
+    return round(float(value), PRECISION)
+
+
+def _d(value: Optional[float]) -> Optional[Decimal]:
+    return Decimal(str(value)) if value is not None else None
+
+
+def _flat() -> Dict[str, Any]:
+    return {
+        "side": None,
+        "amount": 0.0,
+        "avg_price": 0.0,
+        "last_price": None,
+        "realized_pnl": 0.0,
+        "last_trade_id": 0,
+    }
+
+
+def apply_fill(state: Dict[str, Any], action: str, price: float, amount: float) -> Dict[str, Any]:
+    """
+    Fold one trade into a symbol's ledger state (in place).
+
+    BUY opens/adds to a long or covers a short; SELL opens/adds to a short
+    or reduces a long. A fill larger than the opposite position only closes
+    it (no flip), matching the original dashboard replay.
+    """
+    action = (action or "").lower()
+    state["last_price"] = _q(price)
+    side = state["side"]
+
+    if action not in ("buy", "sell"):
+        return state
+
+    opening = "long" if action == "buy" else "short"
+    if side is None or side == opening:
+        total_amount = state["amount"] + amount
+        if total_amount:
+            state["avg_price"] = _q(
+                (state["avg_price"] * state["amount"] + price * amount) / total_amount
+            )
+        state["amount"] = _q(total_amount)
+        state["side"] = opening
+        return state
+
+    closed = min(amount, state["amount"])
+    if side == "long":
+        state["realized_pnl"] = _q(state["realized_pnl"] + (price - state["avg_price"]) * closed)
+    else:
+        state["realized_pnl"] = _q(state["realized_pnl"] + (state["avg_price"] - price) * closed)
+    state["amount"] = _q(state["amount"] - closed)
+    if state["amount"] <= 0:
+        state.update(side=None, amount=0.0, avg_price=0.0)
+    return state
+
+
+def unrealized_pnl(state: Dict[str, Any]) -> float:
+    """Open P&L marked at the last trade price."""
+    if state["side"] is None or state["last_price"] is None:
+        return 0.0
+    move = state["last_price"] - state["avg_price"]
+    return move * state["amount"] if state["side"] == "long" else -move * state["amount"]
+
+
+class PnLLedger:
+    """Per-symbol P&L state, kept current from the trades table by id."""
+
+    def __init__(self, test_mode: bool = False):
+        """
+        Args:
+            test_mode: Which partition of trades/checkpoints to follow
+        """
+        self.test_mode = test_mode
+        self.lock = RLock()
+        # symbol -> ledger state, in order of first trade
+        self.symbols: Dict[str, Dict[str, Any]] = {}
+        self.last_trade_id = 0
+        self.loaded = False
+        self.stats = {"syncs": 0, "trades_applied": 0, "rebuilds": 0, "read_checks": 0}
+
+    # ---------- Loading ----------
+    def load(self, rows: Iterable[Any]):
+        """
+        Replace the ledger from checkpoint rows.
+
+        Args:
+            rows: PnLCheckpoint models
+        """
+        symbols = {}
+        for row in rows:
+            symbols[row.symbol] = {
+                "side": row.side,
+                "amount": float(row.amount or 0),
+                "avg_price": float(row.avg_price or 0),
+                "last_price": float(row.last_price) if row.last_price is not None else None,
+                "realized_pnl": float(row.realized_pnl or 0),
+                "last_trade_id": row.last_trade_id or 0,
+            }
+
+        with self.lock:
+            self.symbols = symbols
+            self.last_trade_id = max((s["last_trade_id"] for s in symbols.values()), default=0)
+            self.loaded = True
+
+    def reset(self):
+        """Forget all state; the next sync reloads from the database."""
+        with self.lock:
+            self.symbols = {}
+            self.last_trade_id = 0
+            self.loaded = False
+
+    # ---------- Updates ----------
+    def sync(self) -> int:
+        """
+        Fold in trades committed since the last sync and checkpoint them.
+
+        Returns:
+            Number of trades applied
+        """
+        with self.lock:
+            try:
+                if not self._has_new_trades():
+                    return 0
+                with get_db() as db:
+                    rebuilt, touched, last_trade_id = self._catch_up(db)
+            except Exception as e:
+                logging.error(f"[PnLLedger] Sync failed: {e}")
+                return 0
+
+            # Committed - bring the in-memory state forward
+            if rebuilt:
+                self.symbols = {}
+                self.stats["rebuilds"] += 1
+            self.symbols.update(touched)
+            self.last_trade_id = last_trade_id
+            self.stats["syncs"] += 1
+
+            applied = sum(state.pop("_applied") for state in touched.values())
+            self.stats["trades_applied"] += applied
+            return applied
+
+    def _has_new_trades(self) -> bool:
+        """Compare the newest trade id with the ledger's on a read connection (caller holds lock)."""
+        with get_read_db() as db:
+            if not self.loaded:
+                self.load(PnLCheckpointRepository(db).get_all(test_mode=self.test_mode))
+            max_id = TradeRepository(db).get_max_id(test_mode=self.test_mode)
+        self.stats["read_checks"] += 1
+        # Lower than ours means trades were deleted; _catch_up rebuilds
+        return max_id != self.last_trade_id
+
+    def _catch_up(self, db) -> Tuple[bool, Dict[str, Dict[str, Any]], int]:
+        """Apply new trades to copies of the affected states and write checkpoints."""
+        trades = TradeRepository(db)
+        checkpoints = PnLCheckpointRepository(db)
+
+        if not self.loaded:
+            self.load(checkpoints.get_all(test_mode=self.test_mode))
+
+        last_trade_id = self.last_trade_id
+        current = self.symbols
+        rebuilt = False
+        if last_trade_id and trades.get_max_id(test_mode=self.test_mode) < last_trade_id:
+            # Trades were deleted underneath us (reset scripts) - replay from scratch
+            logging.warning("[PnLLedger] Trades table shrank below checkpoint, rebuilding")
+            checkpoints.delete_all(test_mode=self.test_mode)
+            last_trade_id, current, rebuilt = 0, {}, True
+
+        touched: Dict[str, Dict[str, Any]] = {}
+        for trade_id, symbol, action, price, amount in trades.get_fills_after(last_trade_id, test_mode=self.test_mode):
+            last_trade_id = trade_id
+            if not symbol or price is None or amount is None:
+                continue
+
+            state = touched.get(symbol)
+            if state is None:
+                if symbol not in current and (action or "").lower() not in ("buy", "sell"):
+                    continue
+                state = {**current.get(symbol, _flat()), "_applied": 0}
+                touched[symbol] = state
+
+            apply_fill(state, action, float(price), float(amount))
+            state["last_trade_id"] = trade_id
+            state["_applied"] += 1
+
+        for symbol, state in touched.items():
+            checkpoints.upsert(
+                symbol=symbol,
+                side=state["side"],
+                amount=_d(state["amount"]),
+                avg_price=_d(state["avg_price"]),
+                last_price=_d(state["last_price"]),
+                realized_pnl=_d(state["realized_pnl"]),
+                last_trade_id=state["last_trade_id"],
+                test_mode=self.test_mode
+            )
+
+        return rebuilt, touched, last_trade_id
+
+    # ---------- Reads ----------
+    def get_pnl_by_symbol(self) -> Dict[str, Dict[str, Any]]:
+        """Realized, unrealized and total P&L per symbol."""
+        with self.lock:
+            result = {}
+            for symbol, state in self.symbols.items():
+                unrealized = unrealized_pnl(state)
+                result[symbol] = {
+                    "side": state["side"],
+                    "amount": state["amount"],
+                    "avg_price": state["avg_price"],
+                    "last_price": state["last_price"],
+                    "realized_pnl": state["realized_pnl"],
+                    "unrealized_pnl": unrealized,
+                    "total_pnl": state["realized_pnl"] + unrealized,
+                }
+            return result
+
+    def get_pnl_data(self) -> Tuple[List[str], List[float]]:
+        """Chart series: (symbols, total P&L rounded to cents)."""
+        by_symbol = self.get_pnl_by_symbol()
+        labels = list(by_symbol)
+        return labels, [round(by_symbol[s]["total_pnl"], 2) for s in labels]
+
+    def get_totals(self) -> Dict[str, float]:
+        """Portfolio-level realized/unrealized P&L."""
+        by_symbol = self.get_pnl_by_symbol()
+        realized = sum(p["realized_pnl"] for p in by_symbol.values())
+        unrealized = sum(p["unrealized_pnl"] for p in by_symbol.values())
+        return {
+            "realized_pnl": realized,
+            "unrealized_pnl": unrealized,
+            "total_pnl": realized + unrealized,
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get ledger statistics."""
+        with self.lock:
+            return {
+                **self.stats,
+                "loaded": self.loaded,
+                "symbols": len(self.symbols),
+                "last_trade_id": self.last_trade_id,
+            }
+
+
+# Global singleton shared by the trader and the dashboard
+pnl_ledger = PnLLedger()
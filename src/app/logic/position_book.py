@@ -0,0 +1,262 @@
+"""
+In-memory position book.
+Tracks amount, average entry price and realized/unrealized P&L per symbol
+so trades and dashboard reads don't re-query the append-only holdings
+table.
+
+Persistence:
+- current_positions: one compacted row per symbol, updated in place
+- holdings: optional append-only snapshot history (keep_history)
+
+The book is rebuilt once at startup from current_positions, falling back
+to the latest holdings snapshots (and seeding current_positions from them)
+on databases that predate the compacted table.
+"""
+
+import logging
+from decimal import Decimal
+from threading import RLock
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional
+
+from app.database.connection import get_db
+from app.database.repositories import CurrentPositionRepository, HoldingRepository
+from app.utils.symbol_normalizer import normalize_symbol
+
+# Holdings columns are Numeric(20, 8); keep in-memory values identical
+# to what a reload from the database would produce.
+PRECISION = 8
+
+
+def _q(value: float) -> float:
+    return round(float(value), PRECISION)
+
+
+def _d(value: Optional[float]) -> Optional[Decimal]:
+    return Decimal(str(value)) if value is not None else None
+
+
+class PositionBook:
+    """Current positions keyed by canonical symbol."""
+
+    def __init__(self, keep_history: bool = True, test_mode: bool = False):
+        """
+        Args:
+            keep_history: Also append a holdings snapshot row on every change
+            test_mode: Which partition of the position tables to use
+        """
+        self.keep_history = keep_history
+        self.test_mode = test_mode
+        self.lock = RLock()
+        # symbol -> position dict; closed positions stay (amount 0) to keep realized P&L
+        self.positions: Dict[str, Dict[str, Any]] = {}
+        self.loaded = False
+
+    # ---------- Loading ----------
+    def rebuild(self) -> bool:
+        """Rebuild the book from the database. Call once at startup."""
+        try:
+            with get_db() as db:
+                self.load_from_session(db)
+            return True
+        except Exception as e:
+            logging.error(f"[PositionBook] Failed to rebuild from database: {e}")
+            return False
+
+    def load_from_session(self, db):
+        """Load from current_positions, or seed it from the latest holdings snapshots."""
+        rows = CurrentPositionRepository(db).get_all(test_mode=self.test_mode)
+        if rows:
+            self.load(rows)
+            source = "current_positions"
+        else:
+            self.load(HoldingRepository(db).get_current_holdings(test_mode=self.test_mode))
+            for symbol, position in self.positions.items():
+                self._write_current(db, symbol, position)
+            source = "holdings snapshots"
+
+        logging.info(f"[PositionBook] Loaded {len(self.snapshot())} open positions from {source}")
+
+    def load(self, rows: Iterable[Any]):
+        """
+        Replace the book from position rows.
+
+        Args:
+            rows: CurrentPosition or Holding models
+        """
+        positions = {}
+        for row in rows:
+            amount = float(row.amount)
+            realized = getattr(row, "realized_pnl", None)
+            if amount <= 0 and not realized:
+                continue
+            avg_price = float(row.avg_buy_price)
+            positions[row.symbol] = {
+                "amount": amount,
+                "avg_price": avg_price,
+                "current_price": float(row.current_price) if row.current_price else avg_price,
+                "unrealized_pnl": float(row.unrealized_pnl) if row.unrealized_pnl else 0.0,
+                "realized_pnl": float(realized) if realized else 0.0,
+                "entry_trade_id": getattr(row, "entry_trade_id", None),
+                "entry_signal_id": getattr(row, "entry_signal_id", None),
+            }
+
+        with self.lock:
+            self.positions = positions
+            self.loaded = True
+
+    def reset(self):
+        """Forget all positions; the next user reloads from the database."""
+        with self.lock:
+            self.positions = {}
+            self.loaded = False
+
+    # ---------- Reads ----------
+    def get(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of the open position for a symbol (None if flat)."""
+        with self.lock:
+            position = self.positions.get(symbol)
+            return dict(position) if position and position["amount"] > 0 else None
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Open positions in the PaperTrader.get_holdings() format."""
+        with self.lock:
+            return {
+                symbol: {
+                    "amount": p["amount"],
+                    "avg_price": p["avg_price"],
+                    "current_price": p["current_price"],
+                    "market_value": p["amount"] * p["current_price"],
+                    "cost_basis": p["amount"] * p["avg_price"],
+                    "unrealized_pnl": p["unrealized_pnl"],
+                    "realized_pnl": p["realized_pnl"],
+                    "entry_trade_id": p["entry_trade_id"],
+                    "entry_signal_id": p["entry_signal_id"],
+                }
+                for symbol, p in self.positions.items()
+                if p["amount"] > 0
+            }
+
+    def get_totals(self) -> Dict[str, float]:
+        """Portfolio-level totals across all symbols."""
+        with self.lock:
+            open_positions = [p for p in self.positions.values() if p["amount"] > 0]
+            return {
+                "open_positions": len(open_positions),
+                "market_value": sum(p["amount"] * p["current_price"] for p in open_positions),
+                "cost_basis": sum(p["amount"] * p["avg_price"] for p in open_positions),
+                "unrealized_pnl": sum(p["unrealized_pnl"] for p in open_positions),
+                "realized_pnl": sum(p["realized_pnl"] for p in self.positions.values()),
+            }
+
+    # ---------- Updates ----------
+    def project(self, symbol: str, action: str, amount: float, price: float) -> Optional[Dict[str, Any]]:
+        """
+        Position after a fill, without changing the book.
+
+        Returns:
+            New position dict, or None if the fill doesn't touch a position
+            (SELL with nothing held)
+        """
+        with self.lock:
+            existing = self.positions.get(symbol)
+            realized = existing["realized_pnl"] if existing else 0.0
+            current = self.get(symbol)
+        action = action.upper()
+
+        if action == "BUY":
+            if current:
+                new_amount = current["amount"] + amount
+                new_avg_price = (
+                    (current["amount"] * current["avg_price"]) + (amount * price)
+                ) / new_amount
+            else:
+                new_amount, new_avg_price = amount, price
+        elif action == "SELL" and current:
+            # Can't go negative; average entry price is unchanged by a sell
+            sold = min(amount, current["amount"])
+            new_amount = current["amount"] - sold
+            new_avg_price = current["avg_price"]
+            realized += (price - new_avg_price) * sold
+        else:
+            return None
+
+        return {
+            "amount": _q(new_amount),
+            "avg_price": _q(new_avg_price),
+            "current_price": _q(price),
+            "unrealized_pnl": _q((new_amount * price) - (new_amount * new_avg_price)),
+            "realized_pnl": _q(realized),
+        }
+
+    def apply(self, symbol: str, position: Optional[Dict[str, Any]],
+              trade_id: Optional[int] = None, signal_id: Optional[int] = None):
+        """Store a projected position (closed positions keep their realized P&L)."""
+        if position is None:
+            return
+        with self.lock:
+            self.positions[symbol] = {
+                **position,
+                "entry_trade_id": trade_id,
+                "entry_signal_id": signal_id,
+            }
+
+    def persist(self, db, symbol: str, position: Dict[str, Any],
+                trade_id: Optional[int] = None, signal_id: Optional[int] = None):
+        """Write a projected position in the caller's transaction."""
+        self._write_current(db, symbol, {**position, "entry_trade_id": trade_id, "entry_signal_id": signal_id})
+
+        if self.keep_history:
+            # If position closed, amount will be 0 (filtered by get_current_holdings)
+            HoldingRepository(db).create(
+                timestamp=datetime.now(timezone.utc),
+                symbol=symbol,
+                amount=_d(position["amount"]),
+                avg_buy_price=_d(position["avg_price"]),
+                current_price=_d(position["current_price"]),
+                unrealized_pnl=_d(position["unrealized_pnl"]),
+                entry_trade_id=trade_id,  # Link to trade that created/modified the position
+                entry_signal_id=signal_id,  # Link to signal
+                test_mode=self.test_mode
+            )
+
+    def _write_current(self, db, symbol: str, position: Dict[str, Any]):
+        CurrentPositionRepository(db).upsert(
+            symbol=symbol,
+            amount=_d(position["amount"]),
+            avg_buy_price=_d(position["avg_price"]),
+            current_price=_d(position["current_price"]),
+            unrealized_pnl=_d(position["unrealized_pnl"]),
+            realized_pnl=_d(position.get("realized_pnl", 0.0)),
+            entry_trade_id=position.get("entry_trade_id"),
+            entry_signal_id=position.get("entry_signal_id"),
+            test_mode=self.test_mode
+        )
+
+    def on_market_update(self, updates: Dict[str, Dict[str, float]]):
+        """
+        DataCollector listener: mark open positions to market (memory only).
+
+        Args:
+            updates: symbol -> {"price": float, "volume": float}
+        """
+        with self.lock:
+            for raw_symbol, data in updates.items():
+                try:
+                    symbol = normalize_symbol(raw_symbol)
+                except ValueError:
+                    continue
+
+                position = self.positions.get(symbol)
+                price = data.get("price", 0)
+                if not position or position["amount"] <= 0 or price <= 0:
+                    continue
+
+                position["current_price"] = _q(price)
+                position["unrealized_pnl"] = _q(
+                    (position["amount"] * price) - (position["amount"] * position["avg_price"])
+                )
+
+
+# Global singleton shared by the trader and the dashboard
+position_book = PositionBook()
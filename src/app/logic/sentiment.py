@@ -2,8 +2,8 @@ import logging
 import os
 import json
 import re
-import openai
 from dotenv import load_dotenv
+from app.metrics.tracing import external_call
 
 load_dotenv()
 
@@ -16,8 +16,10 @@ class SentimentSignal:
     
     @property
     def client(self):
-        """Lazy load OpenAI client."""
+        """Lazy load OpenAI client (and the openai SDK, which is slow to import)."""
         if self._client is None:
+            import openai
+
             api_key = os.getenv("OPENAI_API_KEY")
             if api_key:
                 self._client = openai.OpenAI(api_key=api_key)
@@ -26,6 +28,11 @@ class SentimentSignal:
                 self._client = openai.OpenAI(api_key="dummy-key-for-testing")
         return self._client
 
+    def _complete(self, **kwargs):
+        """Chat completion request, recording latency and errors for /metrics."""
+        with external_call("openai", "chat.completions"):
+            return self.client.chat.completions.create(**kwargs)
+
     def _extract_json(self, content: str) -> dict:
         """
         Extract JSON from GPT response, handling markdown code blocks.
@@ -100,7 +107,7 @@ class SentimentSignal:
                 f'{{\"signal\": \"BUY\", \"reason\": \"High interest and positive news.\"}}'
             )
 
-            response = self.client.chat.completions.create(
+            response = self._complete(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.2,
@@ -153,7 +160,7 @@ class SentimentSignal:
 
             logging.info(f"[SentimentSignal] Sending {len(headlines)} headlines for {symbol} to GPT")
 
-            response = self.client.chat.completions.create(
+            response = self._complete(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.2,
@@ -250,7 +257,7 @@ class SentimentSignal:
                 f'{{\"signal\": \"BUY\", \"reason\": \"High interest and positive news.\"}}'
             )
 
-            response = self.client.chat.completions.create(
+            response = self._complete(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.2,
@@ -303,7 +310,7 @@ class SentimentSignal:
 
             logging.info(f"[SentimentSignal] Sending {len(headlines)} headlines for {symbol} to GPT")
 
-            response = self.client.chat.completions.create(
+            response = self._complete(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.2,
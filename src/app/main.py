@@ -1,6 +1,8 @@
 import logging
 import json
 import os
+import threading
+import time
 from pathlib import Path
 from fastapi import FastAPI
 from apscheduler.schedulers.background import BackgroundScheduler
@@ -8,6 +10,15 @@ from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime
 from app.data_collector import data_collector
 from app.risk_manager import risk_manager
+from app.event_evaluator import event_evaluator
+from app.strategy_signal_logger import signal_writer, backfill_strategy_votes
+from app.logic.position_book import position_book
+from app.logic.pnl_ledger import pnl_ledger
+from app.strategy_rollups import ensure_rollups
+from app.signal_retention import signal_retention
+from app.metrics.loop_monitor import loop_monitor
+from app.metrics.prometheus import CYCLE_SECONDS, CYCLES_TOTAL
+from app.metrics.tracing import stage, tracer
 
 # --- Configure logging early so our INFO lines always show
 logging.basicConfig(
@@ -19,25 +30,23 @@ logging.basicConfig(
 from app.dashboard import router as dashboard_router
 
 # --- Trading logic ---
-from app.logic.sentiment import SentimentSignal
-from app.logic.paper_trader import PaperTrader
-from app.logic.notifier import Notifier
 from app.logic.symbol_scanner import get_top_symbols
-from app.news_fetcher import get_unseen_headlines, mark_as_seen
-from app.client.kraken import KrakenClient
+from app.news_fetcher import get_unseen_headlines_shared, mark_as_seen
 from app.config import get_current_config
 
-# --- Core bot components ---
-client = KrakenClient()
-kraken = KrakenClient()
-signal_model = SentimentSignal()
-trader = PaperTrader()
-notifier = Notifier()
+# --- Core bot components (Kraken client, trader, notifier) are built on first use ---
+from app.bootstrap import components
+
+# Serializes trade execution between the periodic cycle and event evaluations
+trade_lock = threading.Lock()
+
+# Worker threads for blocking route work (DB queries, exchange HTTP calls);
+# sync routes and run_in_threadpool share this bound
+BLOCKING_THREADS = 16
 
 # --- State tracking ---
 PROJECT_ROOT = Path(__file__).resolve().parent  # /src
 LOGS_DIR = PROJECT_ROOT / "logs"
-LOGS_DIR.mkdir(parents=True, exist_ok=True)
 # REMOVED: STATUS_FILE - status now tracked in database
 
 # --- FastAPI app ---
@@ -68,20 +77,9 @@ def normalize_symbol(sym: str) -> str:
     return sym
 
 
-def run_trade_cycle():
-    """Run one trade evaluation cycle with multi-strategy analysis."""
-    start_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logging.info(f"[TradeCycle] === Starting cycle at {start_time} ===")
-
-    # CHECK RISK MANAGER FIRST - ADDED
-    if not risk_manager.can_trade():
-        msg = "Risk manager blocked trading (daily loss limit reached)"
-        logging.error(f"[TradeCycle] {msg}")
-        return
-
-    # Initialize strategy manager with correct logs directory
+def _build_strategy_manager():
+    """Build a StrategyManager from the database config (defaults on failure)."""
     from app.strategies.strategy_manager import StrategyManager
-    from pathlib import Path
     from app.database.connection import get_db
     from app.database.repositories import BotConfigRepository
 
@@ -103,57 +101,37 @@ def run_trade_cycle():
             "logs_dir": str(LOGS_DIR),
         }
 
-    strategy_manager = StrategyManager(config=strategy_config)
-
-    # Fetch scanner symbols and unseen headlines
-    symbols = get_top_symbols(limit=10)
-    headlines_by_symbol = get_unseen_headlines()
-
-    logging.info(f"[Scanner] Top {len(symbols)} symbols: {symbols}")
-    logging.info(
-        f"[News] Retrieved {len(headlines_by_symbol)} symbol groups with unseen headlines"
-    )
-
-    # Combine symbols from scanner and news
-    all_symbols = set(symbols)
-    all_symbols.update(headlines_by_symbol.keys())
+    return StrategyManager(config=strategy_config)
 
-    # Normalize symbols to prevent duplicates (BTC/USD vs BTCUSD)
-    # Keep the slash format as canonical
-    normalized_symbols = set()
-    symbol_map = {}  # Map normalized -> original for news lookup
 
-    for symbol in all_symbols:
-        # Normalize by removing slash
-        normalized = symbol.replace("/", "")
+def process_symbol(symbol, strategy_manager, headlines_by_symbol):
+    """Evaluate one symbol and execute the resulting trade.
 
-        # Keep the first version we see (prefer slashed version)
-        if normalized not in symbol_map or "/" in symbol:
-            symbol_map[normalized] = symbol
-            normalized_symbols.add(symbol if "/" in symbol else symbol)
-
-    all_symbols = normalized_symbols
-    if not all_symbols:
-        # Fallback to default tracked symbols
-        all_symbols = {"BTCUSD", "ETHUSD", "SOLUSD", "XRPUSD", "DOGEUSD"}
-        logging.info("[TradeCycle] No scanner/news symbols, using fallback list")
-
-    # Process each symbol
-    for symbol in all_symbols:
+    Shared by the periodic cycle and the event-driven evaluator. Serialized
+    with trade_lock so both paths never trade the same book concurrently.
+    """
+    with tracer.span("symbol", symbol=symbol), trade_lock:
         logging.info(f"[{symbol}] Checking...")
 
         try:
+            client, trader, notifier = components.kraken, components.trader, components.notifier
+
             # Get current price
-            price = client.get_price(symbol)
+            with stage("price"):
+                price = client.get_price(symbol)
             logging.info(f"[{symbol}] Current price: {price}")
 
             # ADDED - Skip if invalid price
             if price <= 0:
                 logging.warning(f"[{symbol}] Invalid price, skipping")
-                continue
+                return
+
+            # Reset event trigger reference so the same move isn't evaluated twice
+            event_evaluator.mark_evaluated(symbol, price)
 
             # Get current balance (ZUSD asset for paper trading)
-            balance = client.get_balance(asset="ZUSD")
+            with stage("balance"):
+                balance = client.get_balance(asset="ZUSD")
             logging.info(f"[{symbol}] Current USD balance: {balance}")
 
             # ADDED - Calculate position size from risk manager
@@ -183,20 +161,22 @@ def run_trade_cycle():
             logging.info(f"[{symbol}] Signal: {signal} | Reason: {reason} | Signal ID: {signal_id}")
 
             # Execute trade based on signal - UPDATED WITH RISK-MANAGED AMOUNT AND SIGNAL_ID
-            result = trader.execute_trade(
-                symbol=symbol,
-                action=signal,
-                price=price,
-                balance=balance,
-                reason=reason,
-                amount=amount,  # CHANGED - use risk-managed amount instead of default
-                signal_id=signal_id,  # Link trade to the signal that triggered it
-            )
+            with stage("trade"):
+                result = trader.execute_trade(
+                    symbol=symbol,
+                    action=signal,
+                    price=price,
+                    balance=balance,
+                    reason=reason,
+                    amount=amount,  # CHANGED - use risk-managed amount instead of default
+                    signal_id=signal_id,  # Link trade to the signal that triggered it
+                )
 
             logging.info(f"[{symbol}] Trade result: {result}")
 
             # Send notification
-            notifier.send(result)
+            with stage("notify"):
+                notifier.send(result)
 
             logging.info(f"[{symbol}] Notified result.")
 
@@ -209,7 +189,106 @@ def run_trade_cycle():
 
         except Exception as e:
             logging.error(f"[{symbol}] Error processing: {e}")
-            continue
+
+
+def run_event_evaluation(symbol, reasons, headlines):
+    """Out-of-cycle evaluation of a single symbol, fired by event_evaluator."""
+    logging.info(f"[EventEval] Evaluating {symbol}: {'; '.join(reasons)}")
+
+    if not risk_manager.can_trade():
+        logging.error("[EventEval] Risk manager blocked trading (daily loss limit reached)")
+        return
+
+    with tracer.span("event_evaluation", root=True, symbol=symbol, reasons="; ".join(reasons)):
+        strategy_manager = _build_strategy_manager()
+        process_symbol(symbol, strategy_manager, {symbol: headlines} if headlines else {})
+
+
+def _headline_max_age() -> float:
+    """How long a headline fetch can be reused (one watcher poll interval)."""
+    config = event_evaluator.config
+    if config["enabled"] and config["trigger_on_headlines"]:
+        return config["headline_poll_minutes"] * 60
+    return 0
+
+
+def run_headline_watch():
+    """Poll feeds for unseen headlines and hand them to the event evaluator."""
+    try:
+        # A cycle that fetched within the last minute already covered this poll
+        event_evaluator.on_headlines(get_unseen_headlines_shared(max_age_seconds=60))
+    except Exception as e:
+        logging.error(f"[EventEval] Headline watch failed: {e}")
+
+
+def run_trade_cycle():
+    """Run one trade evaluation cycle, traced and recorded (duration, outcome) for /metrics."""
+    started = time.perf_counter()
+    outcome = "failed"
+    with tracer.span("trade_cycle", root=True) as cycle_span:
+        try:
+            outcome = _run_trade_cycle()
+        finally:
+            cycle_span.set_attribute("outcome", outcome)
+            CYCLES_TOTAL.inc(outcome=outcome)
+            if outcome != "blocked":
+                CYCLE_SECONDS.observe(time.perf_counter() - started)
+
+
+def _run_trade_cycle() -> str:
+    """Run one trade evaluation cycle with multi-strategy analysis."""
+    start_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    logging.info(f"[TradeCycle] === Starting cycle at {start_time} ===")
+
+    # CHECK RISK MANAGER FIRST - ADDED
+    if not risk_manager.can_trade():
+        msg = "Risk manager blocked trading (daily loss limit reached)"
+        logging.error(f"[TradeCycle] {msg}")
+        return "blocked"
+
+    strategy_manager = _build_strategy_manager()
+
+    # Fetch scanner symbols and unseen headlines
+    with stage("scanner"):
+        symbols = get_top_symbols(limit=10)
+    with stage("news"):
+        headlines_by_symbol = get_unseen_headlines_shared(max_age_seconds=_headline_max_age())
+
+    logging.info(f"[Scanner] Top {len(symbols)} symbols: {symbols}")
+    logging.info(
+        f"[News] Retrieved {len(headlines_by_symbol)} symbol groups with unseen headlines"
+    )
+
+    # Combine symbols from scanner and news
+    all_symbols = set(symbols)
+    all_symbols.update(headlines_by_symbol.keys())
+
+    # Normalize symbols to prevent duplicates (BTC/USD vs BTCUSD)
+    # Keep the slash format as canonical
+    normalized_symbols = set()
+    symbol_map = {}  # Map normalized -> original for news lookup
+
+    for symbol in all_symbols:
+        # Normalize by removing slash
+        normalized = symbol.replace("/", "")
+
+        # Keep the first version we see (prefer slashed version)
+        if normalized not in symbol_map or "/" in symbol:
+            symbol_map[normalized] = symbol
+            normalized_symbols.add(symbol if "/" in symbol else symbol)
+
+    all_symbols = normalized_symbols
+    if not all_symbols:
+        # Fallback to default tracked symbols
+        all_symbols = {"BTCUSD", "ETHUSD", "SOLUSD", "XRPUSD", "DOGEUSD"}
+        logging.info("[TradeCycle] No scanner/news symbols, using fallback list")
+
+    # Symbols evaluated by the cycle become eligible for event triggers
+    event_evaluator.watch(all_symbols)
+
+    # Process each symbol
+    for symbol in all_symbols:
+        process_symbol(symbol, strategy_manager, headlines_by_symbol)
 
     # Trade cycle complete
     end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -230,6 +309,8 @@ def run_trade_cycle():
     except Exception as e:
         logging.error(f"[TradeCycle] Failed to emit BOT_STATUS_CHANGED event: {e}")
 
+    return "completed"
+
 
 def get_next_run_time():
     """Calculate next scheduled run time."""
@@ -253,10 +334,19 @@ def handle_shutdown(signum, frame):
     
     # Stop data collector
     try:
+        data_collector.remove_listener(event_evaluator.on_market_update)
+        data_collector.remove_listener(position_book.on_market_update)
         data_collector.stop()
+        event_evaluator.stop()
         logging.info("[Shutdown] Data collector stopped")
     except Exception as e:
         logging.error(f"[Shutdown] Error stopping data collector: {e}")
+
+    # Flush queued signals
+    try:
+        signal_writer.stop()
+    except Exception as e:
+        logging.error(f"[Shutdown] Error flushing signal writer: {e}")
     
     # Stop scheduler
     try:
@@ -287,15 +377,68 @@ def start_scheduler():
         )
         return
 
+    # Create the database (first use would do it too; fail early here instead)
+    from app.database.connection import ensure_db
+
+    ensure_db()
+
+    # Build new indexes in the background; writes queue behind each build briefly
+    from app.database.migrations import migration_runner
+
+    migration_runner.start()
+
+    # Write-behind signal persistence (flushed on shutdown)
+    signal_writer.start()
+
+    # Rebuild in-memory positions once; trades keep them current from here
+    position_book.rebuild()
+
+    # Catch the P&L ledger up from its checkpoints (replays only newer trades)
+    pnl_ledger.sync()
+
+    # Backfill strategy votes and rollups for signals logged before they existed
+    backfill_strategy_votes()
+    ensure_rollups()
+
     # ADDED - Start data collector FIRST
     data_collector.start()
+    data_collector.add_listener(position_book.on_market_update)
     logging.info("[Startup] Data collector started")
 
+    # Event-driven evaluation between cycles (the periodic cycle stays as safety net)
+    if event_evaluator.config["enabled"]:
+        from app.logic.symbol_scanner import DEFAULT_PRIORITY_SYMBOLS
+
+        event_evaluator.evaluate_fn = run_event_evaluation
+        event_evaluator.watch(DEFAULT_PRIORITY_SYMBOLS)
+        data_collector.add_listener(event_evaluator.on_market_update)
+        logging.info("[Startup] Event-driven evaluator attached to data collector")
+
     if not scheduler.running:
         trigger = IntervalTrigger(minutes=5)
         job = scheduler.add_job(
             run_trade_cycle, trigger, id="trade_cycle", replace_existing=True
         )
+        headline_poll = event_evaluator.config["headline_poll_minutes"]
+        if (
+            event_evaluator.config["enabled"]
+            and event_evaluator.config["trigger_on_headlines"]
+            and headline_poll > 0
+        ):
+            scheduler.add_job(
+                run_headline_watch,
+                IntervalTrigger(minutes=headline_poll),
+                id="headline_watch",
+                replace_existing=True,
+            )
+        retention_hours = signal_retention.config["interval_hours"]
+        if signal_retention.config["enabled"] and retention_hours > 0:
+            scheduler.add_job(
+                signal_retention.run,
+                IntervalTrigger(hours=retention_hours),
+                id="signal_retention",
+                replace_existing=True,
+            )
         scheduler.start()
         logging.info(
             "[Startup] Scheduler started. Trade cycle scheduled every 5 minutes."
@@ -306,16 +449,34 @@ def start_scheduler():
     logging.info("[Startup] Application startup complete. Ready to accept requests.")
 
 
+@app.on_event("startup")
+async def start_loop_monitor():
+    from anyio import to_thread
+
+    to_thread.current_default_thread_limiter().total_tokens = BLOCKING_THREADS
+    loop_monitor.start()
+
+
+@app.on_event("shutdown")
+async def stop_loop_monitor():
+    await loop_monitor.stop()
+
+
 @app.on_event("shutdown")
 def shutdown_scheduler():
     # ADDED - Stop data collector
+    data_collector.remove_listener(event_evaluator.on_market_update)
+    data_collector.remove_listener(position_book.on_market_update)
     data_collector.stop()
+    event_evaluator.stop()
     logging.info("[Shutdown] Data collector stopped")
 
     if scheduler.running:
         scheduler.shutdown()
         logging.info("[Shutdown] Scheduler shutdown complete.")
 
+    signal_writer.stop()
+
 
 # --- Manual trigger endpoint ---
 @app.get("/run-now")
@@ -0,0 +1,82 @@
+"""
+Event-loop lag monitor.
+
+A background task sleeps for a fixed interval and records how late it wakes
+up. Sustained lag means something is running blocking code on the loop,
+which stalls every request and SSE stream with it.
+"""
+
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Dict, Optional
+
+
+class EventLoopLagMonitor:
+    """Samples scheduling delay of the running asyncio loop."""
+
+    def __init__(self, interval: float = 0.5, window: int = 240, warn_ms: float = 250.0):
+        """
+        Args:
+            interval: Seconds between samples
+            window: Samples kept for avg/p95 (default: last 2 minutes)
+            warn_ms: Lag above this is logged and counted as a stall
+        """
+        self.interval = interval
+        self.warn_ms = warn_ms
+        self.samples = deque(maxlen=window)
+        self.max_ms = 0.0
+        self.stalls = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start sampling; must be called from the running loop."""
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logging.info(f"[LoopMonitor] Sampling event-loop lag every {self.interval}s")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.record((time.perf_counter() - started - self.interval) * 1000)
+
+    def record(self, lag_ms: float):
+        """Record one lag sample in milliseconds."""
+        lag_ms = max(lag_ms, 0.0)
+        self.samples.append(lag_ms)
+        self.max_ms = max(self.max_ms, lag_ms)
+        if lag_ms >= self.warn_ms:
+            self.stalls += 1
+            logging.warning(f"[LoopMonitor] Event loop blocked for {lag_ms:.0f}ms")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Lag statistics over the sample window."""
+        samples = sorted(self.samples)
+        count = len(samples)
+        return {
+            "running": bool(self._task and not self._task.done()),
+            "interval_s": self.interval,
+            "samples": count,
+            "current_ms": round(self.samples[-1], 2) if count else 0.0,
+            "avg_ms": round(sum(samples) / count, 2) if count else 0.0,
+            "p95_ms": round(samples[min(int(count * 0.95), count - 1)], 2) if count else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "stalls": self.stalls,
+            "warn_ms": self.warn_ms,
+        }
+
+
+# Global singleton
+loop_monitor = EventLoopLagMonitor()
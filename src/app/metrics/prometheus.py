@@ -0,0 +1,435 @@
+"""
+Prometheus-style metrics.
+
+A small in-process registry of counters, gauges and histograms rendered in
+the Prometheus text exposition format at /metrics. Instruments for the
+trading loop are declared at the bottom of this module so every metric name
+is listed in one place; the code they measure imports and updates them.
+
+Gauges that describe state owned elsewhere (collector staleness, event-bus
+queue depth) are set_function() gauges: they are read when /metrics is
+scraped and cost nothing in between.
+
+METRICS_ENABLED=0 (or metrics.update_config({"enabled": False})) turns every
+update into a single attribute check, and timers into a shared no-op
+context manager.
+
+Usage:
+    from app.metrics.prometheus import STAGE_SECONDS, track_call
+
+    with STAGE_SECONDS.time(stage="price"):
+        price = client.get_price(symbol)
+
+    with track_call("kraken", "Ticker") as call:
+        result = api.query_public("Ticker", params)
+        if result.get("error"):
+            call.failed()
+"""
+
+import logging
+import math
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_METRICS_CONFIG = {
+    "enabled": os.getenv("METRICS_ENABLED", "1") != "0",
+}
+
+# Histogram bucket upper bounds in seconds (+Inf is implicit)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+CYCLE_BUCKETS = (0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelKey = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels_text(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _NullTimer:
+    """Stand-in for timers while metrics are disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def failed(self):
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+class Metric:
+    """Base class: a named family of samples keyed by label values."""
+
+    type_name = "untyped"
+
+    def __init__(self, registry: "MetricsRegistry", name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[LabelKey, Any] = {}
+
+    def _key(self, labels: Dict[str, Any]) -> LabelKey:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> List[Tuple[str, LabelKey, str, float]]:
+        """(suffix, label values, extra label, value) rows for rendering."""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for suffix, key, extra, value in self.samples():
+            lines.append(f"{self.name}{suffix}{_labels_text(self.labelnames, key, extra)} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    """Monotonically increasing count."""
+
+    type_name = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        if not self.registry.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self):
+        with self._lock:
+            return [("", key, "", value) for key, value in sorted(self._values.items())]
+
+
+class Gauge(Metric):
+    """Current value; either set directly or read from a function at scrape time."""
+
+    type_name = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._function: Optional[Callable[[], Any]] = None
+
+    def set(self, value: float, **labels):
+        if not self.registry.enabled:
+            return
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels):
+        if not self.registry.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], Any]):
+        """
+        Read the value from `function` at scrape time.
+
+        The function returns a number (None to omit the sample) or, for a
+        labelled gauge, {label value(s): number}.
+        """
+        self._function = function
+
+    def value(self, **labels) -> Optional[float]:
+        for _, key, _, value in self.samples():
+            if key == self._key(labels):
+                return value
+        return None
+
+    def samples(self):
+        if self._function is None:
+            with self._lock:
+                return [("", key, "", value) for key, value in sorted(self._values.items())]
+
+        try:
+            result = self._function()
+        except Exception as e:
+            logger.error(f"[Metrics] Gauge {self.name} callback failed: {e}")
+            return []
+        if result is None:
+            return []
+        if not isinstance(result, dict):
+            return [("", (), "", float(result))]
+        rows = []
+        for key, value in result.items():
+            if value is None:
+                continue
+            key = key if isinstance(key, tuple) else (key,)
+            rows.append(("", tuple(str(k) for k in key), "", float(value)))
+        return sorted(rows)
+
+
+class _HistogramTimer:
+    __slots__ = ("histogram", "labels", "started")
+
+    def __init__(self, histogram: "Histogram", labels: Dict[str, Any]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.histogram.observe(time.perf_counter() - self.started, **self.labels)
+        return False
+
+    def failed(self):
+        pass
+
+
+class Histogram(Metric):
+    """Distribution of observed values in fixed buckets (seconds by default)."""
+
+    type_name = "histogram"
+
+    def __init__(self, *args, buckets: Iterable[float] = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        if not self.registry.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                # [bucket counts..., +Inf count, sum]
+                series = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            else:
+                series[len(self.buckets)] += 1
+            series[-1] += value
+
+    def time(self, **labels):
+        """Context manager observing the block's duration."""
+        if not self.registry.enabled:
+            return NULL_TIMER
+        return _HistogramTimer(self, labels)
+
+    def count(self, **labels) -> int:
+        series = self._values.get(self._key(labels))
+        return sum(series[:-1]) if series else 0
+
+    def sum(self, **labels) -> float:
+        series = self._values.get(self._key(labels))
+        return series[-1] if series else 0.0
+
+    def samples(self):
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._values.items())
+        rows = []
+        for key, series in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets, series):
+                cumulative += n
+                rows.append(("_bucket", key, f'le="{_format_value(bound)}"', cumulative))
+            cumulative += series[len(self.buckets)]
+            rows.append(("_bucket", key, 'le="+Inf"', cumulative))
+            rows.append(("_sum", key, "", series[-1]))
+            rows.append(("_count", key, "", cumulative))
+        return rows
+
+
+class MetricsRegistry:
+    """Holds metric families and renders them for /metrics."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            config: Overrides for DEFAULT_METRICS_CONFIG
+        """
+        self.config = {**DEFAULT_METRICS_CONFIG, **(config or {})}
+        # Plain attribute: checked on every update, so it must be cheap
+        self.enabled = bool(self.config["enabled"])
+        self.metrics: Dict[str, Metric] = {}
+        self.lock = threading.Lock()
+        self.scrapes = 0
+
+    def _register(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs) -> Metric:
+        with self.lock:
+            existing = self.metrics.get(name)
+            if existing is not None:
+                if not isinstance(existing, cls) or existing.labelnames != tuple(labelnames):
+                    raise ValueError(f"Metric {name} already registered with a different type or labels")
+                return existing
+            metric = self.metrics[name] = cls(self, name, documentation, labelnames, **kwargs)
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def update_config(self, new_config: Dict[str, Any]):
+        """Update metrics settings at runtime."""
+        self.config.update(new_config)
+        self.enabled = bool(self.config["enabled"])
+        logger.info(f"[Metrics] Config updated: {new_config}")
+
+    def reset(self):
+        """Clear every recorded value (registered metrics stay)."""
+        for metric in list(self.metrics.values()):
+            metric.reset()
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        self.scrapes += 1
+        if not self.enabled:
+            return "# metrics disabled (METRICS_ENABLED=0)\n"
+        lines = []
+        for name in sorted(self.metrics):
+            lines.extend(self.metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"enabled": self.enabled, "metrics": len(self.metrics), "scrapes": self.scrapes}
+
+
+# Global singleton
+metrics = MetricsRegistry()
+
+
+# --- Trading-loop instruments ---
+
+CYCLE_SECONDS = metrics.histogram(
+    "tradingbot_cycle_duration_seconds", "Wall time of one trade cycle.", buckets=CYCLE_BUCKETS,
+)
+CYCLES_TOTAL = metrics.counter(
+    "tradingbot_cycles_total", "Trade cycles by outcome (completed, blocked, failed).", ["outcome"],
+)
+STAGE_SECONDS = metrics.histogram(
+    "tradingbot_cycle_stage_seconds",
+    "Time per trading-loop stage (scanner, news, price, balance, strategies, logging, trade, notify).",
+    ["stage"],
+)
+STRATEGY_SECONDS = metrics.histogram(
+    "tradingbot_strategy_signal_seconds", "Latency of each strategy's get_signal call.", ["strategy"],
+)
+STRATEGY_ERRORS = metrics.counter(
+    "tradingbot_strategy_errors_total", "Strategy get_signal calls that raised.", ["strategy"],
+)
+EXTERNAL_CALL_SECONDS = metrics.histogram(
+    "tradingbot_external_call_seconds",
+    "Latency of calls to external services (kraken, openai, rss); _count is the call count.",
+    ["service", "operation"],
+)
+EXTERNAL_CALL_ERRORS = metrics.counter(
+    "tradingbot_external_call_errors_total",
+    "External calls that raised or returned an error.", ["service", "operation"],
+)
+DB_WRITE_SECONDS = metrics.histogram(
+    "tradingbot_db_write_seconds", "Time a get_db() session held the writer connection (through commit).",
+)
+DB_WRITE_WAIT_SECONDS = metrics.histogram(
+    "tradingbot_db_write_wait_seconds", "Time spent waiting for the writer connection.",
+)
+DB_COMMIT_SECONDS = metrics.histogram(
+    "tradingbot_db_commit_seconds", "Latency of writer commits.",
+)
+DATA_COLLECTOR_STALENESS = metrics.gauge(
+    "tradingbot_data_collector_staleness_seconds", "Seconds since the data collector's last snapshot.",
+)
+DATA_COLLECTOR_SYMBOLS = metrics.gauge(
+    "tradingbot_data_collector_symbols", "Symbols with in-memory price history.",
+)
+EVENT_BUS_QUEUE_DEPTH = metrics.gauge(
+    "tradingbot_event_bus_queue_depth", "Events waiting in event bus subscriber queues.",
+)
+EVENT_BUS_SUBSCRIBER_LAG = metrics.gauge(
+    "tradingbot_event_bus_subscriber_lag_seconds", "Age of the oldest undelivered event in any subscriber queue.",
+)
+EVENT_BUS_DELIVERY_SECONDS = metrics.histogram(
+    "tradingbot_event_bus_delivery_seconds", "Time events wait in a subscriber queue before delivery.",
+)
+EVENT_BUS_DROPPED = metrics.counter(
+    "tradingbot_event_bus_dropped_total", "Events lost to full subscriber queues (dropped or coalesced).", ["reason"],
+)
+EVENT_BUS_SUBSCRIBERS = metrics.gauge(
+    "tradingbot_event_bus_subscribers", "Event bus subscriber callbacks by event type.", ["type"],
+)
+EVENTS_EMITTED = metrics.counter(
+    "tradingbot_events_emitted_total", "Events emitted on the event bus.", ["type"],
+)
+
+
+class _CallTimer:
+    __slots__ = ("service", "operation", "started", "error")
+
+    def __init__(self, service: str, operation: str):
+        self.service = service
+        self.operation = operation
+        self.error = False
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        EXTERNAL_CALL_SECONDS.observe(
+            time.perf_counter() - self.started, service=self.service, operation=self.operation
+        )
+        if exc_type is not None or self.error:
+            EXTERNAL_CALL_ERRORS.inc(service=self.service, operation=self.operation)
+        return False
+
+    def failed(self):
+        """Count this call as an error even though it returned."""
+        self.error = True
+
+
+def track_call(service: str, operation: str):
+    """Time an external call; exceptions (or .failed()) count as errors."""
+    if not metrics.enabled:
+        return NULL_TIMER
+    return _CallTimer(service, operation)
@@ -0,0 +1,341 @@
+"""
+SQL query profiler.
+
+Hooks SQLAlchemy's before/after_cursor_execute on every engine (writer,
+read pool and the async pool) and records each statement's latency in a
+histogram keyed by
+
+- the normalized SQL (literals and IN-lists replaced by ?), and
+- the calling app function, e.g. SignalRepository.get_feed or
+  dashboard._build_holdings (the innermost frame under src/app)
+
+Statements slower than slow_query_ms go to the "app.slow_queries" logger
+and a ring buffer, together with their EXPLAIN QUERY PLAN. Plans are
+produced on a background thread over a read-only connection, so the slow
+statement's own connection and caller are not held up.
+
+Exposed at /api/metrics/db. DB_PROFILE=0 disables recording (the hooks
+then return immediately).
+"""
+
+import logging
+import os
+import queue
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger("app.slow_queries")
+
+APP_DIR = str(Path(__file__).resolve().parents[1])
+
+DEFAULT_PROFILER_CONFIG = {
+    "enabled": os.getenv("DB_PROFILE", "1") != "0",
+    "slow_query_ms": float(os.getenv("DB_SLOW_QUERY_MS", "100")),
+    "explain_slow": True,     # attach EXPLAIN QUERY PLAN to slow queries
+    "max_statements": 1000,   # distinct (sql, caller) keys kept; the rest are counted as overflow
+    "slow_log_size": 100,     # slow queries kept for the API
+    "plan_cache_size": 256,   # EXPLAIN plans kept (least recently used dropped first)
+}
+
+# Histogram bucket upper bounds in milliseconds (last bucket is +inf)
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Frames from these files are never reported as the caller
+_SKIP_FILES = {
+    str(Path(__file__).resolve()),
+    str(Path(APP_DIR) / "database" / "connection.py"),
+    str(Path(APP_DIR) / "database" / "async_repositories.py"),
+}
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*\?\s*,)*\s*\?\s*\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(r"\bVALUES\s*(\((?:[^()]*)\))(?:\s*,\s*\((?:[^()]*)\))+", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def normalize_sql(statement: str) -> str:
+    """Collapse a statement to its shape: literals -> ?, IN (?, ?, ...) -> IN (?), one line."""
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("IN (?)", sql)
+    sql = _VALUES_LIST.sub(r"VALUES \1", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def find_caller(frame) -> str:
+    """Innermost app function on the stack, as Class.method or module.function."""
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(APP_DIR) and filename not in _SKIP_FILES:
+            name = frame.f_code.co_name
+            owner = frame.f_locals.get("self")
+            if owner is not None:
+                return f"{type(owner).__name__}.{name}"
+            return f"{Path(filename).stem}.{name}"
+        frame = frame.f_back
+    return "<external>"
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (milliseconds)."""
+
+    __slots__ = ("count", "total_ms", "max_ms", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def record(self, ms: float):
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+        for i, bound in enumerate(BUCKETS_MS):
+            if ms <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (max for the last bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank and n:
+                return float(BUCKETS_MS[i]) if i < len(BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "buckets": {
+                **{f"le_{bound}": n for bound, n in zip(BUCKETS_MS, self.buckets)},
+                "le_inf": self.buckets[-1],
+            },
+        }
+
+
+class QueryProfiler:
+    """Per-statement latency histograms and a slow-query log."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            config: Overrides for DEFAULT_PROFILER_CONFIG
+        """
+        self.config = {**DEFAULT_PROFILER_CONFIG, **(config or {})}
+        self.lock = threading.Lock()
+        self.statements: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self.overflow = LatencyHistogram()
+        self.slow_queries = deque(maxlen=self.config["slow_log_size"])
+        self.since = datetime.now(timezone.utc).isoformat()
+        self._plans: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._explain_queue: "queue.Queue" = queue.Queue(maxsize=100)
+        self._explain_thread: Optional[threading.Thread] = None
+        self._local = threading.local()  # suppress: don't profile this thread's statements
+
+    def update_config(self, new_config: Dict[str, Any]):
+        """Update profiler settings at runtime."""
+        self.config.update(new_config)
+        if "slow_log_size" in new_config:
+            self.slow_queries = deque(self.slow_queries, maxlen=new_config["slow_log_size"])
+        if "plan_cache_size" in new_config:
+            with self.lock:
+                self._trim_plans()
+        logger.info(f"[QueryProfiler] Config updated: {new_config}")
+
+    def reset(self):
+        """Drop all recorded statistics."""
+        with self.lock:
+            self.statements.clear()
+            self.overflow = LatencyHistogram()
+            self.slow_queries.clear()
+            self._plans.clear()
+            self.since = datetime.now(timezone.utc).isoformat()
+
+    # --- SQLAlchemy hooks ---
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if self.config["enabled"] and not getattr(self._local, "suppress", False):
+            conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    def after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("query_start")
+        if not starts:
+            return
+        ms = (time.perf_counter() - starts.pop()) * 1000
+        self.record(statement, ms, find_caller(sys._getframe(1)), parameters, executemany)
+
+    def handle_error(self, exception_context):
+        # The failed statement never reaches after_cursor_execute
+        conn = exception_context.connection
+        starts = conn.info.get("query_start") if conn is not None else None
+        if starts:
+            starts.pop()
+
+    def record(self, statement: str, ms: float, caller: str, parameters=None, executemany: bool = False):
+        """Record one execution (the hooks call this; usable directly for tests)."""
+        sql = normalize_sql(statement)
+        key = (sql, caller)
+        with self.lock:
+            histogram = self.statements.get(key)
+            if histogram is None:
+                if len(self.statements) >= self.config["max_statements"]:
+                    histogram = self.overflow
+                else:
+                    histogram = self.statements[key] = LatencyHistogram()
+            histogram.record(ms)
+
+        if ms >= self.config["slow_query_ms"]:
+            self._record_slow(statement, sql, caller, ms, parameters, executemany)
+
+    # --- Slow queries ---
+
+    def _record_slow(self, statement, sql, caller, ms, parameters, executemany):
+        entry = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(ms, 3),
+            "caller": caller,
+            "sql": sql,
+            "plan": self._get_plan(sql),
+        }
+        self.slow_queries.append(entry)
+
+        if entry["plan"] is None and self.config["explain_slow"] and self._explainable(sql):
+            if executemany and parameters:
+                parameters = parameters[0]
+            self._start_explainer()
+            try:
+                self._explain_queue.put_nowait((entry, statement, parameters))
+            except queue.Full:
+                pass
+        else:
+            self._log_slow(entry)
+
+    @staticmethod
+    def _explainable(sql: str) -> bool:
+        return sql.split(" ", 1)[0].upper() in ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+    def _log_slow(self, entry: Dict[str, Any]):
+        plan = "; ".join(entry["plan"] or []) or "n/a"
+        slow_query_logger.warning(
+            f"[SlowQuery] {entry['duration_ms']:.1f}ms in {entry['caller']}: {entry['sql']} | plan: {plan}"
+        )
+
+    def _start_explainer(self):
+        if self._explain_thread is None or not self._explain_thread.is_alive():
+            with self.lock:
+                if self._explain_thread is None or not self._explain_thread.is_alive():
+                    self._explain_thread = threading.Thread(
+                        target=self._explain_loop, name="query-explainer", daemon=True
+                    )
+                    self._explain_thread.start()
+
+    def _explain_loop(self):
+        self._local.suppress = True  # the plan lookups themselves aren't profiled
+        while True:
+            entry, statement, parameters = self._explain_queue.get()
+            sql = entry["sql"]
+            plan = self._get_plan(sql)
+            if plan is None:
+                plan = self.explain(statement, parameters)
+                with self.lock:
+                    self._plans[sql] = plan
+                    self._trim_plans()
+            entry["plan"] = plan
+            self._log_slow(entry)
+
+    def _get_plan(self, sql: str) -> Optional[List[str]]:
+        """Cached plan for a normalized statement, marked as recently used."""
+        with self.lock:
+            plan = self._plans.get(sql)
+            if plan is not None:
+                self._plans.move_to_end(sql)
+            return plan
+
+    def _trim_plans(self):
+        """Drop least recently used plans beyond plan_cache_size (caller holds the lock)."""
+        while len(self._plans) > self.config["plan_cache_size"]:
+            self._plans.popitem(last=False)
+
+    def explain(self, statement: str, parameters=None) -> List[str]:
+        """EXPLAIN QUERY PLAN for a statement, run on a read-only pool connection."""
+        from app.database.connection import read_engine
+
+        try:
+            with read_engine.connect() as conn:
+                rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters or ()).fetchall()
+            return [row[-1] for row in rows]
+        except Exception as e:
+            logger.debug(f"[QueryProfiler] EXPLAIN failed for {statement[:80]}: {e}")
+            return [f"EXPLAIN failed: {e}"]
+
+    # --- Reporting ---
+
+    def get_stats(self, top: int = 25, sort: str = "total_ms", caller: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Profiler snapshot.
+
+        Args:
+            top: Statements returned (sorted descending by `sort`)
+            sort: total_ms, avg_ms, max_ms, count or p95_ms
+            caller: Only statements issued from this caller (substring match)
+        """
+        with self.lock:
+            rows = [
+                {"sql": sql, "caller": who, **histogram.to_dict()}
+                for (sql, who), histogram in self.statements.items()
+                if caller is None or caller in who
+            ]
+            overflow = self.overflow.to_dict() if self.overflow.count else None
+
+        by_caller: Dict[str, Dict[str, float]] = {}
+        for row in rows:
+            summary = by_caller.setdefault(row["caller"], {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            summary["count"] += row["count"]
+            summary["total_ms"] = round(summary["total_ms"] + row["total_ms"], 3)
+            summary["max_ms"] = max(summary["max_ms"], row["max_ms"])
+
+        rows.sort(key=lambda r: r.get(sort, r["total_ms"]), reverse=True)
+        return {
+            "enabled": self.config["enabled"],
+            "since": self.since,
+            "slow_query_ms": self.config["slow_query_ms"],
+            "distinct_statements": len(rows),
+            "statements": rows[:top],
+            "callers": dict(sorted(by_caller.items(), key=lambda kv: kv[1]["total_ms"], reverse=True)),
+            "overflow": overflow,
+            "slow_queries": list(self.slow_queries)[::-1],
+        }
+
+
+# Global singleton
+query_profiler = QueryProfiler()
+
+event.listen(Engine, "before_cursor_execute", query_profiler.before_cursor_execute)
+event.listen(Engine, "after_cursor_execute", query_profiler.after_cursor_execute)
+event.listen(Engine, "handle_error", query_profiler.handle_error)
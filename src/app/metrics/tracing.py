@@ -0,0 +1,405 @@
+"""
+Lightweight tracing for the trading loop.
+
+A trace is one trade cycle (or one event-driven evaluation). Spans nest via
+a ContextVar: each cycle opens a root span, and the symbol, stage,
+strategy, external-call and DB-write spans opened beneath it on the same
+thread become its children. Spans opened outside a trace (dashboard
+requests, background writers) are not recorded, so instrumented code pays
+one ContextVar lookup there.
+
+Finished traces go into a bounded ring buffer served by /api/traces/latest:
+per trace a flame-style tree (duration and self time per span), a
+breakdown of self time by span, and folded stacks for flamegraph tools.
+The same traces are available as OTLP/JSON (format=otlp): trace and span
+ids, nanosecond timestamps, attributes, kind and status follow the
+OpenTelemetry data model, so they can be posted to a collector's /v1/traces.
+
+Spans can carry a metrics timer (stage() and external_call() do), so one
+`with` records both the span and the Prometheus histogram.
+
+TRACING_ENABLED=0 disables recording.
+
+Usage:
+    with tracer.span("trade_cycle", root=True):
+        with stage("price"):
+            price = client.get_price(symbol)
+"""
+
+import logging
+import os
+import secrets
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from app.metrics.prometheus import STAGE_SECONDS, track_call
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRACING_CONFIG = {
+    "enabled": os.getenv("TRACING_ENABLED", "1") != "0",
+    "max_traces": 50,            # finished traces kept in the ring buffer
+    "max_spans_per_trace": 2000,  # spans beyond this are counted, not kept
+}
+
+SERVICE_NAME = "trading-bot"
+
+# OTLP span kinds and status codes
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_UNSET, STATUS_OK, STATUS_ERROR = 0, 1, 2
+
+# Attributes appended to a span's label in flame output, e.g. symbol[BTC/USD]
+LABEL_ATTRIBUTES = ("symbol", "strategy", "operation")
+
+
+class Span:
+    """One timed operation within a trace."""
+
+    __slots__ = (
+        "trace", "name", "span_id", "parent", "kind", "attributes",
+        "start_ns", "end_ns", "_perf_start", "status", "status_message", "children", "token",
+    )
+
+    def __init__(self, trace: "Trace", name: str, parent: Optional["Span"], kind: int, attributes: Dict[str, Any]):
+        self.trace = trace
+        self.name = name
+        self.span_id = secrets.token_hex(8)
+        self.parent = parent
+        self.kind = kind
+        self.attributes = attributes
+        self.start_ns = time.time_ns()
+        self._perf_start = time.perf_counter_ns()
+        self.end_ns = None
+        self.status = STATUS_UNSET
+        self.status_message = ""
+        self.children: List["Span"] = []
+        self.token = None
+
+    def end(self):
+        self.end_ns = self.start_ns + (time.perf_counter_ns() - self._perf_start)
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def set_error(self, message: str):
+        self.status = STATUS_ERROR
+        self.status_message = message
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else self.start_ns + (time.perf_counter_ns() - self._perf_start)
+        return (end - self.start_ns) / 1e6
+
+    @property
+    def label(self) -> str:
+        for key in LABEL_ATTRIBUTES:
+            if key in self.attributes:
+                return f"{self.name}[{self.attributes[key]}]"
+        return self.name
+
+
+class Trace:
+    """Spans of one root operation."""
+
+    __slots__ = ("trace_id", "root", "spans", "dropped")
+
+    def __init__(self):
+        self.trace_id = secrets.token_hex(16)
+        self.root: Optional[Span] = None
+        self.spans: List[Span] = []
+        self.dropped = 0
+
+
+class _NullSpan:
+    """Returned when nothing is traced or timed."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set_attribute(self, key, value):
+        pass
+
+    def failed(self, message=None):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _SpanScope:
+    """Context manager for one span plus an optional metrics timer."""
+
+    __slots__ = ("tracer", "name", "root", "kind", "attributes", "timer", "span")
+
+    def __init__(self, tracer: "Tracer", name, root, kind, attributes, timer):
+        self.tracer = tracer
+        self.name = name
+        self.root = root
+        self.kind = kind
+        self.attributes = attributes
+        self.timer = timer
+        self.span = None
+
+    def __enter__(self):
+        if self.timer is not None:
+            self.timer.__enter__()
+        self.span = self.tracer._start(self.name, self.root, self.kind, self.attributes)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.span is not None:
+            if exc_type is not None:
+                self.span.set_error(f"{exc_type.__name__}: {exc}")
+            self.tracer._end(self.span)
+        if self.timer is not None:
+            self.timer.__exit__(exc_type, exc, tb)
+        return False
+
+    def set_attribute(self, key: str, value: Any):
+        if self.span is not None:
+            self.span.set_attribute(key, value)
+
+    def failed(self, message: str = "error"):
+        """Mark the operation failed even though it returned."""
+        if self.span is not None:
+            self.span.set_error(message)
+        if self.timer is not None:
+            self.timer.failed()
+
+
+class Tracer:
+    """Creates spans and keeps the most recent finished traces."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            config: Overrides for DEFAULT_TRACING_CONFIG
+        """
+        self.config = {**DEFAULT_TRACING_CONFIG, **(config or {})}
+        self.enabled = bool(self.config["enabled"])
+        self.traces = deque(maxlen=self.config["max_traces"])
+        self.lock = threading.Lock()
+        self._current: ContextVar[Optional[Span]] = ContextVar(f"current_span_{id(self)}", default=None)
+        self.stats = {"traces": 0, "spans": 0, "dropped_spans": 0}
+
+    def update_config(self, new_config: Dict[str, Any]):
+        """Update tracing settings at runtime."""
+        self.config.update(new_config)
+        self.enabled = bool(self.config["enabled"])
+        if "max_traces" in new_config:
+            with self.lock:
+                self.traces = deque(self.traces, maxlen=new_config["max_traces"])
+        logger.info(f"[Tracing] Config updated: {new_config}")
+
+    def reset(self):
+        """Drop finished traces."""
+        with self.lock:
+            self.traces.clear()
+
+    def span(self, name: str, root: bool = False, kind: int = SPAN_KIND_INTERNAL, timer=None, **attributes):
+        """
+        Context manager for a span named `name`.
+
+        Args:
+            name: Low-cardinality operation name (details go in attributes)
+            root: Start a new trace if none is active (cycles, evaluations);
+                other spans are only recorded inside an active trace
+            kind: OTLP span kind (SPAN_KIND_CLIENT for outgoing calls)
+            timer: Metrics timer (e.g. a Histogram.time()) entered and exited
+                with the span, whether or not the span is recorded
+            **attributes: Span attributes
+        """
+        if not self.enabled and timer is None:
+            return NULL_SPAN
+        return _SpanScope(self, name, root, kind, attributes, timer)
+
+    def current_span(self) -> Optional[Span]:
+        return self._current.get()
+
+    def _start(self, name, root, kind, attributes) -> Optional[Span]:
+        if not self.enabled:
+            return None
+        parent = self._current.get()
+        if parent is None:
+            if not root:
+                return None
+            trace = Trace()
+        else:
+            trace = parent.trace
+            if len(trace.spans) >= self.config["max_spans_per_trace"]:
+                trace.dropped += 1
+                return None
+
+        span = Span(trace, name, parent, kind, attributes)
+        trace.spans.append(span)
+        if parent is None:
+            trace.root = span
+        else:
+            parent.children.append(span)
+        span.token = self._current.set(span)
+        return span
+
+    def _end(self, span: Span):
+        span.end()
+        try:
+            self._current.reset(span.token)
+        except (ValueError, RuntimeError):
+            # Ended in another context (shouldn't happen with `with`); just unlink
+            self._current.set(span.parent)
+        if span.parent is None:
+            trace = span.trace
+            with self.lock:
+                self.traces.append(trace)
+                self.stats["traces"] += 1
+                self.stats["spans"] += len(trace.spans)
+                self.stats["dropped_spans"] += trace.dropped
+
+    # --- Reporting ---
+
+    def get_traces(self, limit: int = 5, name: Optional[str] = None, min_ms: float = 0.0) -> List[Trace]:
+        """Most recent finished traces first."""
+        with self.lock:
+            traces = list(self.traces)
+        traces = [
+            t for t in reversed(traces)
+            if (name is None or t.root.name == name) and t.root.duration_ms >= min_ms
+        ]
+        return traces[:limit]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "buffered": len(self.traces),
+            "max_traces": self.config["max_traces"],
+            **self.stats,
+        }
+
+
+def _flame_node(span: Span, trace_start_ns: int) -> Dict[str, Any]:
+    children = [_flame_node(child, trace_start_ns) for child in span.children]
+    duration = span.duration_ms
+    return {
+        "name": span.label,
+        "start_ms": round((span.start_ns - trace_start_ns) / 1e6, 3),
+        "duration_ms": round(duration, 3),
+        "self_ms": round(max(duration - sum(c["duration_ms"] for c in children), 0.0), 3),
+        "status": "error" if span.status == STATUS_ERROR else "ok",
+        **({"error": span.status_message} if span.status == STATUS_ERROR else {}),
+        "attributes": span.attributes,
+        "children": children,
+    }
+
+
+def _walk(node: Dict[str, Any], path: List[str], breakdown: Dict[str, Dict[str, float]], folded: Dict[str, float]):
+    stack = path + [node["name"]]
+    entry = breakdown.setdefault(node["name"], {"count": 0, "total_ms": 0.0, "self_ms": 0.0})
+    entry["count"] += 1
+    entry["total_ms"] += node["duration_ms"]
+    entry["self_ms"] += node["self_ms"]
+    key = ";".join(stack)
+    folded[key] = folded.get(key, 0.0) + node["self_ms"]
+    for child in node["children"]:
+        _walk(child, stack, breakdown, folded)
+
+
+def trace_to_flame(trace: Trace) -> Dict[str, Any]:
+    """
+    Flame-style view of a trace.
+
+    Returns:
+        Dict with the span tree (duration and self time per node), a
+        breakdown of self time by span label (largest first) and folded
+        stacks ("cycle;symbol[BTC/USD];price" -> self ms)
+    """
+    root = trace.root
+    tree = _flame_node(root, root.start_ns)
+    breakdown: Dict[str, Dict[str, float]] = {}
+    folded: Dict[str, float] = {}
+    _walk(tree, [], breakdown, folded)
+
+    total = tree["duration_ms"] or 1.0
+    return {
+        "trace_id": trace.trace_id,
+        "name": root.name,
+        "start": datetime.fromtimestamp(root.start_ns / 1e9, timezone.utc).isoformat(),
+        "duration_ms": tree["duration_ms"],
+        "status": tree["status"],
+        "span_count": len(trace.spans),
+        "dropped_spans": trace.dropped,
+        "breakdown": [
+            {
+                "name": label, "count": v["count"],
+                "total_ms": round(v["total_ms"], 3), "self_ms": round(v["self_ms"], 3),
+                "self_pct": round(100 * v["self_ms"] / total, 1),
+            }
+            for label, v in sorted(breakdown.items(), key=lambda kv: kv[1]["self_ms"], reverse=True)
+        ],
+        "folded": [f"{stack} {ms:.3f}" for stack, ms in folded.items()],
+        "tree": tree,
+    }
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def traces_to_otlp(traces: List[Trace]) -> Dict[str, Any]:
+    """Traces as an OTLP/JSON ExportTraceServiceRequest."""
+    spans = []
+    for trace in traces:
+        for span in trace.spans:
+            if span.end_ns is None:
+                continue
+            spans.append({
+                "traceId": trace.trace_id,
+                "spanId": span.span_id,
+                "parentSpanId": span.parent.span_id if span.parent else "",
+                "name": span.name,
+                "kind": span.kind,
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns),
+                "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in span.attributes.items()],
+                "status": {"code": span.status, "message": span.status_message},
+            })
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]},
+            "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+        }]
+    }
+
+
+# Global singleton
+tracer = Tracer()
+
+
+def stage(name: str, **attributes):
+    """Span for a trading-loop stage, also timed into the stage histogram."""
+    return tracer.span(name, timer=STAGE_SECONDS.time(stage=name), **attributes)
+
+
+def external_call(service: str, operation: str):
+    """
+    Client span for a call to an external service, also counted and timed
+    for /metrics. Call .failed() on the result when the call returned an error.
+    """
+    return tracer.span(
+        f"{service}.call", kind=SPAN_KIND_CLIENT, timer=track_call(service, operation),
+        service=service, operation=operation,
+    )
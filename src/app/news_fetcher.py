@@ -4,15 +4,17 @@ Fetches from multiple sources, deduplicates, extracts symbols.
 ALL DATA STORED IN DATABASE.
 """
 
-import feedparser
 import hashlib
 import logging
+import threading
+import time
 from typing import List, Dict, Optional
 from datetime import datetime, timezone
 from app.utils.symbol_normalizer import normalize_symbol
 from app.database.connection import get_db
 from app.database.repositories import RSSFeedRepository, SeenNewsRepository
 from app.database.models import SeenNews
+from app.metrics.tracing import external_call
 
 
 # SYMBOL EXTRACTION
@@ -85,10 +87,15 @@ def get_unseen_headlines() -> Dict[str, List[Dict[str, str]]]:
 
         logging.info(f"[NewsFetcher] Fetching from {len(feeds)} enabled feeds")
 
+        import feedparser  # deferred: only news fetches need it
+
         for feed in feeds:
             try:
                 logging.info(f"[NewsFetcher] Fetching {feed.name} ({feed.url})")
-                parsed_feed = feedparser.parse(feed.url)
+                with external_call("rss", "parse") as call:
+                    parsed_feed = feedparser.parse(feed.url)
+                    if parsed_feed.get("bozo") and not parsed_feed.entries:
+                        call.failed()
 
                 headlines_processed = 0
                 headlines_new = 0
@@ -144,6 +151,38 @@ def get_unseen_headlines() -> Dict[str, List[Dict[str, str]]]:
     return unseen
 
 
+# SHARED FETCH
+# The headline watcher and the trade cycle both need unseen headlines; the
+# most recent fetch is reused so feeds aren't polled twice within a window.
+_shared_fetch = {"at": 0.0, "headlines": None}
+_shared_fetch_lock = threading.Lock()
+
+
+def get_unseen_headlines_shared(max_age_seconds: float = 0) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Unseen headlines, reusing the last fetch if it is newer than max_age_seconds.
+
+    The cached result is dropped whenever headlines are marked seen, so it
+    never returns headlines a cycle already consumed.
+    """
+    with _shared_fetch_lock:
+        cached = _shared_fetch["headlines"]
+        if cached is not None and time.monotonic() - _shared_fetch["at"] < max_age_seconds:
+            logging.info("[NewsFetcher] Reusing headlines from the last fetch")
+            return {symbol: list(items) for symbol, items in cached.items()}
+
+        headlines = get_unseen_headlines()
+        _shared_fetch["headlines"] = headlines
+        _shared_fetch["at"] = time.monotonic()
+        return {symbol: list(items) for symbol, items in headlines.items()}
+
+
+def clear_shared_headlines():
+    """Drop the shared fetch so the next caller fetches fresh."""
+    with _shared_fetch_lock:
+        _shared_fetch["headlines"] = None
+
+
 def mark_as_seen(headlines: List[Dict[str, any]], triggered_signal: bool = False, signal_id: int = None):
     """
     Mark headlines as seen in database.
@@ -166,3 +205,5 @@ def mark_as_seen(headlines: List[Dict[str, any]], triggered_signal: bool = False
             )
 
         logging.info(f"[NewsFetcher] Marked {len(headlines)} headlines as seen (triggered_signal={triggered_signal})")
+
+    clear_shared_headlines()
@@ -0,0 +1,225 @@
+"""
+Read-through response cache for the dashboard polling endpoints.
+
+- Entries are keyed by endpoint name + query string and tagged with the data
+  they depend on (trades, signals, positions, pnl)
+- event_bus events invalidate the matching tags; a short TTL is the safety
+  net for writes that don't emit events (and live prices in holdings)
+- Responses carry an ETag; a matching If-None-Match gets a 304
+- Concurrent identical requests share a single computation
+"""
+
+import json
+import time
+import asyncio
+import hashlib
+import logging
+from collections import defaultdict
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+
+from app.events import event_bus, EventType
+
+
+DEFAULT_TTL_SECONDS = 10.0
+
+# Event -> cache tags it invalidates (None clears everything)
+INVALIDATION_RULES: Dict[EventType, Optional[Tuple[str, ...]]] = {
+    EventType.TRADE_EXECUTED: ("trades", "positions", "pnl"),
+    EventType.SIGNAL_GENERATED: ("signals",),
+    EventType.STRATEGY_UPDATED: ("signals",),
+    EventType.HOLDINGS_UPDATED: ("positions",),
+    EventType.BALANCE_UPDATED: ("pnl",),
+    EventType.CONFIG_CHANGED: None,
+}
+
+
+class ResponseCache:
+    """Tag-invalidated cache of rendered JSON responses."""
+
+    def __init__(self, default_ttl: float = DEFAULT_TTL_SECONDS, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            default_ttl: Seconds an entry stays fresh without an invalidating event
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self.lock = Lock()
+
+        # key -> {"body", "etag", "tags", "expires"}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # key -> future shared by requests waiting on the same computation
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Bumped on invalidation so computations started earlier aren't stored
+        self._generations = defaultdict(int)
+        self._clears = 0
+
+        self.stats = {"hits": 0, "misses": 0, "not_modified": 0, "collapsed": 0, "invalidations": 0}
+
+    # ---------- Invalidation ----------
+    def attach(self, bus=event_bus):
+        """Subscribe to the events in INVALIDATION_RULES."""
+        for event_type in INVALIDATION_RULES:
+            bus.subscribe(event_type, self.on_event)
+
+    def detach(self, bus=event_bus):
+        for event_type in INVALIDATION_RULES:
+            bus.unsubscribe(event_type, self.on_event)
+
+    def on_event(self, event: Dict[str, Any]):
+        """EventBus subscriber (sync, so it also runs for events emitted off-loop)."""
+        tags = INVALIDATION_RULES.get(event.get("type"), ())
+        if tags is None:
+            self.clear()
+        elif tags:
+            self.invalidate(*tags)
+
+    def invalidate(self, *tags: str):
+        """Drop entries depending on any of the given tags."""
+        with self.lock:
+            for tag in tags:
+                self._generations[tag] += 1
+            stale = [key for key, entry in self._entries.items() if entry["tags"].intersection(tags)]
+            for key in stale:
+                del self._entries[key]
+            self.stats["invalidations"] += 1
+        logging.debug(f"[ResponseCache] Invalidated {tags}: dropped {len(stale)} entries")
+
+    def clear(self):
+        """Drop every entry."""
+        with self.lock:
+            self._entries.clear()
+            self._clears += 1
+            self.stats["invalidations"] += 1
+
+    # ---------- Serving ----------
+    async def respond(
+        self,
+        request: Request,
+        name: str,
+        compute: Callable[[], Awaitable[Any]],
+        tags: Iterable[str] = (),
+        ttl: Optional[float] = None,
+        finalize: Optional[Callable[[Any], Any]] = None,
+    ) -> Response:
+        """
+        Serve a cached response for an endpoint, computing it on a miss.
+
+        Args:
+            request: Incoming request (query string is part of the key,
+                If-None-Match is honoured)
+            name: Endpoint name
+            compute: Coroutine function producing the endpoint's result
+                (dict/list, or a Response; non-200 responses are not cached)
+            tags: Data the result depends on, for event invalidation
+            ttl: Override default_ttl for this endpoint
+            finalize: Applied to the decoded cached result on every serve,
+                for fields that must reflect serve time (e.g. ages); the
+                ETag still follows the cached result, so these fields alone
+                don't defeat If-None-Match
+        """
+        key = f"{name}?{request.url.query}" if request.url.query else name
+        tags = frozenset(tags)
+
+        with self.lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["expires"] <= self.clock():
+                del self._entries[key]
+                entry = None
+            self.stats["hits" if entry is not None else "misses"] += 1
+
+        if entry is None:
+            entry, response = await self._load(key, compute, tags, self.default_ttl if ttl is None else ttl)
+            if entry is None:
+                return response
+
+        if finalize is not None:
+            entry = self._finalize(entry, finalize)
+        return self._serve(request, entry)
+
+    async def _load(self, key, compute, tags, ttl) -> Tuple[Optional[Dict[str, Any]], Optional[Response]]:
+        """Run (or join) the computation for a key."""
+        future = self._inflight.get(key)
+        if future is not None:
+            with self.lock:
+                self.stats["collapsed"] += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        with self.lock:
+            generation = self._generation(tags)
+        try:
+            outcome = self._render(await compute(), tags, ttl)
+            entry = outcome[0]
+            if entry is not None:
+                with self.lock:
+                    # Don't store a result an invalidation raced past
+                    if generation == self._generation(tags):
+                        self._entries[key] = entry
+            future.set_result(outcome)
+            return outcome
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Waiters re-raise it; don't warn when there are none
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def _generation(self, tags) -> Tuple[int, ...]:
+        return (self._clears,) + tuple(self._generations[tag] for tag in sorted(tags))
+
+    def _render(self, result: Any, tags, ttl) -> Tuple[Optional[Dict[str, Any]], Optional[Response]]:
+        """Turn an endpoint result into a cache entry, or pass a non-cacheable response through."""
+        if isinstance(result, Response):
+            if result.status_code != 200 or not isinstance(result, JSONResponse):
+                return None, result
+            body = result.body
+        else:
+            body = JSONResponse(jsonable_encoder(result)).body
+
+        return {
+            "body": body,
+            "etag": f'"{hashlib.sha1(body).hexdigest()}"',
+            "tags": tags,
+            "expires": self.clock() + ttl,
+        }, None
+
+    def _finalize(self, entry: Dict[str, Any], finalize: Callable[[Any], Any]) -> Dict[str, Any]:
+        """
+        Re-render a cached entry through finalize (the stored entry is left untouched).
+
+        The ETag stays the one computed from the cached body, marked weak:
+        serve-time fields change the bytes on every serve, but the response
+        only really changes when the entry is recomputed.
+        """
+        body = JSONResponse(jsonable_encoder(finalize(json.loads(entry["body"])))).body
+        return {**entry, "body": body, "etag": f"W/{entry['etag']}"}
+
+    def _serve(self, request: Request, entry: Dict[str, Any]) -> Response:
+        headers = {"ETag": entry["etag"], "Cache-Control": "no-cache"}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            candidates = {tag.strip() for tag in if_none_match.split(",")}
+            if entry["etag"] in candidates or "*" in candidates:
+                with self.lock:
+                    self.stats["not_modified"] += 1
+                return Response(status_code=304, headers=headers)
+
+        return Response(content=entry["body"], media_type="application/json", headers=headers)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self.lock:
+            return {**self.stats, "entries": len(self._entries), "inflight": len(self._inflight)}
+
+
+# Global singleton, invalidated by the application event bus
+response_cache = ResponseCache()
+response_cache.attach(event_bus)
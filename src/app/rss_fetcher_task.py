@@ -6,11 +6,11 @@ NO JSON files are used - everything goes to database.
 """
 
 import logging
-import feedparser
 from datetime import datetime, timezone
 from typing import List, Dict, Optional
 from app.database.connection import get_db
 from app.database.repositories import RSSFeedRepository
+from app.metrics.tracing import external_call
 
 
 def fetch_all_rss_feeds():
@@ -50,10 +50,14 @@ def fetch_single_feed(feed, db):
         db: Database session
     """
     logging.info(f"[RSSFetcher] Fetching {feed.name} from {feed.url}")
+    import feedparser  # deferred: only feed fetches need it
 
     try:
         # Parse RSS feed
-        parsed = feedparser.parse(feed.url)
+        with external_call("rss", "parse") as call:
+            parsed = feedparser.parse(feed.url)
+            if parsed.bozo:
+                call.failed()
 
         if parsed.bozo:  # Feed has errors
             error_msg = f"Feed parse error: {parsed.bozo_exception}"
@@ -9,49 +9,58 @@ from collections import defaultdict
 from typing import Dict, List
 import logging
 
+from app.utils.signal_matching import match_by_time, parse_timestamp
+
 LOGS_DIR = Path(__file__).parent / "logs"
 
 
-def load_signals_and_trades():
-    """Load signals and trades from database."""
-    from app.database.connection import get_db
+def _trade_dict(t) -> Dict:
+    return {
+        'timestamp': t.timestamp.isoformat() + 'Z' if t.timestamp else None,
+        'symbol': t.symbol,
+        'action': t.action,
+        'price': float(t.price) if t.price else 0,
+        'amount': float(t.amount) if t.amount else 0,
+        'signal_id': t.signal_id
+    }
+
+
+def load_signals_and_trades(hours: int = 24*7):
+    """
+    Load signals and trades from database.
+
+    Each signal carries the trade linked to it by signal_id ('trade'),
+    resolved with a SQL join.
+    """
+    from app.database.connection import get_read_db
     from app.database.repositories import SignalRepository, TradeRepository
 
     signals = []
     trades = []
 
     try:
-        with get_db() as db:
+        with get_read_db() as db:
             signal_repo = SignalRepository(db)
             trade_repo = TradeRepository(db)
 
-            # Get all non-test signals from last 7 days
-            signal_models = signal_repo.get_recent(hours=24*7, test_mode=False, limit=1000)
+            # Non-test signals in the period, each LEFT JOINed to its first trade
+            cutoff = datetime.utcnow() - timedelta(hours=hours)
+            rows = signal_repo.get_feed(limit=1000, since=cutoff, test_mode=False)
 
             # Convert to dict format for compatibility
-            for s in signal_models:
+            for s, t in rows:
                 signals.append({
                     'id': s.id,  # Include signal ID for proper correlation
                     'timestamp': s.timestamp.isoformat() + 'Z' if s.timestamp else None,
                     'symbol': s.symbol,
                     'final_signal': s.final_signal,
                     'final_confidence': float(s.final_confidence) if s.final_confidence else 0,
-                    'strategies': s.strategies or {}
+                    'strategies': s.strategies or {},
+                    'trade': _trade_dict(t) if t is not None else None
                 })
 
-            # Get all non-test trades
-            trade_models = trade_repo.get_all(test_mode=False)
-
-            # Convert to dict format
-            for t in trade_models:
-                trades.append({
-                    'timestamp': t.timestamp.isoformat() + 'Z' if t.timestamp else None,
-                    'symbol': t.symbol,
-                    'action': t.action,
-                    'price': float(t.price) if t.price else 0,
-                    'amount': float(t.amount) if t.amount else 0,
-                    'signal_id': t.signal_id
-                })
+            # Non-test trades in the same period (for time-window matching)
+            trades = [_trade_dict(t) for t in trade_repo.get_recent(hours=hours, test_mode=False, limit=10000)]
 
     except Exception as e:
         logging.error(f"Error loading signals and trades from database: {e}")
@@ -60,73 +69,57 @@ def load_signals_and_trades():
 
 
 def correlate_signals_to_trades(signals: List[Dict], trades: List[Dict], window_minutes: int = 10) -> List[Dict]:
-    """Correlate signals to trades using signal_id, with fallback to time-window matching."""
-    correlations = []
+    """
+    Correlate signals to trades using signal_id, with fallback to time-window matching.
 
+    A signal's trade is, in order: its SQL-joined 'trade', a trade in
+    `trades` carrying its signal_id, or the earliest matching trade up to
+    window_minutes after it (see app.utils.signal_matching).
+    """
     # Create mapping of signal_id -> trade for fast lookup
     trades_by_signal_id = {}
     for trade in trades:
         if trade.get('signal_id'):
             trades_by_signal_id[trade['signal_id']] = trade
 
-    for signal in signals:
-        sig_time = datetime.fromisoformat(signal['timestamp'].replace('Z', '+00:00'))
-        # Make timezone-naive for comparison
-        if sig_time.tzinfo is not None:
-            sig_time = sig_time.replace(tzinfo=None)
-
-        sig_id = signal.get('id')
-        sig_symbol = signal['symbol']
-        sig_action = signal['final_signal']
-        sig_conf = signal.get('final_confidence', 0)
-
-        # Skip HOLD signals
-        if sig_action == 'HOLD':
-            continue
-
-        # PRIORITY 1: Match by signal_id (most accurate)
-        matched_trade = None
-        if sig_id and sig_id in trades_by_signal_id:
-            matched_trade = trades_by_signal_id[sig_id]
-        else:
-            # FALLBACK: Match by time window (less accurate, only if signal happened BEFORE trade)
-            for trade in trades:
-                try:
-                    trade_time = datetime.fromisoformat(trade['timestamp'])
-                except:
-                    trade_time = datetime.fromisoformat(trade['timestamp'].replace('Z', '+00:00'))
-
-                # Make timezone-naive for comparison
-                if trade_time.tzinfo is not None:
-                    trade_time = trade_time.replace(tzinfo=None)
-
-                trade_symbol = trade['symbol']
-                trade_action = trade['action'].upper()
-
-                # Check if trade matches signal
-                # IMPORTANT: Signal must come BEFORE or at same time as trade (not after!)
-                time_diff_seconds = (trade_time - sig_time).total_seconds()
-                time_diff_minutes = time_diff_seconds / 60
-
-                if (trade_symbol == sig_symbol and
-                    trade_action == sig_action and
-                    0 <= time_diff_seconds <= window_minutes * 60):  # Signal must be before trade
-                    matched_trade = trade
-                    break
-        
-        correlations.append({
+    # Skip HOLD signals
+    actionable = [s for s in signals if s['final_signal'] != 'HOLD']
+
+    # PRIORITY 1: Match by signal_id (most accurate)
+    matched = [
+        signal.get('trade') or trades_by_signal_id.get(signal.get('id'))
+        for signal in actionable
+    ]
+
+    # FALLBACK: Match by time window (only if signal happened BEFORE trade).
+    # Timestamps are parsed once up front, not per signal/trade pair.
+    unmatched = [i for i, trade in enumerate(matched) if trade is None]
+    if unmatched and trades:
+        trade_events = [
+            (t['symbol'], t['action'], parse_timestamp(t['timestamp'])) for t in trades
+        ]
+        signal_events = [
+            (actionable[i]['symbol'], actionable[i]['final_signal'], parse_timestamp(actionable[i]['timestamp']))
+            for i in unmatched
+        ]
+        for i, trade_index in zip(unmatched, match_by_time(signal_events, trade_events, window_minutes)):
+            if trade_index is not None:
+                matched[i] = trades[trade_index]
+
+    return [
+        {
             'signal': {
                 'timestamp': signal['timestamp'],
-                'symbol': sig_symbol,
-                'action': sig_action,
-                'confidence': sig_conf
+                'symbol': signal['symbol'],
+                'action': signal['final_signal'],
+                'confidence': signal.get('final_confidence', 0)
             },
-            'trade': matched_trade,
-            'executed': matched_trade is not None,
+            'trade': trade,
+            'executed': trade is not None,
             'strategies': signal.get('strategies', {})
-        })
-    
-    return correlations
+        }
+        for signal, trade in zip(actionable, matched)
+    ]
 
 
 def analyze_strategy_performance(correlations: List[Dict], trades: List[Dict]) -> Dict:
@@ -159,24 +152,23 @@ def analyze_strategy_performance(correlations: List[Dict], trades: List[Dict]) -
     return dict(strategy_stats)
 
 
+def _is_real_trade(trade: Dict) -> bool:
+    amount = float(trade.get('amount', 0))
+    price = float(trade['price'])
+    return 0 < amount < 100 and 0 < price < 200000
+
+
 def get_signal_performance_analysis() -> Dict:
     """Main analysis function."""
-    signals, trades = load_signals_and_trades()
+    # Only analyze recent signals (last 24 hours)
+    recent_signals, trades = load_signals_and_trades(hours=24)
 
-    # Only analyze recent signals (last 24 hours) - use timezone-naive comparison
-    cutoff = datetime.now() - timedelta(hours=24)
-    recent_signals = [
-        s for s in signals
-        if datetime.fromisoformat(s['timestamp'].replace('Z', '+00:00')).replace(tzinfo=None) > cutoff
-    ]
-    
     # Filter out test trades
-    real_trades = [
-        t for t in trades
-        if float(t.get('amount', 0)) > 0 and float(t.get('amount', 0)) < 100
-        and float(t['price']) > 0 and float(t['price']) < 200000
-    ]
-    
+    real_trades = [t for t in trades if _is_real_trade(t)]
+    for signal in recent_signals:
+        if signal['trade'] is not None and not _is_real_trade(signal['trade']):
+            signal['trade'] = None
+
     correlations = correlate_signals_to_trades(recent_signals, real_trades)
     strategy_performance = analyze_strategy_performance(correlations, real_trades)
     
@@ -0,0 +1,227 @@
+"""
+Signal retention.
+
+A Signal row is written for every symbol every cycle (HOLDs included, with a
+telemetry blob), so the table grows without bound. Retention runs
+periodically and, per DEFAULT_RETENTION_POLICY:
+
+1. Downsamples: (symbol, hour) periods older than downsample_hold_after_days
+   that contain only HOLD signals are collapsed into one signal_aggregates
+   row each and their signals deleted
+2. Archives: signals older than raw_days are appended to gzip JSONL files
+   (one per month) under archive_dir, then deleted
+3. Reclaims space: PRAGMA incremental_vacuum releases freed pages
+
+Deletes are batched range DELETEs (batch_size rows per transaction) so the
+trade cycle is never blocked for long. Signals referenced by a trade are
+kept. Strategy rollups are separate aggregates and are not affected.
+"""
+
+import gzip
+import json
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+
+from app.database.connection import get_db
+from app.database.models import Signal
+from app.database.repositories import SignalRetentionRepository
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIR = Path(__file__).resolve().parents[2] / "data" / "archive"
+
+DEFAULT_RETENTION_POLICY = {
+    "enabled": True,
+    "downsample_hold_after_days": 7,  # HOLD-only hours older than this become aggregates
+    "raw_days": 30,                   # signals older than this are archived and deleted
+    "archive": True,                  # write signals to archive_dir before deleting them
+    "archive_dir": str(ARCHIVE_DIR),
+    "batch_size": 2000,               # rows (or HOLD periods) per transaction
+    "vacuum_pages": 1000,             # pages released per incremental_vacuum step
+    "interval_hours": 6,              # scheduler cadence (0 disables the job)
+}
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def archive_record(signal: Signal) -> Dict[str, Any]:
+    """JSON-serialisable copy of a signal row."""
+    return {
+        "id": signal.id,
+        "timestamp": signal.timestamp.isoformat() if signal.timestamp else None,
+        "symbol": signal.symbol,
+        "price": str(signal.price),
+        "final_signal": signal.final_signal,
+        "final_confidence": str(signal.final_confidence),
+        "aggregation_method": signal.aggregation_method,
+        "strategies": signal.strategies,
+        "test_mode": signal.test_mode,
+        "bot_version": signal.bot_version,
+        "strategy_version": signal.strategy_version,
+        "signal_metadata": signal.signal_metadata,
+        "created_at": signal.created_at.isoformat() if signal.created_at else None,
+    }
+
+
+class SignalRetention:
+    """Applies the retention policy to the signals table."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            config: Overrides for DEFAULT_RETENTION_POLICY
+        """
+        self.config = {**DEFAULT_RETENTION_POLICY, **(config or {})}
+        self.lock = Lock()
+        self.stats = {
+            "runs": 0, "downsampled_periods": 0, "downsampled_signals": 0,
+            "archived": 0, "deleted": 0, "vacuumed_pages": 0, "last_run": None,
+            "last_duration_seconds": None,
+        }
+
+    def update_config(self, new_config: Dict[str, Any]):
+        """Update the policy at runtime."""
+        self.config.update(new_config)
+        logger.info(f"[Retention] Policy updated: {new_config}")
+
+    def run(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Apply the policy once.
+
+        Args:
+            now: Reference time (naive UTC, defaults to now)
+
+        Returns:
+            Counts for this run: downsampled_periods, downsampled_signals,
+            archived, deleted, vacuumed_pages
+        """
+        result = dict.fromkeys(
+            ("downsampled_periods", "downsampled_signals", "archived", "deleted", "vacuumed_pages"), 0
+        )
+        if not self.config["enabled"]:
+            return result
+        if not self.lock.acquire(blocking=False):
+            logger.info("[Retention] Previous run still in progress; skipping")
+            return result
+
+        started = time.monotonic()
+        now = now or _utcnow()
+        try:
+            periods, signals = self.downsample(now - timedelta(days=self.config["downsample_hold_after_days"]))
+            result["downsampled_periods"], result["downsampled_signals"] = periods, signals
+
+            archived, deleted = self.expire(now - timedelta(days=self.config["raw_days"]))
+            result["archived"], result["deleted"] = archived, deleted
+
+            if signals or deleted:
+                result["vacuumed_pages"] = self.vacuum()
+        except Exception as e:
+            logger.error(f"[Retention] Run failed: {e}")
+        finally:
+            self.lock.release()
+
+        for key, value in result.items():
+            self.stats[key] += value
+        self.stats["runs"] += 1
+        self.stats["last_run"] = now.isoformat()
+        self.stats["last_duration_seconds"] = round(time.monotonic() - started, 3)
+        logger.info(f"[Retention] {result} in {self.stats['last_duration_seconds']}s")
+        return result
+
+    def downsample(self, before: datetime) -> tuple:
+        """Collapse HOLD-only hours older than `before`; returns (periods, signals deleted)."""
+        periods = signals = 0
+        while True:
+            with get_db() as db:
+                # A symbol-hour holds ~12 signals at the 5 minute cadence
+                batch_periods, batch_signals = SignalRetentionRepository(db).downsample_hold_hours(
+                    before, limit=max(self.config["batch_size"] // 12, 1)
+                )
+            if not batch_periods:
+                return periods, signals
+            periods += batch_periods
+            signals += batch_signals
+
+    def expire(self, before: datetime) -> tuple:
+        """
+        Remove signals older than `before`, archiving them first if enabled.
+
+        Returns:
+            (signals archived, signals deleted)
+        """
+        batch_size = self.config["batch_size"]
+        archived = deleted = 0
+
+        if not self.config["archive"]:
+            while True:
+                with get_db() as db:
+                    count = SignalRetentionRepository(db).delete_before(before, limit=batch_size)
+                deleted += count
+                if count < batch_size:
+                    return archived, deleted
+
+        archive_dir = Path(self.config["archive_dir"])
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        while True:
+            with get_db() as db:
+                repo = SignalRetentionRepository(db)
+                batch = repo.oldest(before, limit=batch_size)
+                if not batch:
+                    return archived, deleted
+                # Written (and closed) before the delete commits, so a failed
+                # delete can only duplicate archive lines, never lose rows
+                self._append_to_archive(archive_dir, [archive_record(s) for s in batch])
+                archived += len(batch)
+                deleted += repo.delete_before(before, max_id=batch[-1].id)
+
+    def _append_to_archive(self, archive_dir: Path, records: List[Dict[str, Any]]):
+        """Append records to one gzip member per monthly partition file."""
+        partitions: Dict[str, List[str]] = {}
+        for record in records:
+            month = (record["timestamp"] or "unknown")[:7]
+            partitions.setdefault(month, []).append(json.dumps(record, default=str))
+
+        for month, lines in partitions.items():
+            path = archive_dir / f"signals-{month}.jsonl.gz"
+            with gzip.open(path, "at", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+
+    def vacuum(self) -> int:
+        """
+        Release free pages with PRAGMA incremental_vacuum.
+
+        Only effective when the database uses auto_vacuum=INCREMENTAL (new
+        databases do; see scripts/signal_retention.py for converting an
+        existing file).
+
+        Returns:
+            Pages released
+        """
+        with get_db() as db:
+            if db.execute(text("PRAGMA auto_vacuum")).scalar() != 2:
+                logger.debug("[Retention] auto_vacuum is not INCREMENTAL; skipping vacuum")
+                return 0
+            before = db.execute(text("PRAGMA freelist_count")).scalar() or 0
+            # executescript steps the pragma to completion; a plain execute
+            # only steps once and releases a single page
+            db.connection().connection.driver_connection.executescript(
+                f"PRAGMA incremental_vacuum({int(self.config['vacuum_pages'])})"
+            )
+            after = db.execute(text("PRAGMA freelist_count")).scalar() or 0
+        return max(before - after, 0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cumulative retention statistics."""
+        return {**self.stats, "policy": dict(self.config)}
+
+
+# Global singleton
+signal_retention = SignalRetention()
@@ -3,9 +3,10 @@ Strategy Manager - Orchestrates multiple trading strategies.
 Combines signals from different strategies with configurable weights.
 """
 
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Sequence, Mapping, Union
 import logging
-from collections import defaultdict
+
+import numpy as np
 
 from app.strategies.base_strategy import BaseStrategy
 from app.strategies.sentiment_strategy import SentimentStrategy
@@ -13,7 +14,16 @@ from app.strategies.technical_strategy import TechnicalStrategy
 from app.strategies.volume_strategy import VolumeStrategy
 from app.strategy_signal_logger import StrategySignalLogger
 from app.utils.symbol_normalizer import normalize_symbol
-from app.utils.symbol_normalizer import normalize_symbol
+from app.metrics.prometheus import STRATEGY_ERRORS, STRATEGY_SECONDS
+from app.metrics.tracing import stage, tracer
+
+
+# Signal codes used in the (symbols x strategies) aggregation arrays
+SIGNALS = ("BUY", "SELL", "HOLD")
+SIGNAL_CODES = {signal: code for code, signal in enumerate(SIGNALS)}
+BUY, SELL, HOLD = range(len(SIGNALS))
+
+AGGREGATION_METHODS = ("weighted_vote", "highest_confidence", "unanimous")
 
 
 class StrategyManager:
@@ -178,148 +188,8 @@ class StrategyManager:
             - reason: Detailed explanation
             - signal_id: Database ID of logged signal (or None)
         """
-        # Normalize symbol to canonical format (BTCUSD, ETHUSD, etc.)
-        try:
-            symbol = normalize_symbol(symbol)
-        except ValueError:
-            logging.warning(f"[StrategyManager] Unknown symbol format: {symbol}, using as-is")
-        if not self.strategies:
-            return "HOLD", 0.0, "No strategies available"
-
-        # Collect signals from all enabled strategies
-        strategy_results = []
-
-        for strategy in self.strategies:
-            if not strategy.enabled:
-                continue
-
-            try:
-                signal, confidence, reason = strategy.get_signal(symbol, context)
-                strategy_results.append(
-                    {
-                        "strategy": strategy.name,
-                        "signal": signal,
-                        "confidence": confidence,
-                        "reason": reason,
-                        "weight": strategy.weight,
-                    }
-                )
-                logging.info(
-                    f"[{strategy.name}] {symbol}: {signal} (conf: {confidence:.2f}) - {reason}"
-                )
-            except Exception as e:
-                logging.error(
-                    f"[{strategy.name}] Error getting signal for {symbol}: {e}"
-                )
-                continue
-
-        if not strategy_results:
-            return "HOLD", 0.0, "No strategies produced signals"
-
-        # Aggregate signals
-        if self.aggregation_method == "weighted_vote":
-            final_signal, final_confidence, final_reason = (
-                self._weighted_vote_aggregation(strategy_results)
-            )
-        elif self.aggregation_method == "highest_confidence":
-            final_signal, final_confidence, final_reason = (
-                self._highest_confidence_aggregation(strategy_results)
-            )
-        elif self.aggregation_method == "unanimous":
-            final_signal, final_confidence, final_reason = self._unanimous_aggregation(
-                strategy_results
-            )
-        else:
-            final_signal, final_confidence, final_reason = (
-                self._weighted_vote_aggregation(strategy_results)
-            )
-
-        logging.info(
-            f"[StrategyManager] Final signal for {symbol}: {final_signal} (conf: {final_confidence:.2f})"
-        )
-
-        # Log signal details for analysis (BEFORE confidence check)
-        current_price = context.get("price", 0.0)
-        signal_id = None
-        if current_price > 0 and strategy_results:
-            try:
-                # Convert strategy_results to the format expected by logger
-                strategy_details = {}
-                for result in strategy_results:
-                    strategy_details[result["strategy"]] = {
-                        "signal": result["signal"],
-                        "confidence": result["confidence"],
-                        "reason": result["reason"],
-                        "weight": result["weight"],
-                        "enabled": True,
-                    }
-
-                signal_id = self.signal_logger.log_decision(
-                    symbol=symbol,
-                    price=current_price,
-                    final_signal=final_signal,
-                    final_confidence=final_confidence,
-                    strategy_signals=strategy_details,
-                    aggregation_method=self.aggregation_method,
-                    metadata={
-                        "min_confidence": self.min_confidence,
-                        "num_strategies": len(strategy_results),
-                    },
-                )
-
-                # Emit SIGNAL_GENERATED event
-                try:
-                    import asyncio
-                    from app.events.event_bus import event_bus, EventType
-                    from datetime import datetime, timezone
-
-                    try:
-                        loop = asyncio.get_event_loop()
-                        if loop.is_running():
-                            asyncio.ensure_future(event_bus.emit(EventType.SIGNAL_GENERATED, {
-                                "signal_id": signal_id,
-                                "symbol": symbol,
-                                "signal": final_signal,
-                                "confidence": final_confidence,
-                                "price": current_price,
-                                "num_strategies": len(strategy_results),
-                                "timestamp": datetime.now(timezone.utc).isoformat()
-                            }))
-                        else:
-                            loop.run_until_complete(event_bus.emit(EventType.SIGNAL_GENERATED, {
-                                "signal_id": signal_id,
-                                "symbol": symbol,
-                                "signal": final_signal,
-                                "confidence": final_confidence,
-                                "price": current_price,
-                                "num_strategies": len(strategy_results),
-                                "timestamp": datetime.now(timezone.utc).isoformat()
-                            }))
-                    except RuntimeError:
-                        asyncio.run(event_bus.emit(EventType.SIGNAL_GENERATED, {
-                            "signal_id": signal_id,
-                            "symbol": symbol,
-                            "signal": final_signal,
-                            "confidence": final_confidence,
-                            "price": current_price,
-                            "num_strategies": len(strategy_results),
-                            "timestamp": datetime.now(timezone.utc).isoformat()
-                        }))
-                except Exception as emit_error:
-                    logging.error(f"[StrategyManager] Failed to emit SIGNAL_GENERATED event: {emit_error}")
-
-            except Exception as e:
-                # Never let logging errors crash trading
-                logging.warning(f"⚠️  Signal logging failed: {e}")
-
-        # Apply minimum confidence threshold
-        if final_confidence < self.min_confidence:
-            logging.info(
-                f"[StrategyManager] Confidence {final_confidence:.2f} below threshold {self.min_confidence}, converting to HOLD"
-            )
-            return "HOLD", final_confidence, f"Low confidence: {final_reason}", signal_id
-
-        return final_signal, final_confidence, final_reason, signal_id
+        result = self.get_signals([symbol], [context])[0]
+        return result["signal"], result["confidence"], result["reason"], result["signal_id"]
 
     def get_signal_with_telemetry(
         self, symbol: str, context: Dict[str, Any]
@@ -342,146 +212,274 @@ class StrategyManager:
                 - signal_id: Database ID of logged signal (or None)
                 - telemetry: Detailed breakdown dict
         """
-        from datetime import datetime
+        result = self.get_signals([symbol], [context], include_telemetry=True)[0]
+        return {
+            "final_signal": result["final_signal"],
+            "final_confidence": result["final_confidence"],
+            "final_reason": result["final_reason"],
+            "signal_id": result["signal_id"],
+            "telemetry": result["telemetry"]
+        }
 
-        # Normalize symbol
-        try:
-            symbol = normalize_symbol(symbol)
-        except ValueError:
-            logging.warning(f"[StrategyManager] Unknown symbol format: {symbol}, using as-is")
+    def get_signals(
+        self,
+        symbols: Sequence[str],
+        contexts: Union[Sequence[Dict[str, Any]], Mapping[str, Dict[str, Any]]],
+        include_telemetry: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Get aggregated signals for many symbols in one pass.
+
+        Strategy outputs are stacked into (symbols x strategies) arrays and
+        every aggregation method is computed with NumPy at once, so screening
+        a large watchlist or a backtest step costs one vectorized reduction
+        instead of a dict/list walk per symbol.
+
+        Args:
+            symbols: Trading pairs to evaluate
+            contexts: Context per symbol, either aligned with symbols or
+                keyed by symbol (same shape as get_signal's context)
+            include_telemetry: Build the telemetry breakdown for each symbol
+
+        Returns:
+            List aligned with symbols, each a dict with:
+                - symbol: Normalized symbol
+                - signal / confidence / reason: What get_signal() returns
+                  (min_confidence applied)
+                - final_signal / final_confidence / final_reason: Raw aggregate
+                - signal_id: Database ID of logged signal (or None)
+                - would_execute: Whether confidence meets min_confidence
+                - num_strategies: Strategies that produced a signal
+                - telemetry: Breakdown dict (only when include_telemetry)
+        """
+        if isinstance(contexts, Mapping):
+            contexts = [contexts.get(symbol, {}) for symbol in symbols]
+        if len(contexts) != len(symbols):
+            raise ValueError("symbols and contexts must have the same length")
+
+        symbols = [self._normalize(symbol) for symbol in symbols]
 
-        # Early exit if no strategies
         if not self.strategies:
-            return {
-                "final_signal": "HOLD",
-                "final_confidence": 0.0,
-                "final_reason": "No strategies available",
-                "signal_id": None,
-                "telemetry": {
-                    "strategy_votes": [],
-                    "aggregation": {},
-                    "execution": {"would_execute": False, "reason": "No strategies"},
-                    "context": {"symbol": symbol, "timestamp": datetime.now()},
-                    "attribution": {}
-                }
+            return [
+                self._empty_result(symbol, "No strategies available", "No strategies", include_telemetry)
+                for symbol in symbols
+            ]
+
+        with stage("strategies"):
+            batch_results = [
+                self._collect_strategy_results(symbol, context)
+                for symbol, context in zip(symbols, contexts)
+            ]
+            aggregated = self._aggregate_arrays(*self._stack_results(batch_results))
+
+        results = []
+        for row, (symbol, context, strategy_results) in enumerate(zip(symbols, contexts, batch_results)):
+            if not strategy_results:
+                results.append(self._empty_result(
+                    symbol, "No strategies produced signals", "No signals produced", include_telemetry
+                ))
+                continue
+
+            final_signal, final_confidence, final_reason = self._describe_aggregation(
+                self.aggregation_method, aggregated, row, strategy_results
+            )
+            logging.info(
+                f"[StrategyManager] Final signal for {symbol}: {final_signal} (conf: {final_confidence:.2f})"
+            )
+
+            telemetry = None
+            if include_telemetry:
+                telemetry = self._build_telemetry(
+                    symbol=symbol,
+                    context=context,
+                    strategy_results=strategy_results,
+                    final_signal=final_signal,
+                    final_confidence=final_confidence,
+                    final_reason=final_reason,
+                    aggregated=aggregated,
+                    row=row
+                )
+
+            # Log signal details for analysis (BEFORE confidence check)
+            with stage("logging"):
+                signal_id = self._log_decision(
+                    symbol, context, strategy_results, final_signal, final_confidence, telemetry
+                )
+
+            # Apply minimum confidence threshold
+            would_execute = final_confidence >= self.min_confidence
+            signal, reason = final_signal, final_reason
+            if not would_execute:
+                logging.info(
+                    f"[StrategyManager] Confidence {final_confidence:.2f} below threshold {self.min_confidence}, converting to HOLD"
+                )
+                signal, reason = "HOLD", f"Low confidence: {final_reason}"
+
+            result = {
+                "symbol": symbol,
+                "signal": signal,
+                "confidence": final_confidence,
+                "reason": reason,
+                "final_signal": final_signal,
+                "final_confidence": final_confidence,
+                "final_reason": final_reason,
+                "signal_id": signal_id,
+                "would_execute": would_execute,
+                "num_strategies": len(strategy_results),
             }
+            if include_telemetry:
+                result["telemetry"] = telemetry
+            results.append(result)
 
-        # Collect signals from all strategies
+        return results
+
+    def _normalize(self, symbol: str) -> str:
+        """Normalize symbol to canonical format (BTCUSD, ETHUSD, etc.)."""
+        try:
+            return normalize_symbol(symbol)
+        except ValueError:
+            logging.warning(f"[StrategyManager] Unknown symbol format: {symbol}, using as-is")
+            return symbol
+
+    def _collect_strategy_results(self, symbol: str, context: Dict[str, Any]) -> List[Dict]:
+        """Collect signals from all enabled strategies for one symbol."""
         strategy_results = []
+
         for strategy in self.strategies:
             if not strategy.enabled:
                 continue
 
             try:
-                signal, confidence, reason = strategy.get_signal(symbol, context)
-                strategy_results.append({
-                    "strategy": strategy.name,
-                    "signal": signal,
-                    "confidence": confidence,
-                    "reason": reason,
-                    "weight": strategy.weight,
-                })
+                with tracer.span(
+                    "strategy.get_signal", timer=STRATEGY_SECONDS.time(strategy=strategy.name), strategy=strategy.name
+                ):
+                    signal, confidence, reason = strategy.get_signal(symbol, context)
+                strategy_results.append(
+                    {
+                        "strategy": strategy.name,
+                        "signal": signal,
+                        "confidence": confidence,
+                        "reason": reason,
+                        "weight": strategy.weight,
+                    }
+                )
                 logging.info(
                     f"[{strategy.name}] {symbol}: {signal} (conf: {confidence:.2f}) - {reason}"
                 )
             except Exception as e:
+                STRATEGY_ERRORS.inc(strategy=strategy.name)
                 logging.error(
                     f"[{strategy.name}] Error getting signal for {symbol}: {e}"
                 )
                 continue
 
-        if not strategy_results:
-            return {
-                "final_signal": "HOLD",
-                "final_confidence": 0.0,
-                "final_reason": "No strategies produced signals",
-                "signal_id": None,
-                "telemetry": {
-                    "strategy_votes": [],
-                    "aggregation": {},
-                    "execution": {"would_execute": False, "reason": "No signals produced"},
-                    "context": {"symbol": symbol, "timestamp": datetime.now()},
-                    "attribution": {}
-                }
-            }
+        return strategy_results
 
-        # Aggregate signals
-        if self.aggregation_method == "weighted_vote":
-            final_signal, final_confidence, final_reason = (
-                self._weighted_vote_aggregation(strategy_results)
-            )
-        elif self.aggregation_method == "highest_confidence":
-            final_signal, final_confidence, final_reason = (
-                self._highest_confidence_aggregation(strategy_results)
-            )
-        elif self.aggregation_method == "unanimous":
-            final_signal, final_confidence, final_reason = self._unanimous_aggregation(
-                strategy_results
-            )
-        else:
-            final_signal, final_confidence, final_reason = (
-                self._weighted_vote_aggregation(strategy_results)
-            )
-
-        logging.info(
-            f"[StrategyManager] Final signal for {symbol}: {final_signal} (conf: {final_confidence:.2f})"
-        )
+    def _empty_result(
+        self, symbol: str, reason: str, execution_reason: str, include_telemetry: bool
+    ) -> Dict[str, Any]:
+        """Result for a symbol that no strategy could evaluate."""
+        from datetime import datetime
 
-        # Build telemetry
-        telemetry = self._build_telemetry(
-            symbol=symbol,
-            context=context,
-            strategy_results=strategy_results,
-            final_signal=final_signal,
-            final_confidence=final_confidence,
-            final_reason=final_reason
-        )
+        result = {
+            "symbol": symbol,
+            "signal": "HOLD",
+            "confidence": 0.0,
+            "reason": reason,
+            "final_signal": "HOLD",
+            "final_confidence": 0.0,
+            "final_reason": reason,
+            "signal_id": None,
+            "would_execute": False,
+            "num_strategies": 0,
+        }
+        if include_telemetry:
+            result["telemetry"] = {
+                "strategy_votes": [],
+                "aggregation": {},
+                "execution": {"would_execute": False, "reason": execution_reason},
+                "context": {"symbol": symbol, "timestamp": datetime.now()},
+                "attribution": {}
+            }
+        return result
 
-        # Log signal to database
+    def _log_decision(
+        self,
+        symbol: str,
+        context: Dict[str, Any],
+        strategy_results: List[Dict],
+        final_signal: str,
+        final_confidence: float,
+        telemetry: Optional[Dict[str, Any]] = None
+    ) -> Optional[int]:
+        """Persist the decision and emit SIGNAL_GENERATED once it is committed. Never raises."""
         current_price = context.get("price", 0.0)
-        signal_id = None
-        if current_price > 0 and strategy_results:
-            try:
-                strategy_details = {}
-                for result in strategy_results:
-                    strategy_details[result["strategy"]] = {
-                        "signal": result["signal"],
-                        "confidence": result["confidence"],
-                        "reason": result["reason"],
-                        "weight": result["weight"],
-                        "enabled": True,
-                    }
+        if current_price <= 0 or not strategy_results:
+            return None
 
-                signal_id = self.signal_logger.log_decision(
-                    symbol=symbol,
-                    price=current_price,
-                    final_signal=final_signal,
-                    final_confidence=final_confidence,
-                    strategy_signals=strategy_details,
-                    aggregation_method=self.aggregation_method,
-                    metadata={
-                        "min_confidence": self.min_confidence,
-                        "num_strategies": len(strategy_results),
-                        "telemetry": telemetry  # Store telemetry in metadata
-                    },
-                )
-            except Exception as e:
-                logging.warning(f"⚠️  Signal logging failed: {e}")
+        try:
+            # Convert strategy_results to the format expected by logger
+            strategy_details = {}
+            for result in strategy_results:
+                strategy_details[result["strategy"]] = {
+                    "signal": result["signal"],
+                    "confidence": result["confidence"],
+                    "reason": result["reason"],
+                    "weight": result["weight"],
+                    "enabled": True,
+                }
 
-        # Check if would execute
-        would_execute = final_confidence >= self.min_confidence
-        if not would_execute:
-            logging.info(
-                f"[StrategyManager] Confidence {final_confidence:.2f} below threshold {self.min_confidence}"
+            metadata = {
+                "min_confidence": self.min_confidence,
+                "num_strategies": len(strategy_results),
+            }
+            if telemetry is not None:
+                metadata["telemetry"] = telemetry  # Store telemetry in metadata
+
+            signal_id = self.signal_logger.log_decision(
+                symbol=symbol,
+                price=current_price,
+                final_signal=final_signal,
+                final_confidence=final_confidence,
+                strategy_signals=strategy_details,
+                aggregation_method=self.aggregation_method,
+                metadata=metadata,
+                # Emit only once the row is committed, so listeners (cache
+                # invalidation, SSE clients) never race the write-behind queue
+                on_persisted=lambda persisted_id: self._emit_signal_generated({
+                    "signal_id": persisted_id,
+                    "symbol": symbol,
+                    "signal": final_signal,
+                    "confidence": final_confidence,
+                    "price": current_price,
+                    "num_strategies": len(strategy_results),
+                }),
             )
+        except Exception as e:
+            # Never let logging errors crash trading
+            logging.warning(f"⚠️  Signal logging failed: {e}")
+            return None
 
-        return {
-            "final_signal": final_signal,
-            "final_confidence": final_confidence,
-            "final_reason": final_reason,
-            "signal_id": signal_id,
-            "telemetry": telemetry
-        }
+        return signal_id
+
+    def _emit_signal_generated(self, payload: Dict[str, Any]):
+        """Emit SIGNAL_GENERATED from sync code."""
+        try:
+            import asyncio
+            from app.events.event_bus import event_bus, EventType
+            from datetime import datetime, timezone
+
+            payload = {**payload, "timestamp": datetime.now(timezone.utc).isoformat()}
+            try:
+                loop = asyncio.get_event_loop()
+                if loop.is_running():
+                    asyncio.ensure_future(event_bus.emit(EventType.SIGNAL_GENERATED, payload))
+                else:
+                    loop.run_until_complete(event_bus.emit(EventType.SIGNAL_GENERATED, payload))
+            except RuntimeError:
+                asyncio.run(event_bus.emit(EventType.SIGNAL_GENERATED, payload))
+        except Exception as emit_error:
+            logging.error(f"[StrategyManager] Failed to emit SIGNAL_GENERATED event: {emit_error}")
 
     def _build_telemetry(
         self,
@@ -490,11 +488,17 @@ class StrategyManager:
         strategy_results: List[Dict],
         final_signal: str,
         final_confidence: float,
-        final_reason: str
+        final_reason: str,
+        aggregated: Optional[Dict[str, np.ndarray]] = None,
+        row: int = 0
     ) -> Dict[str, Any]:
-        """Build comprehensive telemetry data."""
+        """Build comprehensive telemetry data from the aggregation arrays."""
         from datetime import datetime
 
+        if aggregated is None:
+            aggregated = self._aggregate_arrays(*self._stack_results([strategy_results]))
+            row = 0
+
         # 1. Strategy votes
         strategy_votes = []
         for result in strategy_results:
@@ -508,17 +512,22 @@ class StrategyManager:
             })
 
         # 2. Aggregation breakdown
-        buy_score = sum(r["confidence"] * r["weight"] for r in strategy_results if r["signal"] == "BUY")
-        sell_score = sum(r["confidence"] * r["weight"] for r in strategy_results if r["signal"] == "SELL")
-        hold_score = sum(r["confidence"] * r["weight"] for r in strategy_results if r["signal"] == "HOLD")
-        total_weight = sum(r["weight"] for r in strategy_results)
+        scores = aggregated["scores"][row]
+        total_weight = float(aggregated["total_weight"][row])
 
         aggregation = {
             "method": self.aggregation_method,
-            "buy_score": float(buy_score),
-            "sell_score": float(sell_score),
-            "hold_score": float(hold_score),
-            "total_weight": float(total_weight)
+            "buy_score": float(scores[BUY]),
+            "sell_score": float(scores[SELL]),
+            "hold_score": float(scores[HOLD]),
+            "total_weight": total_weight,
+            "by_method": {
+                method: {
+                    "signal": SIGNALS[aggregated[method]["signal"][row]],
+                    "confidence": float(aggregated[method]["confidence"][row]),
+                }
+                for method in AGGREGATION_METHODS
+            }
         }
 
         # 3. Execution decision
@@ -545,14 +554,18 @@ class StrategyManager:
         }
 
         # 5. Strategy attribution
-        agreeing = [r["strategy"] for r in strategy_results if r["signal"] == final_signal]
-        disagreeing = [r["strategy"] for r in strategy_results if r["signal"] != final_signal]
+        n = len(strategy_results)
+        agrees = aggregated["codes"][row, :n] == SIGNAL_CODES.get(final_signal, HOLD)
+        weighted = aggregated["weighted"][row, :n]
+
+        agreeing = [r["strategy"] for r, agree in zip(strategy_results, agrees) if agree]
+        disagreeing = [r["strategy"] for r, agree in zip(strategy_results, agrees) if not agree]
 
         # Calculate contribution percentages
         contributions = {}
-        for result in strategy_results:
-            if result["signal"] == final_signal:
-                contribution_pct = (result["confidence"] * result["weight"] / total_weight * 100) if total_weight > 0 else 0.0
+        for result, agree, score in zip(strategy_results, agrees, weighted):
+            if agree:
+                contribution_pct = (score / total_weight * 100) if total_weight > 0 else 0.0
                 contributions[result["strategy"]] = float(contribution_pct)
 
         attribution = {
@@ -569,58 +582,142 @@ class StrategyManager:
             "attribution": attribution
         }
 
+    @staticmethod
+    def _stack_results(
+        batch_results: List[List[Dict]]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Stack per-symbol strategy results into (symbols x strategies) arrays.
+
+        Rows are left-aligned in result order; empty slots get code -1.
+        Signals other than BUY/SELL are counted as HOLD.
+
+        Returns:
+            Tuple of (codes int8, confidence float64, weight float64)
+        """
+        n_symbols = len(batch_results)
+        n_strategies = max([len(results) for results in batch_results] + [1])
+
+        codes = np.full((n_symbols, n_strategies), -1, dtype=np.int8)
+        confidence = np.zeros((n_symbols, n_strategies))
+        weight = np.zeros((n_symbols, n_strategies))
+
+        for i, results in enumerate(batch_results):
+            for j, result in enumerate(results):
+                codes[i, j] = SIGNAL_CODES.get(result["signal"], HOLD)
+                confidence[i, j] = result["confidence"]
+                weight[i, j] = result["weight"]
+
+        return codes, confidence, weight
+
+    @staticmethod
+    def _aggregate_arrays(
+        codes: np.ndarray, confidence: np.ndarray, weight: np.ndarray
+    ) -> Dict[str, Any]:
+        """
+        Compute every aggregation method for all rows at once.
+
+        Returns:
+            Dict of arrays: per-row scores/weights plus one
+            {"signal", "confidence"} entry per aggregation method
+        """
+        n_symbols, n_strategies = codes.shape
+        rows = np.arange(n_symbols)
+        valid = codes >= 0
+        has_signals = valid.any(axis=1)
+
+        weighted = np.where(valid, confidence * weight, 0.0)
+        one_hot = codes[:, :, None] == np.arange(len(SIGNALS))  # symbols x strategies x signals
+        present = one_hot.any(axis=1)
+        scores = (weighted[:, :, None] * one_hot).sum(axis=1)
+        total_weight = np.where(valid, weight, 0.0).sum(axis=1)
+        actionable_weight = np.where(valid & (codes != HOLD), weight, 0.0).sum(axis=1)
+
+        # Weighted vote: highest score wins, ties go to the signal seen first.
+        # HOLD signals don't dilute BUY/SELL confidence.
+        first_seen = np.where(present, one_hot.argmax(axis=1), n_strategies)
+        ranked = np.where(present, scores, -np.inf)
+        tied = present & (ranked == ranked.max(axis=1, keepdims=True))
+        wv_signal = np.where(has_signals, np.where(tied, first_seen, n_strategies + 1).argmin(axis=1), HOLD)
+        raw_score = scores[rows, wv_signal]
+        divisor = np.where((wv_signal != HOLD) & (actionable_weight > 0), actionable_weight, total_weight)
+        wv_confidence = np.where(
+            divisor > 0, np.minimum(raw_score / np.where(divisor > 0, divisor, 1.0), 1.0), 0.0
+        )
+
+        # Highest confidence: first strategy with the best confidence * weight
+        best_index = np.where(valid, confidence * weight, -np.inf).argmax(axis=1)
+        hc_signal = np.where(has_signals, codes[rows, best_index], HOLD)
+        hc_confidence = np.where(has_signals, confidence[rows, best_index], 0.0)
+
+        # Unanimous: average confidence if all agree, otherwise HOLD at 0.3
+        counts = valid.sum(axis=1)
+        agree = has_signals & ((codes == codes[:, :1]) | ~valid).all(axis=1)
+        un_signal = np.where(agree, codes[:, 0], HOLD)
+        un_confidence = np.where(
+            agree,
+            np.where(valid, confidence, 0.0).sum(axis=1) / np.maximum(counts, 1),
+            np.where(has_signals, 0.3, 0.0)
+        )
+
+        return {
+            "codes": codes,
+            "weighted": weighted,
+            "scores": scores,
+            "total_weight": total_weight,
+            "best_index": best_index,
+            "unanimous_agree": agree,
+            "weighted_vote": {"signal": wv_signal, "confidence": wv_confidence},
+            "highest_confidence": {"signal": hc_signal, "confidence": hc_confidence},
+            "unanimous": {"signal": un_signal, "confidence": un_confidence},
+        }
+
+    def _describe_aggregation(
+        self, method: str, aggregated: Dict[str, Any], row: int, results: List[Dict]
+    ) -> Tuple[str, float, str]:
+        """Read one row of the aggregation arrays back as (signal, confidence, reason)."""
+        if method not in AGGREGATION_METHODS:
+            method = "weighted_vote"
+
+        code = int(aggregated[method]["signal"][row])
+        signal = SIGNALS[code]
+        confidence = float(aggregated[method]["confidence"][row])
+
+        if method == "highest_confidence":
+            best_result = results[aggregated["best_index"][row]]
+            reason = f"Highest confidence from {best_result['strategy']}: {best_result['reason']}"
+        elif method == "unanimous":
+            if aggregated["unanimous_agree"][row]:
+                all_reasons = [f"{r['strategy']}: {r['reason']}" for r in results]
+                reason = "All strategies agree: " + "; ".join(all_reasons[:2])
+            else:
+                reason = f"Strategies disagree: {', '.join(r['signal'] for r in results)}"
+        else:
+            supporting = [
+                f"{r['strategy']}: {r['reason']}"
+                for r, result_code in zip(results, aggregated["codes"][row])
+                if result_code == code
+            ]
+            reason = (
+                f"{signal} signal from {len(supporting)} strategies: "
+                + "; ".join(supporting[:2])
+            )
+
+        return signal, confidence, reason
+
+    def _aggregate_single(self, results: List[Dict], method: str) -> Tuple[str, float, str]:
+        aggregated = self._aggregate_arrays(*self._stack_results([results]))
+        return self._describe_aggregation(method, aggregated, 0, results)
+
     def _weighted_vote_aggregation(self, results: List[Dict]) -> Tuple[str, float, str]:
         """
         Aggregate signals using weighted voting.
         HOLD signals don't dilute BUY/SELL confidence.
         """
-        scores = defaultdict(float)
-        reasons_by_signal = defaultdict(list)
-        actionable_weight = 0  # Weight of BUY/SELL signals
-        hold_weight = 0  # Weight of HOLD signals
-        
-        for result in results:
-            signal = result["signal"]
-            confidence = result["confidence"]
-            weight = result["weight"]
-            weighted_score = confidence * weight
-            
-            scores[signal] += weighted_score
-            reasons_by_signal[signal].append(
-                f"{result['strategy']}: {result['reason']}"
-            )
-            
-            # Track weights separately
-            if signal in ["BUY", "SELL"]:
-                actionable_weight += weight
-            else:
-                hold_weight += weight
-        
-        # Find winning signal
-        if not scores:
+        if not results:
             return "HOLD", 0.0, "No valid signals"
-        
-        winning_signal = max(scores.items(), key=lambda x: x[1])
-        signal = winning_signal[0]
-        raw_score = winning_signal[1]
-        
-        # Calculate confidence based on signal type
-        if signal in ["BUY", "SELL"] and actionable_weight > 0:
-            # For actionable signals, only divide by actionable weight
-            confidence = min(raw_score / actionable_weight, 1.0)
-        elif actionable_weight + hold_weight > 0:
-            # For HOLD, use total weight
-            confidence = min(raw_score / (actionable_weight + hold_weight), 1.0)
-        else:
-            confidence = 0.0
-        
-        # Build reason
-        reason = (
-            f"{signal} signal from {len(reasons_by_signal[signal])} strategies: "
-            + "; ".join(reasons_by_signal[signal][:2])
-        )
-        
-        return signal, confidence, reason
+        return self._aggregate_single(results, "weighted_vote")
+
     def _highest_confidence_aggregation(
         self, results: List[Dict]
     ) -> Tuple[str, float, str]:
@@ -630,14 +727,7 @@ class StrategyManager:
         """
         if not results:
             return "HOLD", 0.0, "No signals"
-
-        best_result = max(results, key=lambda x: x["confidence"] * x["weight"])
-
-        return (
-            best_result["signal"],
-            best_result["confidence"],
-            f"Highest confidence from {best_result['strategy']}: {best_result['reason']}",
-        )
+        return self._aggregate_single(results, "highest_confidence")
 
     def _unanimous_aggregation(self, results: List[Dict]) -> Tuple[str, float, str]:
         """
@@ -646,19 +736,7 @@ class StrategyManager:
         """
         if not results:
             return "HOLD", 0.0, "No signals"
-
-        signals = [r["signal"] for r in results]
-
-        # Check if all signals are the same
-        if len(set(signals)) == 1:
-            # All agree
-            avg_confidence = sum(r["confidence"] for r in results) / len(results)
-            all_reasons = [f"{r['strategy']}: {r['reason']}" for r in results]
-            reason = "All strategies agree: " + "; ".join(all_reasons[:2])
-            return signals[0], avg_confidence, reason
-        else:
-            # Disagreement - default to HOLD
-            return "HOLD", 0.3, f"Strategies disagree: {', '.join(signals)}"
+        return self._aggregate_single(results, "unanimous")
 
     def get_strategy_summary(self) -> Dict[str, Any]:
         """Get summary of all strategies and their status."""
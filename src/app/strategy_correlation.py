@@ -0,0 +1,183 @@
+"""
+Pairwise strategy agreement and Cohen's kappa.
+
+Votes are encoded once as a (signals x strategies) int8 matrix (0 = no vote,
+1/2/3 = BUY/SELL/HOLD); overlap, agreement and chance agreement for every
+strategy pair then come from a handful of matrix products instead of
+rescanning signals per pair. Results are cached per filter set until a new
+signal is persisted.
+"""
+
+import time
+import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func
+
+from app.database.connection import get_read_db
+from app.database.models import Signal
+from app.database.repositories import StrategyVoteRepository
+
+logger = logging.getLogger(__name__)
+
+VOTE_CODES = {"BUY": 1, "SELL": 2, "HOLD": 3}
+
+
+def encode_votes(votes: Iterable[Tuple[int, str, str]]) -> Tuple[List[str], np.ndarray]:
+    """
+    Encode (signal_id, strategy, signal) rows as a vote matrix.
+
+    Returns:
+        (sorted strategy names, int8 matrix of shape signals x strategies)
+    """
+    votes = list(votes)
+    if not votes:
+        return [], np.zeros((0, 0), dtype=np.int8)
+
+    signal_ids, strategies, signals = zip(*votes)
+    _, rows = np.unique(np.asarray(signal_ids), return_inverse=True)
+    names, cols = np.unique(np.asarray(strategies, dtype=str), return_inverse=True)
+
+    matrix = np.zeros((rows.max() + 1, len(names)), dtype=np.int8)
+    matrix[rows, cols] = [VOTE_CODES.get(signal, VOTE_CODES["HOLD"]) for signal in signals]
+    return names.tolist(), matrix
+
+
+def pairwise_agreement(matrix: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Agreement statistics for every pair of columns.
+
+    Args:
+        matrix: Vote matrix from encode_votes()
+
+    Returns:
+        Strategy x strategy arrays:
+        - overlap: signals both strategies voted on
+        - agreement: share of those where the votes match
+        - kappa: Cohen's kappa (agreement corrected for chance)
+    """
+    present = (matrix > 0).astype(np.float64)
+    overlap = present.T @ present
+
+    agree = np.zeros_like(overlap)
+    expected = np.zeros_like(overlap)
+    for code in VOTE_CODES.values():
+        onehot = (matrix == code).astype(np.float64)
+        agree += onehot.T @ onehot
+        # [a, b] = signals where a voted `code` and b voted at all
+        marginal = onehot.T @ present
+        expected += marginal * marginal.T
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        observed = np.where(overlap > 0, agree / overlap, 0.0)
+        chance = np.where(overlap > 0, expected / overlap ** 2, 0.0)
+        kappa = np.where(
+            chance < 1.0,
+            (observed - chance) / (1.0 - chance),
+            # Both strategies always cast the same single vote
+            np.where(observed == 1.0, 1.0, 0.0)
+        )
+    kappa[overlap == 0] = 0.0
+
+    return {"overlap": overlap.astype(np.int64), "agreement": observed, "kappa": kappa}
+
+
+class StrategyCorrelation:
+    """Cached strategy agreement/kappa matrices over recent signals."""
+
+    def __init__(self, max_entries: int = 32, ttl: float = 300.0):
+        """
+        Args:
+            max_entries: Filter combinations kept
+            ttl: Seconds before a result is recomputed even without new
+                signals (the lookback window slides)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.lock = Lock()
+        self._entries: "OrderedDict[tuple, Tuple[Any, float, Dict[str, Any]]]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def get(
+        self,
+        lookback_days: float = 7,
+        symbol: Optional[str] = None,
+        limit: int = 1000,
+        test_mode: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Agreement and kappa between all strategies.
+
+        Args:
+            lookback_days: Only signals from the last N days
+            symbol: Only signals for this symbol
+            limit: At most this many (latest) signals
+            test_mode: Test or production signals
+
+        Returns:
+            Dict with strategies, signals (sample size) and nested
+            agreement / kappa / overlap dicts keyed strategy -> strategy
+        """
+        key = (lookback_days, symbol, limit, test_mode)
+        since = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=lookback_days)
+
+        with get_read_db() as db:
+            version = db.query(func.max(Signal.id)).scalar()
+            with self.lock:
+                entry = self._entries.get(key)
+                if entry and entry[0] == version and entry[1] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return entry[2]
+                self.stats["misses"] += 1
+
+            votes = StrategyVoteRepository(db).get_votes(since, test_mode=test_mode, symbol=symbol, limit=limit)
+
+        result = self._compute(votes)
+        with self.lock:
+            self._entries[key] = (version, time.monotonic() + self.ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def _compute(self, votes: List[Tuple[int, str, str]]) -> Dict[str, Any]:
+        names, matrix = encode_votes(votes)
+        stats = pairwise_agreement(matrix)
+
+        def nested(values: np.ndarray, digits: Optional[int] = 4) -> Dict[str, Dict[str, Any]]:
+            return {
+                name1: {
+                    name2: (round(float(values[i, j]), digits) if digits is not None else int(values[i, j]))
+                    for j, name2 in enumerate(names)
+                }
+                for i, name1 in enumerate(names)
+            }
+
+        agreement = nested(stats["agreement"])
+        for name in names:
+            agreement[name][name] = 1.0
+
+        return {
+            "strategies": names,
+            "signals": int(matrix.shape[0]),
+            "agreement": agreement,
+            "kappa": nested(stats["kappa"]),
+            "overlap": nested(stats["overlap"], digits=None),
+        }
+
+    def clear(self):
+        with self.lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {**self.stats, "entries": len(self._entries)}
+
+
+# Global singleton
+strategy_correlation = StrategyCorrelation()
@@ -0,0 +1,152 @@
+"""
+Strategy signal rollups.
+
+Per-strategy, per-symbol aggregates (signal counts by type, confidence sum,
+agreement with the final decision) kept in hourly and daily buckets of the
+strategy_rollups table. Rollups are incremented in the same transaction that
+inserts the signal rows, so performance endpoints read a few hundred bucket
+rows instead of scanning raw signals and their JSON strategies column.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.database.connection import get_db, get_read_db
+from app.database.models import Signal
+from app.database.repositories import StrategyRollupRepository
+
+logger = logging.getLogger(__name__)
+
+GRANULARITIES = ("hour", "day")
+SIGNAL_COUNTERS = {"BUY": "buy_count", "SELL": "sell_count", "HOLD": "hold_count"}
+
+
+def bucket_start(ts: datetime, granularity: str) -> datetime:
+    """Truncate a (naive UTC) timestamp to the start of its bucket."""
+    ts = ts.replace(minute=0, second=0, microsecond=0)
+    return ts.replace(hour=0) if granularity == "day" else ts
+
+
+def rollup_deltas(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Aggregate signal rows into rollup increments.
+
+    Args:
+        rows: Signal column dicts (timestamp, symbol, final_signal,
+            strategies, test_mode), as passed to insert(Signal)
+
+    Returns:
+        One dict per (strategy, symbol, granularity, bucket, test_mode)
+        for StrategyRollupRepository.apply()
+    """
+    totals = defaultdict(lambda: dict.fromkeys(StrategyRollupRepository.COUNTERS, 0))
+
+    for row in rows:
+        timestamp = row.get("timestamp")
+        if timestamp is None:
+            continue
+        test_mode = bool(row.get("test_mode", False))
+
+        for strategy_name, strategy_data in (row.get("strategies") or {}).items():
+            if not isinstance(strategy_data, dict):
+                strategy_data = {}
+            signal_type = strategy_data.get("signal", "HOLD")
+            counter = SIGNAL_COUNTERS.get(signal_type, "hold_count")
+            confidence = float(strategy_data.get("confidence") or 0)
+            agreed = signal_type == row.get("final_signal")
+
+            for granularity in GRANULARITIES:
+                key = (strategy_name, row["symbol"], granularity, bucket_start(timestamp, granularity), test_mode)
+                bucket = totals[key]
+                bucket[counter] += 1
+                bucket["confidence_sum"] += confidence
+                bucket["agreement_count"] += int(agreed)
+
+    return [
+        dict(strategy_name=name, symbol=symbol, granularity=granularity,
+             bucket_start=start, test_mode=test_mode, **counters)
+        for (name, symbol, granularity, start, test_mode), counters in totals.items()
+    ]
+
+
+def get_strategy_totals(
+    lookback_days: float,
+    test_mode: bool = False,
+    strategy_name: Optional[str] = None,
+    symbol: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Summed rollups per strategy over the lookback window (hour resolution).
+
+    Returns:
+        Dict mapping strategy name to buy/sell/hold counts, total_signals,
+        confidence_sum and agreement_count (strategies with no signals omitted)
+    """
+    since = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=lookback_days)
+
+    with get_read_db() as db:
+        rows = StrategyRollupRepository(db).get_totals(
+            since, test_mode=test_mode, strategy_name=strategy_name, symbol=symbol
+        )
+
+    totals = {}
+    for name, buy, sell, hold, confidence_sum, agreements in rows:
+        total = (buy or 0) + (sell or 0) + (hold or 0)
+        if total:
+            totals[name] = {
+                "total_signals": total,
+                "buy_count": buy or 0,
+                "sell_count": sell or 0,
+                "hold_count": hold or 0,
+                "confidence_sum": confidence_sum or 0.0,
+                "agreement_count": agreements or 0,
+            }
+    return totals
+
+
+def rebuild_rollups(batch_size: int = 1000) -> int:
+    """
+    Recompute all rollups from the signals table.
+
+    Used to backfill signals written before rollups existed (or by code
+    paths that bypass StrategySignalLogger). Runs in one transaction.
+
+    Returns:
+        Number of signals rolled up
+    """
+    with get_db() as db:
+        repo = StrategyRollupRepository(db)
+        repo.delete_all()
+
+        query = db.query(
+            Signal.timestamp, Signal.symbol, Signal.final_signal, Signal.strategies, Signal.test_mode
+        ).execution_options(yield_per=batch_size)
+
+        count = 0
+        batch = []
+        for row in query:
+            batch.append(row._asdict())
+            if len(batch) >= batch_size:
+                repo.apply(rollup_deltas(batch))
+                count += len(batch)
+                batch = []
+        if batch:
+            repo.apply(rollup_deltas(batch))
+            count += len(batch)
+
+    logger.info(f"[StrategyRollups] Rebuilt rollups from {count} signals")
+    return count
+
+
+def ensure_rollups() -> int:
+    """Backfill rollups at startup when signals exist but rollups don't."""
+    try:
+        with get_db() as db:
+            if StrategyRollupRepository(db).count() or not db.query(Signal.id).first():
+                return 0
+        return rebuild_rollups()
+    except Exception as e:
+        logger.error(f"[StrategyRollups] Backfill failed: {e}")
+        return 0
@@ -10,25 +10,303 @@ This module provides atomic logging of all strategy signals for:
 
 import json
 import os
+import time
+import queue
+from collections import deque
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 from pathlib import Path
 from decimal import Decimal
 import threading
 
+from sqlalchemy import insert
+
 from app.database.connection import get_db
-from app.database.repositories import SignalRepository
+from app.database.models import Signal
+from app.database.repositories import (
+    SignalRepository, StrategyRollupRepository, StrategyVoteRepository, IdSequenceRepository,
+    SignalRetentionRepository
+)
+from app.strategy_rollups import rollup_deltas, get_strategy_totals
+from app.strategy_correlation import strategy_correlation
 
 logger = logging.getLogger(__name__)
 
+_STOP = object()
+_REFILL = object()
+
+
+class SignalWriter:
+    """
+    Write-behind queue for signal rows.
+
+    A background thread drains the queue and inserts signals as multi-row
+    INSERTs, flushing when batch_size rows are waiting or flush_interval
+    seconds after the oldest queued row. IDs are preallocated on enqueue
+    from blocks reserved in id_sequences (shared with
+    SignalRepository.create), so callers get a signal_id immediately and
+    no other insert can claim it; anything that references a signal by
+    FK (trades) should call confirm() before writing.
+
+    While the writer is not running, StrategySignalLogger writes
+    synchronously, exactly as before.
+    """
+
+    def __init__(self, batch_size: int = 100, flush_interval: float = 1.0, max_queue: int = 10000):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+
+        # Reserved ID blocks: current [_next_id, _block_end) plus one spare.
+        # Blocks are reserved on the writer thread so reservation never runs
+        # concurrently with a batch insert on the shared connection.
+        self._id_lock = threading.Lock()
+        self._id_ready = threading.Condition(self._id_lock)
+        self._next_id: Optional[int] = None
+        self._block_end: Optional[int] = None
+        self._spare_block: Optional[tuple] = None
+        # Recently dropped signal IDs, so confirm() can refuse them
+        self._dropped = deque(maxlen=1000)
+        # signal_id -> callback run after the row is committed
+        self._on_written: Dict[int, Callable[[int], None]] = {}
+        # Enqueues past the running check whose put hasn't returned yet
+        self._putting = 0
+        # Set when the spare block was used; the writer checks it after every
+        # item, so a full queue can't hold up (or block) the request
+        self._refill_requested = threading.Event()
+
+        self.running = False
+        self.thread: Optional[threading.Thread] = None
+        self.stats = {"enqueued": 0, "written": 0, "batches": 0, "failed": 0}
+
+    def start(self):
+        """Start the background writer thread."""
+        if self.running:
+            return
+
+        # Nothing else writes from this writer yet, so reserve inline
+        first = self._reserve_block()
+        spare = self._reserve_block()
+        with self._id_lock:
+            self._next_id, self._block_end = first
+            self._spare_block = spare
+
+        self.running = True
+        self.thread = threading.Thread(target=self._write_loop, name="signal-writer", daemon=True)
+        self.thread.start()
+        logger.info(f"[SignalWriter] Started (batch_size={self.batch_size}, flush_interval={self.flush_interval}s)")
+
+    def stop(self, timeout: float = 10.0):
+        """Flush everything queued and stop the writer thread."""
+        if not self.running:
+            return
+
+        # Rows queued before the stop marker are written before the thread exits:
+        # no enqueue starts once running is False, and those in flight finish
+        # their put (the writer keeps draining) before the marker goes in
+        with self._id_lock:
+            self.running = False
+            self._id_ready.wait_for(lambda: self._putting == 0, timeout)
+        self.queue.put(_STOP)
+        if self.thread:
+            self.thread.join(timeout)
+        logger.info(f"[SignalWriter] Stopped ({self.stats['written']} signals written)")
+
+    def enqueue(self, row: Dict[str, Any], on_written: Optional[Callable[[int], None]] = None) -> int:
+        """
+        Queue a signal row for insertion.
+
+        Args:
+            row: Column values as accepted by SignalRepository.create
+            on_written: Called with the signal ID on the writer thread once
+                the row is committed (not called if the row is dropped)
+
+        Returns:
+            The preallocated signal ID
+
+        Raises:
+            RuntimeError: If the writer is not running
+        """
+        with self._id_lock:
+            if not self.running:
+                raise RuntimeError("Signal writer is not running")
+            if self._next_id >= self._block_end:
+                self._take_spare_block()
+            signal_id = self._next_id
+            self._next_id += 1
+            self.stats["enqueued"] += 1
+            if on_written is not None:
+                self._on_written[signal_id] = on_written
+            self._putting += 1
+
+        # Put outside the lock: the writer takes _id_lock after every batch,
+        # so blocking on a full queue while holding it would deadlock
+        try:
+            self.queue.put({**row, "id": signal_id})
+        finally:
+            with self._id_lock:
+                self._putting -= 1
+                if not self._putting:
+                    self._id_ready.notify_all()
+
+        return signal_id
+
+    def _take_spare_block(self, timeout: float = 5.0):
+        """Switch to the spare ID block and ask the writer for a new one (caller holds _id_lock)."""
+        if self._spare_block is None:
+            self._request_refill()
+            if not self._id_ready.wait_for(lambda: self._spare_block is not None, timeout):
+                raise RuntimeError("Signal writer could not reserve IDs")
+        self._next_id, self._block_end = self._spare_block
+        self._spare_block = None
+        self._request_refill()
+
+    def _request_refill(self):
+        """Ask the writer for a new spare block without blocking on the queue."""
+        self._refill_requested.set()
+        try:
+            self.queue.put_nowait(_REFILL)  # Wake an idle writer
+        except queue.Full:
+            pass  # Writer is busy draining and sees the flag after its next item
+
+    def _reserve_block(self) -> tuple:
+        """Reserve the next batch_size IDs in the database."""
+        with get_db() as db:
+            first = IdSequenceRepository(db).reserve(Signal, self.batch_size)
+        return first, first + self.batch_size
+
+    def _refill_spare_block(self):
+        """Reserve a spare ID block if enqueue used the last one (writer thread)."""
+        with self._id_lock:
+            if self._spare_block is not None:
+                return
+        try:
+            block = self._reserve_block()
+        except Exception as e:
+            logger.error(f"[SignalWriter] Failed to reserve signal IDs: {e}")
+            return
+        with self._id_lock:
+            self._spare_block = block
+            self._id_ready.notify_all()
+
+    def confirm(self, signal_id: int, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Wait for a queued signal to be written.
+
+        Returns:
+            True if the signal is in the database, False if it was dropped
+            or is still queued after timeout
+        """
+        if not self.flush(timeout):
+            return False
+        return signal_id not in self._dropped
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Block until every row queued so far is written.
+
+        Returns:
+            True if the queue drained within timeout
+        """
+        if not self.running or not self.pending:
+            return True
+
+        done = threading.Event()
+        self.queue.put(done)
+        return done.wait(timeout)
+
+    @property
+    def pending(self) -> int:
+        """Rows queued but not yet written (or dropped)."""
+        return self.stats["enqueued"] - self.stats["written"] - self.stats["failed"]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get writer statistics."""
+        return {**self.stats, "running": self.running, "pending": self.pending}
+
+    def _write_loop(self):
+        batch: List[Dict[str, Any]] = []
+        waiters: List[threading.Event] = []
+        deadline = None
+
+        while True:
+            timeout = self.flush_interval if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, dict):
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            elif isinstance(item, threading.Event):
+                waiters.append(item)
+
+            stopping = item is _STOP
+            due = deadline is not None and time.monotonic() >= deadline
+            if batch and (len(batch) >= self.batch_size or due or waiters or stopping):
+                self._write_batch(batch)
+                batch = []
+                deadline = None
+
+            for waiter in waiters:
+                waiter.set()
+            waiters = []
+
+            if stopping:
+                return
+            if self._refill_requested.is_set():
+                self._refill_requested.clear()
+                self._refill_spare_block()
+
+    def _write_batch(self, batch: List[Dict[str, Any]]):
+        """Insert a batch (with its votes and rollups) in one transaction, falling back to row-by-row."""
+        try:
+            with get_db() as db:
+                db.execute(insert(Signal), batch)
+                StrategyVoteRepository(db).add_for_signals(batch)
+                StrategyRollupRepository(db).apply(rollup_deltas(batch))
+            self.stats["written"] += len(batch)
+            self.stats["batches"] += 1
+            self._notify_written(batch)
+        except Exception as e:
+            logger.error(f"[SignalWriter] Batch insert of {len(batch)} signals failed, retrying individually: {e}")
+            for row in batch:
+                try:
+                    with get_db() as db:
+                        db.execute(insert(Signal), [row])
+                        StrategyVoteRepository(db).add_for_signals([row])
+                        StrategyRollupRepository(db).apply(rollup_deltas([row]))
+                    self.stats["written"] += 1
+                    self._notify_written([row])
+                except Exception as row_error:
+                    self.stats["failed"] += 1
+                    self._dropped.append(row["id"])
+                    with self._id_lock:
+                        self._on_written.pop(row["id"], None)
+                    logger.error(f"[SignalWriter] Dropped signal {row['id']}: {row_error}")
+
+    def _notify_written(self, rows: List[Dict[str, Any]]):
+        """Run on_written callbacks for committed rows."""
+        with self._id_lock:
+            callbacks = [(row["id"], self._on_written.pop(row["id"], None)) for row in rows]
+        for signal_id, callback in callbacks:
+            if callback is None:
+                continue
+            try:
+                callback(signal_id)
+            except Exception as e:
+                logger.error(f"[SignalWriter] on_written callback failed for signal {signal_id}: {e}")
+
 
 class StrategySignalLogger:
     """
     Thread-safe logger for strategy signals with atomic writes.
     
     Design goals:
-    - Zero impact on trading performance (async writes)
+    - Zero impact on trading performance (async writes via signal_writer)
     - Complete audit trail
     - Easy querying for analysis
     - Data integrity guarantees
@@ -50,7 +328,8 @@ class StrategySignalLogger:
         final_confidence: float,
         strategy_signals: Dict[str, Dict[str, Any]],
         aggregation_method: str,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        on_persisted: Optional[Callable[[Optional[int]], None]] = None
     ) -> Optional[int]:
         """
         Log a complete trading decision with all strategy inputs.
@@ -72,6 +351,9 @@ class StrategySignalLogger:
                 }
             aggregation_method: How signals were combined
             metadata: Optional additional context (market conditions, etc.)
+            on_persisted: Called with the signal ID once the row is committed
+                (on the writer thread when write-behind is active; with None
+                when the database is disabled; never if the write fails)
 
         Returns:
             Database ID of the logged signal (or None if logging failed)
@@ -89,41 +371,64 @@ class StrategySignalLogger:
             "metadata": metadata or {}
         }
 
-        return self._append_record(record)
+        return self._append_record(record, on_persisted)
     
-    def _append_record(self, record: Dict[str, Any]) -> Optional[int]:
+    def _append_record(
+        self,
+        record: Dict[str, Any],
+        on_persisted: Optional[Callable[[Optional[int]], None]] = None
+    ) -> Optional[int]:
         """
         Write signal record to database.
 
+        Queued on the shared signal_writer when it is running, otherwise
+        written synchronously.
+
         Returns:
-            Database ID of the created signal (or None if database write failed)
+            Database ID of the signal (or None if database write failed)
         """
+        if not self.use_database:
+            if on_persisted is not None:
+                on_persisted(None)
+            return None
+
+        row = dict(
+            timestamp=datetime.fromisoformat(record['timestamp'].replace('Z', '+00:00')).replace(tzinfo=None),
+            symbol=record['symbol'],
+            price=Decimal(str(record['price'])),
+            final_signal=record['final_signal'],
+            final_confidence=Decimal(str(record['final_confidence'])),
+            aggregation_method=record['aggregation_method'],
+            strategies=record['strategies'],
+            test_mode=self.test_mode,
+            bot_version="1.0.0",
+            signal_metadata=record.get('metadata')
+        )
+
+        if signal_writer.running:
+            try:
+                return signal_writer.enqueue(row, on_written=on_persisted)
+            except Exception as e:
+                logger.error(f"Failed to queue signal, writing synchronously: {e}")
+
         with self._write_lock:
             # Write to database (primary and only storage)
             signal_id = None
-            if self.use_database:
-                try:
-                    with get_db() as db:
-                        repo = SignalRepository(db)
-                        signal_model = repo.create(
-                            timestamp=datetime.fromisoformat(record['timestamp'].replace('Z', '+00:00')).replace(tzinfo=None),
-                            symbol=record['symbol'],
-                            price=Decimal(str(record['price'])),
-                            final_signal=record['final_signal'],
-                            final_confidence=Decimal(str(record['final_confidence'])),
-                            aggregation_method=record['aggregation_method'],
-                            strategies=record['strategies'],
-                            test_mode=self.test_mode,
-                            bot_version="1.0.0",
-                            signal_metadata=record.get('metadata')
-                        )
-                        # Commit happens automatically in context manager
-                        signal_id = signal_model.id
-                except Exception as e:
-                    logger.error(f"Failed to write signal to database: {e}", exc_info=True)
+            try:
+                with get_db() as db:
+                    repo = SignalRepository(db)
+                    signal_model = repo.create(**row)
+                    StrategyRollupRepository(db).apply(rollup_deltas([row]))
+                    created_id = signal_model.id
+                # Committed by the context manager
+                signal_id = created_id
+            except Exception as e:
+                logger.error(f"Failed to write signal to database: {e}", exc_info=True)
+
+        if signal_id is not None and on_persisted is not None:
+            on_persisted(signal_id)
+        return signal_id
 
-            return signal_id
-    
     def get_recent_signals(
         self,
         limit: int = 100,
@@ -185,56 +490,24 @@ class StrategySignalLogger:
             
         Returns:
             Performance metrics including:
-            - total_signals: Number of non-HOLD signals
+            - total_signals: Number of signals (including HOLD)
             - signal_distribution: Count of BUY/SELL/HOLD
             - avg_confidence: Average confidence when signaling
             - agreement_rate: How often it agrees with final decision
         """
-        signals = self.get_recent_signals(limit=10000)
-        
-        # Filter by date
-        cutoff = datetime.now(timezone.utc) - timedelta(days=lookback_days)
-        cutoff_iso = cutoff.isoformat()
-        signals = [s for s in signals if s['timestamp'] >= cutoff_iso]
-        
-        if not signals:
+        if not self.use_database:
             return self._empty_performance_metrics()
-        
-        # Calculate metrics
-        strategy_signals = []
-        agreements = 0
-        signal_counts = {"BUY": 0, "SELL": 0, "HOLD": 0}
-        confidences = []
-        
-        for record in signals:
-            if strategy_name in record['strategies']:
-                strat = record['strategies'][strategy_name]
-                strategy_signals.append(strat)
-                
-                signal = strat['signal']
-                confidence = strat['confidence']
-                
-                signal_counts[signal] += 1
-                confidences.append(confidence)
-                
-                # Check if strategy agreed with final decision
-                if signal == record['final_signal']:
-                    agreements += 1
-        
-        total = len(strategy_signals)
-        if total == 0:
+
+        try:
+            totals = get_strategy_totals(lookback_days, test_mode=self.test_mode, strategy_name=strategy_name)
+        except Exception as e:
+            logger.error(f"Failed to read strategy rollups: {e}")
             return self._empty_performance_metrics()
-        
-        return {
-            "strategy_name": strategy_name,
-            "lookback_days": lookback_days,
-            "total_signals": total,
-            "signal_distribution": signal_counts,
-            "avg_confidence": sum(confidences) / len(confidences) if confidences else 0,
-            "agreement_rate": agreements / total if total > 0 else 0,
-            "action_signals": signal_counts["BUY"] + signal_counts["SELL"],
-            "action_rate": (signal_counts["BUY"] + signal_counts["SELL"]) / total if total > 0 else 0
-        }
+
+        if strategy_name not in totals:
+            return self._empty_performance_metrics()
+
+        return self._performance_metrics(strategy_name, lookback_days, totals[strategy_name])
     
     def get_all_strategies_performance(
         self,
@@ -246,72 +519,67 @@ class StrategySignalLogger:
         Returns:
             Dict mapping strategy name to performance metrics
         """
-        signals = self.get_recent_signals(limit=10000)
-        
-        if not signals:
+        if not self.use_database:
             return {}
-        
-        # Get unique strategy names
-        strategy_names = set()
-        for record in signals:
-            strategy_names.update(record['strategies'].keys())
-        
-        # Calculate performance for each
+
+        try:
+            totals = get_strategy_totals(lookback_days, test_mode=self.test_mode)
+        except Exception as e:
+            logger.error(f"Failed to read strategy rollups: {e}")
+            return {}
+
+        return {
+            name: self._performance_metrics(name, lookback_days, strategy_totals)
+            for name, strategy_totals in totals.items()
+        }
+
+    def _performance_metrics(
+        self,
+        strategy_name: str,
+        lookback_days: int,
+        totals: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Turn summed rollups into the performance metrics structure."""
+        total = totals["total_signals"]
+        action_signals = totals["buy_count"] + totals["sell_count"]
         return {
-            name: self.get_strategy_performance(name, lookback_days)
-            for name in strategy_names
+            "strategy_name": strategy_name,
+            "lookback_days": lookback_days,
+            "total_signals": total,
+            "signal_distribution": {
+                "BUY": totals["buy_count"],
+                "SELL": totals["sell_count"],
+                "HOLD": totals["hold_count"],
+            },
+            "avg_confidence": totals["confidence_sum"] / total,
+            "agreement_rate": totals["agreement_count"] / total,
+            "action_signals": action_signals,
+            "action_rate": action_signals / total
         }
     
-    def get_signal_correlation(self) -> Dict[str, Dict[str, float]]:
+    def get_signal_correlation(
+        self,
+        lookback_days: float = 7,
+        symbol: Optional[str] = None
+    ) -> Dict[str, Dict[str, float]]:
         """
         Calculate correlation between strategy signals.
-        
+
+        Args:
+            lookback_days: Only signals from the last N days
+            symbol: Optional filter by symbol
+
         Returns:
             Matrix of agreement rates between strategies
         """
-        signals = self.get_recent_signals(limit=1000)
-        
-        if not signals:
+        if not self.use_database:
+            return {}
+
+        try:
+            return strategy_correlation.get(lookback_days, symbol=symbol, test_mode=self.test_mode)["agreement"]
+        except Exception as e:
+            logger.error(f"Failed to compute strategy correlation: {e}")
             return {}
-        
-        # Get all strategy names
-        strategy_names = set()
-        for record in signals:
-            strategy_names.update(record['strategies'].keys())
-        
-        strategy_names = sorted(strategy_names)
-        
-        # Calculate pairwise agreement
-        correlations = {}
-        for name1 in strategy_names:
-            correlations[name1] = {}
-            for name2 in strategy_names:
-                if name1 == name2:
-                    correlations[name1][name2] = 1.0
-                else:
-                    agreement = self._calculate_agreement(signals, name1, name2)
-                    correlations[name1][name2] = agreement
-        
-        return correlations
-    
-    def _calculate_agreement(
-        self,
-        signals: List[Dict[str, Any]],
-        strategy1: str,
-        strategy2: str
-    ) -> float:
-        """Calculate how often two strategies give the same signal."""
-        agreements = 0
-        total = 0
-        
-        for record in signals:
-            strats = record['strategies']
-            if strategy1 in strats and strategy2 in strats:
-                if strats[strategy1]['signal'] == strats[strategy2]['signal']:
-                    agreements += 1
-                total += 1
-        
-        return agreements / total if total > 0 else 0.0
     
     def _empty_performance_metrics(self) -> Dict[str, Any]:
         """Return empty/zero metrics structure."""
@@ -324,12 +592,17 @@ class StrategySignalLogger:
             "action_rate": 0.0
         }
     
-    def clear_old_signals(self, days_to_keep: int = 30) -> int:
+    def clear_old_signals(self, days_to_keep: int = 30, batch_size: int = 1000) -> int:
         """
         Delete old signals from database.
 
+        Runs batched DELETE ... WHERE timestamp < cutoff statements; signals
+        referenced by trades are kept. Scheduled retention (downsampling and
+        archival) lives in app.signal_retention.
+
         Args:
             days_to_keep: Keep signals from last N days
+            batch_size: Rows deleted per transaction
 
         Returns:
             Number of records removed
@@ -337,23 +610,36 @@ class StrategySignalLogger:
         if not self.use_database:
             return 0
 
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days_to_keep)
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days_to_keep)).replace(tzinfo=None)
+        removed_count = 0
 
         with self._write_lock:
             try:
-                with get_db() as db:
-                    repo = SignalRepository(db)
-                    # Get all old signals
-                    all_signals = repo.get_all(test_mode=self.test_mode)
-                    removed_count = 0
-
-                    for signal in all_signals:
-                        if signal.timestamp and signal.timestamp < cutoff.replace(tzinfo=None):
-                            db.delete(signal)
-                            removed_count += 1
-
-                    db.commit()
-                    return removed_count
+                while True:
+                    with get_db() as db:
+                        deleted = SignalRetentionRepository(db).delete_before(
+                            cutoff, test_mode=self.test_mode, limit=batch_size
+                        )
+                    removed_count += deleted
+                    if deleted < batch_size:
+                        return removed_count
             except Exception as e:
                 logger.error(f"Failed to clear old signals from database: {e}")
-                return 0
\ No newline at end of file
+                return removed_count
+
+
+def backfill_strategy_votes() -> int:
+    """Migrate votes for signals written before strategy_votes existed."""
+    try:
+        with get_db() as db:
+            migrated = StrategyVoteRepository(db).backfill()
+        if migrated:
+            logger.info(f"[StrategyVotes] Migrated votes for {migrated} signals")
+        return migrated
+    except Exception as e:
+        logger.error(f"[StrategyVotes] Backfill failed: {e}")
+        return 0
+
+
+# Global write-behind queue shared by all StrategySignalLogger instances
+signal_writer = SignalWriter()
@@ -0,0 +1,64 @@
+"""
+Signal-to-trade time-window matching.
+
+Trades are grouped by (symbol, side) and sorted by time once; each signal then
+finds its trade with a bisect, so matching N signals against M trades costs
+O((N + M) log M) instead of N x M comparisons.
+
+A signal matches the earliest same-symbol, same-side trade executed at or
+after the signal and no more than window_minutes later.
+"""
+
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence, Tuple
+
+# (symbol, side, timestamp) with side upper-cased (BUY/SELL)
+Event = Tuple[str, str, datetime]
+
+
+def parse_timestamp(value) -> datetime:
+    """Parse an ISO timestamp (or pass a datetime through) as naive UTC."""
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    return value.replace(tzinfo=None) if value.tzinfo is not None else value
+
+
+def match_by_time(
+    signals: Sequence[Event],
+    trades: Sequence[Event],
+    window_minutes: float = 10
+) -> List[Optional[int]]:
+    """
+    Match signals to trades inside a time window.
+
+    Args:
+        signals: (symbol, side, timestamp) per signal
+        trades: (symbol, side, timestamp) per trade
+        window_minutes: Max minutes between signal and trade
+
+    Returns:
+        For each signal, the index into `trades` of its match (or None)
+    """
+    window = timedelta(minutes=window_minutes)
+
+    by_key = defaultdict(list)
+    for index, (symbol, side, timestamp) in enumerate(trades):
+        by_key[(symbol, side.upper())].append((timestamp, index))
+    for entries in by_key.values():
+        entries.sort()
+    times = {key: [timestamp for timestamp, _ in entries] for key, entries in by_key.items()}
+
+    matches: List[Optional[int]] = []
+    for symbol, side, timestamp in signals:
+        key = (symbol, side.upper())
+        candidates = times.get(key)
+        match = None
+        if candidates:
+            position = bisect_left(candidates, timestamp)
+            if position < len(candidates) and candidates[position] - timestamp <= window:
+                match = by_key[key][position][1]
+        matches.append(match)
+
+    return matches
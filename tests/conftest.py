@@ -88,8 +88,14 @@ def clean_database():
             # Use raw SQL to delete all test data
             db.execute(text("DELETE FROM error_logs"))
             db.execute(text("DELETE FROM holdings"))
+            db.execute(text("DELETE FROM current_positions"))
+            db.execute(text("DELETE FROM pnl_checkpoints"))
             db.execute(text("DELETE FROM trades"))
+            db.execute(text("DELETE FROM strategy_votes"))
+            db.execute(text("DELETE FROM id_sequences"))
             db.execute(text("DELETE FROM signals"))
+            db.execute(text("DELETE FROM strategy_rollups"))
+            db.execute(text("DELETE FROM signal_aggregates"))
             db.execute(text("DELETE FROM seen_news"))
             db.execute(text("DELETE FROM rss_feeds"))
             db.execute(text("DELETE FROM bot_status"))
@@ -102,6 +108,16 @@ def clean_database():
             db.execute(text("PRAGMA foreign_keys = ON"))
             db.commit()
 
+        # Drop in-memory positions/P&L and cached responses so they reload from the clean tables
+        from app.logic.position_book import position_book
+        from app.logic.pnl_ledger import pnl_ledger
+        from app.response_cache import response_cache
+        from app.strategy_correlation import strategy_correlation
+        position_book.reset()
+        pnl_ledger.reset()
+        response_cache.clear()
+        strategy_correlation.clear()
+
     # Cleanup before test
     cleanup()
 
@@ -0,0 +1,162 @@
+"""Tests for the async read repositories (same results as the sync layer)."""
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.database.async_repositories import (
+    AsyncSignalRepository, AsyncTradeRepository, AsyncHoldingRepository,
+    AsyncRSSFeedRepository, AsyncBotConfigRepository, AsyncHistoricalOHLCVRepository
+)
+from app.database.connection import get_db, get_read_db, get_async_read_db
+from app.database.models import HistoricalOHLCV
+from app.database.repositories import (
+    SignalRepository, TradeRepository, HoldingRepository, RSSFeedRepository,
+    BotConfigRepository, HistoricalOHLCVRepository
+)
+
+NOW = datetime.utcnow().replace(microsecond=0)
+OHLCV_SYMBOL = "ASYNC/USD"
+
+
+def _rows(models, *fields):
+    return [tuple(getattr(m, f) for f in fields) for m in models]
+
+
+def _read(calls):
+    """Run (async repository class, method, args, kwargs) calls in one async session."""
+    async def run():
+        async with get_async_read_db() as db:
+            return [await getattr(cls(db), method)(*args, **kwargs) for cls, method, args, kwargs in calls]
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def seeded():
+    with get_db() as db:
+        signals = SignalRepository(db)
+        ids = [
+            signals.create(
+                timestamp=NOW - timedelta(minutes=i), symbol=symbol, price=Decimal("100"),
+                final_signal=action, final_confidence=Decimal("0.6"),
+                aggregation_method="test", strategies={"technical": {"signal": action}},
+            ).id
+            for i, (symbol, action) in enumerate(
+                [("BTC/USD", "BUY"), ("ETH/USD", "HOLD"), ("BTC/USD", "SELL"), ("ETH/USD", "BUY")]
+            )
+        ]
+        TradeRepository(db).create(
+            timestamp=NOW, action="buy", symbol="BTC/USD", price=Decimal("100"), amount=Decimal("1"),
+            gross_value=Decimal("100"), fee=Decimal("0.26"), net_value=Decimal("100.26"), signal_id=ids[0],
+        )
+        HoldingRepository(db).create(
+            timestamp=NOW, symbol="BTC/USD", amount=Decimal("1"), avg_buy_price=Decimal("100"),
+        )
+        RSSFeedRepository(db).create(url="https://example.com/async.xml", name="Async", keywords=["btc"])
+        BotConfigRepository(db).create_or_update(mode="paper", min_confidence=Decimal("0.55"))
+        HistoricalOHLCVRepository(db).bulk_upsert([
+            dict(symbol=OHLCV_SYMBOL, timestamp=NOW - timedelta(minutes=5 * i), open=Decimal("1"),
+                 high=Decimal("2"), low=Decimal("0.5"), close=Decimal("1.5"), volume=Decimal("10"), interval="5m")
+            for i in range(3)
+        ])
+    yield ids
+    with get_db() as db:
+        db.query(HistoricalOHLCV).filter(HistoricalOHLCV.symbol == OHLCV_SYMBOL).delete()
+
+
+def test_signal_and_trade_reads_match_sync(seeded):
+    with get_read_db() as db:
+        signals, trades = SignalRepository(db), TradeRepository(db)
+        expected = [
+            _rows(signals.get_recent(), "id", "symbol", "final_signal"),
+            [(s.id, t.id if t else None) for s, t in signals.get_feed(limit=3)],
+            _rows(signals.get_non_hold_signals(), "id"),
+            signals.count_by_signal_type(),
+            _rows(trades.get_all(), "id", "signal_id", "net_value"),
+            trades.get_max_id(),
+            trades.count_total(),
+        ]
+
+    recent, feed, non_hold, counts, all_trades, max_id, total = _read([
+        (AsyncSignalRepository, "get_recent", (), {}),
+        (AsyncSignalRepository, "get_feed", (), {"limit": 3}),
+        (AsyncSignalRepository, "get_non_hold_signals", (), {}),
+        (AsyncSignalRepository, "count_by_signal_type", (), {}),
+        (AsyncTradeRepository, "get_all", (), {}),
+        (AsyncTradeRepository, "get_max_id", (), {}),
+        (AsyncTradeRepository, "count_total", (), {}),
+    ])
+
+    assert [
+        _rows(recent, "id", "symbol", "final_signal"),
+        [(s.id, t.id if t else None) for s, t in feed],
+        _rows(non_hold, "id"),
+        counts,
+        _rows(all_trades, "id", "signal_id", "net_value"),
+        max_id,
+        total,
+    ] == expected
+    assert feed[0][1].signal_id == seeded[0]
+
+
+def test_holding_feed_config_and_ohlcv_reads_match_sync(seeded):
+    with get_read_db() as db:
+        expected = [
+            _rows(HoldingRepository(db).get_current_holdings(), "symbol", "amount"),
+            _rows(RSSFeedRepository(db).get_all(enabled_only=True), "id", "url", "keywords"),
+            BotConfigRepository(db).get_config_dict(),
+            _rows(HistoricalOHLCVRepository(db).get_by_symbol(OHLCV_SYMBOL), "timestamp", "close"),
+            HistoricalOHLCVRepository(db).get_latest_timestamp(OHLCV_SYMBOL),
+        ]
+
+    holdings, feeds, config, candles, latest = _read([
+        (AsyncHoldingRepository, "get_current_holdings", (), {}),
+        (AsyncRSSFeedRepository, "get_all", (), {"enabled_only": True}),
+        (AsyncBotConfigRepository, "get_config_dict", (), {}),
+        (AsyncHistoricalOHLCVRepository, "get_by_symbol", (OHLCV_SYMBOL,), {}),
+        (AsyncHistoricalOHLCVRepository, "get_latest_timestamp", (OHLCV_SYMBOL,), {}),
+    ])
+
+    assert [
+        _rows(holdings, "symbol", "amount"),
+        _rows(feeds, "id", "url", "keywords"),
+        config,
+        _rows(candles, "timestamp", "close"),
+        latest,
+    ] == expected
+    assert config["min_confidence"] == 0.55
+    assert len(candles) == 3
+
+
+def test_async_sessions_are_read_only():
+    async def write():
+        async with get_async_read_db() as db:
+            await db.execute(text("DELETE FROM signals"))
+
+    with pytest.raises(OperationalError):
+        asyncio.run(write())
+
+
+def test_concurrent_async_reads(seeded):
+    async def read(_):
+        async with get_async_read_db() as db:
+            return await AsyncSignalRepository(db).count_by_signal_type()
+
+    async def run():
+        return await asyncio.gather(*(read(i) for i in range(20)))
+
+    results = asyncio.run(run())
+    assert all(r == results[0] for r in results)
+    assert sum(results[0].values()) == 4
+
+
+def test_trades_endpoint_reads_through_async_layer(seeded):
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    trades = TestClient(app).get("/api/trades/all").json()["trades"]
+
+    assert [t["signal_id"] for t in trades] == [seeded[0]]
@@ -0,0 +1,63 @@
+"""Tests for lazy startup (app.bootstrap components, deferred DB init and SDK imports)."""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.bootstrap import Components
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def test_components_are_built_once_on_first_use():
+    built = []
+    components = Components({"thing": lambda: built.append(1) or object()})
+
+    assert built == []
+    first = components.thing
+    assert components.get("thing") is first
+    assert built == [1]
+    assert "thing" in components.get_stats()["built"]
+
+
+def test_reset_and_set():
+    components = Components({"thing": object})
+    first = components.thing
+    components.reset()
+    assert components.thing is not first
+
+    stub = object()
+    components.set("thing", stub)
+    assert components.thing is stub
+
+
+def test_unknown_component():
+    components = Components({})
+    with pytest.raises(AttributeError):
+        components.missing
+    with pytest.raises(KeyError):
+        components.get("missing")
+
+
+def test_default_components_defer_heavy_sdks():
+    from app.bootstrap import components
+
+    assert set(components.get_stats()["registered"]) >= {"kraken", "sentiment", "trader", "notifier"}
+
+
+def test_importing_main_has_no_startup_side_effects():
+    probe = (
+        "import sys, json; import app.main; from app.database import connection; "
+        "print(json.dumps({'sdks': [m for m in ('openai', 'krakenex', 'feedparser') if m in sys.modules], "
+        "'db_initialized': connection._db_initialized}))"
+    )
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    env.pop("PYTEST_CURRENT_TEST", None)
+    result = subprocess.run(
+        [sys.executable, "-c", probe], cwd=SRC, env=env, capture_output=True, text=True, check=True
+    )
+
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == {"sdks": [], "db_initialized": False}
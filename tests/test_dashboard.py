@@ -80,6 +80,91 @@ class TestPartialRoute:
         assert "sentiment" in data
         assert "trades" in data
 
+class TestHoldingsRoute:
+    def test_holdings_use_fresh_collector_prices_then_one_batch(self, client, monkeypatch):
+        """Fresh collector quotes are used as-is; the rest come from one Ticker call."""
+        import time
+        import app.dashboard as dashboard_module
+        from unittest.mock import patch
+
+        dashboard_module.position_book.load([])
+        dashboard_module.position_book.apply("BTCUSD", {
+            "amount": 0.1, "avg_price": 40000.0, "current_price": 40000.0,
+            "unrealized_pnl": 0.0, "realized_pnl": 0.0,
+        })
+        dashboard_module.position_book.apply("ETHUSD", {
+            "amount": 1.0, "avg_price": 2000.0, "current_price": 2000.0,
+            "unrealized_pnl": 0.0, "realized_pnl": 0.0,
+        })
+        monkeypatch.setattr(
+            dashboard_module.data_collector, "latest_quotes",
+            {"BTCUSD": (50000.0, time.time() - 5)},
+        )
+
+        with patch("app.client.kraken.KrakenClient.get_prices", return_value={"ETHUSD": 3000.0}) as get_prices:
+            data = client.get("/api/holdings").json()
+
+        get_prices.assert_called_once()
+        assert get_prices.call_args[0][0] == ["ETHUSD"]
+
+        btc, eth = data["holdings"]["BTCUSD"], data["holdings"]["ETHUSD"]
+        assert btc["current_price"] == 50000.0
+        assert btc["price_source"] == "collector"
+        assert btc["price_age_seconds"] >= 5
+        assert eth["current_price"] == 3000.0
+        assert eth["price_source"] == "exchange"
+        assert data["summary"]["oldest_price_age_seconds"] >= 5
+
+    def test_cached_holdings_report_age_at_serve_time(self, client, monkeypatch):
+        """A cached holdings response recomputes price ages instead of freezing them."""
+        import time
+        import app.dashboard as dashboard_module
+        from unittest.mock import patch
+
+        dashboard_module.position_book.load([])
+        dashboard_module.position_book.apply("BTCUSD", {
+            "amount": 0.1, "avg_price": 40000.0, "current_price": 40000.0,
+            "unrealized_pnl": 0.0, "realized_pnl": 0.0,
+        })
+        now = time.time()
+        monkeypatch.setattr(
+            dashboard_module.data_collector, "latest_quotes", {"BTCUSD": (50000.0, now - 5)},
+        )
+
+        first = client.get("/api/holdings").json()
+        with patch("app.dashboard.time.time", return_value=now + 30), \
+                patch("app.dashboard._build_holdings", side_effect=AssertionError("not cached")):
+            second = client.get("/api/holdings").json()
+
+        assert first["holdings"]["BTCUSD"]["price_age_seconds"] < 30
+        assert second["holdings"]["BTCUSD"]["price_age_seconds"] >= 35
+        assert second["summary"]["oldest_price_age_seconds"] >= 35
+
+    def test_cached_holdings_revalidate_despite_changing_ages(self, client, monkeypatch):
+        """Serve-time price ages don't change the ETag, so If-None-Match still gets a 304."""
+        import time
+        import app.dashboard as dashboard_module
+        from unittest.mock import patch
+
+        dashboard_module.position_book.load([])
+        dashboard_module.position_book.apply("BTCUSD", {
+            "amount": 0.1, "avg_price": 40000.0, "current_price": 40000.0,
+            "unrealized_pnl": 0.0, "realized_pnl": 0.0,
+        })
+        now = time.time()
+        monkeypatch.setattr(
+            dashboard_module.data_collector, "latest_quotes", {"BTCUSD": (50000.0, now - 5)},
+        )
+
+        first = client.get("/api/holdings")
+        with patch("app.dashboard.time.time", return_value=now + 30), \
+                patch("app.dashboard._build_holdings", side_effect=AssertionError("not cached")):
+            second = client.get("/api/holdings", headers={"If-None-Match": first.headers["etag"]})
+
+        assert second.status_code == 304
+        assert second.headers["etag"] == first.headers["etag"]
+
+
 class TestStatusRoute:
     def test_status_returns_json(self, client, temp_logs_dir):
         """Test that /status returns JSON."""
@@ -49,7 +49,8 @@ def test_db():
 
     # Patch both locations where get_db is used
     with patch.object(db_connection, 'get_db', mock_get_db), \
-         patch('app.dashboard.get_db', mock_get_db):
+         patch('app.dashboard.get_db', mock_get_db), \
+         patch('app.dashboard.get_read_db', mock_get_db):
         yield shared_session
 
     # Clean up
@@ -181,3 +182,64 @@ class TestFeedsEndpoint:
             assert field in feed_data, f"Missing required field: {field}"
 
 
+
+
+class TestSignalFeedEndpoint:
+    """Test /api/signals/feed keyset pagination."""
+
+    def _seed(self, session, count=5):
+        from datetime import timedelta
+        repo = SignalRepository(session)
+        base = datetime.utcnow()
+        signals = [
+            repo.create(
+                timestamp=base - timedelta(minutes=i),
+                symbol="BTCUSD",
+                price=Decimal("50000.00"),
+                final_signal="BUY",
+                final_confidence=Decimal("0.8"),
+                aggregation_method="weighted_vote",
+                strategies={},
+                test_mode=False
+            )
+            for i in range(count)
+        ]
+        TradeRepository(session).create(
+            timestamp=base,
+            action="buy",
+            symbol="BTCUSD",
+            price=Decimal("50000.00"),
+            amount=Decimal("0.01"),
+            gross_value=Decimal("500.00"),
+            fee=Decimal("1.30"),
+            net_value=Decimal("501.30"),
+            signal_id=signals[1].id,
+            test_mode=False
+        )
+        session.commit()
+        return signals
+
+    def test_pages_through_history(self, test_db, client):
+        signals = self._seed(test_db)
+
+        first = client.get("/api/signals/feed?limit=2").json()
+        assert [s["id"] for s in first["signals"]] == [signals[0].id, signals[1].id]
+        assert first["signals"][1]["executed"] is True
+        assert first["signals"][1]["trade"]["action"] == "buy"
+        assert first["signals"][0]["executed"] is False
+
+        second = client.get(f"/api/signals/feed?limit=2&cursor={first['next_cursor']}").json()
+        third = client.get(f"/api/signals/feed?limit=2&cursor={second['next_cursor']}").json()
+        assert [s["id"] for s in second["signals"]] == [signals[2].id, signals[3].id]
+        assert [s["id"] for s in third["signals"]] == [signals[4].id]
+        assert third["next_cursor"] is None
+
+    def test_executed_filter(self, test_db, client):
+        signals = self._seed(test_db)
+
+        data = client.get("/api/signals/feed?executed=true").json()
+        assert [s["id"] for s in data["signals"]] == [signals[1].id]
+
+    def test_invalid_cursor(self, test_db, client):
+        response = client.get("/api/signals/feed?cursor=not-a-cursor")
+        assert response.status_code == 400
@@ -37,3 +37,21 @@ def test_get_price_history(mock_kraken):
     history = collector.get_price_history("BTCUSD")
     assert len(history) == 5
     assert history[-1] == 50400
+
+
+def test_get_fresh_prices(mock_kraken):
+    collector = DataCollector()
+    collector.client = mock_kraken
+    mock_kraken.get_tickers.return_value = {
+        "XXBTZUSD": {"price": 50000, "volume": 1000},
+        "XETHZUSD": {"price": 3000, "volume": 500},
+    }
+    collector._collect_snapshot()
+
+    fresh = collector.get_fresh_prices(["BTCUSD", "ETHUSD", "SOLUSD"], max_age=60)
+    assert set(fresh) == {"BTCUSD", "ETHUSD"}
+    assert fresh["BTCUSD"][0] == 50000
+
+    # Age the quotes past the limit
+    collector.latest_quotes = {s: (p, t - 120) for s, (p, t) in collector.latest_quotes.items()}
+    assert collector.get_fresh_prices(["BTCUSD"], max_age=60) == {}
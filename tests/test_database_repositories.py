@@ -130,6 +130,43 @@ class TestSignalRepository:
         assert len(test_signals) == 1
         assert test_signals[0].symbol == "ETHUSD"
 
+    def test_executed_feed_pages_from_trades(self, db_session):
+        """Executed feed returns each signal once, with its first trade, newest first."""
+        signal_repo = SignalRepository(db_session)
+        trade_repo = TradeRepository(db_session)
+        now = datetime.utcnow()
+
+        signals = [
+            signal_repo.create(
+                timestamp=now - timedelta(minutes=10 - i), symbol="BTCUSD", price=Decimal("50000.00"),
+                final_signal="BUY", final_confidence=Decimal("0.8"),
+                aggregation_method="weighted_vote", strategies={}, test_mode=False
+            )
+            for i in range(4)
+        ]
+        trade_ids = {}
+        for signal in (signals[0], signals[2], signals[2]):
+            trade = trade_repo.create(
+                timestamp=now, action="buy", symbol="BTCUSD", price=Decimal("50000"),
+                amount=Decimal("0.01"), gross_value=Decimal("500"), fee=Decimal("1"),
+                net_value=Decimal("501"), signal_id=signal.id, test_mode=False
+            )
+            trade_ids.setdefault(signal.id, trade.id)
+        db_session.commit()
+
+        feed = signal_repo.get_feed(executed=True)
+        assert [(s.id, t.id) for s, t in feed] == [
+            (signals[2].id, trade_ids[signals[2].id]),
+            (signals[0].id, trade_ids[signals[0].id]),
+        ]
+
+        newest = feed[0][0]
+        page = signal_repo.get_feed(executed=True, before=(newest.timestamp, newest.id))
+        assert [s.id for s, _ in page] == [signals[0].id]
+
+        unexecuted = signal_repo.get_feed(executed=False)
+        assert [s.id for s, t in unexecuted] == [signals[3].id, signals[1].id]
+
 
 class TestTradeRepository:
     """Test TradeRepository CRUD operations."""
@@ -376,3 +413,55 @@ class TestHoldingRepository:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestPerformanceRepository:
+    """Test signal-to-trade correlation."""
+
+    def _signal(self, db_session, minutes_ago, action="BUY", symbol="BTCUSD"):
+        return SignalRepository(db_session).create(
+            timestamp=datetime.utcnow() - timedelta(minutes=minutes_ago),
+            symbol=symbol,
+            price=Decimal("50000.00"),
+            final_signal=action,
+            final_confidence=Decimal("0.8"),
+            aggregation_method="weighted_vote",
+            strategies={"technical": {"signal": action, "confidence": 0.8}},
+        )
+
+    def _trade(self, db_session, minutes_ago, action="BUY", symbol="BTCUSD", signal_id=None):
+        return TradeRepository(db_session).create(
+            timestamp=datetime.utcnow() - timedelta(minutes=minutes_ago),
+            action=action,
+            symbol=symbol,
+            price=Decimal("50000.00"),
+            amount=Decimal("0.1"),
+            gross_value=Decimal("5000.00"),
+            fee=Decimal("13.00"),
+            net_value=Decimal("5013.00"),
+            signal_id=signal_id,
+        )
+
+    def test_correlate_by_signal_id_and_time_window(self, db_session):
+        linked = self._signal(db_session, 60)
+        windowed = self._signal(db_session, 30, action="SELL")
+        too_late = self._signal(db_session, 20)
+        self._signal(db_session, 10, action="HOLD")
+
+        linked_trade = self._trade(db_session, 5, signal_id=linked.id)
+        window_trade = self._trade(db_session, 25, action="SELL")
+        # Executed before the signal: never its trade
+        self._trade(db_session, 22)
+
+        correlations = PerformanceRepository(db_session).correlate_signals_to_trades(hours=2)
+        by_signal = {c["signal"].id: c for c in correlations}
+
+        assert len(correlations) == 3
+        assert [c["signal"].id for c in correlations] == [too_late.id, windowed.id, linked.id]
+        assert by_signal[linked.id]["trade"].id == linked_trade.id
+        assert by_signal[windowed.id]["trade"].id == window_trade.id
+        assert by_signal[too_late.id]["executed"] is False
+
+        stats = PerformanceRepository(db_session).get_strategy_performance(hours=2)
+        assert stats["technical"]["signals_generated"] == 3
+        assert stats["technical"]["signals_executed"] == 2
@@ -0,0 +1,127 @@
+"""Tests for the writer gate / read-only pool split in app.database.connection."""
+import threading
+import time
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.database.connection import get_db, get_read_db, get_pool_stats, WriteGate
+from app.database.models import Signal
+
+
+def _signal(symbol="BTC/USD"):
+    return Signal(
+        timestamp=datetime.utcnow(), symbol=symbol, price=Decimal("1"), final_signal="HOLD",
+        final_confidence=Decimal("0.5"), aggregation_method="test", strategies={}, test_mode=False,
+    )
+
+
+def test_read_sessions_are_read_only():
+    with pytest.raises(OperationalError):
+        with get_read_db() as db:
+            db.execute(text("DELETE FROM signals"))
+
+
+def test_reads_do_not_wait_for_an_open_write():
+    writing = threading.Event()
+    release = threading.Event()
+
+    def writer():
+        with get_db() as db:
+            db.add(_signal("P1/USD"))
+            db.flush()
+            writing.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        assert writing.wait(5)
+        started = time.monotonic()
+        with get_read_db() as db:
+            # Uncommitted row is invisible, and the read doesn't block
+            assert db.query(Signal).filter(Signal.symbol == "P1/USD").count() == 0
+        assert time.monotonic() - started < 1
+    finally:
+        release.set()
+        thread.join()
+
+    with get_read_db() as db:
+        assert db.query(Signal).filter(Signal.symbol == "P1/USD").count() == 1
+
+
+def test_concurrent_writers_are_serialized():
+    def write(i):
+        for _ in range(10):
+            with get_db() as db:
+                db.add(_signal(f"P2{i}/USD"))
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    with get_read_db() as db:
+        assert db.query(Signal).filter(Signal.symbol.like("P2%")).count() == 40
+
+
+def test_nested_sessions_on_one_thread_share_the_writer():
+    with get_db() as outer:
+        outer.add(_signal("P3/USD"))
+        with get_db() as inner:
+            inner.add(_signal("P3/USD"))
+
+    with get_read_db() as db:
+        assert db.query(Signal).filter(Signal.symbol == "P3/USD").count() == 2
+
+
+def test_write_gate_times_out():
+    gate = WriteGate(timeout=0.05)
+    held = threading.Event()
+    release = threading.Event()
+
+    def holder():
+        with gate.hold():
+            held.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=holder)
+    thread.start()
+    held.wait(5)
+    try:
+        with pytest.raises(TimeoutError):
+            with gate.hold():
+                pass
+    finally:
+        release.set()
+        thread.join()
+
+    stats = gate.get_stats()
+    assert stats["timeouts"] == 1
+    assert stats["acquired"] == 1
+
+
+def test_pool_stats():
+    with get_read_db() as db:
+        db.execute(text("SELECT 1"))
+        stats = get_pool_stats()
+
+    assert stats["mode"] == "split"
+    assert stats["reader"]["checked_out"] >= 1
+    assert {"acquired", "waiting", "wait_seconds_max"} <= set(stats["writer"])
+    assert stats["pragmas"]["busy_timeout_ms"] > 0
+
+
+def test_pool_metrics_endpoint():
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    data = TestClient(app).get("/api/metrics/db-pool").json()
+
+    assert data["status"] == "success"
+    assert data["reader"]["size"] >= 1
+    assert "writer" in data
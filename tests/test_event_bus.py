@@ -0,0 +1,134 @@
+"""Tests for the event bus: bounded queue subscribers, overflow policies, history."""
+import asyncio
+import threading
+
+import pytest
+
+from app.events import EventBus, EventType
+from app.metrics.prometheus import EVENT_BUS_DROPPED, metrics
+
+
+@pytest.fixture
+def bus():
+    return EventBus({"queue_size": 3, "history_size": 5})
+
+
+@pytest.fixture
+def global_metrics():
+    saved = dict(metrics.config)
+    metrics.update_config({"enabled": True})
+    metrics.reset()
+    yield metrics
+    metrics.update_config(saved)
+    metrics.reset()
+
+
+def _emit(bus, event_type, **data):
+    asyncio.run(bus.emit(event_type, data))
+
+
+def _drain(subscription):
+    events = []
+    while (event := subscription.get_nowait()) is not None:
+        events.append(event)
+    return events
+
+
+def test_queue_receives_only_subscribed_types(bus):
+    subscription = bus.subscribe_queue([EventType.TRADE_EXECUTED])
+
+    _emit(bus, EventType.TRADE_EXECUTED, n=1)
+    _emit(bus, EventType.SIGNAL_GENERATED, n=2)
+
+    assert [e["data"]["n"] for e in _drain(subscription)] == [1]
+    subscription.close()
+    _emit(bus, EventType.TRADE_EXECUTED, n=3)
+    assert subscription.get_nowait() is None
+    assert bus.get_stats()["queues"] == 0
+
+
+def test_drop_oldest_keeps_newest_events(bus, global_metrics):
+    subscription = bus.subscribe_queue(overflow="drop_oldest")
+
+    for n in range(5):
+        _emit(bus, EventType.SIGNAL_GENERATED, n=n)
+
+    assert [e["data"]["n"] for e in _drain(subscription)] == [2, 3, 4]
+    assert subscription.stats == {"delivered": 3, "dropped": 2, "coalesced": 0}
+    assert EVENT_BUS_DROPPED.value(reason="dropped") == 2
+
+
+def test_coalesce_replaces_queued_event_for_same_symbol(bus, global_metrics):
+    subscription = bus.subscribe_queue(overflow="coalesce")
+
+    _emit(bus, EventType.SIGNAL_GENERATED, symbol="BTC/USD", n=0)
+    _emit(bus, EventType.SIGNAL_GENERATED, symbol="ETH/USD", n=1)
+    _emit(bus, EventType.TRADE_EXECUTED, symbol="BTC/USD", n=2)
+    _emit(bus, EventType.SIGNAL_GENERATED, symbol="BTC/USD", n=3)  # supersedes n=0 in place
+    _emit(bus, EventType.BALANCE_UPDATED, n=4)  # nothing to coalesce: drops oldest
+
+    assert [e["data"]["n"] for e in _drain(subscription)] == [1, 2, 4]
+    assert subscription.stats["coalesced"] == 1
+    assert subscription.stats["dropped"] == 1
+    assert EVENT_BUS_DROPPED.value(reason="coalesced") == 1
+
+
+def test_slow_queue_does_not_block_emit_or_other_subscribers(bus):
+    slow = bus.subscribe_queue(maxsize=1)
+    fast = bus.subscribe_queue(maxsize=50)
+
+    for n in range(20):
+        _emit(bus, EventType.SIGNAL_GENERATED, n=n)
+
+    assert len(_drain(fast)) == 20
+    assert slow.depth == 1
+    assert slow.lag_seconds() >= 0
+    assert bus.get_stats()["dropped"] == 19
+
+
+def test_get_waits_for_event_emitted_from_another_thread(bus):
+    async def consume():
+        subscription = bus.subscribe_queue()
+        assert await subscription.get(timeout=0.01) is None  # heartbeat timeout
+
+        # Scheduler threads emit on their own event loop
+        threading.Timer(0.05, _emit, (bus, EventType.TRADE_EXECUTED), {"n": 1}).start()
+        event = await subscription.get(timeout=5)
+        subscription.close()
+        return event
+
+    event = asyncio.run(consume())
+    assert event["type"] == EventType.TRADE_EXECUTED
+    assert event["data"] == {"n": 1}
+
+
+def test_history_is_bounded_and_callbacks_still_run(bus):
+    received = []
+    bus.subscribe(EventType.CONFIG_CHANGED, received.append)
+
+    for n in range(8):
+        _emit(bus, EventType.CONFIG_CHANGED, n=n)
+
+    assert len(received) == 8
+    assert [e["data"]["n"] for e in bus.get_recent_events(limit=10)] == [3, 4, 5, 6, 7]
+    assert bus.subscriber_counts()["config_changed"] == 1
+
+
+def test_invalid_overflow_policy(bus):
+    with pytest.raises(ValueError):
+        bus.subscribe_queue(overflow="block")
+
+
+def test_event_bus_metrics_endpoint():
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.events import event_bus
+
+    subscription = event_bus.subscribe_queue(name="test", overflow="coalesce")
+    try:
+        body = TestClient(app).get("/api/metrics/event-bus").json()
+    finally:
+        subscription.close()
+
+    assert body["status"] == "success"
+    assert {"name": "test", "overflow": "coalesce"}.items() <= body["subscriptions"][-1].items()
@@ -0,0 +1,157 @@
+"""Tests for EventDrivenEvaluator."""
+import pytest
+from unittest.mock import Mock
+from app.event_evaluator import EventDrivenEvaluator
+from app.data_collector import DataCollector
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def evaluator(clock):
+    ev = EventDrivenEvaluator(
+        evaluate_fn=Mock(),
+        config={"debounce_seconds": 0, "cooldown_seconds": 60, "volume_lookback": 4},
+        clock=clock,
+    )
+    ev.watch(["BTCUSD"])
+    return ev
+
+
+def test_price_move_triggers_evaluation(evaluator):
+    evaluator.on_market_update({"XXBTZUSD": {"price": 50000, "volume": 100}})
+    evaluator.evaluate_fn.assert_not_called()
+
+    evaluator.on_market_update({"XXBTZUSD": {"price": 51000, "volume": 100}})
+
+    evaluator.evaluate_fn.assert_called_once()
+    symbol, reasons, headlines = evaluator.evaluate_fn.call_args[0]
+    assert symbol == "BTCUSD"
+    assert "price moved +2.00%" in reasons
+    assert headlines == []
+
+
+def test_small_move_does_not_trigger(evaluator):
+    evaluator.on_market_update({"BTCUSD": {"price": 50000, "volume": 100}})
+    evaluator.on_market_update({"BTCUSD": {"price": 50200, "volume": 100}})
+    evaluator.evaluate_fn.assert_not_called()
+
+
+def test_unwatched_symbol_ignored(evaluator):
+    evaluator.on_market_update({"ETHUSD": {"price": 3000, "volume": 100}})
+    evaluator.on_market_update({"ETHUSD": {"price": 3300, "volume": 100}})
+    evaluator.evaluate_fn.assert_not_called()
+
+
+def test_volume_spike_triggers(evaluator):
+    for _ in range(4):
+        evaluator.on_market_update({"BTCUSD": {"price": 50000, "volume": 100}})
+    evaluator.on_market_update({"BTCUSD": {"price": 50000, "volume": 300}})
+
+    evaluator.evaluate_fn.assert_called_once()
+    reasons = evaluator.evaluate_fn.call_args[0][1]
+    assert any("volume spike" in r for r in reasons)
+
+
+def test_cooldown_suppresses_repeat_triggers(evaluator, clock):
+    evaluator.on_market_update({"BTCUSD": {"price": 50000, "volume": 100}})
+    evaluator.on_market_update({"BTCUSD": {"price": 51000, "volume": 100}})
+    evaluator.on_market_update({"BTCUSD": {"price": 53000, "volume": 100}})
+    assert evaluator.evaluate_fn.call_count == 1
+    assert evaluator.get_stats()["suppressed"] == 1
+
+    clock.now += 61
+    evaluator.on_market_update({"BTCUSD": {"price": 55000, "volume": 100}})
+    assert evaluator.evaluate_fn.call_count == 2
+
+
+def test_mark_evaluated_resets_reference(evaluator, clock):
+    evaluator.on_market_update({"BTCUSD": {"price": 50000, "volume": 100}})
+    evaluator.mark_evaluated("BTC/USD", 51000)
+    clock.now += 61
+
+    evaluator.on_market_update({"BTCUSD": {"price": 51200, "volume": 100}})
+    evaluator.evaluate_fn.assert_not_called()
+
+
+def test_new_headlines_trigger_once(evaluator, clock):
+    headlines = {"BTCUSD": [{"title": "Bitcoin rallies", "url": "http://a", "feed_id": 1}]}
+
+    evaluator.on_headlines(headlines)
+    clock.now += 61
+    evaluator.on_headlines(headlines)
+
+    evaluator.evaluate_fn.assert_called_once()
+    assert evaluator.evaluate_fn.call_args[0][2] == headlines["BTCUSD"]
+
+
+def test_debounce_coalesces_triggers(clock):
+    ev = EventDrivenEvaluator(
+        evaluate_fn=Mock(), config={"debounce_seconds": 30}, clock=clock
+    )
+    ev.watch(["BTCUSD"])
+    ev.on_market_update({"BTCUSD": {"price": 50000, "volume": 100}})
+    ev.on_market_update({"BTCUSD": {"price": 51000, "volume": 100}})
+    ev.on_headlines({"BTCUSD": [{"title": "BTC news", "url": "http://b"}]})
+
+    assert ev.get_stats()["pending"] == ["BTCUSD"]
+    ev.evaluate_fn.assert_not_called()
+
+    ev._dispatch("BTCUSD")
+    ev.stop()
+
+    ev.evaluate_fn.assert_called_once()
+    _, reasons, headlines = ev.evaluate_fn.call_args[0]
+    assert len(reasons) == 2
+    assert len(headlines) == 1
+
+
+def test_collector_notifies_listeners():
+    collector = DataCollector()
+    collector.client = Mock()
+    collector.client.get_tickers.return_value = {
+        "XXBTZUSD": {"price": 50000, "volume": 1000},
+        "XXBTZEUR": {"price": 45000, "volume": 10},
+    }
+    listener = Mock()
+    collector.add_listener(listener)
+
+    collector._collect_snapshot()
+
+    listener.assert_called_once_with({"XXBTZUSD": {"price": 50000, "volume": 1000}})
+
+
+def test_seen_headline_urls_are_capped(clock):
+    ev = EventDrivenEvaluator(evaluate_fn=Mock(), config={"max_seen_headlines": 3}, clock=clock)
+    for i in range(5):
+        ev.on_headlines({"BTCUSD": [{"title": "BTC", "url": f"http://{i}"}]})
+
+    assert list(ev.seen_headline_urls) == ["http://2", "http://3", "http://4"]
+
+
+def test_headline_fetch_is_shared_until_marked_seen(monkeypatch):
+    from app import news_fetcher
+
+    fetch = Mock(return_value={"BTCUSD": [{"title": "BTC", "url": "http://a", "feed_id": 1}]})
+    monkeypatch.setattr(news_fetcher, "get_unseen_headlines", fetch)
+    news_fetcher.clear_shared_headlines()
+
+    news_fetcher.get_unseen_headlines_shared(max_age_seconds=60)
+    news_fetcher.get_unseen_headlines_shared(max_age_seconds=60)
+    assert fetch.call_count == 1
+
+    news_fetcher.mark_as_seen([])
+    news_fetcher.get_unseen_headlines_shared(max_age_seconds=60)
+    assert fetch.call_count == 2
+    news_fetcher.clear_shared_headlines()
@@ -23,7 +23,9 @@ def test_feed():
         )
         db.commit()
         db.refresh(feed)
-        yield feed
+        db.expunge(feed)
+    # Yield outside the session: holding the writer would block the app's request threads
+    yield feed
 
 
 class TestFeedEdit:
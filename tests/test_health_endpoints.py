@@ -484,4 +484,33 @@ class TestErrorLogging:
         client.post("/api/test/openai")
         
         # Should NOT have logged error
-        mock_error_tracker.log_error.assert_not_called()
\ No newline at end of file
+        mock_error_tracker.log_error.assert_not_called()
+
+class TestRSSFeedsHealthCheck:
+    """check_rss_feeds_health against real feed rows (fetch stats are written back)."""
+
+    def test_records_fetch_stats(self):
+        from types import SimpleNamespace
+        from app.dashboard import check_rss_feeds_health
+        from app.database.connection import get_db
+        from app.database.models import RSSFeed
+        from app.database.repositories import RSSFeedRepository
+
+        url = f"https://example.com/health-{datetime.now(timezone.utc).timestamp()}.xml"
+        with get_db() as db:
+            feed_id = RSSFeedRepository(db).create(url=url, name="Health test feed").id
+
+        parsed = SimpleNamespace(bozo=False, entries=[{"title": "a"}, {"title": "b"}])
+        try:
+            with patch("feedparser.parse", return_value=parsed):
+                result = check_rss_feeds_health()
+
+            assert result["status"] == "operational", result
+            with get_db() as db:
+                feed = db.get(RSSFeed, feed_id)
+                assert feed.total_items_fetched == 2
+                assert feed.last_fetch is not None
+                assert feed.last_error is None
+        finally:
+            with get_db() as db:
+                db.query(RSSFeed).filter(RSSFeed.id == feed_id).delete()
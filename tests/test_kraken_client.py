@@ -8,6 +8,8 @@ Tests cover:
 - Error handling for API failures
 """
 
+import time
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from app.client.kraken import KrakenClient
@@ -16,7 +18,7 @@ from app.client.kraken import KrakenClient
 @pytest.fixture
 def kraken_client():
     """Fixture providing a KrakenClient instance with mocked API."""
-    with patch('app.client.kraken.krakenex.API') as mock_api_class:
+    with patch('krakenex.API') as mock_api_class:
         client = KrakenClient()
         client.api = Mock()
         yield client
@@ -61,6 +63,75 @@ class TestGetPrice:
         assert price == 0.0
 
 
+class TestGetPrices:
+    def test_get_prices_single_batched_call(self, kraken_client):
+        """Several pairs are fetched in one Ticker query and keyed as requested."""
+        kraken_client.api.query_public.return_value = {
+            "result": {
+                "XXBTZUSD": {"c": ["50000.00", "1.5"]},
+                "XETHZUSD": {"c": ["3000.00", "2.0"]},
+            }
+        }
+
+        prices = kraken_client.get_prices(["BTCUSD", "ETHUSD"])
+        assert prices == {"BTCUSD": 50000.0, "ETHUSD": 3000.0}
+        kraken_client.api.query_public.assert_called_once_with(
+            "Ticker", {"pair": "BTCUSD,ETHUSD"}
+        )
+
+    def test_get_prices_omits_missing_pairs(self, kraken_client):
+        kraken_client.api.query_public.return_value = {
+            "result": {"XXBTZUSD": {"c": ["50000.00", "1.5"]}}
+        }
+
+        assert kraken_client.get_prices(["BTCUSD", "ETHUSD"]) == {"BTCUSD": 50000.0}
+
+    def test_get_prices_api_error(self, kraken_client):
+        kraken_client.api.query_public.side_effect = Exception("API error")
+
+        assert kraken_client.get_prices(["BTCUSD"]) == {}
+
+    def test_get_prices_empty(self, kraken_client):
+        assert kraken_client.get_prices([]) == {}
+        kraken_client.api.query_public.assert_not_called()
+
+    def test_get_prices_retries_without_unknown_pair(self, kraken_client):
+        """An EQuery error for the batch is retried per pair; the bad pair is then skipped."""
+        def ticker(method, params):
+            if params["pair"] == "BTCUSD":
+                return {"error": [], "result": {"XXBTZUSD": {"c": ["50000.00", "1.5"]}}}
+            return {"error": ["EQuery:Unknown asset pair"]}
+
+        kraken_client.api.query_public.side_effect = ticker
+
+        assert kraken_client.get_prices(["BTCUSD", "FOOUSD"]) == {"BTCUSD": 50000.0}
+        assert set(kraken_client.unknown_pairs) == {"FOOUSD"}
+
+        kraken_client.api.query_public.reset_mock()
+        assert kraken_client.get_prices(["BTCUSD", "FOOUSD"]) == {"BTCUSD": 50000.0}
+        kraken_client.api.query_public.assert_called_once_with("Ticker", {"pair": "BTCUSD"})
+
+    def test_get_prices_retries_unknown_pair_after_expiry(self, kraken_client):
+        """A skipped pair is queried again once its skip window has passed."""
+        from app.client import kraken
+
+        kraken_client.unknown_pairs["FOOUSD"] = time.monotonic() - kraken.UNKNOWN_PAIR_RETRY_SECONDS - 1
+        kraken_client.api.query_public.return_value = {
+            "error": [], "result": {"XXBTZUSD": {"c": ["50000.00", "1.5"]}}
+        }
+
+        kraken_client.get_prices(["BTCUSD", "FOOUSD"])
+
+        kraken_client.api.query_public.assert_called_once_with("Ticker", {"pair": "BTCUSD,FOOUSD"})
+        assert "FOOUSD" not in kraken_client.unknown_pairs
+
+    def test_get_prices_logs_errors(self, kraken_client, caplog):
+        kraken_client.api.query_public.return_value = {"error": ["EService:Unavailable"]}
+
+        assert kraken_client.get_prices(["BTCUSD"]) == {}
+        assert "EService:Unavailable" in caplog.text
+
+
 class TestGetBalance:
     def test_get_balance_success(self, kraken_client):
         """Test successful balance retrieval."""
@@ -0,0 +1,58 @@
+"""Tests for the event-loop lag monitor and blocking-work offload."""
+import asyncio
+import time
+
+from fastapi.concurrency import run_in_threadpool
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.metrics.loop_monitor import EventLoopLagMonitor
+
+
+def test_stats_over_window():
+    monitor = EventLoopLagMonitor(window=4, warn_ms=100)
+    for lag in (1.0, 2.0, 3.0, 150.0, 4.0):
+        monitor.record(lag)
+
+    stats = monitor.get_stats()
+    assert stats["samples"] == 4
+    assert stats["current_ms"] == 4.0
+    assert stats["max_ms"] == 150.0
+    assert stats["stalls"] == 1
+    assert stats["running"] is False
+
+
+def _lag_during(work):
+    async def scenario():
+        monitor = EventLoopLagMonitor(interval=0.01, warn_ms=50)
+        monitor.start()
+        await asyncio.sleep(0.02)
+        await work()
+        await asyncio.sleep(0.03)
+        await monitor.stop()
+        return monitor.get_stats()
+
+    return asyncio.run(scenario())
+
+
+def test_blocking_call_on_loop_is_detected():
+    async def blocking():
+        time.sleep(0.15)
+
+    assert _lag_during(blocking)["max_ms"] >= 100
+
+
+def test_offloaded_call_does_not_stall_loop():
+    async def offloaded():
+        await run_in_threadpool(time.sleep, 0.15)
+
+    assert _lag_during(offloaded)["stalls"] == 0
+
+
+def test_event_loop_metrics_endpoint():
+    response = TestClient(app).get("/api/metrics/event-loop")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert "p95_ms" in data["event_loop"]
+    assert data["threadpool"]["size"] > 0
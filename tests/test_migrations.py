@@ -0,0 +1,79 @@
+"""Tests for the schema migration runner."""
+import pytest
+from sqlalchemy import text
+
+from app.database.connection import get_db
+from app.database.migrations import Migration, MigrationRunner, MIGRATIONS
+
+NEW_INDEXES = {"idx_signal_test_timestamp_desc", "idx_trade_test_timestamp_desc", "idx_holding_symbol_test_timestamp"}
+OLD_INDEXES = {"idx_trade_test_timestamp", "idx_symbol_test"}
+
+
+def _indexes():
+    with get_db() as db:
+        return {row[0] for row in db.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))}
+
+
+@pytest.fixture
+def legacy_schema():
+    """Put the test database back to the pre-migration indexes."""
+    with get_db() as db:
+        for name in NEW_INDEXES:
+            db.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        db.execute(text("CREATE INDEX IF NOT EXISTS idx_trade_test_timestamp ON trades (test_mode, timestamp)"))
+        db.execute(text("CREATE INDEX IF NOT EXISTS idx_symbol_test ON holdings (symbol, test_mode)"))
+        db.execute(text("DELETE FROM schema_migrations"))
+    yield
+    MigrationRunner().apply_pending()
+
+
+def test_applies_pending_migrations_once(legacy_schema):
+    runner = MigrationRunner()
+    assert [m.version for m in runner.pending()] == [m.version for m in MIGRATIONS]
+
+    results = runner.apply_pending()
+
+    assert [r["version"] for r in results] == [1, 2, 3]
+    assert all(r["duration_seconds"] >= 0 for r in results)
+    indexes = _indexes()
+    assert NEW_INDEXES <= indexes
+    assert not OLD_INDEXES & indexes
+
+    stats = runner.get_stats()
+    assert [r["version"] for r in stats["recorded"]] == [1, 2, 3]
+    assert stats["pending"] == []
+    assert runner.apply_pending() == []
+
+
+def test_background_run(legacy_schema):
+    runner = MigrationRunner()
+
+    assert runner.start()
+    assert runner.wait(timeout=30)
+
+    assert NEW_INDEXES <= _indexes()
+    assert runner.get_stats()["running"] is False
+
+
+def test_failed_migration_stops_the_run(legacy_schema):
+    runner = MigrationRunner([
+        Migration(901, "broken", ["CREATE INDEX idx_broken ON no_such_table (x)"]),
+        Migration(902, "after broken", ["CREATE INDEX IF NOT EXISTS idx_after_broken ON signals (price)"]),
+    ])
+
+    assert runner.apply_pending() == []
+    assert runner.stats["last_error"].startswith("901 broken")
+    assert [m.version for m in runner.pending()] == [901, 902]
+    assert "idx_after_broken" not in _indexes()
+
+
+def test_feed_query_uses_the_new_index():
+    MigrationRunner().apply_pending()
+    with get_db() as db:
+        plan = " ".join(row[3] for row in db.execute(text(
+            "EXPLAIN QUERY PLAN SELECT id FROM signals WHERE test_mode = 0 "
+            "ORDER BY timestamp DESC, id DESC LIMIT 50"
+        )))
+
+    assert "idx_signal_test_timestamp_desc" in plan
+    assert "TEMP B-TREE" not in plan
@@ -326,3 +326,59 @@ class TestPaperTraderDatabaseIntegration:
             # Ordered DESC - newest first
             assert trades[0].action == "sell"
             assert trades[1].action == "buy"
+
+
+class TestPaperTraderUnitOfWork:
+    """Trade + holdings snapshot are one transaction; memory follows the commit."""
+
+    def test_trade_and_holding_written_together(self, clean_database):
+        trader = PaperTrader()
+        trader.execute_trade("BTCUSD", "BUY", 50000.0, 10000.0, "Test buy", amount=0.1)
+
+        with get_db() as db:
+            trade = db.query(Trade).one()
+            holding = db.query(Holding).one()
+            assert holding.entry_trade_id == trade.id
+            assert float(holding.amount) == 0.1
+
+    def test_failed_holding_write_rolls_back_trade(self, clean_database):
+        trader = PaperTrader()
+        with patch.object(trader, "_write_holding_snapshot", side_effect=Exception("disk full")):
+            trader.execute_trade("BTCUSD", "BUY", 50000.0, 10000.0, "Test buy", amount=0.1)
+
+        with get_db() as db:
+            assert db.query(Trade).count() == 0
+            assert db.query(Holding).count() == 0
+        assert trader.get_holdings() == {}
+
+    def test_new_trader_rebuilds_from_database(self, clean_database):
+        PaperTrader().execute_trade("ETHUSD", "BUY", 3000.0, 10000.0, "Test buy", amount=1.0)
+
+        holdings = PaperTrader().get_holdings()
+
+        assert holdings["ETHUSD"]["amount"] == 1.0
+        assert holdings["ETHUSD"]["avg_price"] == 3000.0
+
+    def test_running_trade_stats(self, clean_database):
+        trader = PaperTrader()
+        trader.execute_trade("BTCUSD", "BUY", 50000.0, 10000.0, "buy", amount=0.1)
+        trader.execute_trade("BTCUSD", "SELL", 51000.0, 10000.0, "win", amount=0.1)
+        trader.execute_trade("ETHUSD", "BUY", 3000.0, 10000.0, "buy", amount=1.0)
+        trader.execute_trade("ETHUSD", "SELL", 2900.0, 10000.0, "loss", amount=1.0)
+
+        assert trader._get_trade_count() == 4
+        assert trader._calculate_win_rate() == 50.0
+
+        # A fresh trader derives the same stats from trade history
+        reloaded = PaperTrader()
+        assert reloaded._get_trade_count() == 4
+        assert reloaded._calculate_win_rate() == 50.0
+
+    def test_trade_skipped_for_unpersisted_signal(self, clean_database):
+        trader = PaperTrader()
+        with patch("app.logic.paper_trader.signal_writer.confirm", return_value=False):
+            result = trader.execute_trade("BTCUSD", "BUY", 50000.0, 10000.0, "Test buy", amount=0.1, signal_id=42)
+
+        assert result["success"] is False
+        with get_db() as db:
+            assert db.query(Trade).count() == 0
@@ -0,0 +1,126 @@
+"""Tests for the incremental PnLLedger."""
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from app.database.connection import get_db
+from app.database.models import Trade
+from app.database.repositories import PnLCheckpointRepository, TradeRepository
+from app.logic.paper_trader import PaperTrader
+from app.logic.pnl_ledger import PnLLedger, apply_fill, pnl_ledger, _flat
+
+
+def _trade(action, symbol, price, amount):
+    with get_db() as db:
+        value = Decimal(str(price)) * Decimal(str(amount))
+        return TradeRepository(db).create(
+            timestamp=datetime.now(timezone.utc),
+            action=action,
+            symbol=symbol,
+            price=Decimal(str(price)),
+            amount=Decimal(str(amount)),
+            gross_value=value,
+            fee=Decimal("0"),
+            net_value=value,
+            test_mode=False
+        ).id
+
+
+def test_apply_fill_long_and_short():
+    long = _flat()
+    apply_fill(long, "buy", 100.0, 1.0)
+    apply_fill(long, "buy", 200.0, 1.0)
+    apply_fill(long, "sell", 250.0, 1.5)
+    assert long["side"] == "long"
+    assert long["avg_price"] == 150.0
+    assert long["amount"] == 0.5
+    assert long["realized_pnl"] == 150.0
+
+    short = _flat()
+    apply_fill(short, "sell", 100.0, 2.0)
+    apply_fill(short, "buy", 90.0, 5.0)  # covers only what is short, no flip
+    assert short["side"] is None
+    assert short["amount"] == 0.0
+    assert short["realized_pnl"] == 20.0
+
+
+def test_sync_is_incremental_and_checkpointed():
+    ledger = PnLLedger()
+    _trade("buy", "BTCUSD", 50000, 0.1)
+    _trade("sell", "BTCUSD", 52000, 0.05)
+
+    assert ledger.sync() == 2
+    pnl = ledger.get_pnl_by_symbol()["BTCUSD"]
+    assert pnl["realized_pnl"] == 100.0
+    assert pnl["unrealized_pnl"] == 100.0  # 0.05 left, marked at 52000
+
+    # Nothing new: no trades applied
+    assert ledger.sync() == 0
+
+    last_id = _trade("buy", "ETHUSD", 3000, 1)
+    assert ledger.sync() == 1
+    assert ledger.last_trade_id == last_id
+    assert ledger.get_pnl_data() == (["BTCUSD", "ETHUSD"], [200.0, 0.0])
+
+    with get_db() as db:
+        rows = {r.symbol: r for r in PnLCheckpointRepository(db).get_all()}
+        assert rows["ETHUSD"].last_trade_id == last_id
+        assert rows["BTCUSD"].side == "long"
+
+
+def test_sync_without_new_trades_skips_the_writer():
+    from app.database.connection import write_gate
+
+    ledger = PnLLedger()
+    _trade("buy", "BTCUSD", 50000, 0.1)
+    ledger.sync()
+
+    acquired = write_gate.stats["acquired"]
+    assert ledger.sync() == 0
+    assert PnLLedger().sync() == 0  # fresh ledger loads checkpoints over the read pool too
+    assert write_gate.stats["acquired"] == acquired
+
+    _trade("sell", "BTCUSD", 51000, 0.1)
+    acquired = write_gate.stats["acquired"]
+    assert ledger.sync() == 1
+    assert write_gate.stats["acquired"] == acquired + 1
+
+
+def test_reload_from_checkpoint_only_replays_new_trades():
+    first = PnLLedger()
+    _trade("buy", "BTCUSD", 50000, 0.1)
+    first.sync()
+
+    _trade("sell", "BTCUSD", 51000, 0.1)
+    second = PnLLedger()
+    assert second.sync() == 1
+    assert second.get_totals() == {
+        "realized_pnl": 100.0,
+        "unrealized_pnl": 0.0,
+        "total_pnl": 100.0,
+    }
+
+
+def test_rebuilds_when_trades_are_deleted():
+    ledger = PnLLedger()
+    _trade("buy", "BTCUSD", 50000, 0.1)
+    _trade("sell", "BTCUSD", 51000, 0.1)
+    ledger.sync()
+
+    with get_db() as db:
+        db.query(Trade).delete()
+
+    assert ledger.sync() == 0
+    assert ledger.get_pnl_by_symbol() == {}
+    assert ledger.get_stats()["rebuilds"] == 1
+
+
+def test_paper_trader_updates_shared_ledger():
+    pnl_ledger.sync()
+    trader = PaperTrader()
+
+    trader.execute_trade("BTCUSD", "BUY", 50000.0, 200.0, "test", amount=0.001)
+    trader.execute_trade("BTCUSD", "SELL", 55000.0, 200.0, "test", amount=0.001)
+
+    pnl = pnl_ledger.get_pnl_by_symbol()["BTCUSD"]
+    assert pnl["realized_pnl"] == 5.0
+    assert pnl["side"] is None
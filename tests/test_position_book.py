@@ -0,0 +1,140 @@
+"""Tests for the in-memory PositionBook."""
+from types import SimpleNamespace
+
+from app.logic.position_book import PositionBook
+
+
+def test_project_buy_averages_up():
+    book = PositionBook()
+    book.apply("BTCUSD", book.project("BTCUSD", "BUY", 0.1, 50000.0))
+
+    position = book.project("BTCUSD", "buy", 0.1, 60000.0)
+
+    assert position["amount"] == 0.2
+    assert position["avg_price"] == 55000.0
+    assert position["unrealized_pnl"] == 1000.0
+    # project() does not mutate the book
+    assert book.get("BTCUSD")["amount"] == 0.1
+
+
+def test_sell_keeps_avg_price_and_closes_at_zero():
+    book = PositionBook()
+    book.apply("ETHUSD", book.project("ETHUSD", "BUY", 1.0, 3000.0))
+
+    partial = book.project("ETHUSD", "SELL", 0.4, 3100.0)
+    assert partial["amount"] == 0.6
+    assert partial["avg_price"] == 3000.0
+
+    closed = book.project("ETHUSD", "SELL", 2.0, 3100.0)
+    assert closed["amount"] == 0
+    book.apply("ETHUSD", closed)
+    assert book.get("ETHUSD") is None
+
+
+def test_sell_without_position_is_noop():
+    book = PositionBook()
+    assert book.project("SOLUSD", "SELL", 1.0, 100.0) is None
+
+
+def test_load_and_snapshot():
+    book = PositionBook()
+    book.load([
+        SimpleNamespace(symbol="BTCUSD", amount=0.5, avg_buy_price=40000,
+                        current_price=42000, unrealized_pnl=1000),
+        SimpleNamespace(symbol="ETHUSD", amount=0, avg_buy_price=3000,
+                        current_price=None, unrealized_pnl=None),
+    ])
+
+    snapshot = book.snapshot()
+
+    assert book.loaded is True
+    assert list(snapshot) == ["BTCUSD"]
+    assert snapshot["BTCUSD"]["market_value"] == 21000.0
+    assert snapshot["BTCUSD"]["cost_basis"] == 20000.0
+
+
+def test_realized_pnl_survives_close():
+    book = PositionBook()
+    book.apply("BTCUSD", book.project("BTCUSD", "BUY", 0.2, 50000.0))
+    book.apply("BTCUSD", book.project("BTCUSD", "SELL", 0.1, 51000.0))
+    book.apply("BTCUSD", book.project("BTCUSD", "SELL", 0.5, 49000.0))
+
+    totals = book.get_totals()
+    assert book.get("BTCUSD") is None
+    assert totals["open_positions"] == 0
+    # +100 on the first half, -100 on the second
+    assert totals["realized_pnl"] == 0.0
+
+    book.apply("BTCUSD", book.project("BTCUSD", "BUY", 0.1, 40000.0))
+    reopened = book.get("BTCUSD")
+    assert reopened["avg_price"] == 40000.0
+    assert reopened["realized_pnl"] == 0.0
+
+
+def test_market_update_marks_open_positions():
+    book = PositionBook()
+    book.apply("BTCUSD", book.project("BTCUSD", "BUY", 0.5, 40000.0))
+
+    book.on_market_update({"XXBTZUSD": {"price": 42000.0, "volume": 10}, "BOGUS": {"price": 1}})
+
+    position = book.get("BTCUSD")
+    assert position["current_price"] == 42000.0
+    assert position["unrealized_pnl"] == 1000.0
+
+
+def test_rebuild_prefers_compacted_table(clean_database):
+    from app.logic.paper_trader import PaperTrader
+    from app.database.connection import get_db
+    from app.database.models import CurrentPosition, Holding
+
+    trader = PaperTrader(book=PositionBook())
+    trader.execute_trade("BTCUSD", "BUY", 50000.0, 10000.0, "buy", amount=0.2)
+    trader.execute_trade("BTCUSD", "SELL", 52000.0, 10000.0, "sell", amount=0.1)
+
+    with get_db() as db:
+        rows = db.query(CurrentPosition).all()
+        assert len(rows) == 1
+        assert float(rows[0].amount) == 0.1
+        assert float(rows[0].realized_pnl) == 200.0
+        assert db.query(Holding).count() == 2
+
+    book = PositionBook()
+    assert book.rebuild() is True
+    assert book.get("BTCUSD")["amount"] == 0.1
+    assert book.get_totals()["realized_pnl"] == 200.0
+
+
+def test_rebuild_seeds_from_holdings_snapshots(clean_database):
+    from datetime import datetime, timedelta
+    from decimal import Decimal
+    from app.database.connection import get_db
+    from app.database.models import CurrentPosition
+    from app.database.repositories import HoldingRepository
+
+    with get_db() as db:
+        repo = HoldingRepository(db)
+        now = datetime.utcnow()
+        repo.create(timestamp=now - timedelta(hours=1), symbol="ETHUSD",
+                    amount=Decimal("1.0"), avg_buy_price=Decimal("3000"))
+        repo.create(timestamp=now, symbol="ETHUSD",
+                    amount=Decimal("2.0"), avg_buy_price=Decimal("3100"))
+
+    book = PositionBook()
+    book.rebuild()
+
+    assert book.get("ETHUSD")["amount"] == 2.0
+    with get_db() as db:
+        assert db.query(CurrentPosition).count() == 1
+
+
+def test_history_is_optional(clean_database):
+    from app.logic.paper_trader import PaperTrader
+    from app.database.connection import get_db
+    from app.database.models import CurrentPosition, Holding
+
+    trader = PaperTrader(book=PositionBook(keep_history=False))
+    trader.execute_trade("BTCUSD", "BUY", 50000.0, 10000.0, "buy", amount=0.1)
+
+    with get_db() as db:
+        assert db.query(CurrentPosition).count() == 1
+        assert db.query(Holding).count() == 0
@@ -0,0 +1,115 @@
+"""Tests for the Prometheus-style metrics registry and /metrics endpoint."""
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.metrics.prometheus import (
+    EXTERNAL_CALL_ERRORS, EXTERNAL_CALL_SECONDS, NULL_TIMER, MetricsRegistry, metrics, track_call,
+)
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry({"enabled": True})
+
+
+@pytest.fixture
+def global_metrics():
+    saved = dict(metrics.config)
+    metrics.update_config({"enabled": True})
+    metrics.reset()
+    yield metrics
+    metrics.update_config(saved)
+    metrics.reset()
+
+
+def test_render_counter_gauge_and_histogram(registry):
+    requests = registry.counter("test_requests_total", "Requests.", ["route"])
+    depth = registry.gauge("test_depth", "Depth.")
+    latency = registry.histogram("test_latency_seconds", "Latency.", buckets=(0.1, 1))
+
+    requests.inc(route="/a")
+    requests.inc(2, route='/b"q')
+    depth.set_function(lambda: 7)
+    for value in (0.05, 0.5, 5):
+        latency.observe(value)
+
+    text = registry.render()
+
+    assert "# TYPE test_requests_total counter" in text
+    assert 'test_requests_total{route="/a"} 1.0' in text
+    assert 'test_requests_total{route="/b\\"q"} 2.0' in text
+    assert "test_depth 7.0" in text
+    assert 'test_latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'test_latency_seconds_bucket{le="1.0"} 2' in text
+    assert 'test_latency_seconds_bucket{le="+Inf"} 3' in text
+    assert "test_latency_seconds_count 3" in text
+    assert "test_latency_seconds_sum 5.55" in text
+
+
+def test_reregistering_returns_the_same_metric(registry):
+    first = registry.counter("test_total", "Total.")
+    assert registry.counter("test_total", "Total.") is first
+    with pytest.raises(ValueError):
+        registry.gauge("test_total", "Total.")
+
+
+def test_disabled_registry_records_nothing(registry):
+    registry.update_config({"enabled": False})
+    counter = registry.counter("test_total", "Total.")
+    histogram = registry.histogram("test_seconds", "Seconds.")
+
+    counter.inc()
+    histogram.observe(1.0)
+
+    assert histogram.time() is NULL_TIMER
+    assert counter.value() == 0.0
+    assert histogram.count() == 0
+    assert "disabled" in registry.render()
+
+
+def test_track_call_counts_errors(global_metrics):
+    with track_call("svc", "ok"):
+        pass
+    with track_call("svc", "soft") as call:
+        call.failed()
+    with pytest.raises(RuntimeError):
+        with track_call("svc", "raises"):
+            raise RuntimeError("boom")
+
+    assert EXTERNAL_CALL_SECONDS.count(service="svc", operation="ok") == 1
+    assert EXTERNAL_CALL_ERRORS.value(service="svc", operation="ok") == 0
+    assert EXTERNAL_CALL_ERRORS.value(service="svc", operation="soft") == 1
+    assert EXTERNAL_CALL_ERRORS.value(service="svc", operation="raises") == 1
+
+
+def test_kraken_calls_are_tracked(global_metrics):
+    from app.client.kraken import KrakenClient
+
+    client = KrakenClient()
+    client.api = MagicMock()
+    client.api.query_public.return_value = {"error": [], "result": {"XXBTZUSD": {"c": ["50000.0", "1"]}}}
+    client.get_price("BTC/USD")
+    client.api.query_public.return_value = {"error": ["EGeneral:Internal error"]}
+    client.get_price("BTC/USD")
+
+    assert EXTERNAL_CALL_SECONDS.count(service="kraken", operation="Ticker") == 2
+    assert EXTERNAL_CALL_ERRORS.value(service="kraken", operation="Ticker") == 1
+
+
+def test_metrics_endpoint(global_metrics):
+    from app.main import app
+    from app.metrics.prometheus import STAGE_SECONDS
+
+    STAGE_SECONDS.observe(0.2, stage="price")
+
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'tradingbot_cycle_stage_seconds_count{stage="price"} 1' in body
+    assert "# TYPE tradingbot_db_write_seconds histogram" in body
+    assert "# TYPE tradingbot_event_bus_queue_depth gauge" in body
+    assert "tradingbot_event_bus_queue_depth 0.0" in body
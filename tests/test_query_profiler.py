@@ -0,0 +1,115 @@
+"""Tests for the SQL query profiler (app.metrics.query_profiler)."""
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database.connection import get_read_db
+from app.database.repositories import SignalRepository
+from app.metrics.query_profiler import LatencyHistogram, normalize_sql, query_profiler
+
+
+@pytest.fixture
+def profiler():
+    saved = dict(query_profiler.config)
+    query_profiler.reset()
+    query_profiler.update_config({"enabled": True, "slow_query_ms": 10_000})
+    yield query_profiler
+    query_profiler.update_config(saved)
+    query_profiler.reset()
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_normalize_sql():
+    assert normalize_sql(
+        "SELECT * FROM signals WHERE symbol = 'BTC/USD' AND id IN (?, ?, ?) LIMIT 50"
+    ) == "SELECT * FROM signals WHERE symbol = ? AND id IN (?) LIMIT ?"
+    assert normalize_sql("INSERT INTO t (a, b) VALUES (?, ?), (?, ?), (?, ?)") == "INSERT INTO t (a, b) VALUES (?, ?)"
+    assert normalize_sql("SELECT anon_1.x\n  FROM t1") == "SELECT anon_1.x FROM t1"
+
+
+def test_histogram_quantiles():
+    histogram = LatencyHistogram()
+    for ms in [0.05] * 90 + [20] * 9 + [3000]:
+        histogram.record(ms)
+
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.95) == 25
+    assert histogram.quantile(0.999) == 5000
+    assert histogram.to_dict()["count"] == 100
+
+
+def test_statements_are_attributed_to_the_repository_method(profiler):
+    with get_read_db() as db:
+        SignalRepository(db).get_recent(hours=1, limit=5)
+        SignalRepository(db).get_recent(hours=2, limit=10)
+
+    stats = profiler.get_stats(caller="SignalRepository")
+    rows = [r for r in stats["statements"] if r["caller"] == "SignalRepository.get_recent"]
+    assert len(rows) == 1
+    assert rows[0]["count"] == 2
+    assert rows[0]["sql"].startswith("SELECT")
+    assert "SignalRepository.get_recent" in stats["callers"]
+
+
+def test_slow_queries_are_logged_with_their_plan(profiler, caplog):
+    profiler.update_config({"slow_query_ms": 0})
+
+    with caplog.at_level("WARNING", logger="app.slow_queries"):
+        with get_read_db() as db:
+            SignalRepository(db).get_recent(hours=1, limit=5)
+        assert _wait_for(lambda: any(q["plan"] for q in profiler.slow_queries))
+
+    entry = next(q for q in profiler.slow_queries if q["plan"])
+    assert entry["caller"] == "SignalRepository.get_recent"
+    assert any("signals" in step.lower() for step in entry["plan"])
+    assert _wait_for(lambda: any("[SlowQuery]" in r.getMessage() for r in caplog.records))
+
+
+def test_plan_cache_keeps_the_most_recently_used_plans(profiler):
+    profiler.update_config({"slow_query_ms": 0, "plan_cache_size": 2})
+    statements = [
+        "SELECT id FROM signals WHERE id = 1",
+        "SELECT id FROM trades WHERE id = 1",
+        "SELECT id FROM signals WHERE symbol = 'BTCUSD'",
+    ]
+    for statement in statements:
+        profiler.record(statement, 50.0, "test")
+    assert _wait_for(lambda: all(q["plan"] for q in profiler.slow_queries))
+
+    assert list(profiler._plans) == [normalize_sql(s) for s in statements[1:]]
+
+    profiler.update_config({"plan_cache_size": 1})
+    assert list(profiler._plans) == [normalize_sql(statements[2])]
+
+
+def test_disabled_profiler_records_nothing(profiler):
+    profiler.update_config({"enabled": False})
+    with get_read_db() as db:
+        SignalRepository(db).get_recent(hours=1, limit=5)
+
+    assert profiler.get_stats()["statements"] == []
+
+
+def test_db_metrics_endpoint(profiler):
+    from app.main import app
+
+    with get_read_db() as db:
+        SignalRepository(db).get_recent(hours=1, limit=5)
+
+    response = TestClient(app).get("/api/metrics/db", params={"top": 5, "sort": "count"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "success"
+    assert body["enabled"] is True
+    assert 0 < len(body["statements"]) <= 5
+    assert {"p50_ms", "p95_ms", "p99_ms", "buckets"} <= set(body["statements"][0])
@@ -0,0 +1,140 @@
+"""Tests for the dashboard ResponseCache."""
+import asyncio
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from starlette.requests import Request as StarletteRequest
+
+from app.events import EventBus, EventType
+from app.response_cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return ResponseCache(default_ttl=10, clock=clock)
+
+
+@pytest.fixture
+def calls():
+    return {"n": 0}
+
+
+@pytest.fixture
+def client(cache, calls):
+    app = FastAPI()
+
+    async def compute():
+        calls["n"] += 1
+        return {"value": calls["n"]}
+
+    async def failing():
+        return JSONResponse({"error": "boom"}, status_code=500)
+
+    @app.get("/data")
+    async def data(request: Request):
+        return await cache.respond(request, "data", compute, tags=("trades",))
+
+    @app.get("/broken")
+    async def broken(request: Request):
+        return await cache.respond(request, "broken", failing)
+
+    return TestClient(app)
+
+
+def _request(query: str = "") -> StarletteRequest:
+    return StarletteRequest({
+        "type": "http", "method": "GET", "path": "/data",
+        "query_string": query.encode(), "headers": [],
+    })
+
+
+def test_hit_and_etag_not_modified(client, cache, calls):
+    first = client.get("/data")
+    assert first.status_code == 200
+    assert first.json() == {"value": 1}
+    etag = first.headers["etag"]
+
+    second = client.get("/data", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert calls["n"] == 1
+    assert cache.get_stats()["not_modified"] == 1
+
+
+def test_query_string_is_part_of_key(client, calls):
+    client.get("/data?limit=5")
+    client.get("/data?limit=10")
+    client.get("/data?limit=5")
+    assert calls["n"] == 2
+
+
+def test_ttl_expiry(client, clock, calls):
+    client.get("/data")
+    clock.now += 11
+    assert client.get("/data").json() == {"value": 2}
+
+
+def test_event_invalidates_matching_tags(client, cache, calls):
+    bus = EventBus()
+    cache.attach(bus)
+
+    client.get("/data")
+    asyncio.run(bus.emit(EventType.SIGNAL_GENERATED, {}))
+    client.get("/data")
+    assert calls["n"] == 1
+
+    asyncio.run(bus.emit(EventType.TRADE_EXECUTED, {}))
+    assert client.get("/data").json() == {"value": 2}
+
+    asyncio.run(bus.emit(EventType.CONFIG_CHANGED, {}))
+    assert client.get("/data").json() == {"value": 3}
+    cache.detach(bus)
+
+
+def test_error_responses_are_not_cached(client, cache):
+    assert client.get("/broken").status_code == 500
+    assert client.get("/broken").status_code == 500
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_concurrent_requests_share_one_computation(cache):
+    calls = {"n": 0}
+
+    async def slow():
+        calls["n"] += 1
+        await asyncio.sleep(0.01)
+        return {"value": calls["n"]}
+
+    async def burst():
+        return await asyncio.gather(*[
+            cache.respond(_request(), "slow", slow) for _ in range(5)
+        ])
+
+    responses = asyncio.run(burst())
+    assert calls["n"] == 1
+    assert {r.body for r in responses} == {b'{"value":1}'}
+    assert cache.get_stats()["collapsed"] == 4
+
+
+def test_invalidation_during_computation_is_not_stored(cache):
+    async def racing():
+        cache.invalidate("trades")
+        return {"value": 1}
+
+    asyncio.run(cache.respond(_request(), "race", racing, tags=("trades",)))
+    assert cache.get_stats()["entries"] == 0
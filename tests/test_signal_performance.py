@@ -10,6 +10,7 @@ from app.signal_performance import (
     analyze_strategy_performance,
     get_signal_performance_analysis
 )
+from app.utils.signal_matching import match_by_time
 
 
 @pytest.fixture
@@ -298,3 +299,32 @@ def test_edge_case_missing_fields():
     correlations = correlate_signals_to_trades([signal_minimal], [trade_minimal])
     assert len(correlations) == 1
     assert correlations[0]['signal']['confidence'] == 0  # Default value
+
+
+def test_signal_id_match_takes_priority(sample_signals, sample_trades):
+    """A trade linked by signal_id wins over a time-window match."""
+    sample_signals[0]['id'] = 7
+    linked = dict(sample_trades[2], signal_id=7)
+
+    correlations = correlate_signals_to_trades(sample_signals, sample_trades + [linked])
+
+    assert correlations[0]['trade'] is linked
+
+
+def test_match_by_time_picks_earliest_trade_after_signal():
+    """Matches the first same-symbol, same-side trade at or after the signal."""
+    t0 = datetime(2026, 1, 1, 12, 0)
+    trades = [
+        ("BTCUSD", "buy", t0 + timedelta(minutes=8)),
+        ("BTCUSD", "buy", t0 - timedelta(minutes=1)),
+        ("BTCUSD", "sell", t0 + timedelta(minutes=1)),
+        ("BTCUSD", "buy", t0 + timedelta(minutes=3)),
+    ]
+    signals = [
+        ("BTCUSD", "BUY", t0),
+        ("BTCUSD", "BUY", t0 + timedelta(minutes=9)),
+        ("ETHUSD", "BUY", t0),
+        ("BTCUSD", "SELL", t0),
+    ]
+
+    assert match_by_time(signals, trades, window_minutes=10) == [3, None, None, 2]
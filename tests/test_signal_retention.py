@@ -0,0 +1,137 @@
+"""Tests for signal retention (HOLD downsampling, archival, batched deletes)."""
+import gzip
+import json
+import tempfile
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from sqlalchemy import insert
+
+from app.database.connection import get_db
+from app.database.models import Signal, SignalAggregate, Trade
+from app.signal_retention import SignalRetention
+from app.strategy_signal_logger import StrategySignalLogger
+
+NOW = datetime(2026, 6, 1, 12, 0)
+
+
+def _signal(timestamp, final_signal="HOLD", symbol="BTC/USD", price="100", confidence="0.5"):
+    return dict(
+        timestamp=timestamp, symbol=symbol, price=Decimal(price),
+        final_signal=final_signal, final_confidence=Decimal(confidence),
+        aggregation_method="test", strategies={"technical": {"signal": final_signal}}, test_mode=False,
+    )
+
+
+def _insert(*rows):
+    with get_db() as db:
+        db.execute(insert(Signal), list(rows))
+        return [s.id for s in db.query(Signal).order_by(Signal.id).all()]
+
+
+def _remaining():
+    with get_db() as db:
+        return sorted((s.symbol, s.timestamp, s.final_signal) for s in db.query(Signal).all())
+
+
+@pytest.fixture
+def retention():
+    return SignalRetention({
+        "downsample_hold_after_days": 7, "raw_days": 30,
+        "archive_dir": tempfile.mkdtemp(), "batch_size": 2,
+    })
+
+
+def test_hold_only_hours_are_downsampled(retention):
+    old_hour = NOW - timedelta(days=10)
+    _insert(
+        _signal(old_hour, price="100", confidence="0.25"),
+        _signal(old_hour + timedelta(minutes=5), price="110", confidence="0.75"),
+        # Mixed hour: kept as raw signals
+        _signal(old_hour + timedelta(hours=1)),
+        _signal(old_hour + timedelta(hours=1, minutes=5), final_signal="BUY"),
+        # Recent HOLD: inside the raw window
+        _signal(NOW - timedelta(days=1)),
+    )
+
+    result = retention.run(now=NOW)
+
+    assert (result["downsampled_periods"], result["downsampled_signals"]) == (1, 2)
+    assert len(_remaining()) == 3
+    with get_db() as db:
+        aggregate = db.query(SignalAggregate).one()
+        assert aggregate.bucket_start == old_hour.replace(minute=0)
+        assert aggregate.signal_count == 2
+        assert aggregate.confidence_sum == pytest.approx(1.0)
+        assert (aggregate.price_min, aggregate.price_max, aggregate.price_sum) == (100.0, 110.0, 210.0)
+
+
+def test_expired_signals_are_archived_then_deleted(retention):
+    old = NOW - timedelta(days=40)
+    ids = _insert(
+        _signal(old, final_signal="BUY"),
+        _signal(old + timedelta(minutes=5), final_signal="SELL"),
+        _signal(old + timedelta(minutes=10), final_signal="BUY", symbol="ETH/USD"),
+        _signal(NOW - timedelta(days=2), final_signal="BUY"),
+    )
+
+    result = retention.run(now=NOW)
+
+    assert (result["archived"], result["deleted"]) == (3, 3)
+    assert len(_remaining()) == 1
+
+    archive_dir = Path(retention.config["archive_dir"])
+    assert [p.name for p in archive_dir.iterdir()] == [f"signals-{old:%Y-%m}.jsonl.gz"]
+    with gzip.open(archive_dir / f"signals-{old:%Y-%m}.jsonl.gz", "rt") as f:
+        records = [json.loads(line) for line in f]
+    assert [r["id"] for r in records] == ids[:3]
+    assert records[0]["strategies"] == {"technical": {"signal": "BUY"}}
+
+
+def test_traded_signals_are_kept(retention):
+    old = NOW - timedelta(days=40)
+    traded_id, _ = _insert(_signal(old), _signal(old + timedelta(minutes=5)))
+    with get_db() as db:
+        db.add(Trade(
+            timestamp=old, action="buy", symbol="BTC/USD", price=Decimal("100"),
+            amount=Decimal("1"), gross_value=Decimal("100"), fee=Decimal("0"),
+            net_value=Decimal("100"), signal_id=traded_id, test_mode=False,
+        ))
+
+    retention.update_config({"archive": False})
+    result = retention.run(now=NOW)
+
+    assert result["deleted"] == 1
+    with get_db() as db:
+        assert [s.id for s in db.query(Signal).all()] == [traded_id]
+
+
+def test_disabled_policy_does_nothing(retention):
+    _insert(_signal(NOW - timedelta(days=40)))
+    retention.update_config({"enabled": False})
+
+    assert retention.run(now=NOW)["deleted"] == 0
+    assert len(_remaining()) == 1
+
+
+def test_clear_old_signals_deletes_in_batches():
+    logger = StrategySignalLogger(data_dir=tempfile.mkdtemp())
+    old = datetime.utcnow() - timedelta(days=45)
+    _insert(*[_signal(old + timedelta(minutes=i)) for i in range(5)])
+    logger.log_decision("BTC/USD", 50000, "BUY", 0.7, {}, "test")
+
+    assert logger.clear_old_signals(days_to_keep=30, batch_size=2) == 5
+    assert len(_remaining()) == 1
+
+
+def test_vacuum_releases_free_pages(retention):
+    _insert(*[_signal(NOW - timedelta(days=40), final_signal="BUY") | {"signal_metadata": {"blob": "x" * 2000}}
+              for _ in range(200)])
+    retention.update_config({"archive": False, "batch_size": 1000})
+
+    result = retention.run(now=NOW)
+
+    assert result["deleted"] == 200
+    assert result["vacuumed_pages"] > 1
@@ -0,0 +1,97 @@
+"""Tests for vectorized strategy agreement / kappa."""
+import tempfile
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.strategy_correlation import StrategyCorrelation, encode_votes, pairwise_agreement
+from app.strategy_signal_logger import StrategySignalLogger
+
+
+def _kappa(a, b):
+    """Reference Cohen's kappa for two equal-length vote lists."""
+    n = len(a)
+    observed = sum(x == y for x, y in zip(a, b)) / n
+    chance = sum((a.count(k) / n) * (b.count(k) / n) for k in ("BUY", "SELL", "HOLD"))
+    return (observed - chance) / (1 - chance)
+
+
+def test_matches_reference_computation():
+    a = ["BUY", "BUY", "SELL", "HOLD", "BUY", "SELL"]
+    b = ["BUY", "SELL", "SELL", "HOLD", "HOLD", "SELL"]
+    votes = [(i, "a", v) for i, v in enumerate(a)] + [(i, "b", v) for i, v in enumerate(b)]
+    # A third strategy that only voted on two of the signals
+    votes += [(0, "c", "BUY"), (1, "c", "BUY")]
+
+    names, matrix = encode_votes(votes)
+    stats = pairwise_agreement(matrix)
+
+    assert names == ["a", "b", "c"]
+    assert matrix.dtype == np.int8
+    assert stats["overlap"][0, 1] == 6
+    assert stats["agreement"][0, 1] == pytest.approx(4 / 6)
+    assert stats["kappa"][0, 1] == pytest.approx(_kappa(a, b))
+    assert stats["kappa"][1, 0] == pytest.approx(_kappa(a, b))
+    assert stats["overlap"][0, 2] == 2
+    assert stats["agreement"][1, 2] == pytest.approx(0.5)
+
+
+def test_constant_identical_votes_have_kappa_one():
+    _, matrix = encode_votes([(i, s, "BUY") for i in range(3) for s in ("x", "y")])
+    assert pairwise_agreement(matrix)["kappa"][0, 1] == 1.0
+
+
+def test_empty():
+    names, matrix = encode_votes([])
+    assert names == []
+    assert pairwise_agreement(matrix)["overlap"].shape == (0, 0)
+
+
+@pytest.fixture
+def logger():
+    return StrategySignalLogger(data_dir=tempfile.mkdtemp())
+
+
+def _log(logger, symbol, technical, sentiment):
+    logger.log_decision(symbol, 100, "BUY", 0.7, {
+        "technical": {"signal": technical, "confidence": 0.7},
+        "sentiment": {"signal": sentiment, "confidence": 0.7},
+    }, "test")
+
+
+def test_cached_until_new_signal(logger):
+    correlation = StrategyCorrelation()
+    _log(logger, "BTC/USD", "BUY", "BUY")
+
+    assert correlation.get()["agreement"]["technical"]["sentiment"] == 1.0
+    correlation.get()
+    assert correlation.get_stats()["hits"] == 1
+
+    _log(logger, "BTC/USD", "BUY", "SELL")
+    assert correlation.get()["agreement"]["technical"]["sentiment"] == 0.5
+    assert correlation.get_stats()["misses"] == 2
+
+
+def test_symbol_filter(logger):
+    _log(logger, "BTC/USD", "BUY", "BUY")
+    _log(logger, "ETH/USD", "BUY", "SELL")
+
+    result = StrategyCorrelation().get(symbol="ETH/USD")
+
+    assert result["signals"] == 1
+    assert result["agreement"]["technical"]["sentiment"] == 0.0
+
+
+def test_endpoint_returns_kappa_and_validates(logger):
+    _log(logger, "BTC/USD", "BUY", "BUY")
+    _log(logger, "BTC/USD", "SELL", "HOLD")
+    client = TestClient(app)
+
+    data = client.get("/api/strategy/correlation?lookback_days=1&symbol=BTC/USD").json()
+    assert data["signals"] == 2
+    assert data["overlap"]["technical"]["sentiment"] == 2
+    assert "kappa" in data
+
+    assert client.get("/api/strategy/correlation?lookback_days=abc").status_code == 400
@@ -183,6 +183,117 @@ class TestStrategyManager:
         assert strategy_manager.aggregation_method == 'highest_confidence'
 
 
+class SymbolStrategy(BaseStrategy):
+    """Mock strategy returning a fixed (signal, confidence) per symbol."""
+
+    def __init__(self, name, by_symbol, weight=1.0):
+        super().__init__(name)
+        self.weight = weight
+        self.by_symbol = by_symbol
+
+    def get_signal(self, symbol, context):
+        signal, confidence = self.by_symbol[symbol]
+        return signal, confidence, f"{self.name} on {symbol}"
+
+
+class TestBatchSignals:
+    """Tests for the vectorized get_signals batch API."""
+
+    @pytest.fixture
+    def manager(self, strategy_manager):
+        strategy_manager.strategies = []
+        strategy_manager.add_strategy(SymbolStrategy("s1", {
+            "BTCUSD": ("BUY", 0.8), "ETHUSD": ("SELL", 0.6), "SOLUSD": ("BUY", 0.9),
+        }))
+        strategy_manager.add_strategy(SymbolStrategy("s2", {
+            "BTCUSD": ("BUY", 0.7), "ETHUSD": ("HOLD", 0.9), "SOLUSD": ("SELL", 0.9),
+        }, weight=0.5))
+        strategy_manager.add_strategy(SymbolStrategy("s3", {
+            "BTCUSD": ("HOLD", 0.5), "ETHUSD": ("SELL", 0.8), "SOLUSD": ("HOLD", 0.2),
+        }))
+        return strategy_manager
+
+    def test_batch_matches_single_symbol_calls(self, manager):
+        symbols = ["BTC/USD", "ETHUSD", "SOLUSD"]
+        contexts = [{"headlines": []} for _ in symbols]
+
+        for method in ("weighted_vote", "highest_confidence", "unanimous"):
+            manager.aggregation_method = method
+            batch = manager.get_signals(symbols, contexts)
+            single = [manager.get_signal(s, c) for s, c in zip(symbols, contexts)]
+
+            assert [r["symbol"] for r in batch] == ["BTCUSD", "ETHUSD", "SOLUSD"]
+            assert [(r["signal"], r["confidence"], r["reason"]) for r in batch] == [
+                (signal, confidence, reason) for signal, confidence, reason, _ in single
+            ]
+
+    def test_weighted_vote_values(self, manager):
+        btc, eth, sol = manager.get_signals(["BTCUSD", "ETHUSD", "SOLUSD"], [{}, {}, {}])
+
+        # BUY: 0.8 + 0.7*0.5 over actionable weight 1.5
+        assert btc["final_signal"] == "BUY"
+        assert btc["final_confidence"] == pytest.approx(1.15 / 1.5)
+        assert btc["final_reason"].startswith("BUY signal from 2 strategies: s1: s1 on BTCUSD; s2: s2 on BTCUSD")
+
+        # SELL: 0.6 + 0.8 over actionable weight 2.0 beats HOLD 0.45
+        assert eth["final_signal"] == "SELL"
+        assert eth["final_confidence"] == pytest.approx(0.7)
+
+        # BUY 0.9 vs SELL 0.45
+        assert sol["final_signal"] == "BUY"
+        assert sol["final_confidence"] == pytest.approx(0.9 / 1.5)
+
+    def test_weighted_vote_tie_goes_to_first_signal(self, strategy_manager):
+        strategy_manager.strategies = []
+        strategy_manager.add_strategy(MockStrategy("s1", "SELL", 0.6))
+        strategy_manager.add_strategy(MockStrategy("s2", "BUY", 0.6))
+
+        result = strategy_manager.get_signals(["BTCUSD"], [{}])[0]
+
+        assert result["final_signal"] == "SELL"
+
+    def test_contexts_by_symbol_and_low_confidence(self, manager):
+        manager.min_confidence = 0.75
+        results = manager.get_signals(["BTCUSD", "ETHUSD"], {"BTCUSD": {}, "ETHUSD": {}})
+
+        assert results[0]["signal"] == "BUY"
+        assert results[0]["would_execute"] is True
+        assert results[1]["final_signal"] == "SELL"
+        assert results[1]["signal"] == "HOLD"
+        assert results[1]["reason"].startswith("Low confidence: ")
+
+    def test_mismatched_contexts_rejected(self, manager):
+        with pytest.raises(ValueError):
+            manager.get_signals(["BTCUSD", "ETHUSD"], [{}])
+
+    def test_failing_strategy_only_affects_its_row(self, strategy_manager):
+        strategy_manager.strategies = []
+        strategy_manager.add_strategy(SymbolStrategy("s1", {"BTCUSD": ("BUY", 0.9)}))
+
+        btc, eth = strategy_manager.get_signals(["BTCUSD", "ETHUSD"], [{}, {}])
+
+        assert btc["final_signal"] == "BUY"
+        assert eth["final_signal"] == "HOLD"
+        assert eth["final_reason"] == "No strategies produced signals"
+        assert eth["num_strategies"] == 0
+
+    def test_telemetry_from_arrays(self, manager):
+        result = manager.get_signals(["BTCUSD"], [{"price": 0}], include_telemetry=True)[0]
+        telemetry = result["telemetry"]
+
+        aggregation = telemetry["aggregation"]
+        assert aggregation["buy_score"] == pytest.approx(1.15)
+        assert aggregation["hold_score"] == pytest.approx(0.5)
+        assert aggregation["total_weight"] == pytest.approx(2.5)
+        assert aggregation["by_method"]["unanimous"]["signal"] == "HOLD"
+        assert aggregation["by_method"]["highest_confidence"]["signal"] == "BUY"
+
+        attribution = telemetry["attribution"]
+        assert attribution["agreeing_strategies"] == ["s1", "s2"]
+        assert attribution["disagreeing_strategies"] == ["s3"]
+        assert attribution["contribution_by_strategy"]["s1"] == pytest.approx(0.8 / 2.5 * 100)
+
+
 class TestStrategyManagerSymbolNormalization:
     """Test that strategy manager normalizes symbols before logging."""
     
@@ -0,0 +1,122 @@
+"""Tests for hourly/daily strategy signal rollups."""
+import tempfile
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.database.connection import get_db
+from app.database.models import Signal, StrategyRollup
+from app.strategy_rollups import bucket_start, rollup_deltas, get_strategy_totals, rebuild_rollups
+from app.strategy_signal_logger import StrategySignalLogger, SignalWriter
+
+
+def _now():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _signal_row(timestamp, strategies, final_signal="BUY", symbol="BTC/USD"):
+    return dict(
+        timestamp=timestamp, symbol=symbol, price=Decimal("50000"),
+        final_signal=final_signal, final_confidence=Decimal("0.7"),
+        aggregation_method="test", strategies=strategies, test_mode=False,
+    )
+
+
+@pytest.fixture
+def logger():
+    return StrategySignalLogger(data_dir=tempfile.mkdtemp())
+
+
+def _snapshot():
+    with get_db() as db:
+        return sorted(
+            (r.strategy_name, r.symbol, r.granularity, r.bucket_start, r.buy_count,
+             r.sell_count, r.hold_count, round(r.confidence_sum, 6), r.agreement_count)
+            for r in db.query(StrategyRollup).all()
+        )
+
+
+def test_deltas_aggregate_per_bucket():
+    ts = datetime(2026, 3, 4, 15, 42)
+    rows = [
+        _signal_row(ts, {"technical": {"signal": "BUY", "confidence": 0.5}}),
+        _signal_row(ts + timedelta(minutes=5), {"technical": {"signal": "SELL", "confidence": 0.25}}),
+    ]
+
+    deltas = {d["granularity"]: d for d in rollup_deltas(rows)}
+
+    assert deltas["hour"]["bucket_start"] == datetime(2026, 3, 4, 15)
+    assert deltas["day"]["bucket_start"] == datetime(2026, 3, 4)
+    for delta in deltas.values():
+        assert (delta["buy_count"], delta["sell_count"], delta["hold_count"]) == (1, 1, 0)
+        assert delta["confidence_sum"] == 0.75
+        assert delta["agreement_count"] == 1
+
+
+def test_logging_updates_rollups_incrementally(logger):
+    for signal, conf in (("BUY", 0.5), ("BUY", 0.7), ("HOLD", 0.9)):
+        logger.log_decision(
+            "BTC/USD", 50000, "BUY", 0.7,
+            {"technical": {"signal": signal, "confidence": conf}, "volume": {"signal": "SELL", "confidence": 0.4}},
+            "test",
+        )
+
+    totals = get_strategy_totals(1)
+
+    assert totals["technical"]["total_signals"] == 3
+    assert (totals["technical"]["buy_count"], totals["technical"]["hold_count"]) == (2, 1)
+    assert totals["technical"]["agreement_count"] == 2
+    assert totals["volume"]["sell_count"] == 3
+    assert totals["volume"]["agreement_count"] == 0
+
+
+def test_write_behind_batches_update_rollups(logger, monkeypatch):
+    from app import strategy_signal_logger
+
+    writer = SignalWriter(batch_size=5, flush_interval=60)
+    monkeypatch.setattr(strategy_signal_logger, "signal_writer", writer)
+    writer.start()
+    try:
+        for _ in range(12):
+            logger.log_decision("ETH/USD", 3000, "SELL", 0.6,
+                                {"technical": {"signal": "SELL", "confidence": 0.6}}, "test")
+    finally:
+        writer.stop()
+
+    totals = get_strategy_totals(1)["technical"]
+    assert totals["sell_count"] == 12
+    assert totals["agreement_count"] == 12
+
+
+def test_lookback_uses_daily_and_hourly_buckets():
+    now = _now()
+    rows = [
+        _signal_row(now - timedelta(minutes=1), {"technical": {"signal": "BUY", "confidence": 1.0}}),
+        _signal_row(now - timedelta(days=2), {"technical": {"signal": "BUY", "confidence": 1.0}}),
+        _signal_row(now - timedelta(days=10), {"technical": {"signal": "BUY", "confidence": 1.0}}),
+    ]
+    with get_db() as db:
+        for row in rows:
+            db.add(Signal(**row))
+    rebuild_rollups()
+
+    assert get_strategy_totals(1)["technical"]["total_signals"] == 1
+    assert get_strategy_totals(3)["technical"]["total_signals"] == 2
+    assert get_strategy_totals(30)["technical"]["total_signals"] == 3
+
+
+def test_rebuild_matches_incremental(logger):
+    for final in ("BUY", "SELL", "HOLD"):
+        logger.log_decision("BTC/USD", 50000, final, 0.7,
+                            {"technical": {"signal": "BUY", "confidence": 0.3}}, "test")
+    incremental = _snapshot()
+
+    assert rebuild_rollups() == 3
+    assert _snapshot() == incremental
+
+
+def test_bucket_start():
+    ts = datetime(2026, 1, 2, 3, 4, 5, 6)
+    assert bucket_start(ts, "hour") == datetime(2026, 1, 2, 3)
+    assert bucket_start(ts, "day") == datetime(2026, 1, 2)
@@ -521,4 +521,180 @@ class TestThreadSafety:
             # Verify data integrity - all signals should have symbol
             for signal in signals:
                 assert signal.symbol is not None, "Signal should have symbol"
-                assert signal.symbol.startswith("T"), "Symbol should start with T"
\ No newline at end of file
+                assert signal.symbol.startswith("T"), "Symbol should start with T"
+
+class TestSignalWriter:
+    """Test the write-behind signal queue."""
+
+    @pytest.fixture
+    def writer(self, monkeypatch):
+        from app import strategy_signal_logger
+        from app.strategy_signal_logger import SignalWriter
+
+        writer = SignalWriter(batch_size=10, flush_interval=60)
+        monkeypatch.setattr(strategy_signal_logger, "signal_writer", writer)
+        writer.start()
+        yield writer
+        writer.stop()
+
+    def _log(self, logger, symbol):
+        return logger.log_decision(
+            symbol=symbol,
+            price=50000.0,
+            final_signal="BUY",
+            final_confidence=0.7,
+            strategy_signals={"technical": {"signal": "BUY", "confidence": 0.7}},
+            aggregation_method="weighted_vote"
+        )
+
+    def test_returns_preallocated_ids_before_write(self, logger, writer):
+        from app.database.models import Signal
+        from app.database.connection import get_db
+
+        ids = [self._log(logger, "Q1/USD") for _ in range(3)]
+
+        assert ids == list(range(ids[0], ids[0] + 3))
+        assert writer.pending == 3
+
+        assert writer.flush() is True
+        assert writer.pending == 0
+
+        with get_db() as db:
+            rows = db.query(Signal).filter(Signal.symbol == "Q1/USD").order_by(Signal.id).all()
+            assert [r.id for r in rows] == ids
+            assert rows[0].strategies["technical"]["signal"] == "BUY"
+
+    def test_batches_by_size_and_flushes_on_stop(self, logger, writer):
+        from app.database.models import Signal
+        from app.database.connection import get_db
+
+        for _ in range(25):
+            self._log(logger, "Q2/USD")
+
+        writer.stop()
+
+        stats = writer.get_stats()
+        assert stats["written"] == 25
+        assert stats["batches"] == 3
+        assert stats["running"] is False
+
+        with get_db() as db:
+            assert db.query(Signal).filter(Signal.symbol == "Q2/USD").count() == 25
+
+    def test_concurrent_enqueue(self, logger, writer):
+        from app.database.models import Signal
+        from app.database.connection import get_db
+
+        results = []
+
+        def write_signals(thread_id):
+            for _ in range(20):
+                results.append(self._log(logger, f"Q3{thread_id}/USD"))
+
+        threads = [threading.Thread(target=write_signals, args=(i,)) for i in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        writer.flush()
+
+        assert len(set(results)) == 100
+        with get_db() as db:
+            assert db.query(Signal).filter(Signal.symbol.like("Q3%")).count() == 100
+
+    def test_falls_back_to_sync_write_when_stopped(self, logger, writer):
+        from app.database.models import Signal
+        from app.database.connection import get_db
+
+        writer.stop()
+        signal_id = self._log(logger, "Q4/USD")
+
+        with get_db() as db:
+            assert db.query(Signal).filter(Signal.id == signal_id).first() is not None
+
+    def test_direct_inserts_never_reuse_queued_ids(self, logger, writer):
+        from decimal import Decimal
+        from app.database.models import Signal
+        from app.database.connection import get_db
+        from app.database.repositories import SignalRepository
+
+        queued_id = self._log(logger, "Q5/USD")
+        with get_db() as db:
+            direct_id = SignalRepository(db).create(
+                timestamp=datetime.utcnow(), symbol="Q6/USD", price=Decimal("1"),
+                final_signal="SELL", final_confidence=Decimal("0.5"),
+                aggregation_method="test", strategies={},
+            ).id
+
+        assert writer.confirm(queued_id) is True
+        assert direct_id != queued_id
+        with get_db() as db:
+            assert db.query(Signal).filter(Signal.id == queued_id).one().symbol == "Q5/USD"
+        assert writer.get_stats()["failed"] == 0
+
+    def test_confirm_reports_dropped_signal(self, logger, writer, monkeypatch):
+        from app.strategy_signal_logger import SignalWriter
+
+        def fail(self, batch):
+            self.stats["failed"] += len(batch)
+            self._dropped.extend(row["id"] for row in batch)
+
+        monkeypatch.setattr(SignalWriter, "_write_batch", fail)
+        signal_id = self._log(logger, "Q7/USD")
+
+        assert writer.confirm(signal_id) is False
+
+    def test_on_persisted_runs_after_commit(self, logger, writer):
+        from app.database.models import Signal
+        from app.database.connection import get_db
+
+        seen = []
+
+        def on_persisted(signal_id):
+            with get_db() as db:
+                seen.append((signal_id, db.query(Signal).filter(Signal.id == signal_id).count()))
+
+        signal_id = logger.log_decision(
+            "Q8/USD", 50000.0, "BUY", 0.7,
+            {"technical": {"signal": "BUY", "confidence": 0.7}}, "weighted_vote",
+            on_persisted=on_persisted,
+        )
+        assert seen == []
+
+        writer.flush()
+        assert seen == [(signal_id, 1)]
+
+    def test_full_queue_with_callbacks_does_not_deadlock(self):
+        """A producer blocked on a full queue must not hold the lock the writer needs after a batch."""
+        from decimal import Decimal
+        from app.database.connection import write_gate
+        from app.strategy_signal_logger import SignalWriter
+
+        writer = SignalWriter(batch_size=4, flush_interval=0.05, max_queue=2)
+        writer.start()
+        written = []
+        row = dict(
+            timestamp=datetime.utcnow(), symbol="Q9/USD", price=Decimal("1"), final_signal="BUY",
+            final_confidence=Decimal("0.5"), aggregation_method="test", strategies={}, test_mode=True,
+        )
+
+        def produce():
+            for _ in range(20):
+                writer.enqueue(dict(row), on_written=written.append)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        try:
+            # Stall the writer mid-batch (as behind an index build) until the queue fills
+            with write_gate.hold():
+                producer.start()
+                deadline = time.monotonic() + 5
+                while not writer.queue.full() and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                assert writer.queue.full()
+
+            producer.join(10)
+            assert not producer.is_alive(), "producer deadlocked with the writer"
+            assert writer.flush(10) is True
+            assert len(written) == 20
+        finally:
+            writer.stop(timeout=2)
@@ -0,0 +1,122 @@
+"""Tests for the normalized strategy_votes table."""
+import tempfile
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import insert
+
+from app.database.connection import get_db
+from app.database.models import Signal, StrategyVote
+from app.database.repositories import SignalRepository, StrategyVoteRepository, PerformanceRepository, TradeRepository
+from app.strategy_signal_logger import StrategySignalLogger, SignalWriter, backfill_strategy_votes
+
+
+STRATEGIES = {
+    "technical": {"signal": "BUY", "confidence": 0.7, "weight": 1.0, "reason": "Test"},
+    "sentiment": {"signal": "SELL", "confidence": 0.4},
+}
+
+
+def _votes():
+    with get_db() as db:
+        return sorted(
+            (v.strategy, v.signal, v.confidence, v.weight)
+            for v in db.query(StrategyVote).all()
+        )
+
+
+@pytest.fixture
+def logger():
+    return StrategySignalLogger(data_dir=tempfile.mkdtemp())
+
+
+def test_create_writes_votes():
+    with get_db() as db:
+        signal = SignalRepository(db).create(
+            timestamp=datetime.utcnow(), symbol="BTC/USD", price=Decimal("50000"),
+            final_signal="BUY", final_confidence=Decimal("0.7"),
+            aggregation_method="test", strategies=STRATEGIES,
+        )
+        signal_id = signal.id
+
+    assert _votes() == [("sentiment", "SELL", 0.4, None), ("technical", "BUY", 0.7, 1.0)]
+    with get_db() as db:
+        assert {v.signal_id for v in db.query(StrategyVote).all()} == {signal_id}
+
+
+def test_write_behind_batch_writes_votes(logger, monkeypatch):
+    from app import strategy_signal_logger
+
+    writer = SignalWriter(batch_size=5, flush_interval=60)
+    monkeypatch.setattr(strategy_signal_logger, "signal_writer", writer)
+    writer.start()
+    try:
+        for _ in range(7):
+            logger.log_decision("ETH/USD", 3000, "BUY", 0.6, STRATEGIES, "test")
+    finally:
+        writer.stop()
+
+    assert len(_votes()) == 14
+
+
+def test_backfill_migrates_signals_without_votes():
+    with get_db() as db:
+        db.execute(insert(Signal), [
+            dict(timestamp=datetime.utcnow(), symbol="BTC/USD", price=Decimal("1"),
+                 final_signal="BUY", final_confidence=Decimal("0.5"),
+                 aggregation_method="legacy", strategies=STRATEGIES, test_mode=False)
+            for _ in range(3)
+        ])
+
+    assert backfill_strategy_votes() == 3
+    assert len(_votes()) == 6
+    assert backfill_strategy_votes() == 0
+
+
+def test_backfill_skips_signals_without_strategies():
+    with get_db() as db:
+        db.execute(insert(Signal), [
+            dict(timestamp=datetime.utcnow(), symbol="BTC/USD", price=Decimal("1"),
+                 final_signal="HOLD", final_confidence=Decimal("0"),
+                 aggregation_method="legacy", strategies=strategies, test_mode=False)
+            for strategies in ({}, None, STRATEGIES)
+        ])
+
+    assert backfill_strategy_votes() == 1
+    assert len(_votes()) == 2
+    assert backfill_strategy_votes() == 0
+
+
+def test_get_votes_filters_by_symbol_and_limit(logger):
+    logger.log_decision("BTC/USD", 50000, "BUY", 0.7, STRATEGIES, "test")
+    logger.log_decision("ETH/USD", 3000, "BUY", 0.7, STRATEGIES, "test")
+    latest = logger.log_decision("ETH/USD", 3000, "BUY", 0.7, STRATEGIES, "test")
+
+    since = datetime.utcnow() - timedelta(hours=1)
+    with get_db() as db:
+        repo = StrategyVoteRepository(db)
+        eth = repo.get_votes(since, symbol="ETH/USD")
+        newest = repo.get_votes(since, limit=1)
+
+    assert len(eth) == 4
+    assert {signal_id for signal_id, _, _ in newest} == {latest}
+
+
+def test_strategy_execution_stats(logger):
+    signal_id = logger.log_decision("BTC/USD", 50000, "BUY", 0.7, STRATEGIES, "test")
+    logger.log_decision("BTC/USD", 50000, "SELL", 0.7, STRATEGIES, "test")
+    logger.log_decision("BTC/USD", 50000, "HOLD", 0.7, STRATEGIES, "test")
+
+    with get_db() as db:
+        TradeRepository(db).create(
+            timestamp=datetime.utcnow(), action="buy", symbol="BTC/USD", price=Decimal("50000"),
+            amount=Decimal("0.01"), gross_value=Decimal("500"), fee=Decimal("1"),
+            net_value=Decimal("501"), signal_id=signal_id, test_mode=False,
+        )
+
+    with get_db() as db:
+        stats = PerformanceRepository(db).get_strategy_performance(hours=1)
+
+    assert stats["technical"] == {"signals_generated": 2, "signals_executed": 1, "execution_rate": 0.5}
+    assert stats["sentiment"]["signals_generated"] == 2
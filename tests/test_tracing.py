@@ -0,0 +1,125 @@
+"""Tests for trace spans (app.metrics.tracing) and /api/traces/latest."""
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.metrics.prometheus import MetricsRegistry
+from app.metrics.tracing import STATUS_ERROR, Tracer, trace_to_flame, traces_to_otlp, tracer
+
+
+@pytest.fixture
+def local_tracer():
+    return Tracer({"enabled": True, "max_traces": 3})
+
+
+def test_nested_spans_form_one_trace(local_tracer):
+    with local_tracer.span("cycle", root=True):
+        with local_tracer.span("symbol", symbol="BTC/USD"):
+            with local_tracer.span("price"):
+                time.sleep(0.01)
+        with local_tracer.span("symbol", symbol="ETH/USD"):
+            pass
+
+    [trace] = local_tracer.get_traces()
+    assert trace.root.name == "cycle"
+    assert len(trace.spans) == 4
+    assert len({span.trace for span in trace.spans}) == 1
+    assert [child.label for child in trace.root.children] == ["symbol[BTC/USD]", "symbol[ETH/USD]"]
+    assert trace.root.duration_ms >= 10
+
+
+def test_spans_outside_a_trace_are_not_recorded(local_tracer):
+    with local_tracer.span("db.write") as scope:
+        scope.set_attribute("ignored", True)
+
+    assert local_tracer.get_traces() == []
+    assert local_tracer.current_span() is None
+
+
+def test_errors_and_ring_buffer(local_tracer):
+    for i in range(5):
+        with pytest.raises(ValueError):
+            with local_tracer.span("cycle", root=True, n=i):
+                raise ValueError("boom")
+
+    traces = local_tracer.get_traces(limit=10)
+    assert [t.root.attributes["n"] for t in traces] == [4, 3, 2]
+    assert traces[0].root.status == STATUS_ERROR
+    assert "ValueError: boom" in traces[0].root.status_message
+
+
+def test_timer_runs_even_without_a_trace(local_tracer):
+    registry = MetricsRegistry({"enabled": True})
+    histogram = registry.histogram("test_seconds", "Seconds.")
+
+    with local_tracer.span("price", timer=histogram.time()):
+        pass
+
+    assert histogram.count() == 1
+    assert local_tracer.get_traces() == []
+
+
+def test_flame_breakdown_and_otlp(local_tracer):
+    with local_tracer.span("cycle", root=True):
+        with local_tracer.span("symbol", symbol="BTC/USD"):
+            with local_tracer.span("price"):
+                time.sleep(0.02)
+
+    [trace] = local_tracer.get_traces()
+    flame = trace_to_flame(trace)
+
+    assert flame["breakdown"][0]["name"] == "price"
+    assert flame["tree"]["children"][0]["children"][0]["self_ms"] >= 20
+    assert any(line.startswith("cycle;symbol[BTC/USD];price ") for line in flame["folded"])
+
+    otlp = traces_to_otlp([trace])
+    spans = otlp["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert len(spans) == 3
+    assert all(len(s["traceId"]) == 32 and len(s["spanId"]) == 16 for s in spans)
+    by_name = {s["name"]: s for s in spans}
+    assert by_name["symbol"]["parentSpanId"] == by_name["cycle"]["spanId"]
+    assert {"key": "symbol", "value": {"stringValue": "BTC/USD"}} in by_name["symbol"]["attributes"]
+    assert int(by_name["price"]["endTimeUnixNano"]) > int(by_name["price"]["startTimeUnixNano"])
+
+
+def test_disabled_tracer_records_nothing():
+    disabled = Tracer({"enabled": False})
+    with disabled.span("cycle", root=True):
+        pass
+    assert disabled.get_traces() == []
+
+
+def test_process_symbol_is_traced():
+    from app.bootstrap import components
+    from app.main import app, process_symbol
+
+    client = MagicMock()
+    client.get_price.return_value = 100.0
+    client.get_balance.return_value = 1000.0
+    trader = MagicMock()
+    trader.execute_trade.return_value = {"status": "hold"}
+    strategy_manager = MagicMock()
+    strategy_manager.get_signal.return_value = ("HOLD", 0.1, "test", None)
+
+    tracer.reset()
+    components.set("kraken", client)
+    components.set("trader", trader)
+    components.set("notifier", MagicMock())
+    try:
+        with tracer.span("trade_cycle", root=True):
+            process_symbol("TRACE/USD", strategy_manager, {})
+    finally:
+        components.reset()
+
+    response = TestClient(app).get("/api/traces/latest", params={"limit": 1})
+    assert response.status_code == 200
+    [trace] = response.json()["traces"]
+    assert trace["name"] == "trade_cycle"
+    [symbol] = trace["tree"]["children"]
+    assert symbol["name"] == "symbol[TRACE/USD]"
+    assert [child["name"] for child in symbol["children"]] == ["price", "balance", "trade", "notify"]
+
+    otlp = TestClient(app).get("/api/traces/latest", params={"limit": 1, "format": "otlp"}).json()
+    assert len(otlp["resourceSpans"][0]["scopeSpans"][0]["spans"]) == trace["span_count"]